@@ -0,0 +1,111 @@
+"""
+Benchmark inserting dictionaries into an in-memory SQLite database.
+
+Reports the rows inserted per second by constructing an instance for each dictionary
+using from_dict and flushing them with a session, compared with bulk_insert_dicts.
+
+Usage:
+    python -m benchmarks.bulk_insert [--rows N] [--chunk-size N]
+"""
+
+import argparse
+import functools
+import time
+import typing
+
+import sqlalchemy
+from sqlalchemy import orm
+
+import open_alchemy
+from open_alchemy import models
+
+from . import helpers
+
+
+def _rows(count: int) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Calculate the dictionaries to insert."""
+    return [
+        {"name": f"employee {idx}", "division": "engineering", "salary": float(idx)}
+        for idx in range(count)
+    ]
+
+
+def _insert_from_dict(
+    session: orm.Session,
+    rows: typing.List[typing.Dict[str, typing.Any]],
+    validation: open_alchemy.ValidationMode,
+) -> None:
+    """Insert the rows by constructing an instance for each."""
+    session.add_all(
+        [models.Employee.from_dict_with(row, validation=validation) for row in rows]
+    )
+    session.commit()
+
+
+def _insert_bulk(
+    session: orm.Session,
+    rows: typing.List[typing.Dict[str, typing.Any]],
+    validation: open_alchemy.ValidationMode,
+    chunk_size: int,
+) -> None:
+    """Insert the rows using bulk_insert_dicts."""
+    models.Employee.bulk_insert_dicts(
+        session, rows, chunk_size=chunk_size, validation=validation
+    )
+    session.commit()
+
+
+def _rate(insert: typing.Callable[[orm.Session], None], rows: int) -> float:
+    """Calculate the rows inserted per second into an empty database."""
+    engine = sqlalchemy.create_engine("sqlite://")
+    models.Base.metadata.create_all(engine)
+    session = orm.Session(bind=engine)
+    start = time.perf_counter()
+    insert(session)
+    elapsed = time.perf_counter() - start
+    assert session.query(models.Employee).count() == rows
+    return rows / elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    helpers.init_example("simple/example-spec.yml")
+    rows = _rows(args.rows)
+
+    table_rows = []
+    for validation in open_alchemy.ValidationMode:
+        before = _rate(
+            functools.partial(_insert_from_dict, rows=rows, validation=validation),
+            args.rows,
+        )
+        after = _rate(
+            functools.partial(
+                _insert_bulk,
+                rows=rows,
+                validation=validation,
+                chunk_size=args.chunk_size,
+            ),
+            args.rows,
+        )
+        table_rows.append(
+            (
+                validation.value,
+                f"{before:,.0f}",
+                f"{after:,.0f}",
+                f"{after / before:.1f}x",
+            )
+        )
+
+    helpers.print_table(
+        ("validation", "from_dict (rows/s)", "bulk_insert_dicts (rows/s)", "speedup"),
+        table_rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark from_dict on the example models.
+
+Reports the from_dict calls per second with the schema validator of each model
+constructed on every call (as before the validators were cached) and with the cached
+validator.
+
+Usage:
+    python -m benchmarks.from_dict [--duration SECONDS]
+"""
+
+import argparse
+import contextlib
+import functools
+import typing
+
+from open_alchemy import models
+from open_alchemy import utility_base
+from open_alchemy.facades import jsonschema
+
+from . import helpers
+
+
+class Case(typing.NamedTuple):
+    """A model to benchmark and the dictionary to construct it from."""
+
+    spec_filename: str
+    model_name: str
+    value: typing.Dict[str, typing.Any]
+
+
+CASES = (
+    Case(
+        "simple/example-spec.yml",
+        "Employee",
+        {"id": 1, "name": "David Andersson", "division": "engineering", "salary": 1.0},
+    ),
+    Case(
+        "relationship/many_to_one/example-spec.yml",
+        "Employee",
+        {"id": 1, "name": "David Andersson", "division": {"id": 1, "name": "eng"}},
+    ),
+    Case(
+        "relationship/one_to_many/example-spec.yml",
+        "Division",
+        {
+            "id": 1,
+            "name": "engineering",
+            "employees": [{"id": idx, "name": f"employee {idx}"} for idx in range(10)],
+        },
+    ),
+    Case(
+        "inheritance/joined-example-spec.yml",
+        "Manager",
+        {"id": 1, "name": "David Andersson", "type": "manager", "manager_data": "x"},
+    ),
+)
+
+
+@contextlib.contextmanager
+def _uncached_validator() -> typing.Iterator[None]:
+    """Construct the schema validator on every call for the duration of the context."""
+    # pylint: disable=protected-access
+    original = utility_base.UtilityBase.__dict__["_get_schema_validator"]
+
+    def _get_schema_validator(cls: typing.Type) -> jsonschema.Validator:
+        """Construct the validator without caching it."""
+        return jsonschema.compile_(cls._get_schema())
+
+    utility_base.UtilityBase._get_schema_validator = classmethod(  # type: ignore
+        _get_schema_validator
+    )
+    try:
+        yield
+    finally:
+        utility_base.UtilityBase._get_schema_validator = original  # type: ignore
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--duration", type=float, default=1.0)
+    args = parser.parse_args()
+
+    rows = []
+    for case in CASES:
+        helpers.init_example(case.spec_filename)
+        model = getattr(models, case.model_name)
+        from_dict = functools.partial(model.from_dict, **case.value)
+
+        with _uncached_validator():
+            before = helpers.rate(from_dict, duration=args.duration)
+        after = helpers.rate(from_dict, duration=args.duration)
+
+        rows.append(
+            (
+                f"{case.spec_filename}:{case.model_name}",
+                f"{before:,.0f}",
+                f"{after:,.0f}",
+                f"{after / before:.1f}x",
+            )
+        )
+
+    helpers.print_table(("model", "before (req/s)", "after (req/s)", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
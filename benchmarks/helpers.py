@@ -0,0 +1,65 @@
+"""Helpers for the benchmarks."""
+
+import pathlib
+import time
+import typing
+
+import yaml
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+
+EXAMPLES_DIRECTORY = pathlib.Path(__file__).parent.parent / "examples"
+
+
+def init_example(spec_filename: str) -> None:
+    """
+    Construct the models of an example specification on open_alchemy.models.
+
+    The specification is passed as a dictionary so that no cache file is written
+    next to the example.
+
+    Args:
+        spec_filename: The path to the specification relative to the examples folder.
+
+    """
+    spec = yaml.safe_load((EXAMPLES_DIRECTORY / spec_filename).read_text())
+    open_alchemy.init_model_factory(base=declarative.declarative_base(), spec=spec)
+
+
+def rate(func: typing.Callable[[], typing.Any], *, duration: float) -> float:
+    """
+    Calculate how often a function can be called per second.
+
+    Args:
+        func: The function to call.
+        duration: The minimum number of seconds to call the function for.
+
+    Returns:
+        The number of calls per second.
+
+    """
+    func()
+
+    calls = 0
+    batch = 1
+    start = time.perf_counter()
+    while True:
+        for _ in range(batch):
+            func()
+        calls += batch
+        elapsed = time.perf_counter() - start
+        if elapsed >= duration:
+            return calls / elapsed
+        batch *= 2
+
+
+def print_table(
+    headings: typing.Sequence[str], rows: typing.Iterable[typing.Sequence[str]]
+) -> None:
+    """Print rows as a table with aligned columns."""
+    rows = [headings, *rows]
+    widths = [max(len(row[idx]) for row in rows) for idx in range(len(headings))]
+    for row in rows:
+        line = "  ".join(value.rjust(width) for value, width in zip(row, widths))
+        print(line)  # allow-print
@@ -0,0 +1,135 @@
+"""
+Benchmark how the initialization scales with the number of models.
+
+Generates a specification for each number of models and reports the seconds taken by
+init_json (without and with the artifacts cache), build_json and openalchemy
+generate. For each step in the number of models, the scaling exponent k of
+time ~ models ** k is reported together with whether the step scales linearly.
+
+Usage:
+    python -m benchmarks.init_scaling [--models 10 100 1000 5000]
+        [--inheritance-depth N] [--inheritance joined|single] [--all-of-depth N]
+        [--remote] [--relationship-density F] [--many-to-many-density F]
+"""
+
+import argparse
+import math
+import pathlib
+import tempfile
+import time
+import typing
+
+import open_alchemy
+from open_alchemy import cli
+
+from . import helpers
+from . import spec
+
+# Scaling exponents up to this value are reported as linear to allow for noise
+LINEAR_EXPONENT = 1.2
+
+
+def _remove_cache(directory: pathlib.Path) -> None:
+    """Remove any cache files written next to the specification."""
+    for path in directory.glob("__open_alchemy_*_cache__"):
+        path.unlink()
+
+
+def _time(func: typing.Callable[[], typing.Any]) -> float:
+    """Calculate the seconds taken by a function."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def measure(directory: pathlib.Path, spec_path: pathlib.Path) -> typing.List[float]:
+    """
+    Measure the seconds taken by the initialization for a specification.
+
+    Args:
+        directory: The directory for any files that are written.
+        spec_path: The path to the specification.
+
+    Returns:
+        The seconds taken by init_json, init_json with the cache, build_json and
+        openalchemy generate.
+
+    """
+    _remove_cache(spec_path.parent)
+    init = _time(lambda: open_alchemy.init_json(str(spec_path)))
+    init_cached = _time(lambda: open_alchemy.init_json(str(spec_path)))
+
+    build = _time(
+        lambda: open_alchemy.build_json(
+            str(spec_path), "generated", str(directory / "dist")
+        )
+    )
+
+    _remove_cache(spec_path.parent)
+    args = argparse.Namespace(
+        specfile=str(spec_path), output=str(directory / "models.py"), jobs=1
+    )
+    generate = _time(lambda: cli.generate(args))
+
+    return [init, init_cached, build, generate]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--relationship-density", type=float, default=0.5)
+    parser.add_argument("--many-to-many-density", type=float, default=0.1)
+    parser.add_argument("--inheritance-depth", type=int, default=0)
+    parser.add_argument("--inheritance", choices=["joined", "single"], default="joined")
+    parser.add_argument("--all-of-depth", type=int, default=0)
+    parser.add_argument("--remote", action="store_true")
+    args = parser.parse_args()
+
+    headings = ("init_json", "init_json cached", "build_json", "generate")
+    results: typing.List[typing.List[float]] = []
+    for models in args.models:
+        config = spec.Config(
+            models=models,
+            relationship_density=args.relationship_density,
+            many_to_many_density=args.many_to_many_density,
+            inheritance_depth=args.inheritance_depth,
+            inheritance=args.inheritance,
+            all_of_depth=args.all_of_depth,
+            remote=args.remote,
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            spec_path = spec.write(config, pathlib.Path(directory) / "spec")
+            results.append(measure(pathlib.Path(directory), spec_path))
+
+    helpers.print_table(
+        ("models", *(f"{heading} (s)" for heading in headings)),
+        (
+            (str(models), *(f"{seconds:.3f}" for seconds in result))
+            for models, result in zip(args.models, results)
+        ),
+    )
+    print()  # allow-print
+
+    rows = []
+    for idx in range(1, len(args.models)):
+        ratio = math.log(args.models[idx] / args.models[idx - 1])
+        exponents = [
+            math.log(after / before) / ratio
+            for before, after in zip(results[idx - 1], results[idx])
+        ]
+        rows.append(
+            (
+                f"{args.models[idx - 1]} -> {args.models[idx]}",
+                *(
+                    f"{exponent:.2f} "
+                    f"({'linear' if exponent <= LINEAR_EXPONENT else 'super-linear'})"
+                    for exponent in exponents
+                ),
+            )
+        )
+    helpers.print_table(("models", *(f"{heading} k" for heading in headings)), rows)
+
+
+if __name__ == "__main__":
+    main()
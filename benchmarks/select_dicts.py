@@ -0,0 +1,67 @@
+"""
+Benchmark reading rows as dictionaries from an in-memory SQLite database.
+
+Reports the rows read per second by querying instances and converting them using
+to_dict_many, compared with select_dicts.
+
+Usage:
+    python -m benchmarks.select_dicts [--rows N] [--duration SECONDS]
+"""
+
+import argparse
+
+import sqlalchemy
+from sqlalchemy import orm
+
+from open_alchemy import models
+
+from . import helpers
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--duration", type=float, default=2.0)
+    args = parser.parse_args()
+
+    helpers.init_example("simple/example-spec.yml")
+    engine = sqlalchemy.create_engine("sqlite://")
+    models.Base.metadata.create_all(engine)
+    session = orm.Session(bind=engine)
+    models.Employee.bulk_insert_dicts(
+        session,
+        (
+            {"name": f"employee {idx}", "division": "engineering", "salary": float(idx)}
+            for idx in range(args.rows)
+        ),
+    )
+    session.commit()
+
+    def query() -> None:
+        """Query the instances and convert them to dictionaries."""
+        models.Employee.to_dict_many(session.query(models.Employee))
+        session.expunge_all()
+
+    def select() -> None:
+        """Select the rows as dictionaries."""
+        models.Employee.select_dicts(session)
+
+    before = helpers.rate(query, duration=args.duration) * args.rows
+    after = helpers.rate(select, duration=args.duration) * args.rows
+
+    helpers.print_table(
+        ("rows", "query + to_dict_many (rows/s)", "select_dicts (rows/s)", "speedup"),
+        [
+            (
+                str(args.rows),
+                f"{before:,.0f}",
+                f"{after:,.0f}",
+                f"{after / before:.1f}x",
+            )
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Generate valid OpenAPI specifications with any number of models.
+
+The shape of the specification is controlled by Config:
+* relationship_density: the fraction of models with a many to one relationship,
+* many_to_many_density: the fraction of models with a many to many relationship,
+* inheritance_depth: the number of models that inherit from each other in a chain,
+  using joined or single table inheritance,
+* all_of_depth: the length of the allOf chain of the schema of the name column and
+* remote: whether the schema of the id column is a remote reference.
+
+Only models that don't inherit have relationships so that the specification is valid
+for any combination of the options.
+"""
+
+import dataclasses
+import json
+import pathlib
+import random
+import typing
+
+REMOTE_FILENAME = "remote.json"
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    """The options for the generated specification."""
+
+    # The number of models
+    models: int
+    # The fraction of models with a many to one relationship to another model
+    relationship_density: float = 0.5
+    # The fraction of models with a many to many relationship to another model
+    many_to_many_density: float = 0.1
+    # The number of models that inherit from each other in a chain, 0 for none
+    inheritance_depth: int = 0
+    # The type of inheritance, joined or single
+    inheritance: str = "joined"
+    # The length of the allOf chain of the schema of the name column
+    all_of_depth: int = 0
+    # Whether the schema of the id column is a remote reference
+    remote: bool = False
+    # The seed for selecting the models for relationships
+    seed: int = 0
+
+
+def _name(idx: int) -> str:
+    """Calculate the name of a model."""
+    return f"Model{idx}"
+
+
+def _tablename(idx: int) -> str:
+    """Calculate the name of the table of a model."""
+    return f"model_{idx}"
+
+
+def _ref(name: str) -> typing.Dict[str, str]:
+    """Calculate the $ref to a schema."""
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+def _column_schemas(config: Config) -> typing.Dict[str, typing.Any]:
+    """Calculate the schemas of the columns shared by all models."""
+    schemas: typing.Dict[str, typing.Any] = {
+        "NameColumn0": {"type": "string", "maxLength": 255}
+    }
+    for level in range(1, config.all_of_depth + 1):
+        schemas[f"NameColumn{level}"] = {
+            "allOf": [_ref(f"NameColumn{level - 1}"), {"description": f"level {level}"}]
+        }
+    if not config.remote:
+        schemas["IdColumn"] = {"type": "integer", "x-primary-key": True}
+    return schemas
+
+
+def _id_column(config: Config) -> typing.Dict[str, typing.Any]:
+    """Calculate the schema of the id column of a model."""
+    if config.remote:
+        return {"$ref": f"{REMOTE_FILENAME}#/IdColumn"}
+    return _ref("IdColumn")
+
+
+def _model(
+    idx: int, *, config: Config, parent: typing.Optional[int], root: bool
+) -> typing.Dict[str, typing.Any]:
+    """Calculate the schema of a model without any relationships."""
+    properties: typing.Dict[str, typing.Any] = {
+        "name": _ref(f"NameColumn{config.all_of_depth}"),
+        "value": {"type": "number"},
+    }
+    schema: typing.Dict[str, typing.Any] = {"type": "object", "properties": properties}
+    if parent is None:
+        properties["id"] = _id_column(config)
+        schema["x-tablename"] = _tablename(idx)
+        schema["required"] = ["id"]
+    if root:
+        properties["type"] = {"type": "string"}
+        schema["x-kwargs"] = {
+            "__mapper_args__": {
+                "polymorphic_on": "type",
+                "polymorphic_identity": _name(idx),
+            }
+        }
+    if parent is None:
+        return schema
+
+    schema["x-inherits"] = True
+    schema["x-kwargs"] = {"__mapper_args__": {"polymorphic_identity": _name(idx)}}
+    if config.inheritance == "joined":
+        schema["x-tablename"] = _tablename(idx)
+        properties["id"] = {
+            "type": "integer",
+            "x-primary-key": True,
+            "x-foreign-key": f"{_tablename(parent)}.id",
+        }
+    # The column names must be unique in the chain
+    properties[f"name_{idx}"] = properties.pop("name")
+    properties[f"value_{idx}"] = properties.pop("value")
+    return {"allOf": [_ref(_name(parent)), schema]}
+
+
+def generate(config: Config) -> typing.Dict[str, typing.Any]:
+    """
+    Generate a specification.
+
+    Args:
+        config: The options for the specification.
+
+    Returns:
+        The specification.
+
+    """
+    rand = random.Random(config.seed)
+    schemas = _column_schemas(config)
+
+    chain_length = config.inheritance_depth + 1
+    plain: typing.List[int] = []
+    for idx in range(config.models):
+        position = idx % chain_length
+        parent = idx - 1 if position > 0 else None
+        root = config.inheritance_depth > 0 and position == 0
+        schemas[_name(idx)] = _model(idx, config=config, parent=parent, root=root)
+        if parent is None:
+            plain.append(idx)
+
+    # Relationships to models defined earlier
+    for idx in plain[1:]:
+        properties = schemas[_name(idx)]["properties"]
+        earlier = plain[: plain.index(idx)]
+        if rand.random() < config.relationship_density:
+            target = rand.choice(earlier)
+            properties[f"ref_{target}"] = _ref(_name(target))
+        if rand.random() < config.many_to_many_density:
+            target = rand.choice(earlier)
+            properties[f"many_{target}"] = {
+                "type": "array",
+                "items": {
+                    "allOf": [
+                        _ref(_name(target)),
+                        {"x-secondary": f"{_tablename(idx)}_{_tablename(target)}"},
+                    ]
+                },
+            }
+
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Generated Schema", "version": "0.1"},
+        "paths": {},
+        "components": {"schemas": schemas},
+    }
+
+
+def write(config: Config, directory: pathlib.Path) -> pathlib.Path:
+    """
+    Generate a specification and write it as spec.json to a directory.
+
+    Any remote schemas are written next to the specification.
+
+    Args:
+        config: The options for the specification.
+        directory: The directory to write the specification to.
+
+    Returns:
+        The path to the specification.
+
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    if config.remote:
+        (directory / REMOTE_FILENAME).write_text(
+            json.dumps({"IdColumn": {"type": "integer", "x-primary-key": True}})
+        )
+    spec_path = directory / "spec.json"
+    spec_path.write_text(json.dumps(generate(config)))
+    return spec_path
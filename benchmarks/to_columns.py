@@ -0,0 +1,69 @@
+"""
+Benchmark the memory of the rows of a table as dictionaries and as columns.
+
+Reports the memory allocated for the result of to_dict_many, select_dicts and
+to_columns for the rows of an in-memory SQLite database, excluding the memory of
+the instances.
+
+Usage:
+    python -m benchmarks.to_columns [--rows N]
+"""
+
+import argparse
+import tracemalloc
+import typing
+
+import sqlalchemy
+from sqlalchemy import orm
+
+from open_alchemy import models
+
+from . import helpers
+
+
+def _memory(func: typing.Callable[[], typing.Any]) -> int:
+    """Calculate the bytes allocated for the result of a function."""
+    tracemalloc.start()
+    result = func()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return memory
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    helpers.init_example("simple/example-spec.yml")
+    engine = sqlalchemy.create_engine("sqlite://")
+    models.Base.metadata.create_all(engine)
+    session = orm.Session(bind=engine)
+    models.Employee.bulk_insert_dicts(
+        session,
+        (
+            {"name": f"employee {idx}", "division": "engineering", "salary": float(idx)}
+            for idx in range(args.rows)
+        ),
+    )
+    session.commit()
+    instances = session.query(models.Employee).all()
+
+    results = (
+        ("to_dict_many", _memory(lambda: models.Employee.to_dict_many(instances))),
+        ("select_dicts", _memory(lambda: models.Employee.select_dicts(session))),
+        ("to_columns", _memory(lambda: models.Employee.to_columns(instances))),
+    )
+    helpers.print_table(
+        ("result", "memory (MiB)", "relative to to_columns"),
+        (
+            (name, f"{memory / 2 ** 20:.2f}", f"{memory / results[-1][1]:.1f}x")
+            for name, memory in results
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,16 +10,23 @@ from sqlalchemy.ext import declarative
 from open_alchemy import types as oa_types
 
 from . import build as _build_module
+from . import cache as _cache
 from . import exceptions
 from . import model_factory as _model_factory
 from . import models_file as _models_file
+from . import profile as _profile
 from . import schemas as _schemas_module
 from .build import PackageFormat
+from .facades import json_codec as _json_codec
+from .facades.json_codec import JsonBackend
 from .helpers import define_all as _define_all
+from .helpers import dependency_graph as _dependency_graph
 from .helpers import inheritance as _inheritance
 from .helpers import ref as _ref
 from .helpers import schema as _schema_helper
 from .schemas import artifacts as _schemas_artifacts
+from .schemas import subset as _schemas_subset
+from .types import ValidationMode
 
 models = py_types.ModuleType("models")  # pylint: disable=invalid-name
 sys.modules["open_alchemy.models"] = models
@@ -31,6 +38,11 @@ def init_model_factory(
     spec: oa_types.Schema,
     models_filename: typing.Optional[str] = None,
     spec_path: typing.Optional[str] = None,
+    validation: oa_types.ValidationMode = oa_types.ValidationMode.STRICT,
+    lazy: bool = False,
+    json_backend: JsonBackend = JsonBackend.STDLIB,
+    jobs: int = 1,
+    model_names: typing.Optional[typing.Iterable[str]] = None,
 ) -> oa_types.ModelFactory:
     """
     Create factory that generates SQLAlchemy models based on OpenAPI specification.
@@ -41,6 +53,15 @@ def init_model_factory(
         models_filename: The name of the file to write the models typing information to.
         spec_path: The path the the OpenAPI specification. Mainly used to support remote
             references.
+        validation: How dictionaries passed to from_dict of the models are validated.
+        lazy: Whether to define each model when it is first accessed on
+            open_alchemy.models instead of defining all models straight away.
+        json_backend: The library to_str, from_str and iter_json of the models use to
+            encode and decode JSON.
+        jobs: The number of processes that validate the models of the specification,
+            0 for the number of CPUs.
+        model_names: The names of the models to construct. Only these models and
+            the schemas they need are processed, all models if not given.
 
     Returns:
         A factory that returns SQLAlchemy models derived from the base based on the
@@ -51,6 +72,10 @@ def init_model_factory(
     if spec_path is not None:
         _ref.set_context(path=spec_path)
 
+    # Check that the JSON backend is available before any model is defined
+    json_backend = JsonBackend(json_backend)
+    _json_codec.get(backend=json_backend)
+
     # Retrieving the schema from the specification
     if "components" not in spec:
         raise exceptions.MalformedSpecificationError(
@@ -63,12 +88,15 @@ def init_model_factory(
         )
     schemas = components.get("schemas", {})
 
-    # Pre-processing schemas
-    _schemas_module.process(schemas=schemas, spec_filename=spec_path)
+    # Restricting the schemas to the closure of the models, the cache is for all the
+    # schemas of the specification
+    if model_names is not None:
+        schemas = _schemas_subset.calculate(schemas=schemas, names=model_names)
+        spec_path = None
 
-    # Getting artifacts
-    schemas_artifacts = _schemas_artifacts.get_from_schemas(
-        schemas=schemas, stay_within_model=True
+    # Pre-processing schemas and getting artifacts
+    schemas_artifacts = _process_schemas(
+        schemas=schemas, spec_path=spec_path, jobs=jobs
     )
 
     # Binding the base and schemas
@@ -77,9 +105,17 @@ def init_model_factory(
         schemas=schemas,
         artifacts=schemas_artifacts,
         get_base=_get_base,
+        validation=oa_types.ValidationMode(validation),
+        json_backend=json_backend,
     )
+
+    def _profiled_model_factory(*, name: str) -> typing.Type:
+        """Record the construction of the model in any profile being collected."""
+        with _profile.record(f"model_factory.{name}"):
+            return bound_model_factories(name=name)
+
     # Caching calls
-    cached_model_factories = functools.lru_cache(maxsize=None)(bound_model_factories)
+    cached_model_factories = functools.lru_cache(maxsize=None)(_profiled_model_factory)
 
     # Making Base importable
     setattr(models, "Base", base)
@@ -92,18 +128,78 @@ def init_model_factory(
         return model
 
     if models_filename is not None:
-        schemas_artifacts = _schemas_artifacts.get_from_schemas(
-            schemas=schemas, stay_within_model=False
+        with _profile.record("models_file"):
+            models_file_artifacts = _schemas_artifacts.get_from_schemas(
+                schemas=schemas, stay_within_model=False
+            )
+            models_file_contents = _models_file.generate(
+                artifacts=models_file_artifacts
+            )
+            with open(models_filename, "w") as out_file:
+                out_file.write(models_file_contents)
+
+    graph = _dependency_graph.build(schemas=schemas, artifacts=schemas_artifacts)
+
+    # Remove any lazy definition from a previous initialization
+    vars(models).pop("__getattr__", None)
+    if lazy:
+        setattr(
+            models,
+            "__getattr__",
+            _define_all.define_lazy(model_factory=_register_model, graph=graph),
         )
-        models_file_contents = _models_file.generate(artifacts=schemas_artifacts)
-        with open(models_filename, "w") as out_file:
-            out_file.write(models_file_contents)
-
-    _define_all.define_all(model_factory=_register_model, schemas=schemas)
+    else:
+        with _profile.record("model_factory"):
+            _define_all.define_all(
+                model_factory=_register_model, schemas=schemas, graph=graph
+            )
 
     return _register_model
 
 
+def _process_schemas(
+    *, schemas: oa_types.Schemas, spec_path: typing.Optional[str], jobs: int = 1
+) -> oa_types.ModelsModelArtifacts:
+    """
+    Pre-process the schemas in place and calculate the artifacts of the models.
+
+    If the spec path is known, the processed schemas and the artifacts are retrieved
+    from the cache if it is valid for the spec file. Otherwise, they are calculated and
+    stored in the cache.
+
+    Args:
+        schemas: The schemas to pre-process.
+        spec_path: The path to the OpenAPI specification.
+        jobs: The number of processes that validate the models.
+
+    Returns:
+        The artifacts of the models.
+
+    """
+    if spec_path is not None:
+        with _profile.record("artifacts_cache"):
+            cached = _cache.load_artifacts(spec_path)
+        if cached is not None:
+            schemas.clear()
+            schemas.update(cached.schemas)
+            return cached.artifacts
+
+    _schemas_module.process(schemas=schemas, spec_filename=spec_path, jobs=jobs)
+    with _profile.record("artifacts"):
+        schemas_artifacts = _schemas_artifacts.get_from_schemas(
+            schemas=schemas, stay_within_model=True
+        )
+
+    if spec_path is not None:
+        _cache.store_artifacts(
+            spec_path,
+            schemas=schemas,
+            artifacts=schemas_artifacts,
+            remote_contexts=_ref.get_remote_contexts(),
+        )
+    return schemas_artifacts
+
+
 BaseAndModelFactory = typing.Tuple[typing.Type, oa_types.ModelFactory]
 
 
@@ -113,6 +209,11 @@ def _init_optional_base(
     spec: oa_types.Schema,
     models_filename: typing.Optional[str] = None,
     spec_path: typing.Optional[str] = None,
+    validation: oa_types.ValidationMode = oa_types.ValidationMode.STRICT,
+    lazy: bool = False,
+    json_backend: JsonBackend = JsonBackend.STDLIB,
+    jobs: int = 1,
+    model_names: typing.Optional[typing.Iterable[str]] = None,
 ) -> BaseAndModelFactory:
     """Wrap init_model_factory with optional base."""
     if base is None:
@@ -124,6 +225,11 @@ def _init_optional_base(
             spec=spec,
             models_filename=models_filename,
             spec_path=spec_path,
+            validation=validation,
+            lazy=lazy,
+            json_backend=json_backend,
+            jobs=jobs,
+            model_names=model_names,
         ),
     )
 
@@ -133,6 +239,11 @@ def init_json(
     *,
     base: typing.Optional[typing.Type] = None,
     models_filename: typing.Optional[str] = None,
+    validation: oa_types.ValidationMode = oa_types.ValidationMode.STRICT,
+    lazy: bool = False,
+    json_backend: JsonBackend = JsonBackend.STDLIB,
+    jobs: int = 1,
+    model_names: typing.Optional[typing.Iterable[str]] = None,
 ) -> BaseAndModelFactory:
     """
     Create SQLAlchemy models factory based on an OpenAPI specification as a JSON file.
@@ -143,6 +254,24 @@ def init_json(
               If base=None, construct a new SQLAlchemy declarative base.
         models_filename: (optional) The path to write the models file to. If it is not
             provided, the models file is not created.
+        validation: (optional) How dictionaries passed to from_dict of the models are
+            validated. Defaults to validating against the full model schema.
+        lazy: (optional) Whether to define each model, together with its parents and
+            the models it depends on, when it is first accessed on open_alchemy.models
+            instead of defining all models straight away.
+        json_backend: (optional) The library to_str, from_str and iter_json of the
+            models use to encode and decode JSON. Defaults to the json module of the
+            standard library.
+        jobs: (optional) The number of processes that validate the models of the
+            specification, 0 for the number of CPUs. Any error for an invalid
+            specification is the same as for validating with a single process, which
+            is the default.
+        model_names: (optional) The names of the models to construct. Only these
+            models, the schemas they reference, the models that define back
+            references or one to many relationships on them and the models of their
+            association tables and foreign keys, are validated, processed,
+            constructed and written to the models file. The cache next to the
+            specification is not used. Defaults to all models.
 
     Returns:
         A tuple (Base, model_factory), where:
@@ -156,7 +285,7 @@ def init_json(
     # need it:
     import json  # pylint: disable=import-outside-toplevel
 
-    with open(spec_filename) as spec_file:
+    with _profile.record("spec_load"), open(spec_filename) as spec_file:
         spec = json.load(spec_file)
 
     return _init_optional_base(
@@ -164,6 +293,11 @@ def init_json(
         spec=spec,
         models_filename=models_filename,
         spec_path=spec_filename,
+        validation=validation,
+        lazy=lazy,
+        json_backend=json_backend,
+        jobs=jobs,
+        model_names=model_names,
     )
 
 
@@ -172,6 +306,11 @@ def init_yaml(
     *,
     base: typing.Optional[typing.Type] = None,
     models_filename: typing.Optional[str] = None,
+    validation: oa_types.ValidationMode = oa_types.ValidationMode.STRICT,
+    lazy: bool = False,
+    json_backend: JsonBackend = JsonBackend.STDLIB,
+    jobs: int = 1,
+    model_names: typing.Optional[typing.Iterable[str]] = None,
 ) -> BaseAndModelFactory:
     """
     Create SQLAlchemy models factory based on an OpenAPI specification as a YAML file.
@@ -184,6 +323,24 @@ def init_yaml(
               If base=None, construct a new SQLAlchemy declarative base.
         models_filename: (optional) The path to write the models file to. If it is not
             provided, the models file is not created.
+        validation: (optional) How dictionaries passed to from_dict of the models are
+            validated. Defaults to validating against the full model schema.
+        lazy: (optional) Whether to define each model, together with its parents and
+            the models it depends on, when it is first accessed on open_alchemy.models
+            instead of defining all models straight away.
+        json_backend: (optional) The library to_str, from_str and iter_json of the
+            models use to encode and decode JSON. Defaults to the json module of the
+            standard library.
+        jobs: (optional) The number of processes that validate the models of the
+            specification, 0 for the number of CPUs. Any error for an invalid
+            specification is the same as for validating with a single process, which
+            is the default.
+        model_names: (optional) The names of the models to construct. Only these
+            models, the schemas they reference, the models that define back
+            references or one to many relationships on them and the models of their
+            association tables and foreign keys, are validated, processed,
+            constructed and written to the models file. The cache next to the
+            specification is not used. Defaults to all models.
 
     Returns:
         A tuple (Base, model_factory), where:
@@ -200,7 +357,7 @@ def init_yaml(
             "Using init_yaml requires the pyyaml package. Try `pip install pyyaml`."
         ) from exc
 
-    with open(spec_filename) as spec_file:
+    with _profile.record("spec_load"), open(spec_filename) as spec_file:
         spec = yaml.load(spec_file, Loader=yaml.SafeLoader)
 
     return _init_optional_base(
@@ -208,6 +365,11 @@ def init_yaml(
         spec=spec,
         models_filename=models_filename,
         spec_path=spec_filename,
+        validation=validation,
+        lazy=lazy,
+        json_backend=json_backend,
+        jobs=jobs,
+        model_names=model_names,
     )
 
 
@@ -253,6 +415,8 @@ def build_json(
     package_name: str,
     dist_path: str,
     format_: PackageFormat = PackageFormat.NONE,
+    *,
+    jobs: int = 1,
 ) -> None:
     """
     Create an OpenAlchemy distribution package with the SQLAlchemy models.
@@ -272,17 +436,19 @@ def build_json(
         package_name: The name of the package.
         dist_path: The directory to output the package to.
         format_: (optional) The format(s) of the archive(s) to build.
+        jobs: (optional) The number of processes that validate the models of the
+            specification, 0 for the number of CPUs.
 
     """
     # Most OpenAPI specs are YAML, so, for efficiency, we only import json if we
     # need it:
     import json  # pylint: disable=import-outside-toplevel
 
-    with open(spec_filename) as spec_file:
+    with _profile.record("spec_load"), open(spec_filename) as spec_file:
         spec = json.load(spec_file)
 
     return _build_module.execute(
-        spec=spec, name=package_name, path=dist_path, format_=format_
+        spec=spec, name=package_name, path=dist_path, format_=format_, jobs=jobs
     )
 
 
@@ -291,6 +457,8 @@ def build_yaml(
     package_name: str,
     dist_path: str,
     format_: PackageFormat = PackageFormat.NONE,
+    *,
+    jobs: int = 1,
 ) -> None:
     """
     Create an OpenAlchemy distribution package with the SQLAlchemy models.
@@ -310,6 +478,8 @@ def build_yaml(
         package_name: The name of the package.
         dist_path: The directory to output the package to.
         format_: (optional) The format(s) of the archive(s) to build.
+        jobs: (optional) The number of processes that validate the models of the
+            specification, 0 for the number of CPUs.
 
     """
     try:
@@ -319,11 +489,11 @@ def build_yaml(
             "Using init_yaml requires the pyyaml package. Try `pip install pyyaml`."
         ) from exc
 
-    with open(spec_filename) as spec_file:
+    with _profile.record("spec_load"), open(spec_filename) as spec_file:
         spec = yaml.load(spec_file, Loader=yaml.SafeLoader)
 
     return _build_module.execute(
-        spec=spec, name=package_name, path=dist_path, format_=format_
+        spec=spec, name=package_name, path=dist_path, format_=format_, jobs=jobs
     )
 
 
@@ -334,4 +504,6 @@ __all__ = [
     "build_json",
     "build_yaml",
     "PackageFormat",
+    "ValidationMode",
+    "JsonBackend",
 ]
@@ -13,6 +13,7 @@ import jinja2
 from .. import cache
 from .. import exceptions
 from .. import models_file as models_file_module
+from .. import profile
 from .. import schemas as schemas_module
 from .. import types
 from ..helpers import command
@@ -63,7 +64,7 @@ def validate_dist_format(format_) -> None:
         )
 
 
-def get_schemas(*, spec: typing.Any) -> types.Schemas:
+def get_schemas(*, spec: typing.Any, jobs: int = 1) -> types.Schemas:
     """
     Get the schemas from the specification.
 
@@ -72,6 +73,7 @@ def get_schemas(*, spec: typing.Any) -> types.Schemas:
 
     Args:
         spec: The spec to retrieve schemas from.
+        jobs: The number of processes that validate the models.
 
     Returns:
         The schemas after validation.
@@ -93,7 +95,7 @@ def get_schemas(*, spec: typing.Any) -> types.Schemas:
         raise exceptions.MalformedSchemaError(one_model_result.reason)
 
     # Check schemas
-    schemas_module.process(schemas=schemas)
+    schemas_module.process(schemas=schemas, jobs=jobs)
 
     return schemas
 
@@ -276,11 +278,12 @@ def generate_init_models_file(schemas: types.Schemas) -> str:
         The models file component of the schemas.
 
     """
-    schemas_backref.process(schemas=schemas)
-    artifacts = schemas_artifacts.get_from_schemas(
-        schemas=schemas, stay_within_model=False
-    )
-    return models_file_module.generate(artifacts=artifacts)
+    with profile.record("models_file"):
+        schemas_backref.process(schemas=schemas)
+        artifacts = schemas_artifacts.get_from_schemas(
+            schemas=schemas, stay_within_model=False
+        )
+        return models_file_module.generate(artifacts=artifacts)
 
 
 def generate_init(open_alchemy: str, models_file: str) -> str:
@@ -404,6 +407,7 @@ def execute(
     name: TName,
     path: TPath,
     format_: PackageFormat,
+    jobs: int = 1,
 ) -> None:
     """
     Execute the build for a spec.
@@ -413,10 +417,11 @@ def execute(
         name: The name of the package.
         path: The build output path.
         format_: The format of the distribution package to build.
+        jobs: The number of processes that validate the models.
 
     """
     validate_dist_format(format_)
-    schemas = get_schemas(spec=spec)
+    schemas = get_schemas(spec=spec, jobs=jobs)
     spec_info = calculate_spec_info(schemas=schemas, spec=spec)
     setup = generate_setup(name=name, version=spec_info.version)
     manifest = generate_manifest(name=name)
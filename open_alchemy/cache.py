@@ -10,18 +10,59 @@ The structure of the file is:
     "hash": "<sha256 hash of the file contents>",
     "data": {
         "schemas": {
-            "valid": true/false
+            "valid": true/false,
+            "models": {
+                "<model name>": "<sha256 of the model and the schemas it references>"
+            }
         }
     }
 }
+
+The models key records the models that were valid the last time the schemas were
+validated. The hashes only depend on the contents of the schemas, so they are used to
+skip validating the models that did not change when the spec file changes.
+
+The processed schemas and the artifacts of the models are cached in a separate file.
+The name of the file is:
+__open_alchemy_<sha256 of spec filename>_artifacts_cache__
+
+The structure of the file is:
+
+{
+    "version": <version of the artifacts cache format>,
+    "package_version": "<version of OpenAlchemy>",
+    "hash": "<sha256 hash of the file contents>",
+    "remote": {
+        "<path of remote file relative to spec file>": "<sha256 hash of its contents>"
+    },
+    "schemas": <the processed schemas>,
+    "artifacts": <the artifacts of the models>
+}
+
+The artifacts, enums and tuples are stored as objects with the name of their type
+under the "__open_alchemy_type__" key and their value under the "value" key. Only the
+classes of open_alchemy.types are constructed from the file.
 """
 
+import dataclasses
+import enum
 import hashlib
 import json
+import os
 import pathlib
 import shutil
+import sys
+import tempfile
+import typing
 
 from . import exceptions
+from . import types
+
+if sys.version_info[1] < 8:
+    # jsonschema depends on importlib_metadata before Python 3.8
+    import importlib_metadata
+else:  # version compatibility
+    from importlib import metadata as importlib_metadata
 
 
 def calculate_hash(value: str) -> str:
@@ -49,6 +90,7 @@ _HASH_KEY = "hash"
 _DATA_KEY = "data"
 _DATA_SCHEMAS_KEY = "schemas"
 _DATA_SCHEMAS_VALID_KEY = "valid"
+_DATA_SCHEMAS_MODELS_KEY = "models"
 
 
 def schemas_valid(filename: str) -> bool:
@@ -112,7 +154,51 @@ def schemas_valid(filename: str) -> bool:
     return cache[_DATA_KEY][_DATA_SCHEMAS_KEY][_DATA_SCHEMAS_VALID_KEY] is True
 
 
-def schemas_are_valid(filename: str) -> None:
+def valid_model_hashes(filename: str) -> typing.Dict[str, str]:
+    """
+    Retrieve the hashes of the models that the cache records as valid.
+
+    The hashes are returned even if the spec file has changed since the cache was
+    written because they only depend on the contents of the models.
+
+    Args:
+        filename: The name of the OpenAPI specification file.
+
+    Returns:
+        The hash of each valid model or an empty dictionary if the cache does not
+        exist or does not record any models.
+
+    """
+    cache_path = calculate_cache_path(pathlib.Path(filename))
+    if not cache_path.exists() or not cache_path.is_file():
+        return {}
+
+    try:
+        cache = json.loads(cache_path.read_text())
+    except json.JSONDecodeError:
+        return {}
+
+    cache_data = cache.get(_DATA_KEY) if isinstance(cache, dict) else None
+    cache_data_schemas = (
+        cache_data.get(_DATA_SCHEMAS_KEY) if isinstance(cache_data, dict) else None
+    )
+    model_hashes = (
+        cache_data_schemas.get(_DATA_SCHEMAS_MODELS_KEY)
+        if isinstance(cache_data_schemas, dict)
+        else None
+    )
+    if not isinstance(model_hashes, dict):
+        return {}
+    return {
+        name: model_hash
+        for name, model_hash in model_hashes.items()
+        if isinstance(model_hash, str)
+    }
+
+
+def schemas_are_valid(
+    filename: str, *, model_hashes: typing.Optional[typing.Dict[str, str]] = None
+) -> None:
     """
     Update the cache to indicate that the filename is valid.
 
@@ -130,10 +216,13 @@ def schemas_are_valid(filename: str) -> None:
     9. Look for the schemas key under data in the cache dictionary. If it does not exist
         or is not a dictionary, set it to be an empty dictionary.
     10. Create or update the valid key under data.schemas and set it to True.
-    11. Write the dictionary to the file as JSON.
+    11. If model hashes are passed, create or update the models key under
+        data.schemas and set it to the hashes.
+    12. Write the dictionary to the file as JSON.
 
     Args:
         filename: The name of the spec file.
+        model_hashes: The hash of each valid model.
 
     """
     path = pathlib.Path(filename)
@@ -169,5 +258,364 @@ def schemas_are_valid(filename: str) -> None:
         cache_data[_DATA_SCHEMAS_KEY] = {}
     cache_data_schemas = cache_data[_DATA_SCHEMAS_KEY]
     cache_data_schemas[_DATA_SCHEMAS_VALID_KEY] = True
+    if model_hashes is not None:
+        cache_data_schemas[_DATA_SCHEMAS_MODELS_KEY] = model_hashes
 
     cache_path.write_text(json.dumps(cache), encoding="utf-8")
+
+
+def calculate_artifacts_cache_path(path: pathlib.Path) -> pathlib.Path:
+    """
+    Calculate the name of the artifacts cache file.
+
+    Args:
+        path: The path to the spec file.
+
+    Returns:
+        The path to the artifacts cache file.
+
+    """
+    return path.parent / f"__open_alchemy_{calculate_hash(path.name)}_artifacts_cache__"
+
+
+# Increment whenever the processed schemas or the artifacts change
+_ARTIFACTS_VERSION = 2
+_ARTIFACTS_VERSION_KEY = "version"
+_ARTIFACTS_PACKAGE_VERSION_KEY = "package_version"
+_ARTIFACTS_REMOTE_KEY = "remote"
+_ARTIFACTS_SCHEMAS_KEY = "schemas"
+_ARTIFACTS_ARTIFACTS_KEY = "artifacts"
+# Marks the JSON objects that encode a value that is not a JSON value
+_ARTIFACTS_TYPE_KEY = "__open_alchemy_type__"
+_ARTIFACTS_VALUE_KEY = "value"
+_ARTIFACTS_DICT_TYPE = "dict"
+_ARTIFACTS_TUPLE_TYPE = "tuple"
+# The only classes that are constructed when the artifacts are loaded
+_ARTIFACTS_CLASSES: typing.Dict[str, typing.Type] = {
+    name: value
+    for name, value in vars(types).items()
+    if isinstance(value, type)
+    and value.__module__ == types.__name__
+    and (
+        dataclasses.is_dataclass(value)
+        or issubclass(value, enum.Enum)
+        or issubclass(value, tuple)
+    )
+}
+
+
+def _package_version() -> str:
+    """Retrieve the installed version of OpenAlchemy, empty if it is not installed."""
+    try:
+        return importlib_metadata.version("OpenAlchemy")
+    except importlib_metadata.PackageNotFoundError:
+        return ""
+
+
+def _remote_hashes(
+    *, path: pathlib.Path, remote_contexts: typing.Iterable[str]
+) -> typing.Optional[typing.Dict[str, str]]:
+    """
+    Calculate the hashes of the remote files the spec references.
+
+    Args:
+        path: The path to the spec file.
+        remote_contexts: The paths to the remote files relative to the spec file.
+
+    Returns:
+        The hash of the contents of each remote file or None if any of them is not a
+        readable file, such as a remote file on a URL.
+
+    """
+    hashes: typing.Dict[str, str] = {}
+    for context in remote_contexts:
+        remote_path = path.parent / context
+        try:
+            hashes[context] = calculate_hash(remote_path.read_text())
+        except (OSError, ValueError):
+            return None
+    return hashes
+
+
+def _encode_object(value: typing.Any) -> typing.Dict[str, typing.Any]:
+    """
+    Convert an instance of an artifact class, an enum or a tuple to a JSON object.
+
+    Raise TypeError if the value is not an instance of an artifact class nor a tuple.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        The JSON object with the name of the type under the type key and the encoded
+        value under the value key.
+
+    """
+    name = type(value).__name__
+    if _ARTIFACTS_CLASSES.get(name) is not type(value):
+        # Only plain tuples are encoded without an artifact class
+        if not isinstance(value, tuple) or hasattr(value, "_fields"):
+            raise TypeError(f"{name} is not an artifacts class")
+        name = _ARTIFACTS_TUPLE_TYPE
+
+    encoded: typing.Any
+    if isinstance(value, enum.Enum):
+        encoded = value.value
+    elif isinstance(value, tuple):
+        encoded = [_encode_artifacts(item) for item in value]
+    else:
+        encoded = {
+            field.name: _encode_artifacts(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+    return {_ARTIFACTS_TYPE_KEY: name, _ARTIFACTS_VALUE_KEY: encoded}
+
+
+def _encode_artifacts(value: typing.Any) -> typing.Any:
+    """
+    Convert the processed schemas or the artifacts to JSON values.
+
+    The artifact classes, enums and tuples are converted to JSON objects with the
+    name of the type under the type key and the encoded value under the value key.
+    Dictionaries that have the type key are wrapped in the same way.
+
+    Raise TypeError if the value contains a class that is not an artifacts class or a
+    dictionary key that is not a string.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        The JSON value.
+
+    """
+    if isinstance(value, (enum.Enum, tuple)) or dataclasses.is_dataclass(value):
+        return _encode_object(value)
+    if isinstance(value, list):
+        return [_encode_artifacts(item) for item in value]
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError("the keys of dictionaries must be strings")
+        encoded = {key: _encode_artifacts(item) for key, item in value.items()}
+        if _ARTIFACTS_TYPE_KEY in value:
+            return {
+                _ARTIFACTS_TYPE_KEY: _ARTIFACTS_DICT_TYPE,
+                _ARTIFACTS_VALUE_KEY: encoded,
+            }
+        return encoded
+    return value
+
+
+def _decode_object(name: typing.Any, encoded: typing.Any) -> typing.Any:
+    """
+    Convert a JSON object from _encode_object back to the artifact class or tuple.
+
+    Raise CacheError if the name is not an artifact class or the encoded value is not
+    valid for it.
+
+    Args:
+        name: The name of the type.
+        encoded: The encoded value.
+
+    Returns:
+        The instance of the artifact class, the enum or the tuple.
+
+    """
+    if name == _ARTIFACTS_TUPLE_TYPE and isinstance(encoded, list):
+        return tuple(_decode_artifacts(item) for item in encoded)
+
+    cls = _ARTIFACTS_CLASSES.get(name) if isinstance(name, str) else None
+    try:
+        if cls is not None and issubclass(cls, enum.Enum):
+            return cls(encoded)
+        if (
+            cls is not None
+            and dataclasses.is_dataclass(cls)
+            and isinstance(encoded, dict)
+        ):
+            return cls(
+                **{key: _decode_artifacts(item) for key, item in encoded.items()}
+            )
+        if cls is not None and issubclass(cls, tuple) and isinstance(encoded, list):
+            return cls(*(_decode_artifacts(item) for item in encoded))
+    except (TypeError, ValueError) as exc:
+        raise exceptions.CacheError(
+            f"the artifacts cache has an invalid {name} value"
+        ) from exc
+    raise exceptions.CacheError(f"the artifacts cache has an invalid type, type={name}")
+
+
+def _decode_artifacts(value: typing.Any) -> typing.Any:
+    """
+    Convert the JSON values from the artifacts cache back to the schemas or artifacts.
+
+    Raise CacheError if the value was not encoded by _encode_artifacts.
+
+    Args:
+        value: The JSON value.
+
+    Returns:
+        The processed schemas or the artifacts.
+
+    """
+    if isinstance(value, list):
+        return [_decode_artifacts(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if _ARTIFACTS_TYPE_KEY not in value:
+        return {key: _decode_artifacts(item) for key, item in value.items()}
+
+    name = value[_ARTIFACTS_TYPE_KEY]
+    encoded = value.get(_ARTIFACTS_VALUE_KEY)
+    if name == _ARTIFACTS_DICT_TYPE and isinstance(encoded, dict):
+        return {key: _decode_artifacts(item) for key, item in encoded.items()}
+    return _decode_object(name, encoded)
+
+
+class CachedArtifacts(typing.NamedTuple):
+    """The processed schemas and the artifacts of the models from the cache."""
+
+    schemas: types.Schemas
+    artifacts: types.ModelsModelArtifacts
+
+
+def load_artifacts(filename: str) -> typing.Optional[CachedArtifacts]:
+    """
+    Retrieve the processed schemas and artifacts of the models from the cache.
+
+    Algorithm:
+    1. If the spec file or the artifacts cache do not exist or are not files, return
+        None.
+    2. Calculate the hash of the spec file contents.
+    3. Try to load the artifacts cache, if it fails or it is not a dictionary, return
+        None.
+    4. If the version, the version of OpenAlchemy or the hash are different to the
+        current versions or the hash of the file, return None.
+    5. If the hash of any remote file is different to the hash of its contents or it
+        can't be read, return None.
+    6. Decode the schemas and artifacts from the cache, if it fails return None.
+
+    Args:
+        filename: The name of the OpenAPI specification file.
+
+    Returns:
+        The processed schemas and artifacts of the models or None if they are not
+        cached for the contents of the file.
+
+    """
+    path = pathlib.Path(filename)
+    cache_path = calculate_artifacts_cache_path(path)
+
+    # Check that both file and cache exists and are files
+    if (
+        not path.exists()
+        or not path.is_file()
+        or not cache_path.exists()
+        or not cache_path.is_file()
+    ):
+        return None
+
+    file_hash = calculate_hash(path.read_text())
+
+    try:
+        cache = json.loads(cache_path.read_text())
+    except json.JSONDecodeError:
+        return None
+
+    cache_valid = (
+        isinstance(cache, dict)
+        and cache.get(_ARTIFACTS_VERSION_KEY) == _ARTIFACTS_VERSION
+        and cache.get(_ARTIFACTS_PACKAGE_VERSION_KEY) == _package_version()
+        and cache.get(_HASH_KEY) == file_hash
+        and isinstance(cache.get(_ARTIFACTS_REMOTE_KEY), dict)
+        and isinstance(cache.get(_ARTIFACTS_SCHEMAS_KEY), dict)
+        and isinstance(cache.get(_ARTIFACTS_ARTIFACTS_KEY), dict)
+    )
+    if not cache_valid:
+        return None
+
+    remote_hashes = cache[_ARTIFACTS_REMOTE_KEY]
+    if _remote_hashes(path=path, remote_contexts=remote_hashes) != remote_hashes:
+        return None
+
+    try:
+        return CachedArtifacts(
+            schemas=_decode_artifacts(cache[_ARTIFACTS_SCHEMAS_KEY]),
+            artifacts=_decode_artifacts(cache[_ARTIFACTS_ARTIFACTS_KEY]),
+        )
+    except exceptions.CacheError:
+        return None
+
+
+def store_artifacts(
+    filename: str,
+    *,
+    schemas: types.Schemas,
+    artifacts: types.ModelsModelArtifacts,
+    remote_contexts: typing.Iterable[str] = (),
+) -> None:
+    """
+    Update the cache with the processed schemas and artifacts of the models.
+
+    The cache is replaced atomically so that processes starting at the same time never
+    read a partially written cache. Writing the cache is skipped if the folder of the
+    spec file is not writable, if any remote file is not a readable file or if the
+    schemas or artifacts can't be encoded.
+
+    Raise CacheError if the spec file does not exist or is not a file.
+
+    Args:
+        filename: The name of the spec file.
+        schemas: The processed schemas.
+        artifacts: The artifacts of the models.
+        remote_contexts: The paths, relative to the spec file, of the remote files
+            the schemas reference.
+
+    """
+    path = pathlib.Path(filename)
+    if not path.exists():
+        raise exceptions.CacheError(
+            f"the spec file does not exists, filename={filename}"
+        )
+    if not path.is_file():
+        raise exceptions.CacheError(f"the spec file is not a file, filename={filename}")
+    file_hash = calculate_hash(path.read_text())
+
+    cache_path = calculate_artifacts_cache_path(path)
+    if cache_path.exists() and not cache_path.is_file():
+        shutil.rmtree(cache_path)
+
+    remote_hashes = _remote_hashes(path=path, remote_contexts=remote_contexts)
+    if remote_hashes is None:
+        return
+    try:
+        cache_contents = json.dumps(
+            {
+                _ARTIFACTS_VERSION_KEY: _ARTIFACTS_VERSION,
+                _ARTIFACTS_PACKAGE_VERSION_KEY: _package_version(),
+                _HASH_KEY: file_hash,
+                _ARTIFACTS_REMOTE_KEY: remote_hashes,
+                _ARTIFACTS_SCHEMAS_KEY: _encode_artifacts(schemas),
+                _ARTIFACTS_ARTIFACTS_KEY: _encode_artifacts(artifacts),
+            }
+        )
+    except (TypeError, ValueError):
+        return
+
+    try:
+        out_file = tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=cache_path.parent,
+            prefix=cache_path.name,
+            delete=False,
+        )
+    except OSError:
+        return
+    try:
+        with out_file:
+            out_file.write(cache_contents)
+        os.chmod(out_file.name, 0o644)
+        os.replace(out_file.name, cache_path)
+    except OSError:
+        os.remove(out_file.name)
@@ -1,5 +1,6 @@
 """Define the CLI module."""
 import argparse
+import contextlib
 import logging
 import pathlib
 
@@ -9,6 +10,7 @@ from open_alchemy import build_yaml
 from open_alchemy import exceptions
 from open_alchemy import init_json
 from open_alchemy import init_yaml
+from open_alchemy import profile
 
 # Configure the logger.
 logging.basicConfig(format="%(message)s", level=logging.INFO)
@@ -20,8 +22,10 @@ VALID_EXTENSIONS = [".json", ".yml", ".yaml"]
 def main() -> None:
     """Define the CLI entrypoint."""
     args = build_application_parser()
+    context = profile.collect() if args.profile else contextlib.nullcontext()
     try:
-        args.func(args)
+        with context:
+            args.func(args)
     except exceptions.CLIError as exc:
         logging.error("Cannot perform the operation: %s.", exc)
 
@@ -55,6 +59,11 @@ def build_application_parser() -> argparse.Namespace:
     """Build the main parser and subparsers."""
     # Define the top level parser.
     parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="log the time and memory spent in each phase of the initialization",
+    )
     subparsers = parser.add_subparsers(title="subcommands", help="subcommand help")
 
     # Define the parser for the "build" subcommand.
@@ -75,6 +84,7 @@ def build_application_parser() -> argparse.Namespace:
         choices=["sdist", "wheel"],
         help="limit the format to either sdist or wheel, defaults to both",
     )
+    _add_jobs_argument(build_parser)
     build_parser.set_defaults(func=build)
 
     # Define the parser for the "generate" subcommand.
@@ -87,12 +97,25 @@ def build_application_parser() -> argparse.Namespace:
         "specfile", type=str, help="specify the specification file"
     )
     generate_parser.add_argument("output", type=str, help="specify the output file")
+    _add_jobs_argument(generate_parser)
     generate_parser.set_defaults(func=generate)
 
     # Return the parsed arguments for a particular command.
     return parser.parse_args()
 
 
+def _add_jobs_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the argument for the number of processes that validate the models."""
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="validate the models using this many processes, 0 for the number of "
+        "CPUs, defaults to 1",
+    )
+
+
 def build(args: argparse.Namespace) -> None:
     """
     Define the build subcommand.
@@ -113,10 +136,13 @@ def build(args: argparse.Namespace) -> None:
         "sdist": PackageFormat.SDIST,
         "wheel": PackageFormat.WHEEL,
     }
+    package_format = fmt.get(args.format, fmt[None])
 
     # Build the package.
     builder = builders.get(specfile.suffix.lower())
-    builder(args.specfile, args.name, args.output, fmt.get(args.format))  # type: ignore
+    builder(  # type: ignore
+        args.specfile, args.name, args.output, package_format, jobs=args.jobs
+    )
 
 
 def generate(args):
@@ -135,4 +161,4 @@ def generate(args):
 
     # Regenerate the models.
     generator = generators.get(specfile.suffix.lower())
-    generator(args.specfile, models_filename=args.output)
+    generator(args.specfile, models_filename=args.output, jobs=args.jobs)
@@ -0,0 +1,92 @@
+"""Encode and decode JSON using the standard library or a faster backend."""
+
+import dataclasses
+import enum
+import functools
+import json
+import typing
+
+
+@enum.unique
+class JsonBackend(str, enum.Enum):
+    """The library used by to_str, from_str and iter_json to encode and decode JSON."""
+
+    # The json module of the standard library
+    STDLIB = "stdlib"
+    # orjson, which must be installed
+    ORJSON = "orjson"
+    # orjson if it is installed, otherwise the json module of the standard library
+    AUTO = "auto"
+
+
+@dataclasses.dataclass(frozen=True)
+class Codec:
+    """The functions of a backend to encode and decode JSON."""
+
+    # The backend the functions are from
+    backend: JsonBackend
+    # Encode a value as a JSON string
+    dumps: typing.Callable[[typing.Any], str]
+    # Decode a JSON string
+    loads: typing.Callable[[str], typing.Any]
+    # The string formats whose Python values are encoded directly by dumps without
+    # converting them to a string first
+    native_formats: typing.FrozenSet[str] = frozenset()
+
+
+STDLIB = Codec(backend=JsonBackend.STDLIB, dumps=json.dumps, loads=json.loads)
+
+
+def _orjson() -> Codec:
+    """
+    Construct the codec using orjson.
+
+    Raise ImportError if orjson has not been installed.
+
+    Returns:
+        The codec.
+
+    """
+    import orjson  # pylint: disable=import-outside-toplevel
+
+    def dumps(value: typing.Any) -> str:
+        """Encode a value as a JSON string."""
+        return orjson.dumps(value).decode()
+
+    return Codec(
+        backend=JsonBackend.ORJSON,
+        dumps=dumps,
+        loads=orjson.loads,
+        native_formats=frozenset(("date", "date-time")),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get(*, backend: JsonBackend) -> Codec:
+    """
+    Get the codec for a backend.
+
+    Raise ImportError if the orjson backend is requested but orjson has not been
+    installed.
+
+    Args:
+        backend: The backend to get the codec for. auto uses orjson if it has been
+            installed and the standard library otherwise.
+
+    Returns:
+        The codec.
+
+    """
+    backend = JsonBackend(backend)
+    if backend == JsonBackend.STDLIB:
+        return STDLIB
+
+    try:
+        return _orjson()
+    except ImportError as exc:
+        if backend == JsonBackend.AUTO:
+            return STDLIB
+        raise ImportError(
+            "Using the orjson JSON backend requires the orjson package. Try "
+            "`pip install orjson`."
+        ) from exc
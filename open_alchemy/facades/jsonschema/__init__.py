@@ -9,6 +9,7 @@ import jsonschema
 # Re mapping values
 ValidationError = jsonschema.ValidationError
 validate = jsonschema.validate  # pylint: disable=invalid-name
+Validator = typing.Any  # pylint: disable=invalid-name
 
 
 def _filename_to_dict(filename: str) -> typing.Dict:
@@ -46,3 +47,44 @@ def resolver(
     initial: typing.Dict[str, typing.Any] = {}
     merged_schema = functools.reduce(lambda x, y: {**x, **y}, schema_dicts, initial)
     return jsonschema.RefResolver.from_schema(merged_schema), schema_dicts
+
+
+def compile_(
+    schema: typing.Any, *, ref_resolver: typing.Optional[jsonschema.RefResolver] = None
+) -> Validator:
+    """
+    Construct a validator for a schema that can be re-used for many instances.
+
+    The schema is checked against its meta schema once, calling validate_compiled
+    with the returned validator is equivalent to calling validate with the schema.
+
+    Raise jsonschema.SchemaError if the schema is not valid.
+
+    Args:
+        schema: The schema to construct the validator for.
+        ref_resolver: The resolver to use for any references in the schema.
+
+    Returns:
+        The validator for the schema.
+
+    """
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema, resolver=ref_resolver)
+
+
+def validate_compiled(instance: typing.Any, validator: Validator) -> None:
+    """
+    Validate an instance with a validator constructed by compile_.
+
+    Raise the same jsonschema.ValidationError as validate, which is the best match
+    of all the errors rather than the first error.
+
+    Args:
+        instance: The instance to validate.
+        validator: The validator for the schema.
+
+    """
+    error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
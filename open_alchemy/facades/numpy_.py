@@ -0,0 +1,31 @@
+"""Facade for NumPy, which is an optional dependency."""
+
+import typing
+
+
+def array(*, values: typing.Iterable[typing.Any], dtype: str) -> typing.Any:
+    """
+    Construct a NumPy array.
+
+    Raise ImportError if NumPy has not been installed.
+
+    Args:
+        values: The values of the array.
+        dtype: The dtype of the array. If a value is None, the dtype of an integer or
+            boolean array is object.
+
+    Returns:
+        The array.
+
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError(
+            "Converting columns to NumPy arrays requires the numpy package. Try "
+            "`pip install numpy`."
+        ) from exc
+
+    if dtype in {"int64", "bool"} and isinstance(values, list):
+        dtype = "object"
+    return numpy.array(values, dtype=dtype)
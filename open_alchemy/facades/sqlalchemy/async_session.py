@@ -0,0 +1,63 @@
+"""Load and add instances using an asyncio session."""
+
+import typing
+
+import sqlalchemy
+
+# The maximum number of instances loaded by a statement
+LOAD_CHUNK_SIZE = 500
+
+
+async def load(
+    *,
+    session: typing.Any,
+    model: typing.Type,
+    instances: typing.Sequence[typing.Any],
+    keys: typing.AbstractSet[str],
+    options: typing.Sequence[typing.Any],
+) -> None:
+    """
+    Load the unloaded attributes of instances of a model with loader options.
+
+    If there are options or any of the attributes is not loaded for an instance, the
+    instances are selected by their primary key with the options so that the session
+    populates the attributes that are not loaded, including expired attributes.
+    Changes to the instances that have not been flushed are kept. Instances that are
+    not persistent are skipped.
+
+    Args:
+        session: The AsyncSession of the instances.
+        model: The model of the instances.
+        instances: The instances to load.
+        keys: The names of the attributes that must be loaded.
+        options: The loader options for the relationships to load.
+
+    """
+    states = [sqlalchemy.inspect(instance) for instance in instances]
+    identities = [state.identity for state in states if state.identity is not None]
+    if not options and not any(state.unloaded & keys for state in states):
+        return
+
+    primary_key = sqlalchemy.inspect(model).primary_key
+    for start in range(0, len(identities), LOAD_CHUNK_SIZE):
+        chunk = identities[start : start + LOAD_CHUNK_SIZE]
+        if len(primary_key) == 1:
+            condition = primary_key[0].in_([identity[0] for identity in chunk])
+        else:
+            condition = sqlalchemy.tuple_(*primary_key).in_(chunk)
+        # The sqlalchemy-stubs only know the SQLAlchemy 1.3 select API
+        statement: typing.Any = sqlalchemy.select(model)  # type: ignore
+        await session.execute(statement.where(condition).options(*options))
+
+
+async def add(*, session: typing.Any, instances: typing.Sequence[typing.Any]) -> None:
+    """
+    Add instances to an asyncio session and flush them.
+
+    Args:
+        session: The AsyncSession to add the instances to.
+        instances: The instances to add.
+
+    """
+    session.add_all(instances)
+    await session.flush()
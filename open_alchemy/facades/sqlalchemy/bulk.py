@@ -0,0 +1,297 @@
+"""Insert or upsert rows into the table of a model using Core statements."""
+
+import itertools
+import typing
+
+import sqlalchemy
+
+from ... import exceptions
+
+
+def column_keys(*, model: typing.Type) -> typing.Dict[str, str]:
+    """
+    Map the name of each column attribute of a model to the key of its column.
+
+    Args:
+        model: The model.
+
+    Returns:
+        The key of the column of each column attribute.
+
+    """
+    mapper = sqlalchemy.inspect(model)
+    return {prop.key: prop.columns[0].key for prop in mapper.column_attrs}
+
+
+def polymorphic_values(*, model: typing.Type) -> typing.Dict[str, typing.Any]:
+    """
+    Calculate the column values the ORM sets to identify the model of a row.
+
+    Args:
+        model: The model.
+
+    Returns:
+        The polymorphic identity of the model for the key of the polymorphic_on column
+        if the model has one.
+
+    """
+    mapper = sqlalchemy.inspect(model)
+    if mapper.polymorphic_on is None or mapper.polymorphic_identity is None:
+        return {}
+    return {mapper.polymorphic_on.key: mapper.polymorphic_identity}
+
+
+def _key_groups(
+    rows: typing.List[typing.Dict[str, typing.Any]]
+) -> typing.Iterator[typing.List[typing.Dict[str, typing.Any]]]:
+    """
+    Split rows into runs of consecutive rows with the same keys.
+
+    An executemany statement takes its parameters from the keys of the first row, so
+    each run is executed separately. The order of the rows is kept.
+
+    Args:
+        rows: The values of the columns of each row.
+
+    Returns:
+        The runs of rows.
+
+    """
+    return (list(group) for _, group in itertools.groupby(rows, key=frozenset))
+
+
+def insert(
+    *,
+    bind: typing.Any,
+    model: typing.Type,
+    rows: typing.List[typing.Dict[str, typing.Any]],
+) -> None:
+    """
+    Insert rows into the table of a model with an executemany for each run of rows.
+
+    Columns that are not in a row are set to their default, consecutive rows with the
+    same keys are inserted with a single executemany.
+
+    Args:
+        bind: The connection or session to execute the statement with.
+        model: The model.
+        rows: The values of the columns of each row.
+
+    """
+    statement = model.__table__.insert()
+    for group in _key_groups(rows):
+        bind.execute(statement, group)
+
+
+def unique_keys(*, model: typing.Type) -> typing.List[typing.Tuple[str, ...]]:
+    """
+    Calculate the keys of the columns of each unique constraint of a model.
+
+    The primary key is first, followed by unique columns, unique constraints and
+    unique indexes.
+
+    Args:
+        model: The model.
+
+    Returns:
+        The keys of the columns of each unique constraint.
+
+    """
+    table = model.__table__
+    keys: typing.List[typing.Tuple[str, ...]] = [
+        tuple(column.key for column in table.primary_key.columns)
+    ]
+    keys.extend((column.key,) for column in table.columns if column.unique)
+    keys.extend(
+        tuple(column.key for column in constraint.columns)
+        for constraint in table.constraints
+        if isinstance(constraint, sqlalchemy.UniqueConstraint)
+    )
+    keys.extend(
+        tuple(column.key for column in index.columns)
+        for index in table.indexes
+        if index.unique
+    )
+    # A unique column is also recorded as a unique constraint of the table
+    return [key for idx, key in enumerate(keys) if key and key not in keys[:idx]]
+
+
+def _dialect_name(*, bind: typing.Any, model: typing.Type) -> str:
+    """Get the name of the dialect of the database of a connection or session."""
+    dialect = getattr(bind, "dialect", None)
+    if dialect is None:
+        dialect = bind.get_bind(mapper=model).dialect
+    return dialect.name
+
+
+def upsert_statement(
+    *,
+    dialect_name: str,
+    model: typing.Type,
+    conflict_keys: typing.Sequence[str],
+    update_keys: typing.Sequence[str],
+) -> typing.Optional[typing.Any]:
+    """
+    Construct the statement that inserts a row or updates it if it already exists.
+
+    Args:
+        dialect_name: The name of the dialect of the database.
+        model: The model with the table of the rows.
+        conflict_keys: The keys of the columns of the unique constraint that
+            identifies an existing row.
+        update_keys: The keys of the columns to update for an existing row.
+
+    Returns:
+        The statement or None if the dialect does not support upserts.
+
+    """
+    # The dialects are only imported when they are used
+    # pylint: disable=import-outside-toplevel
+    table = model.__table__
+    if dialect_name == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        mysql_statement = mysql_insert(table)
+        # MySQL updates the row for a conflict with any unique constraint
+        return mysql_statement.on_duplicate_key_update(
+            {key: mysql_statement.inserted[key] for key in update_keys or conflict_keys}
+        )
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        statement = sqlite_insert(table)
+    elif dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+
+        statement = postgresql_insert(table)
+    else:
+        return None
+    if not update_keys:
+        return statement.on_conflict_do_nothing(index_elements=conflict_keys)
+    return statement.on_conflict_do_update(
+        index_elements=conflict_keys,
+        set_={key: statement.excluded[key] for key in update_keys},
+    )
+
+
+def _upsert_generic(
+    *,
+    bind: typing.Any,
+    model: typing.Type,
+    rows: typing.List[typing.Dict[str, typing.Any]],
+    conflict_keys: typing.Sequence[str],
+    update_keys: typing.Sequence[str],
+) -> None:
+    """Upsert rows by selecting the existing rows and then updating or inserting."""
+    table = model.__table__
+    conflict_columns = [table.c[key] for key in conflict_keys]
+    row_conflict_values = [tuple(row[key] for key in conflict_keys) for row in rows]
+
+    if len(conflict_columns) == 1:
+        condition = conflict_columns[0].in_(
+            [values[0] for values in row_conflict_values]
+        )
+    else:
+        condition = sqlalchemy.or_(
+            *(
+                sqlalchemy.and_(
+                    *(
+                        column == value
+                        for column, value in zip(conflict_columns, values)
+                    )
+                )
+                for values in row_conflict_values
+            )
+        )
+    existing = {
+        tuple(row)
+        for row in bind.execute(sqlalchemy.select(*conflict_columns).where(condition))
+    }
+
+    inserts: typing.List[typing.Dict[str, typing.Any]] = []
+    updates: typing.List[typing.Dict[str, typing.Any]] = []
+    for row, conflict_values in zip(rows, row_conflict_values):
+        if conflict_values not in existing:
+            existing.add(conflict_values)
+            inserts.append(row)
+        elif update_keys:
+            updates.append(
+                {
+                    **{key: row[key] for key in update_keys},
+                    **{f"conflict_{key}": row[key] for key in conflict_keys},
+                }
+            )
+
+    if inserts:
+        bind.execute(table.insert(), inserts)
+    if updates:
+        bind.execute(
+            table.update()
+            .where(
+                sqlalchemy.and_(
+                    *(
+                        column == sqlalchemy.bindparam(f"conflict_{key}")
+                        for column, key in zip(conflict_columns, conflict_keys)
+                    )
+                )
+            )
+            .values({key: sqlalchemy.bindparam(key) for key in update_keys}),
+            updates,
+        )
+
+
+def upsert(
+    *,
+    bind: typing.Any,
+    model: typing.Type,
+    rows: typing.List[typing.Dict[str, typing.Any]],
+    conflict_keys: typing.Sequence[str],
+) -> None:
+    """
+    Insert rows into the table of a model or update them if they already exist.
+
+    Uses the native upsert statement of SQLite, PostgreSQL and MySQL with an
+    executemany for each run of consecutive rows with the same keys. For other
+    databases, the existing rows of each run are selected and then updated or
+    inserted. The columns of an existing row that are in the row are updated.
+
+    Raise MalformedModelDictionaryError if any row does not have all the columns of
+    the conflict target, before any row is upserted.
+
+    Args:
+        bind: The connection or session to execute the statements with.
+        model: The model.
+        rows: The values of the columns of each row.
+        conflict_keys: The keys of the columns of the unique constraint that
+            identifies an existing row.
+
+    """
+    groups = list(_key_groups(rows))
+    for group in groups:
+        missing_keys = [key for key in conflict_keys if key not in group[0]]
+        if missing_keys:
+            raise exceptions.MalformedModelDictionaryError(
+                "A row does not have all the columns of the conflict target.",
+                missing_keys=missing_keys,
+                row=group[0],
+            )
+
+    dialect_name = _dialect_name(bind=bind, model=model)
+    for group in groups:
+        update_keys = [key for key in group[0] if key not in conflict_keys]
+        statement = upsert_statement(
+            dialect_name=dialect_name,
+            model=model,
+            conflict_keys=conflict_keys,
+            update_keys=update_keys,
+        )
+        if statement is None:
+            _upsert_generic(
+                bind=bind,
+                model=model,
+                rows=group,
+                conflict_keys=conflict_keys,
+                update_keys=update_keys,
+            )
+        else:
+            bind.execute(statement, group)
@@ -0,0 +1,52 @@
+"""Construct loader options for queries."""
+
+import typing
+
+from sqlalchemy import orm
+
+
+def construct(*, path: typing.Sequence[typing.Tuple[typing.Any, bool]]) -> typing.Any:
+    """
+    Construct the option that loads a path of relationships with a query.
+
+    Collections are loaded using selectinload and other relationships using
+    joinedload.
+
+    Args:
+        path: The attribute of each relationship on the path together with whether the
+            relationship is a collection.
+
+    Returns:
+        The loader option.
+
+    """
+    (attribute, collection), *rest = path
+    option = orm.selectinload(attribute) if collection else orm.joinedload(attribute)
+    for attribute, collection in rest:
+        option = (
+            option.selectinload(attribute)
+            if collection
+            else option.joinedload(attribute)
+        )
+    return option
+
+
+def load_only(*, attributes: typing.Iterable[typing.Any]) -> typing.Any:
+    """
+    Construct the option that only loads the columns of some attributes.
+
+    Attributes that are not columns, such as relationships, are ignored.
+
+    Args:
+        attributes: The attributes whose columns are loaded.
+
+    Returns:
+        The loader option.
+
+    """
+    columns = [
+        attribute
+        for attribute in attributes
+        if isinstance(getattr(attribute, "property", None), orm.ColumnProperty)
+    ]
+    return orm.load_only(*columns)
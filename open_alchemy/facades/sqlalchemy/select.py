@@ -0,0 +1,53 @@
+"""Construct Core select statements for the columns of a model."""
+
+import typing
+
+import sqlalchemy
+
+
+def construct(*, model: typing.Type, names: typing.Sequence[str]) -> typing.Any:
+    """
+    Construct the statement that selects the columns of some attributes of a model.
+
+    Each column is labelled with the name of its attribute. The rows are selected from
+    the tables of the model so that a model that inherits using joined table
+    inheritance only selects its rows. For single table inheritance, only the rows
+    with the polymorphic identity of the model or a model that inherits from it are
+    selected.
+
+    Args:
+        model: The model.
+        names: The names of the column attributes to select.
+
+    Returns:
+        The statement.
+
+    """
+    mapper = sqlalchemy.inspect(model)
+    statement = sqlalchemy.select(
+        *(mapper.column_attrs[name].columns[0].label(name) for name in names)
+    ).select_from(mapper.selectable)
+    if mapper.single and mapper.polymorphic_on is not None:
+        statement = statement.where(
+            mapper.polymorphic_on.in_(
+                [
+                    descendant.polymorphic_identity
+                    for descendant in mapper.self_and_descendants
+                ]
+            )
+        )
+    return statement
+
+
+def keys(*, statement: typing.Any) -> typing.List[str]:
+    """
+    Calculate the keys of the columns of the rows of a select statement.
+
+    Args:
+        statement: The statement.
+
+    Returns:
+        The key of each column in the order of the columns.
+
+    """
+    return list(statement.selected_columns.keys())
@@ -1,24 +1,74 @@
 """Define all the models with x-tablename properties."""
 
+import threading
+import typing
+
 from .. import types
-from . import inheritance as inheritance_helper
-from . import schema as schema_helper
+from . import dependency_graph
 
 
-def define_all(*, model_factory: types.ModelFactory, schemas: types.Schemas) -> None:
+def define_all(
+    *,
+    model_factory: types.ModelFactory,
+    schemas: types.Schemas,
+    graph: typing.Optional[dependency_graph.DependencyGraph] = None,
+) -> None:
     """
     Define all the models with x-tablename properties.
 
+    The models are defined in the topological order of the graph of their
+    dependencies, so a parent is defined before the models that inherit from it.
+
     Args:
         model_factory: Factory used to construct models.
         schemas: The schemas from which to define all.
+        graph: The graph of the dependencies of the models. If it is not passed, it is
+            built with only the inheritance dependencies.
 
     """
-    for name, schema in schemas.items():
-        if not schema_helper.constructable(schema=schema, schemas=schemas):
-            continue
-        if schema_helper.inherits(schema=schema, schemas=schemas):
-            parents = inheritance_helper.get_parents(schema=schema, schemas=schemas)
-            for parent in parents:
-                model_factory(name=parent)
+    if graph is None:
+        graph = dependency_graph.build(schemas=schemas, artifacts={})
+    for name in graph.topological_order():
         model_factory(name=name)
+
+
+def define_lazy(
+    *,
+    model_factory: types.ModelFactory,
+    graph: dependency_graph.DependencyGraph,
+) -> typing.Callable[[str], typing.Type]:
+    """
+    Calculate the function that defines a model when it is first accessed.
+
+    The function is intended to be used as the __getattr__ of the models module. The
+    model is defined together with the closure of its dependencies in the graph so that
+    it can be used straight away.
+
+    Args:
+        model_factory: Factory used to construct models.
+        graph: The graph of the dependencies of the models.
+
+    Returns:
+        The function that defines a model based on its name.
+
+    """
+    order = graph.topological_order()
+    lock = threading.RLock()
+
+    def define(name: str) -> typing.Type:
+        """Define a model and any models it depends on."""
+        if name not in graph:
+            raise AttributeError(
+                f"module 'open_alchemy.models' has no attribute '{name}'"
+            )
+
+        with lock:
+            # Define the model and its dependencies in the same order as define_all
+            names = graph.closure(names=[name])
+            for current in order:
+                if current in names:
+                    model_factory(name=current)
+
+            return model_factory(name=name)
+
+    return define
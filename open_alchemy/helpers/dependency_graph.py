@@ -0,0 +1,284 @@
+"""Graph of the models that have to be defined before or together with a model."""
+
+import typing
+
+from .. import types
+from . import inheritance as inheritance_helper
+from . import schema as schema_helper
+
+
+def calculate_dependencies(
+    *, artifacts: types.ModelsModelArtifacts
+) -> typing.Dict[str, typing.Set[str]]:
+    """
+    Calculate the models that have to be defined together with each model.
+
+    SQLAlchemy resolves relationships and foreign keys by name, so a model can only be
+    used once the targets of its relationships, the models that define back references
+    to it, the association tables of its many-to-many relationships and the targets of
+    its foreign keys are defined.
+
+    Args:
+        artifacts: The artifacts of the models.
+
+    Returns:
+        Mapping of the name of each model to the names of the models it depends on.
+
+    """
+    tablename_names: typing.Dict[str, typing.List[str]] = {}
+    for name, model_artifacts in artifacts.items():
+        tablename_names.setdefault(model_artifacts.tablename, []).append(name)
+
+    def model_dependencies(
+        model_artifacts: types.ModelArtifacts,
+    ) -> typing.Iterator[str]:
+        """Calculate the names of the models a model depends on."""
+        for _, property_artifacts in model_artifacts.properties:
+            if property_artifacts.type == types.PropertyType.RELATIONSHIP:
+                yield property_artifacts.parent
+                if property_artifacts.sub_type == types.RelationshipType.MANY_TO_MANY:
+                    yield from tablename_names.get(property_artifacts.secondary, [])
+            if (
+                property_artifacts.type == types.PropertyType.SIMPLE
+                and property_artifacts.extension.foreign_key is not None
+            ):
+                tablename = property_artifacts.extension.foreign_key.split(".")[0]
+                yield from tablename_names.get(tablename, [])
+        for _, backref_artifacts in model_artifacts.backrefs:
+            yield backref_artifacts.child
+
+    return {
+        name: set(model_dependencies(model_artifacts)) - {name}
+        for name, model_artifacts in artifacts.items()
+    }
+
+
+class DependencyGraph:
+    """
+    The dependencies between the models.
+
+    A model depends on its parent and on the models that have to be defined together
+    with it, see calculate_dependencies. The names of the models and the dependencies
+    of each model are kept in the order of the schemas so that every order calculated
+    from the graph is deterministic.
+    """
+
+    def __init__(
+        self,
+        *,
+        dependencies: typing.Dict[str, typing.Iterable[str]],
+        parents: typing.Dict[str, str],
+    ) -> None:
+        """
+        Construct.
+
+        Dependencies on names that are not models are ignored.
+
+        Args:
+            dependencies: The names of the models the model depends on for the name of
+                each model in the order of the schemas.
+            parents: The name of the parent of each model that inherits.
+
+        """
+        positions = {name: position for position, name in enumerate(dependencies)}
+        self.names: typing.Tuple[str, ...] = tuple(dependencies)
+        self.parents = {
+            name: parent for name, parent in parents.items() if parent in positions
+        }
+        self.dependencies: typing.Dict[str, typing.Tuple[str, ...]] = {
+            name: tuple(
+                sorted(
+                    {
+                        dependency
+                        for dependency in name_dependencies
+                        if dependency in positions and dependency != name
+                    }
+                    | ({self.parents[name]} if name in self.parents else set()),
+                    key=positions.__getitem__,
+                )
+            )
+            for name, name_dependencies in dependencies.items()
+        }
+        dependents: typing.Dict[str, typing.List[str]] = {
+            name: [] for name in self.names
+        }
+        for name, name_dependencies in self.dependencies.items():
+            for dependency in name_dependencies:
+                dependents[dependency].append(name)
+        self.dependents: typing.Dict[str, typing.Tuple[str, ...]] = {
+            name: tuple(name_dependents) for name, name_dependents in dependents.items()
+        }
+        self._components: typing.Optional[typing.List[typing.Tuple[str, ...]]] = None
+
+    def __contains__(self, name: typing.Any) -> bool:
+        """Check whether a model is in the graph."""
+        return name in self.dependencies
+
+    def strongly_connected_components(self) -> typing.List[typing.Tuple[str, ...]]:
+        """
+        Calculate the groups of models that depend on each other.
+
+        Uses Tarjan's algorithm without recursion so that long chains of dependencies
+        are supported. A model that is not part of a cycle is a group by itself.
+
+        Returns:
+            The groups with the groups a group depends on before it. The models of a
+            group are in the order of the schemas.
+
+        """
+        if self._components is not None:
+            return self._components
+
+        positions = {name: position for position, name in enumerate(self.names)}
+        index: typing.Dict[str, int] = {}
+        low_link: typing.Dict[str, int] = {}
+        stack: typing.List[str] = []
+        on_stack: typing.Set[str] = set()
+        components: typing.List[typing.Tuple[str, ...]] = []
+
+        work: typing.List[typing.Tuple[str, typing.Iterator[str]]] = []
+
+        def visit(name: str) -> None:
+            """Start visiting a model."""
+            index[name] = low_link[name] = len(index)
+            stack.append(name)
+            on_stack.add(name)
+            work.append((name, iter(self.dependencies[name])))
+
+        def pop_component(name: str) -> typing.Tuple[str, ...]:
+            """Remove the models of the group of a model from the stack."""
+            component: typing.List[str] = []
+            while not component or component[-1] != name:
+                component.append(stack.pop())
+                on_stack.discard(component[-1])
+            return tuple(sorted(component, key=positions.__getitem__))
+
+        for root in self.names:
+            if root in index:
+                continue
+            visit(root)
+            while work:
+                name, dependencies = work[-1]
+                dependency = next(dependencies, None)
+                if dependency is None:
+                    work.pop()
+                    if work:
+                        caller = work[-1][0]
+                        low_link[caller] = min(low_link[caller], low_link[name])
+                    if low_link[name] == index[name]:
+                        components.append(pop_component(name))
+                elif dependency not in index:
+                    visit(dependency)
+                elif dependency in on_stack:
+                    low_link[name] = min(low_link[name], index[dependency])
+
+        self._components = components
+        return components
+
+    def topological_order(self) -> typing.List[str]:
+        """
+        Calculate the order in which the models are defined.
+
+        A model comes after the models it depends on unless they depend on each other,
+        in which case they are in the order of the schemas except that a parent always
+        comes before the models that inherit from it.
+
+        Returns:
+            The names of all models in the order.
+
+        """
+        order: typing.List[str] = []
+        seen: typing.Set[str] = set()
+
+        def add(name: str, component: typing.Tuple[str, ...]) -> None:
+            """Add a model after its parent if they depend on each other."""
+            if name in seen:
+                return
+            parent = self.parents.get(name)
+            if parent is not None and parent in component:
+                add(parent, component)
+            seen.add(name)
+            order.append(name)
+
+        for component in self.strongly_connected_components():
+            for name in component:
+                add(name, component)
+        return order
+
+    def _reachable(
+        self,
+        *,
+        names: typing.Iterable[str],
+        edges: typing.Dict[str, typing.Tuple[str, ...]],
+    ) -> typing.Set[str]:
+        """Calculate the models reachable from models following the edges."""
+        reachable = {name for name in names if name in self}
+        pending = list(reachable)
+        while pending:
+            for next_name in edges[pending.pop()]:
+                if next_name not in reachable:
+                    reachable.add(next_name)
+                    pending.append(next_name)
+        return reachable
+
+    def closure(self, *, names: typing.Iterable[str]) -> typing.Set[str]:
+        """
+        Calculate the models that have to be defined to use some models.
+
+        Args:
+            names: The names of the models.
+
+        Returns:
+            The models and the models they depend on, recursively.
+
+        """
+        return self._reachable(names=names, edges=self.dependencies)
+
+    def invalidated(self, *, names: typing.Iterable[str]) -> typing.Set[str]:
+        """
+        Calculate the models affected by changes to some models.
+
+        Args:
+            names: The names of the models that changed.
+
+        Returns:
+            The models and the models that depend on them, recursively.
+
+        """
+        return self._reachable(names=names, edges=self.dependents)
+
+
+def build(
+    *, schemas: types.Schemas, artifacts: types.ModelsModelArtifacts
+) -> DependencyGraph:
+    """
+    Build the graph of the dependencies between the constructable schemas.
+
+    The parent of each model is retrieved from the schemas and the other dependencies
+    are calculated from the artifacts so the graph only has inheritance dependencies
+    for models without artifacts.
+
+    Args:
+        schemas: All the schemas.
+        artifacts: The artifacts of the models.
+
+    Returns:
+        The graph.
+
+    """
+    dependencies = calculate_dependencies(artifacts=artifacts)
+    names: typing.List[str] = []
+    parents: typing.Dict[str, str] = {}
+    for name, schema in schemas.items():
+        if not schema_helper.constructable(schema=schema, schemas=schemas):
+            continue
+        names.append(name)
+        if schema_helper.inherits(schema=schema, schemas=schemas):
+            parents[name] = inheritance_helper.get_parent(
+                schema=schema, schemas=schemas
+            )
+
+    return DependencyGraph(
+        dependencies={name: dependencies.get(name, set()) for name in names},
+        parents=parents,
+    )
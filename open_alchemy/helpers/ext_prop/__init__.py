@@ -1,5 +1,6 @@
 """Read the value of an extension property, validate the schema and return it."""
 
+import functools
 import json
 import os
 import typing
@@ -16,6 +17,12 @@ _resolver, (_SCHEMAS, _) = jsonschema.resolver(  # pylint: disable=invalid-name
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _validator(name: str) -> jsonschema.Validator:
+    """Get the validator for an extension property, constructed on first use."""
+    return jsonschema.compile_(_SCHEMAS.get(name), ref_resolver=_resolver)
+
+
 def get(
     *,
     source: typing.Union[
@@ -65,7 +72,7 @@ def get(
 
     schema = _SCHEMAS.get(name)
     try:
-        jsonschema.validate(instance=value, schema=schema, resolver=_resolver)
+        jsonschema.validate_compiled(value, _validator(name))
     except jsonschema.ValidationError as exc:
         raise exceptions.MalformedExtensionPropertyError(
             f"The value of the {json.dumps(name)} extension property is not "
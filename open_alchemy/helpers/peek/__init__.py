@@ -1,5 +1,6 @@
 """Assemble the final schema and return its type."""
 
+import functools
 import typing
 
 from open_alchemy import exceptions
@@ -7,6 +8,7 @@ from open_alchemy import types
 from open_alchemy.facades import jsonschema
 
 from .. import ext_prop as ext_prop_helper
+from .. import schema_index
 from . import helpers
 
 PeekValue = helpers.PeekValue
@@ -748,18 +750,13 @@ def default(*, schema: types.Schema, schemas: types.Schemas) -> types.TColumnDef
     )
     if value is None:
         return None
-    # Assemble schema
-    resolved_schema: types.ColumnSchema = {
-        types.OpenApiProperties.TYPE.value: type_(schema=schema, schemas=schemas)
-    }
-    format_value = format_(schema=schema, schemas=schemas)
-    max_length_value = max_length(schema=schema, schemas=schemas)
-    if format_value is not None:
-        resolved_schema[types.OpenApiProperties.FORMAT.value] = format_value
-    if max_length_value is not None:
-        resolved_schema[types.OpenApiProperties.MAX_LENGTH.value] = max_length_value
+    validator = _default_validator(
+        type_(schema=schema, schemas=schemas),
+        format_(schema=schema, schemas=schemas),
+        max_length(schema=schema, schemas=schemas),
+    )
     try:
-        jsonschema.validate(value, resolved_schema)
+        jsonschema.validate_compiled(value, validator)
     except jsonschema.ValidationError as exc:
         raise exceptions.MalformedSchemaError(
             "The default value does not conform to the schema. "
@@ -768,6 +765,23 @@ def default(*, schema: types.Schema, schemas: types.Schemas) -> types.TColumnDef
     return value
 
 
+@functools.lru_cache(maxsize=None)
+def _default_validator(
+    type_value: str,
+    format_value: typing.Optional[str],
+    max_length_value: typing.Optional[int],
+) -> jsonschema.Validator:
+    """Get the validator for default values, constructed once for each schema."""
+    resolved_schema: types.ColumnSchema = {
+        types.OpenApiProperties.TYPE.value: type_value
+    }
+    if format_value is not None:
+        resolved_schema[types.OpenApiProperties.FORMAT.value] = format_value
+    if max_length_value is not None:
+        resolved_schema[types.OpenApiProperties.MAX_LENGTH.value] = max_length_value
+    return jsonschema.compile_(resolved_schema)
+
+
 def server_default(
     *, schema: types.Schema, schemas: types.Schemas
 ) -> typing.Optional[str]:
@@ -896,9 +910,32 @@ def peek_key(
         The key value (if found) or None.
 
     """
+    current_index = schema_index.get(schemas=schemas)
+    if (
+        current_index is not None
+        and skip_ref is None
+        and schema in current_index
+        and helpers.is_resolvable(key)
+    ):
+        resolved = current_index.lookup(
+            schema=schema, key="resolved", calculate=lambda: _resolve(schema, schemas)
+        )
+        if resolved is not None:
+            return resolved.get(key)
+
     return helpers.peek_key(schema, schemas, key, set(), skip_ref=skip_ref)
 
 
+def _resolve(
+    schema: types.Schema, schemas: types.Schemas
+) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    """Resolve a schema, returning None if it is malformed."""
+    try:
+        return helpers.resolve(schema, schemas, set())
+    except exceptions.BaseError:
+        return None
+
+
 def prefer_local(
     *, get_value: PeekValue, schema: types.Schema, schemas: types.Schemas
 ) -> typing.Any:
@@ -1,5 +1,6 @@
 """Helpers for the peek functions."""
 
+import functools
 import typing
 
 from open_alchemy import exceptions
@@ -55,6 +56,14 @@ def check_sub_schema_dict(sub_schema: typing.Any) -> dict:
     return sub_schema
 
 
+@functools.lru_cache(maxsize=None)
+def prefixed_keys(key: str) -> typing.Tuple[str, ...]:
+    """Calculate the keys to look for including any extension property prefixes."""
+    if key.startswith("x-"):
+        return tuple(key.replace("x-", prefix) for prefix in types.KeyPrefixes)
+    return (key,)
+
+
 def peek_key(
     schema: types.Schema,
     schemas: types.Schemas,
@@ -66,11 +75,7 @@ def peek_key(
     check_schema_schemas_dict(schema, schemas)
 
     # Base case, look for type key
-    keys = (
-        [key.replace("x-", prefix) for prefix in types.KeyPrefixes]
-        if key.startswith("x-")
-        else [key]
-    )
+    keys = prefixed_keys(key)
     value = next(filter(lambda value: value is not None, map(schema.get, keys)), None)
     if value is not None:
         return value
@@ -100,6 +105,79 @@ def peek_key(
     return None
 
 
+def _unprefixed_keys(key: typing.Any) -> typing.Iterator[str]:
+    """Calculate the keys that look for a key of a schema including any prefix."""
+    if not isinstance(key, str):
+        return
+    yield key
+    for prefix in types.KeyPrefixes:
+        if not key.startswith(prefix):
+            continue
+        suffix = key[len(prefix) :]
+        # Keys where the suffix contains x- are not resolved, see is_resolvable
+        if "x-" not in suffix:
+            yield f"x-{suffix}"
+
+
+def is_resolvable(key: str) -> bool:
+    """Check whether the value for a key can be looked up in a resolved schema."""
+    return not key.startswith("x-") or "x-" not in key[2:]
+
+
+def resolve(
+    schema: types.Schema, schemas: types.Schemas, seen_refs: typing.Set[str]
+) -> typing.Dict[str, typing.Any]:
+    """
+    Resolve the value of all keys of a schema.
+
+    The value of a key in the resolved schema is the value peek_key returns for the
+    key. Any $ref and allOf are followed completely so that any malformed schema
+    raises an exception even if peek_key would find the key before reaching it.
+
+    Args:
+        schema: The schema to resolve.
+        schemas: All the schemas to resolve any $ref.
+        seen_refs: All the $ref that have already been seen.
+
+    Returns:
+        The value of all keys that are not None.
+
+    """
+    check_schema_schemas_dict(schema, schemas)
+
+    resolved: typing.Dict[str, typing.Any] = {}
+    for key in {key for raw_key in schema for key in _unprefixed_keys(raw_key)}:
+        value = next(
+            filter(
+                lambda value: value is not None, map(schema.get, prefixed_keys(key))
+            ),
+            None,
+        )
+        if value is not None:
+            resolved[key] = value
+
+    # Values of the schema take precedence over values of any $ref or allOf
+    ref_value = schema.get(types.OpenApiProperties.REF)
+    if ref_value is not None:
+        ref_value_str = check_ref_string(ref_value)
+        check_circular_ref(ref_value_str, seen_refs)
+
+        _, ref_schema = ref_helper.get_ref(ref=ref_value_str, schemas=schemas)
+        sub_schemas = [ref_schema]
+    else:
+        all_of = schema.get("allOf")
+        sub_schemas = (
+            list(map(check_sub_schema_dict, check_all_of_list(all_of)))
+            if all_of is not None
+            else []
+        )
+    for sub_schema in sub_schemas:
+        for key, value in resolve(sub_schema, schemas, seen_refs).items():
+            resolved.setdefault(key, value)
+
+    return resolved
+
+
 def prefer_local(
     get_value: PeekValue,
     schema: types.Schema,
@@ -286,6 +286,10 @@ class _RemoteSchemaStore:
         self._schemas = {}
         self.spec_context = None
 
+    def contexts(self) -> typing.List[str]:
+        """Retrieve the contexts of the schemas that have been loaded."""
+        return sorted(self._schemas)
+
     def get_schemas(self, *, context: str) -> types.Schema:
         """
         Retrieve the schemas for a context.
@@ -371,13 +375,39 @@ def set_context(*, path: str) -> None:
     """
     Set the context for the initial OpenAPI specification.
 
+    The remote files retrieved for any previous specification are forgotten so that
+    only the remote files of this specification are recorded.
+
     Args:
         path: The path to the OpenAPI specification
 
     """
+    _remote_schema_store.reset()
     _remote_schema_store.spec_context = path
 
 
+def get_context() -> typing.Optional[str]:
+    """
+    Get the context for the initial OpenAPI specification.
+
+    Returns:
+        The path to the OpenAPI specification, if it has been set.
+
+    """
+    return _remote_schema_store.spec_context
+
+
+def get_remote_contexts() -> typing.List[str]:
+    """
+    Get the contexts of the remote files that have been retrieved.
+
+    Returns:
+        The paths, relative to the OpenAPI specification, or URLs of the files.
+
+    """
+    return _remote_schema_store.contexts()
+
+
 def _retrieve_schema(*, schemas: types.Schemas, path: str) -> NameSchema:
     """
     Retrieve schema at a path from schemas.
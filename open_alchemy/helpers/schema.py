@@ -7,6 +7,7 @@ from .. import types
 from . import all_of as all_of_helper
 from . import peek
 from . import ref as ref_helper
+from . import schema_index
 
 
 def constructable(*, schema: types.Schema, schemas: types.Schemas) -> bool:
@@ -24,6 +25,18 @@ def constructable(*, schema: types.Schema, schemas: types.Schemas) -> bool:
         Whether the schema is constructable.
 
     """
+    index = schema_index.get(schemas=schemas)
+    if index is None:
+        return _constructable(schema, schemas)
+    return index.lookup(
+        schema=schema,
+        key="constructable",
+        calculate=lambda: _constructable(schema, schemas),
+    )
+
+
+def _constructable(schema: types.Schema, schemas: types.Schemas) -> bool:
+    """Implement constructable."""
     if not isinstance(schema, dict):
         return False
     # Check for reference only models
@@ -97,6 +110,9 @@ def prepare_deep(schema: types.Schema, schemas: types.Schemas):
 
     Assume the schema is a valid JSONSchema.
 
+    The schemas are not modified. The prepared schema, its properties and items are new
+    dictionaries so that top level keys can be changed without modifying the schemas.
+
     Args:
         schema: The schema to prepare.
         schemas: The schemas from which to resolve any $ref.
@@ -105,13 +121,15 @@ def prepare_deep(schema: types.Schema, schemas: types.Schemas):
         The prepared schema.
 
     """
-    schema = prepare(schema=schema, schemas=schemas)
+    schema = {**prepare(schema=schema, schemas=schemas)}
 
     # Resolve $ref in any properties
     properties = schema.get(types.OpenApiProperties.PROPERTIES, None)
     if properties is not None:
-        for name, prop_schema in properties.items():
-            properties[name] = prepare_deep(schema=prop_schema, schemas=schemas)
+        schema[types.OpenApiProperties.PROPERTIES] = {
+            name: prepare_deep(schema=prop_schema, schemas=schemas)
+            for name, prop_schema in properties.items()
+        }
 
     # Resolve $ref of any items
     items_schema = peek.items(schema=schema, schemas={})
@@ -0,0 +1,125 @@
+"""Index of the schemas to calculate values for a schema only once."""
+
+import contextlib
+import contextvars
+import typing
+
+from .. import types
+
+TValue = typing.TypeVar("TValue")
+
+
+class SchemaIndex:
+    """
+    Index of all the schemas reachable from the schemas.
+
+    Values calculated for a schema in the index, such as the result of a peek lookup,
+    are recorded so that they are only calculated once. The schemas must not be
+    modified while the index is in use. Schemas that are not in the index, such as
+    schemas constructed while processing, are not recorded.
+    """
+
+    def __init__(self, *, schemas: types.Schemas) -> None:
+        """
+        Construct.
+
+        Args:
+            schemas: The schemas to index.
+
+        """
+        self.schemas = schemas
+        # The references to the schemas ensure that the id is not re-used
+        self._schemas: typing.Dict[int, types.Schema] = {}
+        self._values: typing.Dict[typing.Tuple[int, typing.Hashable], typing.Any] = {}
+
+        pending: typing.List[typing.Any] = list(schemas.values())
+        while pending:
+            value = pending.pop()
+            if isinstance(value, dict):
+                if id(value) in self._schemas:
+                    continue
+                self._schemas[id(value)] = value
+                pending.extend(value.values())
+            elif isinstance(value, list):
+                pending.extend(value)
+
+    def __contains__(self, schema: typing.Any) -> bool:
+        """Check whether a schema is in the index."""
+        return self._schemas.get(id(schema)) is schema
+
+    def lookup(
+        self,
+        *,
+        schema: types.Schema,
+        key: typing.Hashable,
+        calculate: typing.Callable[[], TValue],
+    ) -> TValue:
+        """
+        Look up a value for a schema.
+
+        The value is calculated on first use if the schema is in the index. Exceptions
+        are not recorded.
+
+        Args:
+            schema: The schema to look up the value for.
+            key: Identifies the value.
+            calculate: Calculates the value.
+
+        Returns:
+            The value.
+
+        """
+        if schema not in self:
+            return calculate()
+
+        value_key = (id(schema), key)
+        try:
+            return self._values[value_key]
+        except KeyError:
+            pass
+
+        value = calculate()
+        self._values[value_key] = value
+        return value
+
+
+_INDEX: "contextvars.ContextVar[typing.Optional[SchemaIndex]]" = contextvars.ContextVar(
+    "schema_index", default=None
+)
+
+
+def get(*, schemas: types.Schemas) -> typing.Optional[SchemaIndex]:
+    """
+    Get the index of the schemas.
+
+    Args:
+        schemas: The schemas to get the index for.
+
+    Returns:
+        The index if it has been built for the schemas and is in use, otherwise None.
+
+    """
+    index = _INDEX.get()
+    if index is None or index.schemas is not schemas:
+        return None
+    return index
+
+
+@contextlib.contextmanager
+def build(*, schemas: types.Schemas) -> typing.Iterator[SchemaIndex]:
+    """
+    Build the index of the schemas and use it until the context is exited.
+
+    Args:
+        schemas: The schemas to index.
+
+    Returns:
+        The index.
+
+    """
+    index = SchemaIndex(schemas=schemas)
+    token = _INDEX.set(index)
+    try:
+        yield index
+    finally:
+        _INDEX.reset(token)
@@ -8,6 +8,7 @@ from . import mixins
 from . import table_args
 from . import types
 from . import utility_base
+from .facades import json_codec
 from .helpers import ext_prop
 from .helpers import inheritance
 from .helpers import peek
@@ -29,6 +30,8 @@ def model_factory(
     get_base: GetBase,
     schemas: types.Schemas,
     artifacts: types.ModelsModelArtifacts,
+    validation: types.ValidationMode = types.ValidationMode.STRICT,
+    json_backend: json_codec.JsonBackend = json_codec.JsonBackend.STDLIB,
 ) -> typing.Type:
     """
     Convert OpenAPI schema to SQLAlchemy model.
@@ -38,6 +41,8 @@ def model_factory(
         get_base: Funcrtion to retrieve the base class for the model.
         schemas: The OpenAPI schemas.
         artifacts: The artifacts for the models.
+        validation: How dictionaries passed to from_dict of the model are validated.
+        json_backend: The library to_str and from_str of the model use for JSON.
 
     Returns:
         The model as a class.
@@ -94,6 +99,8 @@ def model_factory(
         (base, utility_base.UtilityBase, *mixin_classes),
         {
             "_schema": model_schema,
+            "_validation": validation,
+            "_json_codec": json_codec.get(backend=json_backend),
             **model_class_vars,
             "__table_args__": table_args.construct(schema=schema),
             **_get_kwargs(schema=schema),
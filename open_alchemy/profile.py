@@ -0,0 +1,169 @@
+"""
+Record where the time is spent when models are initialized.
+
+Recording is opt-in and only happens while a report is being collected:
+
+with profile.collect() as report:
+    init_yaml(...)
+
+The report records the wall time, number of calls and peak memory of each phase of
+the initialization, such as loading the spec, each pre-processing step, calculating
+the artifacts, constructing each model and generating the models file. When the
+collection is finished, the report is logged to the open_alchemy.profile logger.
+"""
+
+import contextlib
+import contextvars
+import dataclasses
+import logging
+import time
+import tracemalloc
+import typing
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _reset_peak() -> None:
+    """Reset the peak memory if supported by the Python version."""
+    reset_peak = getattr(tracemalloc, "reset_peak", None)
+    if reset_peak is not None:
+        reset_peak()
+
+
+@dataclasses.dataclass
+class Phase:
+    """The measurements of a phase of the initialization."""
+
+    # The name of the phase
+    name: str
+    # The number of times the phase was executed
+    calls: int = 0
+    # The total wall time of the phase in seconds
+    seconds: float = 0.0
+    # The highest memory allocated while the phase was executed in bytes. Before Python
+    # 3.9 it also includes any higher memory allocated before the phase
+    peak_memory: int = 0
+
+
+@dataclasses.dataclass
+class Report:
+    """The measurements of all phases of the initialization."""
+
+    # The phases in the order they were first executed
+    phases: typing.Dict[str, Phase] = dataclasses.field(default_factory=dict)
+    # The highest memory allocated in the phases that are being executed
+    _peak_stack: typing.List[int] = dataclasses.field(
+        default_factory=list, repr=False, compare=False
+    )
+
+    @property
+    def seconds(self) -> float:
+        """Calculate the wall time of the phases not nested in another phase."""
+        return sum(
+            phase.seconds
+            for phase in self.phases.values()
+            if not any(phase.name.startswith(f"{other}.") for other in self.phases)
+        )
+
+    @contextlib.contextmanager
+    def record(self, name: str) -> typing.Iterator[None]:
+        """
+        Record the measurements of a phase.
+
+        Phases can be nested, a nested phase should be named after the phase it is
+        nested in followed by a dot and its own name.
+
+        Args:
+            name: The name of the phase.
+
+        """
+        # Record the peak of any phase the phase is nested in before resetting it
+        if self._peak_stack:
+            self._peak_stack[-1] = max(
+                self._peak_stack[-1], tracemalloc.get_traced_memory()[1]
+            )
+        _reset_peak()
+        self._peak_stack.append(0)
+        phase = self.phases.setdefault(name, Phase(name=name))
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            peak = max(self._peak_stack.pop(), tracemalloc.get_traced_memory()[1])
+            if self._peak_stack:
+                self._peak_stack[-1] = max(self._peak_stack[-1], peak)
+
+            phase.calls += 1
+            phase.seconds += seconds
+            phase.peak_memory = max(phase.peak_memory, peak)
+            LOGGER.debug(
+                "%s took %.4f seconds with a peak memory of %d bytes",
+                name,
+                seconds,
+                peak,
+            )
+
+    def __str__(self) -> str:
+        """Format the report as a table."""
+        name_width = max((len(name) for name in self.phases), default=0)
+        name_width = max(name_width, len("phase"))
+        lines = [
+            f"{'phase':<{name_width}} {'calls':>6} {'seconds':>10} {'peak MiB':>10}"
+        ]
+        for phase in self.phases.values():
+            lines.append(
+                f"{phase.name:<{name_width}} {phase.calls:>6} {phase.seconds:>10.4f} "
+                f"{phase.peak_memory / 2 ** 20:>10.2f}"
+            )
+        lines.append(f"{'total':<{name_width}} {'':>6} {self.seconds:>10.4f}")
+        return "\n".join(lines)
+
+
+_REPORT: "contextvars.ContextVar[typing.Optional[Report]]" = contextvars.ContextVar(
+    "profile_report", default=None
+)
+
+
+@contextlib.contextmanager
+def record(name: str) -> typing.Iterator[None]:
+    """
+    Record the measurements of a phase if a report is being collected.
+
+    Args:
+        name: The name of the phase.
+
+    """
+    report = _REPORT.get()
+    if report is None:
+        yield
+        return
+
+    with report.record(name):
+        yield
+
+
+@contextlib.contextmanager
+def collect() -> typing.Iterator[Report]:
+    """
+    Collect a report of the phases executed until the context is exited.
+
+    Memory allocations are traced while the report is collected which slows down the
+    initialization.
+
+    Returns:
+        The report which is complete once the context is exited.
+
+    """
+    report = Report()
+    token = _REPORT.set(report)
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        yield report
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+        _REPORT.reset(token)
+        LOGGER.info("OpenAlchemy initialization profile:\n%s", report)
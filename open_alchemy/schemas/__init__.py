@@ -2,27 +2,58 @@
 
 import typing
 
+from .. import profile
 from .. import types as _types
+from ..helpers import schema_index
 from . import association
 from . import backref
 from . import foreign_key
 from . import validation
+from .helpers import pipeline as pipeline_helper
 
 
 def process(
-    *, schemas: _types.Schemas, spec_filename: typing.Optional[str] = None
+    *,
+    schemas: _types.Schemas,
+    spec_filename: typing.Optional[str] = None,
+    jobs: int = 1,
 ) -> None:
     """
     Pre-process schemas.
 
     The processing actions executed are:
-    1. Calculate the back references.
+    1. Validate the schemas.
+    2. Calculate the back references, the foreign keys and the association tables
+        from a single walk over the properties of the models.
+    3. Add the back references.
+    4. Add the foreign keys.
+    5. Add the association tables.
+
+    The schemas are not modified until the walk is complete so the validation and the
+    walk read the schemas through the same index. The association tables are combined
+    with any schemas with the same tablename after the foreign keys are added, which
+    reads the schemas through a new index.
 
     Args:
         schemas: The schemas to pre-process in place.
+        spec_filename: The filename of the spec, used to cache the validation.
+        jobs: The number of processes that validate the models, 0 for the number of
+            CPUs.
 
     """
-    validation.process(schemas=schemas, spec_filename=spec_filename)
-    backref.process(schemas=schemas)
-    foreign_key.process(schemas=schemas)
-    association.process(schemas=schemas)
+    pipeline = pipeline_helper.Pipeline()
+    add_backrefs = backref.register(pipeline=pipeline)
+    add_foreign_keys = foreign_key.register(pipeline=pipeline)
+    add_associations = association.register(pipeline=pipeline)
+
+    with schema_index.build(schemas=schemas):
+        with profile.record("validation"):
+            validation.process(schemas=schemas, spec_filename=spec_filename, jobs=jobs)
+        with profile.record("properties"):
+            pipeline.run(schemas=schemas)
+    with profile.record("backref"):
+        add_backrefs(schemas)
+    with profile.record("foreign_key"):
+        add_foreign_keys(schemas)
+    with profile.record("association"), schema_index.build(schemas=schemas):
+        add_associations(schemas)
@@ -3,6 +3,7 @@
 import typing
 
 from ... import types as _oa_types
+from ...helpers import schema_index
 from .. import validation
 from ..helpers import iterate
 from . import model
@@ -200,13 +201,14 @@ def get_from_schemas(
         The artifacts for the schemas.
 
     """
-    constructables = iterate.constructable(schemas=schemas)
-    return dict(
-        map(
-            lambda args: (
-                args[0],
-                _from_schemas_get_model(stay_within_model, schemas, args[1]),
-            ),
-            constructables,
+    with schema_index.build(schemas=schemas):
+        constructables = iterate.constructable(schemas=schemas)
+        return dict(
+            map(
+                lambda args: (
+                    args[0],
+                    _from_schemas_get_model(stay_within_model, schemas, args[1]),
+                ),
+                constructables,
+            )
         )
-    )
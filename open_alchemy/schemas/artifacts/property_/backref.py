@@ -1,6 +1,5 @@
 """Retrieve artifacts for backref property."""
 
-import copy
 import typing
 
 from .... import types as oa_types
@@ -36,7 +35,7 @@ def get(
         The artifacts for the property.
 
     """
-    schema = copy.deepcopy(schema_helper.prepare_deep(schema=schema, schemas=schemas))
+    schema = schema_helper.prepare_deep(schema=schema, schemas=schemas)
 
     type_ = peek.type_(schema=schema, schemas=schemas)
     assert type_ in OPEN_API_TO_SUB_TYPE
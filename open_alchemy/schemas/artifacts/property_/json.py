@@ -1,7 +1,5 @@
 """Retrieve artifacts for a JSON property."""
 
-import copy
-
 from .... import types as oa_types
 from ....helpers import peek
 from ....helpers import schema as schema_helper
@@ -24,7 +22,7 @@ def get(
         The artifacts for the property.
 
     """
-    schema = copy.deepcopy(schema_helper.prepare_deep(schema=schema, schemas=schemas))
+    schema = schema_helper.prepare_deep(schema=schema, schemas=schemas)
 
     nullable = peek.nullable(schema=schema, schemas=schemas)
 
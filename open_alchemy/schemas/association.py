@@ -7,6 +7,7 @@ from ..helpers import inheritance
 from ..helpers import peek
 from .helpers import association as association_helper
 from .helpers import iterate
+from .helpers import pipeline as pipeline_helper
 
 
 def _assert_is_string(value: typing.Any) -> str:
@@ -291,6 +292,65 @@ def _combine_defined_expected_schemas(
         )
 
 
+def _add_association_schemas(
+    *, schemas: types.Schemas, association_schemas: typing.List[types.TNameSchema]
+) -> None:
+    """
+    Add association schemas to the schemas.
+
+    Args:
+        schemas: The schemas to add the association schemas to.
+        association_schemas: All expected association schemas.
+
+    """
+    combined_association_schemas = _combine_defined_expected_schemas(
+        association_schemas=association_schemas, schemas=schemas
+    )
+    for association in combined_association_schemas:
+        schemas[association.name] = association.schema
+
+
+def register(
+    *, pipeline: pipeline_helper.Pipeline
+) -> typing.Callable[[types.Schemas], None]:
+    """
+    Register the handler that calculates the association schemas with a pipeline.
+
+    The handler is called for the many-to-many relationships.
+
+    Args:
+        pipeline: The pipeline that walks the properties.
+
+    Returns:
+        Function that adds the association schemas calculated by the pipeline to the
+        schemas. The association schemas are combined with any defined schemas when
+        the function is called so that it can be called after the foreign keys are
+        added.
+
+    """
+    association_schemas: typing.List[types.TNameSchema] = []
+
+    def handle(schemas: types.Schemas, property_: pipeline_helper.Property) -> None:
+        """Calculate the association schema of a many-to-many relationship."""
+        association_schemas.append(
+            association_helper.calculate_schema(
+                property_schema=property_.schema,
+                parent_schema=property_.parent_schema,
+                schemas=schemas,
+            )
+        )
+
+    pipeline.register(handler=handle, kinds=(types.RelationshipType.MANY_TO_MANY,))
+
+    def apply(schemas: types.Schemas) -> None:
+        """Add the calculated association schemas to the schemas."""
+        _add_association_schemas(
+            schemas=schemas, association_schemas=association_schemas
+        )
+
+    return apply
+
+
 def process(*, schemas: types.Schemas) -> None:
     """
     Pre-process the schemas to add association schemas as necessary.
@@ -320,8 +380,4 @@ def process(*, schemas: types.Schemas) -> None:
             association_properties,
         )
     )
-    combined_association_schemas = _combine_defined_expected_schemas(
-        association_schemas=association_schemas, schemas=schemas
-    )
-    for association in combined_association_schemas:
-        schemas[association.name] = association.schema
+    _add_association_schemas(schemas=schemas, association_schemas=association_schemas)
@@ -8,6 +8,7 @@ from ..helpers import peek
 from ..helpers import ref as ref_helper
 from .helpers import backref as backref_helper
 from .helpers import iterate
+from .helpers import pipeline as pipeline_helper
 from .helpers import process as process_helper
 
 
@@ -133,6 +134,62 @@ def _backrefs_to_schema(backrefs: process_helper.TArtifactsIter) -> types.Schema
     }
 
 
+def _add_backrefs(
+    *, schemas: types.Schemas, backrefs: process_helper.TArtifactsIter
+) -> None:
+    """
+    Add back references to the schemas.
+
+    Args:
+        schemas: The schemas to add the back references to.
+        backrefs: The back references to add.
+
+    """
+    # Map to a schema for each grouped back references
+    backref_schemas = process_helper.calculate_outputs(
+        artifacts=backrefs, calculate_output=_backrefs_to_schema
+    )
+    # Convert to list to resolve iterator
+    backref_schema_list = list(backref_schemas)
+    # Add backreferences to schemas
+    for name, backref_schema in backref_schema_list:
+        schemas[name] = {"allOf": [schemas[name], backref_schema]}
+
+
+def register(
+    *, pipeline: pipeline_helper.Pipeline
+) -> typing.Callable[[types.Schemas], None]:
+    """
+    Register the handler that retrieves the back references with a pipeline.
+
+    Back references are retrieved from properties of any type, like process.
+
+    Args:
+        pipeline: The pipeline that walks the properties.
+
+    Returns:
+        Function that adds the back references retrieved by the pipeline to the
+        schemas.
+
+    """
+    backrefs: typing.List[TArtifacts] = []
+
+    def handle(schemas: types.Schemas, property_: pipeline_helper.Property) -> None:
+        """Retrieve the back reference of a property."""
+        if backref_helper.defined(schemas, property_.schema):
+            backrefs.append(
+                _calculate_artifacts(property_.parent_name, schemas, property_.schema)
+            )
+
+    pipeline.register(handler=handle)
+
+    def apply(schemas: types.Schemas) -> None:
+        """Add the retrieved back references to the schemas."""
+        _add_backrefs(schemas=schemas, backrefs=iter(backrefs))
+
+    return apply
+
+
 def process(*, schemas: types.Schemas) -> None:
     """
     Pre-process the schemas to add back references as required.
@@ -148,12 +205,4 @@ def process(*, schemas: types.Schemas) -> None:
     backrefs = process_helper.get_artifacts(
         schemas=schemas, get_schema_artifacts=_get_schema_backrefs
     )
-    # Map to a schema for each grouped back references
-    backref_schemas = process_helper.calculate_outputs(
-        artifacts=backrefs, calculate_output=_backrefs_to_schema
-    )
-    # Convert to list to resolve iterator
-    backref_schema_list = list(backref_schemas)
-    # Add backreferences to schemas
-    for name, backref_schema in backref_schema_list:
-        schemas[name] = {"allOf": [schemas[name], backref_schema]}
+    _add_backrefs(schemas=schemas, backrefs=backrefs)
@@ -9,6 +9,7 @@ from ..helpers import peek
 from ..helpers import property_
 from ..helpers import relationship
 from .helpers import iterate
+from .helpers import pipeline as pipeline_helper
 from .helpers import process as process_helper
 
 
@@ -48,6 +49,7 @@ def _foreign_key_property_not_defined(
     parent_schema: types.Schema,
     property_name: str,
     property_schema: types.Schema,
+    relationship_type: typing.Optional[types.RelationshipType] = None,
 ) -> bool:
     """
     Check whether the foreign key property is not already defined.
@@ -59,13 +61,16 @@ def _foreign_key_property_not_defined(
         parent_schema: The schema that contains the relationship property.
         property_name: The name of the property.
         property_schema: The schema of the property.
+        relationship_type: The type of the relationship, calculated if not given.
 
     Returns:
         Whether the foreign key property is not already defined.
 
     """
     # Retrieve the property name
-    type_ = relationship.calculate_type(schema=property_schema, schemas=schemas)
+    type_ = relationship_type
+    if type_ is None:
+        type_ = relationship.calculate_type(schema=property_schema, schemas=schemas)
     column_name = foreign_key_helper.calculate_column_name(
         type_=type_,
         property_schema=property_schema,
@@ -115,6 +120,7 @@ def _calculate_foreign_key_property_artifacts(
     parent_schema: types.Schema,
     property_name: str,
     property_schema: types.Schema,
+    relationship_type: typing.Optional[types.RelationshipType] = None,
 ) -> TArtifacts:
     """
     Calculate the artifacts for the schema for the foreign key property.
@@ -128,6 +134,7 @@ def _calculate_foreign_key_property_artifacts(
         parent_schema: The schema that contains the relationship property.
         property_name: The name of the property.
         property_schema: The schema of the property.
+        relationship_type: The type of the relationship, calculated if not given.
 
     Returns:
         The name of the schema to store the property onto and the name and schema of the
@@ -135,9 +142,10 @@ def _calculate_foreign_key_property_artifacts(
 
     """
     # Retrieve the schema of the property that is targeted by the foreign key
-    relationship_type = relationship.calculate_type(
-        schema=property_schema, schemas=schemas
-    )
+    if relationship_type is None:
+        relationship_type = relationship.calculate_type(
+            schema=property_schema, schemas=schemas
+        )
     assert relationship_type != types.RelationshipType.MANY_TO_MANY
 
     column_name = foreign_key_helper.calculate_column_name(
@@ -167,9 +175,6 @@ def _calculate_foreign_key_property_artifacts(
         required = any(filter(lambda name: name == property_name, required_items))
     # Calculate nullable for all but one-to-many relationships based on property
     nullable: typing.Optional[bool] = None
-    relationship_type = relationship.calculate_type(
-        schema=property_schema, schemas=schemas
-    )
     if relationship_type != types.RelationshipType.ONE_TO_MANY:
         nullable = peek.nullable(schema=property_schema, schemas=schemas)
     default = peek.default(schema=foreign_key_target_schema, schemas=schemas)
@@ -304,18 +309,17 @@ def _foreign_keys_to_schema(
     }
 
 
-def process(*, schemas: types.Schemas):
+def _add_foreign_keys(
+    *, schemas: types.Schemas, foreign_keys: process_helper.TArtifactsIter
+) -> None:
     """
-    Pre-process the schemas to add foreign keys as required.
+    Add foreign key properties to the schemas.
 
     Args:
-        schemas: The schemas to process.
+        schemas: The schemas to add the foreign key properties to.
+        foreign_keys: The foreign key properties to add.
 
     """
-    # Retrieve foreign keys
-    foreign_keys = process_helper.get_artifacts(
-        schemas=schemas, get_schema_artifacts=_get_schema_foreign_keys
-    )
     # Map to a schema for each grouped foreign keys
     foreign_key_schemas = process_helper.calculate_outputs(
         artifacts=foreign_keys, calculate_output=_foreign_keys_to_schema
@@ -325,3 +329,72 @@ def process(*, schemas: types.Schemas):
     # Add foreign keys to schemas
     for name, foreign_key_schema in foreign_key_schema_list:
         schemas[name] = {"allOf": [schemas[name], foreign_key_schema]}
+
+
+def register(
+    *, pipeline: pipeline_helper.Pipeline
+) -> typing.Callable[[types.Schemas], None]:
+    """
+    Register the handler that retrieves the foreign keys with a pipeline.
+
+    The handler is called for the relationships that are not many-to-many.
+
+    Args:
+        pipeline: The pipeline that walks the properties.
+
+    Returns:
+        Function that adds the foreign keys retrieved by the pipeline to the schemas.
+
+    """
+    foreign_keys: typing.List[TArtifacts] = []
+
+    def handle(schemas: types.Schemas, prop: pipeline_helper.Property) -> None:
+        """Retrieve the foreign key of a relationship if it is not defined."""
+        if not _foreign_key_property_not_defined(
+            schemas,
+            prop.parent_schema,
+            prop.name,
+            prop.schema,
+            prop.relationship_type,
+        ):
+            return
+        foreign_keys.append(
+            _calculate_foreign_key_property_artifacts(
+                schemas,
+                prop.parent_name,
+                prop.parent_schema,
+                prop.name,
+                prop.schema,
+                prop.relationship_type,
+            )
+        )
+
+    pipeline.register(
+        handler=handle,
+        kinds=(
+            types.RelationshipType.MANY_TO_ONE,
+            types.RelationshipType.ONE_TO_ONE,
+            types.RelationshipType.ONE_TO_MANY,
+        ),
+    )
+
+    def apply(schemas: types.Schemas) -> None:
+        """Add the retrieved foreign keys to the schemas."""
+        _add_foreign_keys(schemas=schemas, foreign_keys=iter(foreign_keys))
+
+    return apply
+
+
+def process(*, schemas: types.Schemas):
+    """
+    Pre-process the schemas to add foreign keys as required.
+
+    Args:
+        schemas: The schemas to process.
+
+    """
+    # Retrieve foreign keys
+    foreign_keys = process_helper.get_artifacts(
+        schemas=schemas, get_schema_artifacts=_get_schema_foreign_keys
+    )
+    _add_foreign_keys(schemas=schemas, foreign_keys=foreign_keys)
@@ -419,3 +419,32 @@ def backrefs_values(
         skip_name=None,
         key=types.ExtensionProperties.BACKREFS,
     )
+
+
+# The prefix of a $ref to a schema in the same specification
+_LOCAL_REF_PREFIX = "#/components/schemas/"
+
+
+def local_refs(value: typing.Any) -> typing.Iterator[str]:
+    """
+    Find the names of the schemas referenced by a value using a local $ref.
+
+    The value is searched recursively without resolving any $ref so that the
+    references are found even if the value is not valid.
+
+    Args:
+        value: The value to search.
+
+    Returns:
+        The name of each referenced schema.
+
+    """
+    if isinstance(value, dict):
+        ref_value = value.get(types.OpenApiProperties.REF)
+        if isinstance(ref_value, str) and ref_value.startswith(_LOCAL_REF_PREFIX):
+            yield ref_value[len(_LOCAL_REF_PREFIX) :]
+        for item in value.values():
+            yield from local_refs(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from local_refs(item)
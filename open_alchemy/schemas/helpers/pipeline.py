@@ -0,0 +1,95 @@
+"""Walk the properties of the models once for all pre-processing steps."""
+
+import typing
+
+from ... import types
+from ...helpers import property_ as property_helper
+from ...helpers import relationship
+from . import iterate
+
+
+class Property(typing.NamedTuple):
+    """A property of a model with its type."""
+
+    # The name and schema of the model the property is on
+    parent_name: str
+    parent_schema: types.Schema
+    # The name and schema of the property
+    name: str
+    schema: types.Schema
+    # The type of the property and, for a relationship, the type of the relationship
+    type: types.PropertyType
+    relationship_type: typing.Optional[types.RelationshipType]
+
+
+TKind = typing.Union[types.PropertyType, types.RelationshipType]
+THandler = typing.Callable[[types.Schemas, Property], None]
+
+
+class Pipeline:
+    """
+    Handlers for the properties of the models.
+
+    The properties of each model are walked once and the type of each property is
+    calculated once, the handlers registered for the type of the property are then
+    called with the property.
+    """
+
+    def __init__(self) -> None:
+        """Construct."""
+        self._handlers: typing.List[
+            typing.Tuple[typing.Optional[typing.FrozenSet[TKind]], THandler]
+        ] = []
+
+    def register(
+        self,
+        *,
+        handler: THandler,
+        kinds: typing.Optional[typing.Iterable[TKind]] = None,
+    ) -> None:
+        """
+        Register a handler for some kinds of properties.
+
+        Handlers are called in the order they are registered.
+
+        Args:
+            handler: Called with all the schemas and the property.
+            kinds: The property and relationship types the handler is called for, all
+                properties if not given.
+
+        """
+        self._handlers.append((None if kinds is None else frozenset(kinds), handler))
+
+    def run(self, *, schemas: types.Schemas) -> None:
+        """
+        Call the handlers for the properties of all constructable schemas.
+
+        Assume the schemas are valid. Property iteration stays within the model so
+        that each property is only handled for the model it is defined on.
+
+        Args:
+            schemas: All the schemas.
+
+        """
+        for parent_name, parent_schema in iterate.constructable(schemas=schemas):
+            properties = iterate.properties_items(
+                schema=parent_schema, schemas=schemas, stay_within_model=True
+            )
+            for name, schema in properties:
+                type_ = property_helper.calculate_type(schema=schema, schemas=schemas)
+                relationship_type: typing.Optional[types.RelationshipType] = None
+                if type_ == types.PropertyType.RELATIONSHIP:
+                    relationship_type = relationship.calculate_type(
+                        schema=schema, schemas=schemas
+                    )
+                property_ = Property(
+                    parent_name=parent_name,
+                    parent_schema=parent_schema,
+                    name=name,
+                    schema=schema,
+                    type=type_,
+                    relationship_type=relationship_type,
+                )
+                for kinds, handler in self._handlers:
+                    if kinds is None or type_ in kinds or relationship_type in kinds:
+                        handler(schemas, property_)
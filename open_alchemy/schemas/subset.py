@@ -0,0 +1,154 @@
+"""Restrict the schemas to some models and the schemas they need."""
+
+import typing
+
+from .. import exceptions
+from .. import types
+from ..helpers import peek
+from ..helpers import ref as ref_helper
+from .helpers import backref as backref_helper
+from .helpers import iterate
+
+
+def _extension_values(
+    value: typing.Any, keys: typing.Tuple[str, ...]
+) -> typing.Iterator[typing.Any]:
+    """Find the values of any of the keys anywhere in a value without resolving $ref."""
+    if isinstance(value, dict):
+        for key in keys:
+            if key in value:
+                yield value[key]
+        for item in value.values():
+            yield from _extension_values(item, keys)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _extension_values(item, keys)
+
+
+def _tablenames(schema: types.Schema) -> typing.Iterator[str]:
+    """
+    Find the tablenames of the association tables and foreign keys of a schema.
+
+    Args:
+        schema: The schema to search.
+
+    Returns:
+        The tablename of the x-secondary and of the target of the x-foreign-key of
+        any property, with any of the extension property prefixes.
+
+    """
+    secondary_keys = peek.helpers.prefixed_keys(types.ExtensionProperties.SECONDARY)
+    for secondary in _extension_values(schema, secondary_keys):
+        if isinstance(secondary, str):
+            yield secondary
+    foreign_key_keys = peek.helpers.prefixed_keys(types.ExtensionProperties.FOREIGN_KEY)
+    for foreign_key in _extension_values(schema, foreign_key_keys):
+        if isinstance(foreign_key, str):
+            yield foreign_key.split(".")[0]
+
+
+def _dependent_targets(
+    *, schemas: types.Schemas, schema: types.Schema
+) -> typing.Iterator[str]:
+    """
+    Find the names of the schemas a model adds properties to.
+
+    A model adds a back reference to the target of a relationship with a back
+    reference and a foreign key column to the target of a one to many relationship.
+
+    The schemas are not validated yet so, if the properties of the model can't be
+    read, every schema the model references is assumed to be a target.
+
+    Args:
+        schemas: All the schemas.
+        schema: The schema of the model.
+
+    Returns:
+        The name of the schema referenced by each relationship with a back reference
+        or that is one to many.
+
+    """
+    try:
+        properties = iterate.properties_items(
+            schema=schema, schemas=schemas, stay_within_model=True
+        )
+        for _, property_schema in properties:
+            has_backref = backref_helper.defined(schemas, property_schema)
+            items_schema = peek.items(schema=property_schema, schemas=schemas)
+            if items_schema is not None:
+                property_schema = items_schema
+            one_to_many = (
+                items_schema is not None
+                and peek.secondary(schema=items_schema, schemas=schemas) is None
+            )
+            if not has_backref and not one_to_many:
+                continue
+            ref = peek.ref(schema=property_schema, schemas=schemas)
+            if ref is not None:
+                name, _ = ref_helper.get_ref(ref=ref, schemas=schemas)
+                yield name
+    except exceptions.BaseError:
+        yield from iterate.local_refs(schema)
+
+
+def calculate(*, schemas: types.Schemas, names: typing.Iterable[str]) -> types.Schemas:
+    """
+    Calculate the schemas needed to construct some models.
+
+    Assume the schemas have not been validated.
+
+    The closure of the models is calculated before the schemas are validated so that
+    only the schemas in the closure are processed. It includes, recursively:
+    1. the schemas a schema references with a local $ref, which includes the parents
+        and the targets of the relationships of a model,
+    2. the models that define a back reference on a model or that have a one to many
+        relationship to a model, which adds a foreign key column to it, and
+    3. the models with the tablename of an association table or the target of a
+        foreign key of a schema.
+
+    Raises SchemaNotFoundError if a name is not the name of a model.
+
+    Args:
+        schemas: All the schemas.
+        names: The names of the models to construct.
+
+    Returns:
+        The schemas in the closure in the order of the schemas.
+
+    """
+    constructables = dict(iterate.constructable(schemas=schemas))
+    names = list(names)
+    for name in names:
+        if name not in constructables:
+            raise exceptions.SchemaNotFoundError(
+                f"{name} is not a model in the specification."
+            )
+
+    tablename_names: typing.Dict[str, typing.List[str]] = {}
+    dependent_owners: typing.Dict[str, typing.Set[str]] = {}
+    for name, schema in constructables.items():
+        try:
+            tablename = peek.prefer_local(
+                get_value=peek.tablename, schema=schema, schemas=schemas
+            )
+        except exceptions.BaseError:
+            tablename = None
+        if isinstance(tablename, str):
+            tablename_names.setdefault(tablename, []).append(name)
+        for target in _dependent_targets(schemas=schemas, schema=schema):
+            dependent_owners.setdefault(target, set()).add(name)
+
+    closure: typing.Set[str] = set()
+    pending = names
+    while pending:
+        name = pending.pop()
+        if name in closure or name not in schemas:
+            continue
+        closure.add(name)
+        schema = schemas[name]
+        pending.extend(iterate.local_refs(schema))
+        pending.extend(dependent_owners.get(name, ()))
+        for tablename in _tablenames(schema):
+            pending.extend(tablename_names.get(tablename, ()))
+
+    return {name: schema for name, schema in schemas.items() if name in closure}
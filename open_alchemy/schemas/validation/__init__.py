@@ -1,13 +1,19 @@
 """Schema validation pre-processor."""
 
+import concurrent.futures
+import contextlib
+import os
 import typing
 
 from ... import cache
 from ... import exceptions as _exceptions
 from ... import types as _oa_types
+from ...helpers import ref
+from ...helpers import schema_index
 from ..helpers import iterate
 from . import association
 from . import model
+from . import model_hash
 from . import property_
 from . import schemas_validation
 from . import spec_validation
@@ -58,6 +64,118 @@ def _process_model(
         )
 
 
+# The result of a check or the exception raised by the check
+TOutcome = typing.Union[types.Result, Exception]
+# The outcome of the checks of a model and the exception raised by the checks of its
+# properties, if any
+TModelOutcome = typing.Tuple[TOutcome, typing.Optional[Exception]]
+
+
+def _check_model_outcome(
+    schemas: _oa_types.Schemas, schema_name: str, schema: _oa_types.Schema
+) -> TModelOutcome:
+    """
+    Check a model and, if it is valid, its properties recording any exception.
+
+    Args:
+        schemas: All defined schemas used to resolve any $ref.
+        schema_name: The name of the schema to validate.
+        schema: The schema to validate.
+
+    Returns:
+        The outcome of the checks.
+
+    """
+    try:
+        model_result = model.check(schemas, schema)
+    except Exception as exc:  # pylint: disable=broad-except
+        return exc, None
+    if not model_result.valid:
+        return model_result, None
+
+    try:
+        _process_model(schemas, schema_name, schema)
+    except Exception as exc:  # pylint: disable=broad-except
+        return model_result, exc
+    return model_result, None
+
+
+# The schemas and the schema index of a worker process
+_WORKER_SCHEMAS: _oa_types.Schemas = {}
+_WORKER_CONTEXT = contextlib.ExitStack()
+
+
+def _init_worker(
+    schemas: _oa_types.Schemas, spec_context: typing.Optional[str]
+) -> None:
+    """Record the schemas in a worker process."""
+    global _WORKER_SCHEMAS  # pylint: disable=global-statement
+    _WORKER_SCHEMAS = schemas
+    if spec_context is not None:
+        ref.set_context(path=spec_context)
+    _WORKER_CONTEXT.enter_context(schema_index.build(schemas=schemas))
+
+
+def _check_worker_model(schema_name: str) -> TModelOutcome:
+    """Check a model of the schemas of a worker process."""
+    return _check_model_outcome(
+        _WORKER_SCHEMAS, schema_name, _WORKER_SCHEMAS[schema_name]
+    )
+
+
+def _check_models_outcomes(
+    *, schemas: _oa_types.Schemas, names: typing.Sequence[str], jobs: int
+) -> typing.Iterator[typing.Tuple[str, TModelOutcome]]:
+    """
+    Check models in parallel using a pool of processes.
+
+    Args:
+        schemas: All defined schemas.
+        names: The names of the models to check.
+        jobs: The number of processes.
+
+    Returns:
+        The name and the outcome of the checks of each model in order.
+
+    """
+    chunksize = max(1, len(names) // (jobs * 4))
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(schemas, ref.get_context()),
+    ) as executor:
+        outcomes = list(executor.map(_check_worker_model, names, chunksize=chunksize))
+    return zip(names, outcomes)
+
+
+def _process_parallel(
+    *, schemas: _oa_types.Schemas, names: typing.Sequence[str], jobs: int
+) -> None:
+    """
+    Validate models and their properties in parallel.
+
+    The outcomes are merged in the order of the models so that the error that is
+    raised is the same as for validating the models one after another.
+
+    Args:
+        schemas: All defined schemas.
+        names: The names of the models to validate.
+        jobs: The number of processes.
+
+    """
+    models_outcomes = list(
+        _check_models_outcomes(schemas=schemas, names=names, jobs=jobs)
+    )
+    for name, (model_outcome, _) in models_outcomes:
+        if isinstance(model_outcome, Exception):
+            raise model_outcome
+        if not model_outcome.valid:
+            raise _exceptions.MalformedSchemaError(f"{name} :: {model_outcome.reason}")
+    for _, (_, properties_exception) in models_outcomes:
+        if properties_exception is not None:
+            raise properties_exception
+
+
 def _other_schemas_checks(*, schemas: _oa_types.Schemas) -> types.Result:
     """
     Check that at least 1 model is defined and for multiple tablename.
@@ -89,14 +207,22 @@ def _other_schemas_checks(*, schemas: _oa_types.Schemas) -> types.Result:
 
 
 def process(
-    *, schemas: _oa_types.Schemas, spec_filename: typing.Optional[str] = None
+    *,
+    schemas: _oa_types.Schemas,
+    spec_filename: typing.Optional[str] = None,
+    jobs: int = 1,
 ) -> None:
     """
     Validate schemas.
 
     Args:
         schemas: The schemas to validate.
-        spec_filename: The filename of the spec, used to cache the result.
+        spec_filename: The filename of the spec, used to cache the result. If the
+            spec has changed since the result was cached, only the models that
+            changed, including any schema they reference, are validated again.
+        jobs: The number of processes that validate the models and their properties.
+            0 uses the number of CPUs. The error that is raised for invalid schemas
+            does not depend on the number of processes.
 
     """
     if spec_filename is not None:
@@ -107,11 +233,43 @@ def process(
     if not schemas_result.valid:
         raise _exceptions.MalformedSchemaError(schemas_result.reason)
 
-    # Check constructable schemas model
-    constructables = iterate.constructable(schemas=schemas)
-    model_results = map(
-        lambda args: (args[0], model.check(schemas, args[1])), constructables
-    )
+    names = [name for name, _ in iterate.constructable(schemas=schemas)]
+    model_hashes: typing.Optional[typing.Dict[str, str]] = None
+    if spec_filename is not None:
+        model_hashes = model_hash.calculate(schemas=schemas, names=names)
+        valid_model_hashes = cache.valid_model_hashes(spec_filename)
+        names = [
+            name for name in names if valid_model_hashes.get(name) != model_hashes[name]
+        ]
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs > 1 and len(names) > 1:
+        _process_parallel(schemas=schemas, names=names, jobs=jobs)
+    else:
+        _process_sequential(schemas=schemas, names=names)
+
+    other_results_result = _other_schemas_checks(schemas=schemas)
+    if not other_results_result.valid:
+        raise _exceptions.MalformedSchemaError(other_results_result.reason)
+
+    if spec_filename is not None:
+        cache.schemas_are_valid(spec_filename, model_hashes=model_hashes)
+
+
+def _process_sequential(
+    *, schemas: _oa_types.Schemas, names: typing.Sequence[str]
+) -> None:
+    """
+    Validate models and then their properties one after another.
+
+    Args:
+        schemas: All defined schemas.
+        names: The names of the models to validate.
+
+    """
+    # Check schemas model
+    model_results = map(lambda name: (name, model.check(schemas, schemas[name])), names)
     invalid_model_result = next(
         filter(lambda args: not args[1].valid, model_results), None
     )
@@ -119,18 +277,9 @@ def process(
         name, result = invalid_model_result
         raise _exceptions.MalformedSchemaError(f"{name} :: {result.reason}")
 
-    # Check constructable schemas properties
-    constructables = iterate.constructable(schemas=schemas)
-    for constructable in constructables:
-        name, schema = constructable
-        _process_model(schemas, name, schema)
-
-    other_results_result = _other_schemas_checks(schemas=schemas)
-    if not other_results_result.valid:
-        raise _exceptions.MalformedSchemaError(other_results_result.reason)
-
-    if spec_filename is not None:
-        cache.schemas_are_valid(spec_filename)
+    # Check schemas properties
+    for name in names:
+        _process_model(schemas, name, schemas[name])
 
 
 def check_one_model(*, schemas: _oa_types.Schemas) -> types.Result:
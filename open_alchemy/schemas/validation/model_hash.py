@@ -0,0 +1,54 @@
+"""Calculate hashes of models that change whenever their validation could change."""
+
+import json
+import typing
+
+from ... import cache
+from ... import types as _oa_types
+from ..helpers import iterate
+
+
+def calculate(
+    *, schemas: _oa_types.Schemas, names: typing.Iterable[str]
+) -> typing.Dict[str, str]:
+    """
+    Calculate the hash of models together with the schemas they reference.
+
+    The hash of a model covers its schema and the transitive closure of the schemas it
+    references with a local $ref, so it changes whenever the result of validating the
+    model could change. Remote references are covered by their value, the contents of
+    remote files are not, like the hash of the spec file used by the cache.
+
+    Args:
+        schemas: All defined schemas.
+        names: The names of the models to calculate the hash for.
+
+    Returns:
+        The hash of each model.
+
+    """
+    schema_hashes: typing.Dict[str, str] = {}
+    schema_refs: typing.Dict[str, typing.Set[str]] = {}
+
+    def schema_hash(name: str) -> str:
+        """Calculate the hash of a schema without its references."""
+        if name not in schema_hashes:
+            schema = schemas.get(name)
+            schema_hashes[name] = cache.calculate_hash(
+                json.dumps(schema, sort_keys=True, default=str)
+            )
+            schema_refs[name] = set(iterate.local_refs(schema))
+        return schema_hashes[name]
+
+    def model_hash(name: str) -> str:
+        """Calculate the hash of a model and the closure of its references."""
+        closure = {name: schema_hash(name)}
+        pending = [name]
+        while pending:
+            for ref_name in schema_refs[pending.pop()]:
+                if ref_name not in closure:
+                    closure[ref_name] = schema_hash(ref_name)
+                    pending.append(ref_name)
+        return cache.calculate_hash(json.dumps([name, sorted(closure.items())]))
+
+    return {name: model_hash(name) for name in names}
@@ -21,6 +21,37 @@ _COMMON_SCHEMAS_FILE = os.path.join(_DIRECTORY, *_PATHS, "common-schemas.json")
 ) = jsonschema.resolver(_COMMON_SCHEMAS_FILE)
 
 
+@functools.lru_cache(maxsize=None)
+def _validator(name: str) -> jsonschema.Validator:
+    """Get the validator for a common schema, constructed on first use."""
+    return jsonschema.compile_(_COMMON_SCHEMAS[name], ref_resolver=_resolver)
+
+
+# The names of the schemas that could match a specification based on the type of the
+# specification and the type of its first item, any other schema could match any
+# specification
+_SHAPE_SCHEMA_NAMES: typing.Dict[
+    typing.Tuple[type, typing.Optional[type]], typing.Tuple[str, ...]
+] = {
+    (list, str): ("ColumnList",),
+    (list, list): ("ColumnListList",),
+    (list, dict): ("UniqueList", "IndexList"),
+    (dict, None): ("Unique", "Index"),
+}
+_SHAPED_SCHEMA_NAMES = frozenset(itertools.chain(*_SHAPE_SCHEMA_NAMES.values()))
+
+
+def _spec_shape(spec: typing.Any) -> typing.Tuple[type, typing.Optional[type]]:
+    """Calculate the type of a specification and of its first item."""
+    if isinstance(spec, dict):
+        return dict, None
+    if isinstance(spec, list) and spec:
+        for item_type in (str, list, dict):
+            if isinstance(spec[0], item_type):
+                return list, item_type
+    return type(spec), None
+
+
 def _spec_to_schema_name(
     *,
     spec: typing.Union[types.AnyUnique, types.AnyIndex],
@@ -30,7 +61,8 @@ def _spec_to_schema_name(
     Convert a specification to the name of the matched schema.
 
     Use the schema names defined in common-schemas.json to find the first matching
-    schema.
+    schema. The schemas in the shape dispatch table are only validated against if they
+    could match based on the shape of the specification.
 
     Args:
         spec: The specification to convert.
@@ -43,14 +75,13 @@ def _spec_to_schema_name(
     if schema_names is None:
         schema_names = list(_COMMON_SCHEMAS.keys())
 
-    for name in schema_names:
-        try:
-            jsonschema.validate(
-                instance=spec, schema=_COMMON_SCHEMAS[name], resolver=_resolver
-            )
+    shape_schema_names = _SHAPE_SCHEMA_NAMES.get(_spec_shape(spec), ())
+    for name in filter(
+        lambda name: name in shape_schema_names or name not in _SHAPED_SCHEMA_NAMES,
+        schema_names,
+    ):
+        if _validator(name).is_valid(spec):
             return name
-        except jsonschema.ValidationError:
-            continue
     raise exceptions.SchemaNotFoundError("Specification did not match any schemas.")
 
 
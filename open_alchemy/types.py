@@ -3,9 +3,10 @@
 import dataclasses
 import datetime
 import enum
+import typing
+
 from open_alchemy.helpers import custom_python_types
 
-import typing
 try:  # pragma: no cover
     from typing import Literal  # pylint: disable=unused-import
     from typing import Protocol
@@ -120,8 +121,9 @@ class Index(_IndexBase, total=False):
 IndexList = typing.List[Index]
 AnyIndex = typing.Union[ColumnList, ColumnListList, Index, IndexList]
 TColumnDefault = typing.Optional[typing.Union[str, int, float, bool]]
-TPyColumnDefault = typing.Optional[
-    typing.Union[str, int, float, bool, bytes, datetime.date, datetime.datetime, custom_python_types.duration]
+# datetime.datetime is a subclass of datetime.date
+TPyColumnDefault = typing.Union[
+    TColumnDefault, bytes, datetime.date, custom_python_types.duration
 ]
 
 
@@ -207,6 +209,15 @@ class RelationshipType(str, enum.Enum):
     MANY_TO_MANY = "MANY_TO_MANY"
 
 
+@enum.unique
+class ValidationMode(str, enum.Enum):
+    """How dictionaries passed to from_dict are checked against the model schema."""
+
+    STRICT = "strict"
+    STRUCTURAL = "structural"
+    TRUSTED = "trusted"
+
+
 TMixins = typing.List[str]
 
 
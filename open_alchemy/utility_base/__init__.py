@@ -1,23 +1,33 @@
 """Base class providing utilities for SQLAlchemy models."""
 
-import json
+import contextvars
 import typing
 
 from .. import exceptions
 from .. import types as oa_types
+from ..facades import json_codec
 from ..facades import jsonschema
-from ..facades import models
-from ..helpers import peek
+from ..facades.sqlalchemy import bulk
 from ..helpers import schema as schema_helper
+from . import async_
+from . import compiled
 from . import from_dict
+from . import query
 from . import repr_
+from . import to_columns
 from . import to_dict
+from . import types
 
 TUtilityBase = typing.TypeVar("TUtilityBase", bound="UtilityBase")
-TOptUtilityBase = typing.Optional[TUtilityBase]
 
+# The validation mode for the from_dict call in progress, overrides the mode of the
+# models so that it also applies to any related models constructed during the call
+_VALIDATION: "contextvars.ContextVar[typing.Optional[oa_types.ValidationMode]]" = (
+    contextvars.ContextVar("validation", default=None)
+)
 
-class UtilityBase:
+
+class UtilityBase(async_.AsyncUtilityBase):
     """Base class providing utilities for SQLAlchemy models."""
 
     # Record of the schema used to construct the model. Must be an object type. For all
@@ -25,6 +35,31 @@ class UtilityBase:
     # be recorded as a free-form object and have a x-de-$ref extension property with
     # the de-referenced name of the schema.
     _schema: typing.ClassVar[oa_types.Schema]
+    # How dictionaries passed to from_dict are validated
+    _validation: typing.ClassVar[
+        oa_types.ValidationMode
+    ] = oa_types.ValidationMode.STRICT
+    # How to_str, from_str and iter_json encode and decode JSON
+    _json_codec: typing.ClassVar[json_codec.Codec] = json_codec.STDLIB
+    # Values calculated based on _schema are cached on the model together with the
+    # schema they were calculated for. They are only read from the __dict__ of a model
+    # so that models that derive from each other don't share them.
+    _schema_validator: typing.ClassVar[
+        typing.Tuple[oa_types.Schema, jsonschema.Validator]
+    ]
+    _to_dict_plan: typing.ClassVar[typing.Tuple[oa_types.Schema, types.TToDictPlan]]
+    _to_json_plan: typing.ClassVar[typing.Tuple[oa_types.Schema, types.TToDictPlan]]
+    _to_dict_projections: typing.ClassVar[
+        typing.Tuple[oa_types.Schema, to_dict.TProjector]
+    ]
+    _from_dict_plan: typing.ClassVar[typing.Tuple[oa_types.Schema, types.FromDictPlan]]
+    _to_dict_relationships: typing.ClassVar[
+        typing.Tuple[oa_types.Schema, typing.Tuple[types.ToDictRelationship, ...]]
+    ]
+    _select_plan: typing.ClassVar[typing.Tuple[oa_types.Schema, types.TToDictPlan]]
+    _to_columns_plan: typing.ClassVar[
+        typing.Tuple[oa_types.Schema, types.TToColumnsPlan]
+    ]
 
     def __init__(self, **kwargs: typing.Any) -> None:
         """Construct."""
@@ -41,13 +76,27 @@ class UtilityBase:
             The schema.
 
         """
-        # Checking for _schema
-        if not hasattr(cls, "_schema"):
-            raise exceptions.ModelAttributeError(
-                "Model does not have a record of its schema. "
-                "To support to_dict set the _schema class variable."
-            )
-        return cls._schema
+        return compiled.get_schema(model=cls)
+
+    @classmethod
+    def _get_schema_validator(cls) -> jsonschema.Validator:
+        """Get the validator for the schema."""
+        return compiled.get(
+            model=cls,
+            name="_schema_validator",
+            calculate=lambda: jsonschema.compile_(cls._get_schema()),
+        )
+
+    @classmethod
+    def _get_from_dict_plan(cls) -> types.FromDictPlan:
+        """Get the plan for constructing the model from a dictionary."""
+
+        def calculate() -> types.FromDictPlan:
+            """Calculate the plan."""
+            cls.get_properties()
+            return from_dict.calculate_plan(schema=cls._get_schema())
+
+        return compiled.get(model=cls, name="_from_dict_plan", calculate=calculate)
 
     @classmethod
     def get_properties(cls) -> oa_types.Schema:
@@ -70,72 +119,112 @@ class UtilityBase:
             )
         return properties
 
-    @staticmethod
-    def _get_parent(*, schema: oa_types.Schema) -> typing.Type[TUtilityBase]:
-        """Get the parent model of a model."""
-        parent_name = peek.inherits(schema=schema, schemas={})
-        if parent_name is None or not isinstance(parent_name, str):
-            raise exceptions.MalformedSchemaError(
-                "To construct a model that inherits x-inherits must be present and a "
-                "string.",
-                schema=schema,
-                x_inherits=parent_name,
-                x_inherits_type=type(parent_name),
-            )
-        # Try to get model
-        parent: TOptUtilityBase = models.get_model(name=parent_name)
-        if parent is None:
-            raise exceptions.SchemaNotFoundError(
-                "The parent model was not found on open_alchemy.models.",
-                schema=schema,
-                parent_model_name=parent_name,
-            )
-        return parent
+    @classmethod
+    def _from_dict_init_constructor(
+        cls,
+    ) -> typing.Callable[[typing.Dict[str, typing.Any]], typing.Dict[str, typing.Any]]:
+        """Get the function that constructs the dictionary passed to construction."""
+        schema = cls._get_schema()
+        plan = cls._get_from_dict_plan()
+        validation = _VALIDATION.get() or cls._validation
+        validator = (
+            cls._get_schema_validator()
+            if validation == oa_types.ValidationMode.STRICT
+            else None
+        )
+
+        def construct(
+            kwargs: typing.Dict[str, typing.Any]
+        ) -> typing.Dict[str, typing.Any]:
+            """Construct the dictionary passed to model construction."""
+            # Check dictionary
+            if validator is not None:
+                try:
+                    jsonschema.validate_compiled(kwargs, validator)
+                except jsonschema.ValidationError as exc:
+                    raise exceptions.MalformedModelDictionaryError(
+                        "The dictionary passed to from_dict is not a valid instance of "
+                        "the model schema.",
+                        schema=schema,
+                        kwargs=kwargs,
+                    ) from exc
+            elif validation == oa_types.ValidationMode.STRUCTURAL:
+                if not plan.required.issubset(kwargs):
+                    raise exceptions.MalformedModelDictionaryError(
+                        "The dictionary passed to from_dict is missing required "
+                        "properties.",
+                        schema=schema,
+                        kwargs=kwargs,
+                        missing=sorted(plan.required.difference(kwargs)),
+                    )
+
+            # Assemble dictionary for construction
+            model_dict: typing.Dict[str, typing.Any] = {}
+            for name, value in kwargs.items():
+                converter = plan.converters.get(name)
+                if converter is None and name not in plan.read_only:
+                    raise exceptions.MalformedModelDictionaryError(
+                        "A parameter was passed in that is not a property in the model "
+                        "schema.",
+                        parameter_name=name,
+                        schema=schema,
+                    )
+
+                # Convert to column value
+                try:
+                    if converter is None:
+                        raise exceptions.MalformedModelDictionaryError(
+                            "readOnly properties cannot be passed to the from_dict "
+                            "constructor."
+                        )
+                    model_dict[name] = converter(value)
+                except exceptions.BaseError as exc:
+                    exc.schema = schema  # type: ignore
+                    exc.property_schema = cls.get_properties()[name]  # type: ignore
+                    exc.property_name = name  # type: ignore
+                    exc.property_value = value  # type: ignore
+                    raise
+
+            return model_dict
+
+        return construct
 
     @classmethod
     def construct_from_dict_init(
         cls: typing.Type[TUtilityBase], **kwargs: typing.Any
     ) -> typing.Dict[str, typing.Any]:
         """Construct the dictionary passed to model construction."""
-        # Check dictionary
+        return cls._from_dict_init_constructor()(kwargs)
+
+    @classmethod
+    def _from_dict_constructor(
+        cls: typing.Type[TUtilityBase],
+    ) -> typing.Callable[[typing.Dict[str, typing.Any]], TUtilityBase]:
+        """Get the function that constructs a model instance from a dictionary."""
         schema = cls._get_schema()
-        try:
-            jsonschema.validate(instance=kwargs, schema=schema)
-        except jsonschema.ValidationError as exc:
-            raise exceptions.MalformedModelDictionaryError(
-                "The dictionary passed to from_dict is not a valid instance of the "
-                "model schema.",
-                schema=schema,
-                kwargs=kwargs,
-            ) from exc
+        init = cls._from_dict_init_constructor()
+        if not schema_helper.inherits(schema=schema, schemas={}):
+            return lambda kwargs: cls(**init(kwargs))
 
-        # Assemble dictionary for construction
+        parent: typing.Type[UtilityBase] = compiled.get_parent(schema=schema)
         properties = cls.get_properties()
-        model_dict: typing.Dict[str, typing.Any] = {}
-        for name, value in kwargs.items():
-            # Get the specification and type of the property
-            property_schema = properties.get(name)
-            if property_schema is None:
-                raise exceptions.MalformedModelDictionaryError(
-                    "A parameter was passed in that is not a property in the model "
-                    "schema.",
-                    parameter_name=name,
-                    schema=schema,
-                )
 
-            # Convert to column value
-            try:
-                model_dict[name] = from_dict.convert(
-                    value=value, schema=property_schema
-                )
-            except exceptions.BaseError as exc:
-                exc.schema = schema  # type: ignore
-                exc.property_schema = property_schema  # type: ignore
-                exc.property_name = name  # type: ignore
-                exc.property_value = value  # type: ignore
-                raise
+        def construct(kwargs: typing.Dict[str, typing.Any]) -> TUtilityBase:
+            """Construct the model, passing properties of the parent to the parent."""
+            parent_kwargs = {
+                key: value for key, value in kwargs.items() if key not in properties
+            }
+            child_kwargs = {
+                key: value for key, value in kwargs.items() if key in properties
+            }
+            return cls(
+                **{
+                    **parent.construct_from_dict_init(**parent_kwargs),
+                    **init(child_kwargs),
+                }
+            )
 
-        return model_dict
+        return construct
 
     @classmethod
     def from_dict(cls: typing.Type[TUtilityBase], **kwargs: typing.Any) -> TUtilityBase:
@@ -156,7 +245,7 @@ class UtilityBase:
         # Handle model that inherits
         if schema_helper.inherits(schema=schema, schemas={}):
             # Retrieve parent model
-            parent: typing.Type[UtilityBase] = cls._get_parent(schema=schema)
+            parent: typing.Type[UtilityBase] = compiled.get_parent(schema=schema)
 
             # Construct parent initialization dictionary
             # Get properties for schema
@@ -180,6 +269,253 @@ class UtilityBase:
 
         return cls(**init_dict)
 
+    @classmethod
+    def from_dict_with(
+        cls: typing.Type[TUtilityBase],
+        value: typing.Dict[str, typing.Any],
+        *,
+        validation: oa_types.ValidationMode,
+    ) -> TUtilityBase:
+        """
+        Construct model instance from a dictionary using a validation mode.
+
+        The validation mode overrides the validation mode of the model, including for
+        any related models constructed from the dictionary.
+
+        Raise MalformedModelDictionaryError when the dictionary does not satisfy the
+        model schema.
+
+        Args:
+            value: The values to construct the class with.
+            validation: How the dictionary is validated.
+
+        Returns:
+            An instance of the model constructed using the dictionary.
+
+        """
+        token = _VALIDATION.set(oa_types.ValidationMode(validation))
+        try:
+            return cls.from_dict(**value)
+        finally:
+            _VALIDATION.reset(token)
+
+    @classmethod
+    def from_dict_many(
+        cls: typing.Type[TUtilityBase],
+        values: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        validation: typing.Optional[oa_types.ValidationMode] = None,
+    ) -> typing.List[TUtilityBase]:
+        """
+        Construct model instances from dictionaries.
+
+        Equivalent to calling from_dict for each dictionary with the work that only
+        depends on the model done once.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the
+        model schema.
+
+        Args:
+            values: The dictionaries to construct the instances with.
+            validation: (optional) How the dictionaries are validated, overriding the
+                validation mode of the model like from_dict_with.
+
+        Returns:
+            The instances in the order of the dictionaries.
+
+        """
+        token = (
+            _VALIDATION.set(oa_types.ValidationMode(validation))
+            if validation is not None
+            else None
+        )
+        try:
+            construct = cls._from_dict_constructor()
+            return [construct(value) for value in values]
+        finally:
+            if token is not None:
+                _VALIDATION.reset(token)
+
+    @classmethod
+    def _bulk_row_chunks(
+        cls,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        chunk_size: int,
+        validation: typing.Optional[oa_types.ValidationMode],
+    ) -> typing.Iterator[typing.List[typing.Dict[str, typing.Any]]]:
+        """
+        Convert dictionaries to the values of the columns of rows in chunks.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the
+        model schema or includes a property that is not a column.
+        Raise FeatureNotImplementedError if the model inherits from another model.
+
+        """
+        schema = cls._get_schema()
+        if schema_helper.inherits(schema=schema, schemas={}):
+            raise exceptions.FeatureNotImplementedError(
+                "Bulk operations do not support models that inherit.",
+                schema=schema,
+            )
+
+        token = (
+            _VALIDATION.set(oa_types.ValidationMode(validation))
+            if validation is not None
+            else None
+        )
+        try:
+            construct = cls._from_dict_init_constructor()
+        finally:
+            if token is not None:
+                _VALIDATION.reset(token)
+        column_keys = bulk.column_keys(model=cls)
+        polymorphic_values = bulk.polymorphic_values(model=cls)
+
+        def to_row(value: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+            """Convert a dictionary to the values of the columns of the row."""
+            row = dict(polymorphic_values)
+            for name, column_value in construct(value).items():
+                column_key = column_keys.get(name)
+                if column_key is None:
+                    raise exceptions.MalformedModelDictionaryError(
+                        "Bulk operations only support properties that are columns.",
+                        parameter_name=name,
+                        schema=schema,
+                    )
+                row[column_key] = column_value
+            return row
+
+        chunk: typing.List[typing.Dict[str, typing.Any]] = []
+        for value in rows:
+            chunk.append(to_row(value))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    @classmethod
+    def bulk_insert_dicts(
+        cls,
+        bind: typing.Any,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        chunk_size: int = 1000,
+        validation: typing.Optional[oa_types.ValidationMode] = None,
+    ) -> int:
+        """
+        Insert dictionaries into the table of the model without constructing instances.
+
+        Each dictionary is converted like from_dict and the rows are inserted using an
+        executemany Core insert statement for each chunk. Consecutive dictionaries with
+        different properties are inserted with separate statements. Relationships are
+        not supported, use foreign key properties instead.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the
+        model schema or includes a property that is not a column.
+        Raise FeatureNotImplementedError if the model inherits from another model.
+
+        Args:
+            bind: The connection or session to insert the rows with.
+            rows: The dictionaries to insert.
+            chunk_size: (optional) The maximum number of rows inserted by a statement.
+            validation: (optional) How the dictionaries are validated, overriding the
+                validation mode of the model like from_dict_with.
+
+        Returns:
+            The number of rows inserted.
+
+        """
+        inserted = 0
+        for chunk in cls._bulk_row_chunks(
+            rows, chunk_size=chunk_size, validation=validation
+        ):
+            bulk.insert(bind=bind, model=cls, rows=chunk)
+            inserted += len(chunk)
+        return inserted
+
+    @classmethod
+    def bulk_upsert_dicts(
+        cls,
+        bind: typing.Any,
+        rows: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        conflict_on: typing.Optional[typing.Sequence[str]] = None,
+        chunk_size: int = 1000,
+        validation: typing.Optional[oa_types.ValidationMode] = None,
+    ) -> int:
+        """
+        Insert dictionaries into the table of the model or update existing rows.
+
+        Each dictionary is converted like bulk_insert_dicts. A row already exists if it
+        has the same values for the columns of a unique constraint, the conflict
+        target, as a dictionary. The columns of existing rows in the dictionary are
+        updated. SQLite and PostgreSQL use INSERT ... ON CONFLICT DO UPDATE and MySQL
+        INSERT ... ON DUPLICATE KEY UPDATE with an executemany statement for each
+        chunk. For other databases, the existing rows of each chunk are selected and
+        then updated or inserted. Consecutive dictionaries with different properties
+        are upserted with separate statements and only the properties in a dictionary
+        are updated.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the
+        model schema, includes a property that is not a column or does not include all
+        the properties of the conflict target.
+        Raise FeatureNotImplementedError if the model inherits from another model.
+        Raise MissingArgumentError if conflict_on is not passed and no unique
+        constraint has all its columns in the first dictionary.
+        Raise ModelAttributeError if any property in conflict_on is not a column.
+
+        Args:
+            bind: The connection or session to upsert the rows with.
+            rows: The dictionaries to upsert.
+            conflict_on: (optional) The names of the properties of the conflict target.
+                Defaults to the first of the primary key, the unique properties, the
+                composite unique constraints and the unique indexes with all its
+                columns in the first dictionary.
+            chunk_size: (optional) The maximum number of rows upserted by a statement.
+            validation: (optional) How the dictionaries are validated, overriding the
+                validation mode of the model like from_dict_with.
+
+        Returns:
+            The number of dictionaries upserted.
+
+        """
+        conflict_keys: typing.Optional[typing.Sequence[str]] = None
+        if conflict_on is not None:
+            column_keys = bulk.column_keys(model=cls)
+            unknown = [name for name in conflict_on if name not in column_keys]
+            if unknown:
+                raise exceptions.ModelAttributeError(
+                    "The conflict_on properties are not columns of the model.",
+                    fields=unknown,
+                    schema=cls._get_schema(),
+                )
+            conflict_keys = [column_keys[name] for name in conflict_on]
+
+        upserted = 0
+        for chunk in cls._bulk_row_chunks(
+            rows, chunk_size=chunk_size, validation=validation
+        ):
+            if conflict_keys is None:
+                conflict_keys = next(
+                    (
+                        keys
+                        for keys in bulk.unique_keys(model=cls)
+                        if set(keys).issubset(chunk[0])
+                    ),
+                    None,
+                )
+                if conflict_keys is None:
+                    raise exceptions.MissingArgumentError(
+                        "No unique constraint has all its columns in the dictionaries, "
+                        "pass the properties of the conflict target using conflict_on.",
+                        schema=cls._get_schema(),
+                    )
+            bulk.upsert(bind=bind, model=cls, rows=chunk, conflict_keys=conflict_keys)
+            upserted += len(chunk)
+        return upserted
+
     @classmethod
     def from_str(cls: typing.Type[TUtilityBase], value: str) -> TUtilityBase:
         """
@@ -200,8 +536,8 @@ class UtilityBase:
                 "The value is not of type string.", value=value, value_type=type(value)
             )
         try:
-            dict_value = json.loads(value)
-        except json.JSONDecodeError as exc:
+            dict_value = cls._json_codec.loads(value)
+        except ValueError as exc:
             raise exceptions.MalformedModelDictionaryError(
                 "The string value is not valid JSON.", value=value
             ) from exc
@@ -216,49 +552,242 @@ class UtilityBase:
     @classmethod
     def instance_to_dict(cls, instance: TUtilityBase) -> typing.Dict[str, typing.Any]:
         """Convert instance of the model to a dictionary."""
-        schema = cls._get_schema()
-        properties = cls.get_properties()
+        return to_dict.get_instance_converter(model=cls)(instance)
+
+    @classmethod
+    def to_dict_many(
+        cls,
+        instances: typing.Iterable[typing.Any],
+        *,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Convert model instances to dictionaries.
+
+        Equivalent to calling to_dict on each instance with the work that only depends
+        on the model done once for each model. The instances can be of the model or
+        of models that inherit from it.
+
+        Raise ModelAttributeError if any of the fields is not a property of the model
+        of an instance.
+
+        Args:
+            instances: The instances to convert.
+            fields: (optional) The names of the properties to include in the
+                dictionaries like to_dict. Defaults to all properties.
+
+        Returns:
+            The dictionary representations of the instances in the same order.
+
+        """
+        return list(
+            to_dict.iter_converted(
+                instances=instances,
+                json_=False,
+                fields=None if fields is None else frozenset(fields),
+            )
+        )
+
+    @classmethod
+    def iter_json(cls, instances: typing.Iterable[typing.Any]) -> typing.Iterator[str]:
+        """
+        Encode model instances as a JSON array one instance at a time.
+
+        The instances are only retrieved and converted as the chunks are consumed so
+        that, for example, a query using yield_per can be streamed as a response
+        without holding all the instances or the whole string in memory. The chunks
+        joined together are the JSON array of the output of to_dict_many. Each instance
+        is encoded using the JSON codec of its model.
+
+        Args:
+            instances: The instances to encode.
+
+        Returns:
+            The chunks of the JSON array.
+
+        """
+        yield "["
+        separator = ""
+        for instance_str in to_dict.iter_converted(instances=instances, json_=True):
+            yield separator + instance_str
+            separator = ", "
+        yield "]"
+
+    @classmethod
+    def to_dict_load_options(
+        cls,
+        *,
+        depth: typing.Optional[int] = None,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+    ) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options for the relationships to_dict converts.
+
+        Use the options with a query so that converting the instances it returns to
+        dictionaries loads all relationships with a fixed number of queries instead of
+        loading them for each instance:
+
+        query.options(*Model.to_dict_load_options())
+
+        Collections are loaded using selectinload and other relationships using
+        joinedload. A model that is already on the path of relationships is not
+        loaded again so that cycles of relationships end.
+
+        Args:
+            depth: (optional) The number of levels of relationships to load. 1 only
+                loads the relationships of the model. Defaults to all levels.
+            fields: (optional) The names of the properties of the model passed to
+                to_dict, only the relationships in the fields are loaded. Defaults to
+                all properties.
+
+        Returns:
+            The loader options.
+
+        """
+        return query.to_dict_load_options(model=cls, depth=depth, fields=fields)
+
+    @classmethod
+    def load_only_options(cls, fields: typing.Iterable[str]) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options that only load the columns of some properties.
+
+        Use the options with a query for the same fields as to_dict so that the columns
+        of the other properties are not loaded:
+
+        query.options(*Model.load_only_options(fields))
 
-        # Collecting the values of the properties
-        return_dict: typing.Dict[str, typing.Any] = {}
-        for name, property_schema in properties.items():
-            # Handle for writeOnly
-            if peek.write_only(schema=property_schema, schemas={}):
-                continue
+        The primary key is always loaded. Relationships in the fields are not loaded
+        by the options, see to_dict_load_options.
 
-            value = getattr(instance, name, None)
+        Raise ModelAttributeError if any of the fields is not a property of the model.
 
-            # Handle none value
-            if value is None:
-                return_none = to_dict.return_none(schema=schema, property_name=name)
-                if return_none is True:
-                    return_dict[name] = None
-                # Don't consider for coverage due to coverage bug
-                continue  # pragma: no cover
+        Args:
+            fields: The names of the properties whose columns are loaded.
+
+        Returns:
+            The loader options.
+
+        """
+        return query.load_only_options(model=cls, fields=fields)
+
+    @classmethod
+    def select_statement(
+        cls, *, fields: typing.Optional[typing.Iterable[str]] = None
+    ) -> typing.Any:
+        """
+        Construct the Core select statement for the columns of the model.
+
+        Each column is labelled with the name of its property so that select_dicts
+        can convert the rows. The statement can be refined before it is passed to
+        select_dicts, for example:
+
+        Model.select_statement().where(Model.id > 10).order_by(Model.id).limit(100)
+
+        Raise ModelAttributeError if any of the fields is not a property of the model
+        or is not a column, such as a relationship.
+
+        Args:
+            fields: (optional) The names of the properties to select. Defaults to all
+                properties that are columns and are not writeOnly.
+
+        Returns:
+            The statement.
+
+        """
+        return query.select_statement(model=cls, fields=fields)
+
+    @classmethod
+    def select_dicts(
+        cls, bind: typing.Any, statement: typing.Optional[typing.Any] = None
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Execute a Core select statement and convert the rows to dictionaries.
+
+        Each row is converted like to_dict without constructing model instances, so
+        that the rows are not added to the identity map of a session. Useful for large
+        read only queries. The key of each column of the statement must be the name of
+        a property of the model, see select_statement. Relationships are not
+        included in the dictionaries.
+
+        Raise ModelAttributeError if the key of a column of the statement is not a
+        property of the model that is a column and is not writeOnly.
 
-            try:
-                return_dict[name] = to_dict.convert(schema=property_schema, value=value)
-            except exceptions.BaseError as exc:
-                exc.schema = schema  # type: ignore
-                exc.property_schema = property_schema  # type: ignore
-                exc.property_name = name  # type: ignore
-                exc.property_value = value  # type: ignore
-                raise
+        Args:
+            bind: The connection or session to execute the statement with.
+            statement: (optional) The statement to execute. Defaults to the
+                select_statement for all columns.
+
+        Returns:
+            The dictionary representation of each row.
+
+        """
+        if statement is None:
+            statement = cls.select_statement()
+        return query.select_dicts(model=cls, bind=bind, statement=statement)
+
+    @classmethod
+    def to_columns(
+        cls,
+        values: typing.Iterable[typing.Any],
+        *,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        numpy: bool = False,
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Collect the values of model instances or rows into a column for each property.
+
+        The values of integer, number and boolean properties are collected into an
+        array.array, which uses much less memory than a list. A None value is NaN in a
+        number column and an integer or boolean column with a None value is a list.
+        The values of other properties are collected into a list, dates and date-times
+        as Python values and other values converted like to_dict. Relationships are not
+        collected.
+
+        Raise ModelAttributeError if any of the fields is not a property of the model
+        or is not a column.
+        Raise ImportError if numpy is True and NumPy has not been installed.
 
-        return return_dict
+        Args:
+            values: The instances, for example from a query, or the rows of a
+                select_statement, for which only the properties with a column in the
+                rows are collected.
+            fields: (optional) The names of the properties to collect. Defaults to all
+                properties that are columns and are not writeOnly.
+            numpy: (optional) Whether to convert each column to a NumPy array, dates
+                and date-times have the datetime64 dtype.
+
+        Returns:
+            The column of each property.
 
-    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """
+        return to_columns.convert(model=cls, values=values, fields=fields, numpy=numpy)
+
+    def to_dict(
+        self, *, fields: typing.Optional[typing.Iterable[str]] = None
+    ) -> typing.Dict[str, typing.Any]:
         """
         Convert model instance to dictionary.
 
+        Raise ModelAttributeError if any of the fields is not a property of the model.
+
+        Args:
+            fields: (optional) The names of the properties to include in the
+                dictionary. The conversion for each set of fields is calculated once.
+                Defaults to all properties.
+
         Returns:
             The dictionary representation of the model.
 
         """
+        if fields is not None:
+            return to_dict.get_converter(model=type(self), fields=frozenset(fields))(
+                self
+            )
+
         schema = self._get_schema()
         if schema_helper.inherits(schema=schema, schemas={}):
             # Retrieve parent model and convert to dict
-            parent: typing.Type[UtilityBase] = self._get_parent(schema=schema)
+            parent: typing.Type[UtilityBase] = compiled.get_parent(schema=schema)
             parent_dict = parent.instance_to_dict(self)
             return {**parent_dict, **self.instance_to_dict(self)}
 
@@ -272,8 +801,7 @@ class UtilityBase:
             The JSON string representation of the model.
 
         """
-        instance_dict = self.to_dict()
-        return json.dumps(instance_dict)
+        return to_dict.get_json_converter(model=type(self))(self)
 
     __str__ = to_str
 
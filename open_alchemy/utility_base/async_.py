@@ -0,0 +1,182 @@
+"""Utilities for models with instances in an asyncio session."""
+
+import typing
+
+from .. import types as oa_types
+from ..facades.sqlalchemy import async_session
+from . import fields as fields_
+from . import query
+from . import to_dict
+
+TAsyncUtilityBase = typing.TypeVar("TAsyncUtilityBase", bound="AsyncUtilityBase")
+
+
+async def to_dict_many(
+    *,
+    model: typing.Type,
+    instances: typing.Iterable[typing.Any],
+    session: typing.Any,
+    fields: typing.Optional[typing.Iterable[str]] = None,
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """
+    Load the attributes of instances to_dict converts and convert them.
+
+    Raise ModelAttributeError if any of the fields is not a property of the model
+    of an instance.
+
+    Args:
+        model: The model the instances are converted for.
+        instances: The instances to convert.
+        session: The AsyncSession of the instances.
+        fields: The names of the properties to convert, defaults to all.
+
+    Returns:
+        The dictionary representations of the instances in the same order.
+
+    """
+    instances = list(instances)
+    if fields is not None:
+        fields = frozenset(fields)
+        fields_.check(model=model, fields=fields)
+
+    model_instances: typing.Dict[typing.Type, typing.List[typing.Any]] = {}
+    for instance in instances:
+        model_instances.setdefault(type(instance), []).append(instance)
+    for instance_model, instances_of_model in model_instances.items():
+        await async_session.load(
+            session=session,
+            model=instance_model,
+            instances=instances_of_model,
+            keys=(
+                fields_.property_names(model=instance_model)
+                if fields is None
+                else fields
+            ),
+            options=query.to_dict_load_options(model=instance_model, fields=fields),
+        )
+
+    return list(to_dict.iter_converted(instances=instances, json_=False, fields=fields))
+
+
+async def from_dict_many(
+    *,
+    model: typing.Type,
+    values: typing.Iterable[typing.Dict[str, typing.Any]],
+    session: typing.Any,
+    validation: typing.Optional[oa_types.ValidationMode] = None,
+) -> typing.List[typing.Any]:
+    """
+    Construct instances of a model from dictionaries and add them to a session.
+
+    Raise MalformedModelDictionaryError when a dictionary does not satisfy the
+    model schema.
+
+    Args:
+        model: The model to construct.
+        values: The dictionaries to construct the instances with.
+        session: The AsyncSession to add the instances to.
+        validation: How the dictionaries are validated.
+
+    Returns:
+        The flushed instances in the order of the dictionaries.
+
+    """
+    instances = model.from_dict_many(values, validation=validation)
+    await async_session.add(session=session, instances=instances)
+    return instances
+
+
+class AsyncUtilityBase:
+    """Base class providing utilities for SQLAlchemy models in an asyncio session."""
+
+    @classmethod
+    async def ato_dict_many(
+        cls,
+        instances: typing.Iterable[typing.Any],
+        session: typing.Any,
+        *,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Convert model instances of an asyncio session to dictionaries.
+
+        Like to_dict_many, except that any attributes and relationships to_dict
+        converts that are not loaded are first loaded with a query for each model
+        using to_dict_load_options, so that no attribute is lazy loaded which is not
+        supported by an AsyncSession.
+
+        Raise ModelAttributeError if any of the fields is not a property of the model
+        of an instance.
+
+        Args:
+            instances: The instances to convert.
+            session: The AsyncSession of the instances.
+            fields: (optional) The names of the properties to include in the
+                dictionaries like to_dict. Defaults to all properties.
+
+        Returns:
+            The dictionary representations of the instances in the same order.
+
+        """
+        return await to_dict_many(
+            model=cls, instances=instances, session=session, fields=fields
+        )
+
+    @classmethod
+    async def ato_dict(
+        cls,
+        instance: typing.Any,
+        session: typing.Any,
+        *,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Convert a model instance of an asyncio session to a dictionary.
+
+        Like to_dict with the attributes loaded like ato_dict_many.
+
+        Raise ModelAttributeError if any of the fields is not a property of the model.
+
+        Args:
+            instance: The instance to convert.
+            session: The AsyncSession of the instance.
+            fields: (optional) The names of the properties to include in the
+                dictionary like to_dict. Defaults to all properties.
+
+        Returns:
+            The dictionary representation of the instance.
+
+        """
+        (instance_dict,) = await cls.ato_dict_many([instance], session, fields=fields)
+        return instance_dict
+
+    @classmethod
+    async def afrom_dict_many(
+        cls: typing.Type[TAsyncUtilityBase],
+        values: typing.Iterable[typing.Dict[str, typing.Any]],
+        session: typing.Any,
+        *,
+        validation: typing.Optional[oa_types.ValidationMode] = None,
+    ) -> typing.List[TAsyncUtilityBase]:
+        """
+        Construct model instances from dictionaries and add them to an asyncio session.
+
+        The instances are constructed like from_dict_many, added to the session and
+        flushed so that, for example, their primary keys are set.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the
+        model schema.
+
+        Args:
+            values: The dictionaries to construct the instances with.
+            session: The AsyncSession to add the instances to.
+            validation: (optional) How the dictionaries are validated, overriding the
+                validation mode of the model like from_dict_with.
+
+        Returns:
+            The flushed instances in the order of the dictionaries.
+
+        """
+        return await from_dict_many(
+            model=cls, values=values, session=session, validation=validation
+        )
@@ -0,0 +1,112 @@
+"""Functions to access the schema of a model and the values calculated based on it."""
+
+import typing
+
+from .. import exceptions
+from .. import types as oa_types
+from ..facades import json_codec
+from ..facades import models
+from ..helpers import peek
+
+TCompiled = typing.TypeVar("TCompiled")
+
+
+def get_schema(*, model: typing.Type) -> oa_types.Schema:
+    """
+    Get the schema of a model.
+
+    Raise ModelAttributeError if _schema is not defined.
+
+    Args:
+        model: The model to get the schema of.
+
+    Returns:
+        The schema.
+
+    """
+    # Checking for _schema
+    if not hasattr(model, "_schema"):
+        raise exceptions.ModelAttributeError(
+            "Model does not have a record of its schema. "
+            "To support to_dict set the _schema class variable."
+        )
+    return model._schema  # pylint: disable=protected-access
+
+
+def get_json_codec(*, model: typing.Type) -> json_codec.Codec:
+    """
+    Get the codec a model encodes and decodes JSON with.
+
+    Args:
+        model: The model to get the codec of.
+
+    Returns:
+        The codec.
+
+    """
+    return model._json_codec  # pylint: disable=protected-access
+
+
+def get(
+    *, model: typing.Type, name: str, calculate: typing.Callable[[], TCompiled]
+) -> TCompiled:
+    """
+    Get a value calculated based on the schema of a model.
+
+    The value is calculated on first use and cached on the model together with the
+    schema. The cache is discarded if _schema is replaced. It is only read from the
+    __dict__ of the model so that models that derive from each other don't share it.
+
+    Raise ModelAttributeError if _schema is not defined.
+
+    Args:
+        model: The model the value is calculated for.
+        name: The name of the class variable the value is cached at.
+        calculate: Calculates the value.
+
+    Returns:
+        The value.
+
+    """
+    schema = get_schema(model=model)
+    cached = model.__dict__.get(name)
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    value = calculate()
+    setattr(model, name, (schema, value))
+    return value
+
+
+def get_parent(*, schema: oa_types.Schema) -> typing.Type:
+    """
+    Get the parent model of a model that inherits.
+
+    Raise MalformedSchemaError if x-inherits is not a string.
+    Raise SchemaNotFoundError if the parent model has not been constructed.
+
+    Args:
+        schema: The schema of the model.
+
+    Returns:
+        The parent model.
+
+    """
+    parent_name = peek.inherits(schema=schema, schemas={})
+    if parent_name is None or not isinstance(parent_name, str):
+        raise exceptions.MalformedSchemaError(
+            "To construct a model that inherits x-inherits must be present and a "
+            "string.",
+            schema=schema,
+            x_inherits=parent_name,
+            x_inherits_type=type(parent_name),
+        )
+    # Try to get model
+    parent = models.get_model(name=parent_name)
+    if parent is None:
+        raise exceptions.SchemaNotFoundError(
+            "The parent model was not found on open_alchemy.models.",
+            schema=schema,
+            parent_model_name=parent_name,
+        )
+    return parent
@@ -0,0 +1,69 @@
+"""Functions to check the names of properties passed as fields."""
+
+import typing
+
+from .. import exceptions
+from ..facades.sqlalchemy import bulk
+from ..helpers import schema as schema_helper
+from . import compiled
+
+
+def property_names(*, model: typing.Type) -> typing.FrozenSet[str]:
+    """
+    Get the names of the properties of a model and its parents.
+
+    Args:
+        model: The model to get the names of the properties of.
+
+    Returns:
+        The names of the properties.
+
+    """
+    schema = compiled.get_schema(model=model)
+    names = frozenset(model.get_properties())
+    if not schema_helper.inherits(schema=schema, schemas={}):
+        return names
+    parent = compiled.get_parent(schema=schema)
+    return property_names(model=parent) | names
+
+
+def check(*, model: typing.Type, fields: typing.FrozenSet[str]) -> None:
+    """
+    Check that fields are properties of a model.
+
+    Raise ModelAttributeError if any field is not a property of the model.
+
+    Args:
+        model: The model the fields are for.
+        fields: The names of the properties.
+
+    """
+    unknown = fields - property_names(model=model)
+    if unknown:
+        raise exceptions.ModelAttributeError(
+            "The fields are not properties of the model.",
+            fields=sorted(unknown),
+            schema=compiled.get_schema(model=model),
+        )
+
+
+def check_columns(*, model: typing.Type, fields: typing.FrozenSet[str]) -> None:
+    """
+    Check that fields are properties of a model that are columns.
+
+    Raise ModelAttributeError if any field is not a property of the model or is not
+    a column.
+
+    Args:
+        model: The model the fields are for.
+        fields: The names of the properties.
+
+    """
+    check(model=model, fields=fields)
+    not_columns = fields - frozenset(bulk.column_keys(model=model))
+    if not_columns:
+        raise exceptions.ModelAttributeError(
+            "The fields are not columns of the model.",
+            fields=sorted(not_columns),
+            schema=compiled.get_schema(model=model),
+        )
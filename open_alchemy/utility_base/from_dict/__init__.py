@@ -23,20 +23,102 @@ def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyCol:
     Returns:
         The converted value.
 
+    """
+    return compile_(schema=schema)(value)
+
+
+def _convert_read_only(value: typing.Any) -> typing.NoReturn:
+    """Raise MalformedModelDictionaryError for any value of a readOnly property."""
+    raise exceptions.MalformedModelDictionaryError(
+        "readOnly properties cannot be passed to the from_dict constructor."
+    )
+
+
+def _convert_json(value: typing.Any) -> typing.Any:
+    """Convert JSON property values, which are already column values."""
+    return value
+
+
+def compile_(*, schema: oa_types.Schema) -> types.TFromDictConverter:
+    """
+    Calculate the function that converts values for a schema to a column value.
+
+    Args:
+        schema: The schema of the values.
+
+    Returns:
+        The function that converts a value.
+
     """
     type_ = peek.type_(schema=schema, schemas={})
     read_only = peek.read_only(schema=schema, schemas={})
     if read_only:
-        raise exceptions.MalformedModelDictionaryError(
-            "readOnly properties cannot be passed to the from_dict constructor."
-        )
+        return _convert_read_only
     json = peek.json(schema=schema, schemas={})
     if json:
-        return value
+        return _convert_json
     if type_ == "object":
-        return object_.convert(value, schema=schema)
+        return object_.compile_(schema=schema)
     if type_ == "array":
-        return array.convert(value, schema=schema)
+        return array.compile_(schema=schema)
     if type_ in type_helper.SIMPLE_TYPES:
-        return simple.convert(value, schema=schema)
+        return simple.compile_(schema=schema)
     raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
+
+
+def _compile_property(*, schema: oa_types.Schema) -> types.TFromDictConverter:
+    """
+    Calculate the function that converts the values of a property.
+
+    Any error due to the property schema is raised when a value is converted so that
+    the error is only raised if a value for the property is passed.
+
+    Args:
+        schema: The schema of the property.
+
+    Returns:
+        The function that converts a value.
+
+    """
+    try:
+        return compile_(schema=schema)
+    except exceptions.BaseError:
+        return lambda value: convert(schema=schema, value=value)
+
+
+def calculate_plan(*, schema: oa_types.Schema) -> types.FromDictPlan:
+    """
+    Calculate the plan for constructing a model from a dictionary.
+
+    Assume the schema has properties.
+    Assume that any $ref and allOf has already been resolved.
+
+    The plan maps the name of each property that is not readOnly to the function that
+    converts its value and records the names of the readOnly and required properties.
+
+    Args:
+        schema: The schema for the model.
+
+    Returns:
+        The plan for the model.
+
+    """
+    properties = schema[oa_types.OpenApiProperties.PROPERTIES]
+    converters = {
+        name: _compile_property(schema=property_schema)
+        for name, property_schema in properties.items()
+    }
+    read_only = frozenset(
+        name
+        for name, converter in converters.items()
+        if converter is _convert_read_only
+    )
+    return types.FromDictPlan(
+        converters={
+            name: converter
+            for name, converter in converters.items()
+            if name not in read_only
+        },
+        read_only=read_only,
+        required=frozenset(schema.get(oa_types.OpenApiProperties.REQUIRED, [])),
+    )
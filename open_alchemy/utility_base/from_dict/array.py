@@ -1,6 +1,6 @@
 """Convert array values to columns."""
 
-import functools
+import typing
 
 from ... import exceptions
 from ... import types as oa_types
@@ -26,6 +26,23 @@ def convert(
     Returns:
         The converted value.
 
+    """
+    return compile_(schema=schema)(value)
+
+
+def compile_(*, schema: oa_types.Schema) -> types.TFromDictArrayConverter:
+    """
+    Calculate the function that converts array values from a dictionary to a column.
+
+    Raises MalformedSchemaError if the items schema is missing from the schema.
+    Raises MalformedSchemaError if the items type is not object.
+
+    Args:
+        schema: The schema of the values.
+
+    Returns:
+        The function that converts a value.
+
     """
     # Check the schema
     items_schema = peek.items(schema=schema, schemas={})
@@ -40,13 +57,19 @@ def convert(
         raise exceptions.MalformedSchemaError(
             "The type of the array items must be object."
         )
+    item_conversion = object_.compile_(schema=items_schema)
+
+    def _convert(value: typing.Any) -> types.TOptArrayCol:
+        """Convert array value from a dictionary to a column."""
+        if value is None:
+            return None
+        # Convert values
+        try:
+            converted_items = map(item_conversion, value)
+        except TypeError as exc:
+            raise exceptions.InvalidInstanceError(
+                "Array values must be iterable."
+            ) from exc
+        return list(converted_items)
 
-    if value is None:
-        return None
-    # Convert values
-    item_conversion = functools.partial(object_.convert, schema=items_schema)
-    try:
-        converted_items = map(item_conversion, value)
-    except TypeError as exc:
-        raise exceptions.InvalidInstanceError("Array values must be iterable.") from exc
-    return list(converted_items)
+    return _convert
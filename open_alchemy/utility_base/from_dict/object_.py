@@ -1,5 +1,7 @@
 """Convert object dictionary to column value."""
 
+import typing
+
 from ... import exceptions
 from ... import types as oa_types
 from ...facades import models
@@ -22,6 +24,25 @@ def convert(
     Returns:
         The converted value.
 
+    """
+    return compile_(schema=schema)(value)
+
+
+def compile_(*, schema: oa_types.Schema) -> types.TFromDictConverter:
+    """
+    Calculate the function that converts dictionary values to model instances.
+
+    The referenced model is retrieved once. If it is not yet available it is retrieved
+    when a value is converted.
+
+    Raises MalformedSchemaError if the schema does not have x-de-$ref.
+
+    Args:
+        schema: The schema for the values.
+
+    Returns:
+        The function that converts a value.
+
     """
     ref_model_name = ext_prop.get(
         source=schema, name=oa_types.ExtensionProperties.DE_REF
@@ -32,13 +53,23 @@ def convert(
             "include the x-de-$ref extension property with the name of the "
             "model to construct for the property."
         )
-    if not isinstance(value, dict):
-        raise exceptions.InvalidInstanceError(
-            "The value for an object parameter must be a dictionary."
-        )
-    ref_model = models.get_model(name=ref_model_name)
-    if ref_model is None:
-        raise exceptions.SchemaNotFoundError(
-            f"The referenced model {ref_model} was not found in the models."
+    bound_ref_model = models.get_model(name=ref_model_name)
+
+    def _convert(value: typing.Any) -> types.TOptObjectCol:
+        """Convert dictionary value to model instance."""
+        if not isinstance(value, dict):
+            raise exceptions.InvalidInstanceError(
+                "The value for an object parameter must be a dictionary."
+            )
+        ref_model = (
+            bound_ref_model
+            if bound_ref_model is not None
+            else models.get_model(name=ref_model_name)
         )
-    return ref_model.from_dict(**value)
+        if ref_model is None:
+            raise exceptions.SchemaNotFoundError(
+                f"The referenced model {ref_model_name} was not found in the models."
+            )
+        return ref_model.from_dict(**value)
+
+    return _convert
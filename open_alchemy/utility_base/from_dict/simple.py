@@ -1,6 +1,7 @@
 """Convert simple type from dictionary to the column equivalent."""
 
 import datetime
+import typing
 
 from ... import exceptions
 from ... import types as oa_types
@@ -23,61 +24,114 @@ def convert(
     Returns:
         The value converted for a column.
 
+    """
+    return compile_(schema=schema)(value)
+
+
+def compile_(*, schema: oa_types.Schema) -> types.TFromDictSimpleConverter:
+    """
+    Calculate the function that converts simple values to the column equivalent.
+
+    Raises TypeMissingError if the schema does not have a type.
+
+    Args:
+        schema: The schema for the values.
+
+    Returns:
+        The function that converts a value.
+
     """
     type_ = peek.type_(schema=schema, schemas={})
-    if value is None:
-        return None
 
     if type_ == "integer":
-        if not isinstance(value, int):
-            raise exceptions.InvalidInstanceError(
-                "Integer type columns must have int values."
-            )
-        return value
+        return _convert_integer
     if type_ == "number":
-        if not isinstance(value, (float, int)):
-            raise exceptions.InvalidInstanceError(
-                "Number type columns must have float values."
-            )
-        return value
+        return _convert_number
     if type_ == "string":
-        return _handle_string(value, schema=schema)
+        return _compile_string(schema=schema)
     if type_ == "boolean":
-        if not isinstance(value, bool):
-            raise exceptions.InvalidInstanceError(
-                "Boolean type columns must have bool values."
-            )
-        return value
+        return _convert_boolean
 
-    raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
+    def _convert_not_implemented(value: types.TOptSimpleDict) -> types.TOptSimpleCol:
+        """Raise FeatureNotImplementedError for any value that is not None."""
+        if value is None:
+            return None
+        raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
 
+    return _convert_not_implemented
 
-def _handle_string(
-    value: types.TSimpleDict, *, schema: oa_types.Schema
-) -> types.TStringCol:
-    """
-    Convert string type value to column type.
 
-    Raises InvalidInstanceError if the value is not of the type implied by the schema.
+def _convert_integer(value: types.TOptSimpleDict) -> typing.Optional[int]:
+    """Convert integer value to the column equivalent."""
+    if value is None:
+        return None
+    if not isinstance(value, int):
+        raise exceptions.InvalidInstanceError(
+            "Integer type columns must have int values."
+        )
+    return value
+
+
+def _convert_number(value: types.TOptSimpleDict) -> typing.Optional[float]:
+    """Convert number value to the column equivalent."""
+    if value is None:
+        return None
+    if not isinstance(value, (float, int)):
+        raise exceptions.InvalidInstanceError(
+            "Number type columns must have float values."
+        )
+    return value
+
+
+def _convert_boolean(value: types.TOptSimpleDict) -> typing.Optional[bool]:
+    """Convert boolean value to the column equivalent."""
+    if value is None:
+        return None
+    if not isinstance(value, bool):
+        raise exceptions.InvalidInstanceError(
+            "Boolean type columns must have bool values."
+        )
+    return value
+
+
+_STRING_FORMAT_PARSERS: typing.Dict[
+    typing.Optional[str], typing.Callable[[str], types.TStringCol]
+] = {
+    "date": datetime.date.fromisoformat,
+    "date-time": datetime.datetime.fromisoformat,
+    # fromisoformat of duration is defined without self and called on the class
+    "duration": typing.cast(
+        typing.Callable[[str], types.TStringCol],
+        custom_python_types.duration.fromisoformat,
+    ),
+    "binary": str.encode,
+}
+
+
+def _compile_string(*, schema: oa_types.Schema) -> types.TFromDictSimpleConverter:
+    """
+    Calculate the function that converts string values to the column equivalent.
 
     Args:
-        value: The value to convert.
+        schema: The schema for the values.
 
     Returns:
-        The converted value.
+        The function that converts a value.
 
     """
-    if not isinstance(value, str):
-        raise exceptions.InvalidInstanceError(
-            "String type columns must have str values."
-        )
     format_ = peek.format_(schema=schema, schemas={})
-    if format_ == "date":
-        return datetime.date.fromisoformat(value)
-    if format_ == "date-time":
-        return datetime.datetime.fromisoformat(value)
-    if format_ == "duration":
-        return custom_python_types.duration.fromisoformat(value)
-    if format_ == "binary":
-        return value.encode()
-    return value
+    parse = _STRING_FORMAT_PARSERS.get(format_)
+
+    def _convert(value: types.TOptSimpleDict) -> typing.Optional[types.TStringCol]:
+        """Convert string value to the column equivalent."""
+        if value is None:
+            return None
+        if not isinstance(value, str):
+            raise exceptions.InvalidInstanceError(
+                "String type columns must have str values."
+            )
+        if parse is None:
+            return value
+        return parse(value)
+
+    return _convert
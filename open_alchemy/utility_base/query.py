@@ -0,0 +1,242 @@
+"""Functions to construct the statements and loader options of queries of a model."""
+
+import typing
+
+from .. import exceptions
+from ..facades import models
+from ..facades.sqlalchemy import bulk
+from ..facades.sqlalchemy import load_options
+from ..facades.sqlalchemy import select
+from ..helpers import schema as schema_helper
+from . import compiled
+from . import fields as fields_
+from . import to_dict
+from . import types
+
+
+def get_select_plan(*, model: typing.Type) -> types.TToDictPlan:
+    """
+    Get the plan for converting selected columns of a model to a dictionary.
+
+    Only has the entries of the properties that are columns, including those of the
+    parent.
+
+    Args:
+        model: The model to get the plan of.
+
+    Returns:
+        The plan, calculated once for each schema of the model.
+
+    """
+
+    def calculate() -> types.TToDictPlan:
+        """Calculate the plan."""
+        schema = compiled.get_schema(model=model)
+        plan = to_dict.get_plan(model=model)
+        if schema_helper.inherits(schema=schema, schemas={}):
+            plan = get_select_plan(model=compiled.get_parent(schema=schema)) + plan
+        column_keys = bulk.column_keys(model=model)
+        # The entry of the model replaces any entry of the parent for a property
+        entries = {entry[0]: entry for entry in plan if entry[0] in column_keys}
+        return tuple(entries.values())
+
+    return compiled.get(model=model, name="_select_plan", calculate=calculate)
+
+
+def select_statement(
+    *, model: typing.Type, fields: typing.Optional[typing.Iterable[str]] = None
+) -> typing.Any:
+    """
+    Construct the select statement for the columns of a model.
+
+    Raise ModelAttributeError if any of the fields is not a property of the model or
+    is not a column.
+
+    Args:
+        model: The model to select.
+        fields: The names of the properties to select, defaults to all columns.
+
+    Returns:
+        The statement.
+
+    """
+    plan = get_select_plan(model=model)
+    if fields is None:
+        return select.construct(model=model, names=[entry[0] for entry in plan])
+
+    fields = frozenset(fields)
+    fields_.check_columns(model=model, fields=fields)
+    return select.construct(
+        model=model, names=[entry[0] for entry in plan if entry[0] in fields]
+    )
+
+
+def select_dicts(
+    *, model: typing.Type, bind: typing.Any, statement: typing.Any
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """
+    Execute a select statement and convert the rows to dictionaries.
+
+    Raise ModelAttributeError if the key of a column of the statement is not a
+    property of the model that is a column and is not writeOnly.
+
+    Args:
+        model: The model of the rows.
+        bind: The connection or session to execute the statement with.
+        statement: The statement to execute.
+
+    Returns:
+        The dictionary representation of each row.
+
+    """
+    schema = compiled.get_schema(model=model)
+    plan = {entry[0]: entry for entry in get_select_plan(model=model)}
+    keys = select.keys(statement=statement)
+    unknown = [key for key in keys if key not in plan]
+    if unknown:
+        raise exceptions.ModelAttributeError(
+            "The columns of the statement are not column properties of the model.",
+            fields=unknown,
+            schema=schema,
+        )
+    columns = [(idx, *plan[key]) for idx, key in enumerate(keys)]
+
+    def convert(row: typing.Any) -> typing.Dict[str, typing.Any]:
+        """Convert a row to a dictionary."""
+        return_dict: typing.Dict[str, typing.Any] = {}
+        for idx, name, converter, include_none in columns:
+            value = row[idx]
+
+            # Handle none value
+            if value is None:
+                if include_none:
+                    return_dict[name] = None
+                # Don't consider for coverage due to coverage bug
+                continue  # pragma: no cover
+
+            try:
+                return_dict[name] = converter(value)
+            except exceptions.BaseError as exc:
+                exc.schema = schema  # type: ignore
+                exc.property_name = name  # type: ignore
+                exc.property_value = value  # type: ignore
+                raise
+
+        return return_dict
+
+    return [convert(row) for row in bind.execute(statement)]
+
+
+def get_to_dict_relationships(
+    *, model: typing.Type
+) -> typing.Tuple[types.ToDictRelationship, ...]:
+    """
+    Get the relationships of a model converted by to_dict.
+
+    Args:
+        model: The model to get the relationships of.
+
+    Returns:
+        The relationships, including those of the parent.
+
+    """
+
+    def calculate() -> typing.Tuple[types.ToDictRelationship, ...]:
+        """Calculate the relationships."""
+        model.get_properties()
+        schema = compiled.get_schema(model=model)
+        relationships = to_dict.calculate_relationships(schema=schema)
+        if not schema_helper.inherits(schema=schema, schemas={}):
+            return relationships
+        parent = compiled.get_parent(schema=schema)
+        return get_to_dict_relationships(model=parent) + relationships
+
+    return compiled.get(model=model, name="_to_dict_relationships", calculate=calculate)
+
+
+def _to_dict_relationship_paths(
+    *,
+    model: typing.Type,
+    depth: typing.Optional[int],
+    visited: typing.FrozenSet[typing.Type],
+) -> typing.Iterator[types.TRelationshipPath]:
+    """Calculate the longest paths of relationships converted by to_dict."""
+    if depth is not None and depth <= 0:
+        return
+
+    for relationship in get_to_dict_relationships(model=model):
+        step: types.TRelationshipPath = (
+            (getattr(model, relationship.name), relationship.collection),
+        )
+        related = (
+            models.get_model(name=relationship.model_name)
+            if relationship.model_name is not None
+            else None
+        )
+        sub_paths: typing.List[types.TRelationshipPath] = []
+        if related is not None and related not in visited:
+            sub_paths = list(
+                _to_dict_relationship_paths(
+                    model=related,
+                    depth=None if depth is None else depth - 1,
+                    visited=visited | {related},
+                )
+            )
+
+        if not sub_paths:
+            yield step
+        for sub_path in sub_paths:
+            yield step + sub_path
+
+
+def to_dict_load_options(
+    *,
+    model: typing.Type,
+    depth: typing.Optional[int] = None,
+    fields: typing.Optional[typing.Iterable[str]] = None,
+) -> typing.List[typing.Any]:
+    """
+    Calculate the loader options for the relationships to_dict converts.
+
+    Args:
+        model: The model of the query.
+        depth: The number of levels of relationships to load, defaults to all.
+        fields: The names of the properties whose relationships are loaded, defaults
+            to all.
+
+    Returns:
+        The loader options.
+
+    """
+    return [
+        load_options.construct(path=path)
+        for path in _to_dict_relationship_paths(
+            model=model, depth=depth, visited=frozenset((model,))
+        )
+        if fields is None or path[0][0].key in fields
+    ]
+
+
+def load_only_options(
+    *, model: typing.Type, fields: typing.Iterable[str]
+) -> typing.List[typing.Any]:
+    """
+    Calculate the loader options that only load the columns of some properties.
+
+    Raise ModelAttributeError if any of the fields is not a property of the model.
+
+    Args:
+        model: The model of the query.
+        fields: The names of the properties whose columns are loaded.
+
+    Returns:
+        The loader options.
+
+    """
+    fields = frozenset(fields)
+    fields_.check(model=model, fields=fields)
+    return [
+        load_options.load_only(
+            attributes=[getattr(model, name) for name in sorted(fields)]
+        )
+    ]
@@ -0,0 +1,213 @@
+"""Functions to collect the values of properties into columns."""
+
+import array
+import itertools
+import math
+import typing
+
+from .. import exceptions
+from .. import types as oa_types
+from ..facades import numpy_
+from ..facades.sqlalchemy import bulk
+from ..helpers import peek
+from ..helpers import schema as schema_helper
+from . import compiled
+from . import fields as fields_
+from . import to_dict
+from . import types
+
+# Dates and date-times are collected as Python values instead of strings
+NATIVE_FORMATS = frozenset(("date", "date-time"))
+# The typecode of the array.array for each type
+_TYPECODES = {"integer": "q", "number": "d", "boolean": "b"}
+# The NumPy dtype for each type and for each format of the string type
+_DTYPES = {"integer": "int64", "number": "float64", "boolean": "bool"}
+_FORMAT_DTYPES = {"date": "datetime64[D]", "date-time": "datetime64[us]"}
+
+
+def calculate_plan(*, schema: oa_types.Schema) -> types.TToColumnsPlan:
+    """
+    Calculate the plan for collecting the values of the properties of a model.
+
+    Assume the schema has properties.
+    Assume that any $ref and allOf has already been resolved.
+
+    The plan has a column for each property that is not writeOnly with the object or
+    array type unless it is JSON. The values of integer, number and boolean
+    properties are collected into an array.array. The values of other properties are
+    collected into a list, with dates and date-times as Python values and other
+    values converted like to_dict.
+
+    Args:
+        schema: The schema for the model.
+
+    Returns:
+        The plan for the model.
+
+    """
+    columns: typing.List[types.ToColumnsColumn] = []
+    properties = schema[oa_types.OpenApiProperties.PROPERTIES]
+    for name, converter, _ in to_dict.calculate_plan(
+        schema=schema, native_formats=NATIVE_FORMATS
+    ):
+        property_schema = properties[name]
+        json = peek.json(schema=property_schema, schemas={})
+        type_ = peek.type_(schema=property_schema, schemas={})
+        if not json and type_ in {"object", "array"}:
+            continue
+
+        dtype = "object"
+        if not json and type_ in _DTYPES:
+            dtype = _DTYPES[type_]
+        elif not json and type_ == "string":
+            format_ = peek.format_(schema=property_schema, schemas={})
+            dtype = _FORMAT_DTYPES.get(format_ or "", "object")
+        columns.append(
+            types.ToColumnsColumn(
+                name=name,
+                typecode=None if json else _TYPECODES.get(type_),
+                converter=converter,
+                dtype=dtype,
+            )
+        )
+
+    return tuple(columns)
+
+
+def collect(
+    *,
+    plan: types.TToColumnsPlan,
+    values: typing.Iterable[typing.Any],
+    schema: oa_types.Schema,
+) -> typing.Dict[str, types.TColumn]:
+    """
+    Collect the values of the properties of instances or rows into columns.
+
+    Rows of a select statement only have the columns the statement selects, so only
+    the properties of the plan with a column in the rows are collected. A None value
+    is collected as NaN into a number column. An integer or boolean column is
+    converted to a list when a None value is collected.
+
+    Args:
+        plan: The plan for the columns to collect.
+        values: The instances or the rows of a select statement.
+        schema: The schema for the model, recorded on any exception.
+
+    Returns:
+        The column of each property.
+
+    """
+    values = iter(values)
+    first = next(values, None)
+    mapping = getattr(first, "_mapping", None)
+    positions: typing.List[int] = []
+    if mapping is not None:
+        keys = list(mapping.keys())
+        plan = tuple(column for column in plan if column.name in mapping)
+        positions = [keys.index(column.name) for column in plan]
+
+    columns: typing.List[types.TColumn] = [
+        [] if column.typecode is None else array.array(column.typecode)
+        for column in plan
+    ]
+    if first is None:
+        return {column.name: collected for column, collected in zip(plan, columns)}
+
+    for value in itertools.chain((first,), values):
+        for idx, (name, typecode, converter, _) in enumerate(plan):
+            item = (
+                getattr(value, name, None) if mapping is None else value[positions[idx]]
+            )
+
+            # Handle none value
+            if item is None:
+                if typecode == "d":
+                    columns[idx].append(math.nan)
+                    continue
+                column = columns[idx]
+                if isinstance(column, array.array):
+                    columns[idx] = (
+                        [bool(collected) for collected in column]
+                        if typecode == "b"
+                        else column.tolist()
+                    )
+                columns[idx].append(None)
+                continue
+
+            try:
+                columns[idx].append(converter(item))
+            except exceptions.BaseError as exc:
+                exc.schema = schema  # type: ignore
+                exc.property_name = name  # type: ignore
+                exc.property_value = item  # type: ignore
+                raise
+
+    return {column.name: collected for column, collected in zip(plan, columns)}
+
+
+def get_plan(*, model: typing.Type) -> types.TToColumnsPlan:
+    """
+    Get the plan for collecting the values of a model into columns.
+
+    Only has the columns of the properties that are columns, including those of the
+    parent.
+
+    Args:
+        model: The model to get the plan of.
+
+    Returns:
+        The plan, calculated once for each schema of the model.
+
+    """
+
+    def calculate() -> types.TToColumnsPlan:
+        """Calculate the plan."""
+        model.get_properties()
+        schema = compiled.get_schema(model=model)
+        plan = calculate_plan(schema=schema)
+        if schema_helper.inherits(schema=schema, schemas={}):
+            plan = get_plan(model=compiled.get_parent(schema=schema)) + plan
+        column_keys = bulk.column_keys(model=model)
+        # The column of the model replaces any column of the parent for a property
+        columns = {column.name: column for column in plan if column.name in column_keys}
+        return tuple(columns.values())
+
+    return compiled.get(model=model, name="_to_columns_plan", calculate=calculate)
+
+
+def convert(
+    *,
+    model: typing.Type,
+    values: typing.Iterable[typing.Any],
+    fields: typing.Optional[typing.Iterable[str]] = None,
+    numpy: bool = False,
+) -> typing.Dict[str, typing.Any]:
+    """
+    Collect the values of instances or rows of a model into a column for each property.
+
+    Raise ModelAttributeError if any of the fields is not a property of the model or
+    is not a column.
+
+    Args:
+        model: The model of the instances or rows.
+        values: The instances or the rows of a select statement.
+        fields: The names of the properties to collect, defaults to all columns.
+        numpy: Whether to convert each column to a NumPy array.
+
+    Returns:
+        The column of each property.
+
+    """
+    plan = get_plan(model=model)
+    if fields is not None:
+        fields = frozenset(fields)
+        fields_.check_columns(model=model, fields=fields)
+        plan = tuple(column for column in plan if column.name in fields)
+
+    columns = collect(plan=plan, values=values, schema=compiled.get_schema(model=model))
+    if not numpy:
+        return columns
+    return {
+        column.name: numpy_.array(values=columns[column.name], dtype=column.dtype)
+        for column in plan
+    }
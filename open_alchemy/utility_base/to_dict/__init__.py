@@ -1,16 +1,27 @@
 """Functions to convert to dictionary."""
 
+import functools
 import typing
 
 from ... import exceptions
 from ... import types as oa_types
+from ...helpers import ext_prop
 from ...helpers import peek
+from ...helpers import schema as schema_helper
 from ...helpers import type_ as type_helper
+from .. import compiled
+from .. import fields as fields_
 from .. import types
 from . import array
 from . import object_
 from . import simple
 
+TProjector = typing.Callable[[typing.FrozenSet[str], bool], types.TToDictPlan]
+TInstanceConverter = typing.Callable[[typing.Any], typing.Dict[str, typing.Any]]
+
+# The number of projections of the to_dict plan for fields cached per model
+_PROJECTIONS_MAXSIZE = 128
+
 
 def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyDict:
     """
@@ -23,20 +34,156 @@ def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyDict:
     Returns:
         The converted value.
 
+    """
+    # Without native formats the converter only returns dictionary values
+    return typing.cast(types.TAnyDict, compile_(schema=schema)(value))
+
+
+def _convert_json(value: typing.Any) -> typing.Any:
+    """Convert JSON property values, which are already dictionary values."""
+    return value
+
+
+def compile_(
+    *,
+    schema: oa_types.Schema,
+    native_formats: typing.FrozenSet[str] = frozenset(),
+) -> types.TToDictConverter:
+    """
+    Calculate the function that converts values for a schema to a dictionary.
+
+    Args:
+        schema: The schema of the values.
+        native_formats: The string formats whose values are not converted to a string
+            because the JSON encoder supports them directly.
+
+    Returns:
+        The function that converts a value.
+
     """
     json = peek.json(schema=schema, schemas={})
     if json:
-        return value
+        return _convert_json
     type_ = peek.type_(schema=schema, schemas={})
     if type_ == "object":
-        return object_.convert(value, schema=schema)
+        return object_.compile_(schema=schema)
     if type_ == "array":
-        return array.convert(value, schema=schema)
+        return array.compile_(schema=schema)
     if type_ in type_helper.SIMPLE_TYPES:
-        return simple.convert(value, schema=schema)
+        return simple.compile_(schema=schema, native_formats=native_formats)
     raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
 
 
+def _compile_property(
+    *, schema: oa_types.Schema, native_formats: typing.FrozenSet[str]
+) -> types.TToDictConverter:
+    """
+    Calculate the function that converts the values of a property.
+
+    Any error due to the property schema is raised when a value is converted so that
+    the error is only raised for values that are not None.
+
+    Args:
+        schema: The schema of the property.
+        native_formats: The string formats that are not converted to a string.
+
+    Returns:
+        The function that converts a value.
+
+    """
+    try:
+        return compile_(schema=schema, native_formats=native_formats)
+    except exceptions.BaseError:
+        return lambda value: convert(schema=schema, value=value)
+
+
+def calculate_plan(
+    *,
+    schema: oa_types.Schema,
+    native_formats: typing.FrozenSet[str] = frozenset(),
+) -> types.TToDictPlan:
+    """
+    Calculate the plan for converting instances of a model to a dictionary.
+
+    Assume the schema has properties.
+    Assume that any $ref and allOf has already been resolved.
+
+    The plan has an entry for each property that is not writeOnly with the name of the
+    property, the function that converts its value and whether a None value is
+    included in the dictionary.
+
+    Args:
+        schema: The schema for the model.
+        native_formats: The string formats whose values are not converted to a string
+            because the JSON encoder supports them directly.
+
+    Returns:
+        The plan for the model.
+
+    """
+    properties = schema[oa_types.OpenApiProperties.PROPERTIES]
+    return tuple(
+        (
+            name,
+            _compile_property(schema=property_schema, native_formats=native_formats),
+            return_none(schema=schema, property_name=name),
+        )
+        for name, property_schema in properties.items()
+        if not peek.write_only(schema=property_schema, schemas={})
+    )
+
+
+def calculate_relationships(
+    *, schema: oa_types.Schema
+) -> typing.Tuple[types.ToDictRelationship, ...]:
+    """
+    Calculate the relationships of a model that are converted to a dictionary.
+
+    Assume the schema has properties.
+    Assume that any $ref and allOf has already been resolved.
+
+    Relationships are the properties that are not writeOnly nor JSON with the object
+    type or the array type with object items. Unless it is readOnly, to_dict is called
+    on the related instances of a relationship.
+
+    Args:
+        schema: The schema for the model.
+
+    Returns:
+        The relationships of the model.
+
+    """
+    relationships: typing.List[types.ToDictRelationship] = []
+    properties = schema[oa_types.OpenApiProperties.PROPERTIES]
+    for name, property_schema in properties.items():
+        if peek.write_only(schema=property_schema, schemas={}) or peek.json(
+            schema=property_schema, schemas={}
+        ):
+            continue
+
+        type_ = property_schema.get(oa_types.OpenApiProperties.TYPE)
+        item_schema: typing.Optional[oa_types.Schema] = property_schema
+        if type_ == "array":
+            item_schema = peek.items(schema=property_schema, schemas={})
+        elif type_ != "object":
+            continue
+        if item_schema is None:
+            continue
+
+        model_name = None
+        if not peek.read_only(schema=property_schema, schemas={}):
+            model_name = ext_prop.get(
+                source=item_schema, name=oa_types.ExtensionProperties.DE_REF
+            )
+        relationships.append(
+            types.ToDictRelationship(
+                name=name, collection=type_ == "array", model_name=model_name
+            )
+        )
+
+    return tuple(relationships)
+
+
 def return_none(*, schema: oa_types.Schema, property_name: str) -> bool:
     """
     Check whether a null value for a property should be returned.
@@ -68,3 +215,224 @@ def return_none(*, schema: oa_types.Schema, property_name: str) -> bool:
     if nullable_value is True:
         return True
     return False
+
+
+def get_plan(*, model: typing.Type) -> types.TToDictPlan:
+    """
+    Get the plan for converting instances of a model to a dictionary.
+
+    Args:
+        model: The model to get the plan of.
+
+    Returns:
+        The plan, calculated once for each schema of the model.
+
+    """
+
+    def calculate() -> types.TToDictPlan:
+        """Calculate the plan."""
+        model.get_properties()
+        return calculate_plan(schema=compiled.get_schema(model=model))
+
+    return compiled.get(model=model, name="_to_dict_plan", calculate=calculate)
+
+
+def get_json_plan(*, model: typing.Type) -> types.TToDictPlan:
+    """
+    Get the plan for converting instances of a model to a dictionary to encode.
+
+    Values that the JSON codec of the model encodes directly are not converted.
+
+    Args:
+        model: The model to get the plan of.
+
+    Returns:
+        The plan, calculated once for each schema of the model.
+
+    """
+    native_formats = compiled.get_json_codec(model=model).native_formats
+    if not native_formats:
+        return get_plan(model=model)
+
+    def calculate() -> types.TToDictPlan:
+        """Calculate the plan."""
+        model.get_properties()
+        return calculate_plan(
+            schema=compiled.get_schema(model=model), native_formats=native_formats
+        )
+
+    return compiled.get(model=model, name="_to_json_plan", calculate=calculate)
+
+
+def get_projection(
+    *, model: typing.Type, fields: typing.FrozenSet[str], json_: bool
+) -> types.TToDictPlan:
+    """
+    Get the plan for converting only some properties of a model to a dictionary.
+
+    The most recently used projections are cached so that the cache does not grow
+    with every combination of fields.
+
+    Args:
+        model: The model to get the plan of.
+        fields: The names of the properties to convert.
+        json_: Whether to project the plan for a dictionary to encode.
+
+    Returns:
+        The entries of the plan for the fields.
+
+    """
+
+    def calculate() -> TProjector:
+        """Calculate the function that projects the plan."""
+
+        @functools.lru_cache(maxsize=_PROJECTIONS_MAXSIZE)
+        def project(fields: typing.FrozenSet[str], json_: bool) -> types.TToDictPlan:
+            """Project the plan to the fields."""
+            plan = get_json_plan(model=model) if json_ else get_plan(model=model)
+            return tuple(entry for entry in plan if entry[0] in fields)
+
+        return project
+
+    return compiled.get(model=model, name="_to_dict_projections", calculate=calculate)(
+        fields, json_
+    )
+
+
+def get_instance_converter(
+    *,
+    model: typing.Type,
+    json_: bool = False,
+    fields: typing.Optional[typing.FrozenSet[str]] = None,
+) -> TInstanceConverter:
+    """
+    Get the function that converts the properties of a model of an instance.
+
+    The properties of the parent of the model are not converted.
+
+    Args:
+        model: The model to get the function of.
+        json_: Whether the dictionary is encoded by the JSON codec of the model.
+        fields: The names of the properties to convert, defaults to all.
+
+    Returns:
+        The function that converts an instance.
+
+    """
+    if fields is not None:
+        plan = get_projection(model=model, fields=fields, json_=json_)
+    elif json_:
+        plan = get_json_plan(model=model)
+    else:
+        plan = get_plan(model=model)
+
+    def convert_instance(instance: typing.Any) -> typing.Dict[str, typing.Any]:
+        """Convert instance of the model to a dictionary."""
+        # Collecting the values of the properties
+        return_dict: typing.Dict[str, typing.Any] = {}
+        for name, converter, include_none in plan:
+            value = getattr(instance, name, None)
+
+            # Handle none value
+            if value is None:
+                if include_none:
+                    return_dict[name] = None
+                # Don't consider for coverage due to coverage bug
+                continue  # pragma: no cover
+
+            try:
+                return_dict[name] = converter(value)
+            except exceptions.BaseError as exc:
+                exc.schema = compiled.get_schema(model=model)  # type: ignore
+                exc.property_schema = model.get_properties()[name]  # type: ignore
+                exc.property_name = name  # type: ignore
+                exc.property_value = value  # type: ignore
+                raise
+
+        return return_dict
+
+    return convert_instance
+
+
+def get_converter(
+    *,
+    model: typing.Type,
+    json_: bool = False,
+    fields: typing.Optional[typing.FrozenSet[str]] = None,
+) -> TInstanceConverter:
+    """
+    Get the function that converts an instance of a model to a dictionary.
+
+    Raise ModelAttributeError if any of the fields is not a property of the model.
+
+    Args:
+        model: The model to get the function of.
+        json_: Whether the dictionary is encoded by the JSON codec of the model
+            which means that values it encodes directly are not converted.
+        fields: The names of the properties to convert, defaults to all.
+
+    Returns:
+        The function that converts an instance, including the properties of the
+        parent of the model.
+
+    """
+    if fields is not None:
+        fields_.check(model=model, fields=fields)
+    schema = compiled.get_schema(model=model)
+    convert_instance = get_instance_converter(model=model, json_=json_, fields=fields)
+    if not schema_helper.inherits(schema=schema, schemas={}):
+        return convert_instance
+
+    parent = compiled.get_parent(schema=schema)
+    convert_parent = get_instance_converter(model=parent, json_=json_, fields=fields)
+    return lambda instance: {**convert_parent(instance), **convert_instance(instance)}
+
+
+def get_json_converter(*, model: typing.Type) -> typing.Callable[[typing.Any], str]:
+    """
+    Get the function that encodes an instance of a model as JSON.
+
+    Args:
+        model: The model to get the function of.
+
+    Returns:
+        The function that encodes an instance using the JSON codec of the model.
+
+    """
+    dumps = compiled.get_json_codec(model=model).dumps
+    convert_instance = get_converter(model=model, json_=True)
+    return lambda instance: dumps(convert_instance(instance))
+
+
+def iter_converted(
+    *,
+    instances: typing.Iterable[typing.Any],
+    json_: bool,
+    fields: typing.Optional[typing.FrozenSet[str]] = None,
+) -> typing.Iterator[typing.Any]:
+    """
+    Convert model instances to dictionaries or JSON one at a time.
+
+    The function that converts the instances of a model is retrieved once.
+
+    Args:
+        instances: The instances to convert.
+        json_: Whether to encode the instances as JSON.
+        fields: The names of the properties to convert, defaults to all.
+
+    Returns:
+        The converted instances in the same order.
+
+    """
+    converters: typing.Dict[typing.Type, typing.Callable[[typing.Any], typing.Any]]
+    converters = {}
+    for instance in instances:
+        model = type(instance)
+        converter = converters.get(model)
+        if converter is None:
+            converter = converters[model] = (
+                get_json_converter(model=model)
+                if json_
+                else get_converter(model=model, fields=fields)
+            )
+        yield converter(instance)
@@ -1,6 +1,5 @@
 """Convert array to dictionary."""
 
-import functools
 import typing
 
 from ... import exceptions
@@ -28,6 +27,23 @@ def convert(value: typing.Any, *, schema: ao_types.Schema) -> types.TOptArrayDic
     """
     if value is None:
         return None
+    return compile_(schema=schema)(value)
+
+
+def compile_(*, schema: ao_types.Schema) -> types.TToDictArrayConverter:
+    """
+    Calculate the function that converts array values to a list of dictionaries.
+
+    Raises MalformedSchemaError if schema does not define item schema.
+    Raises FeatureNotImplementedError if the item schema is not of type object.
+
+    Args:
+        schema: The schema for the values.
+
+    Returns:
+        The function that converts a value.
+
+    """
     item_schema = peek.items(schema=schema, schemas={})
     if item_schema is None:
         raise exceptions.MalformedSchemaError(
@@ -39,11 +55,18 @@ def convert(value: typing.Any, *, schema: ao_types.Schema) -> types.TOptArrayDic
             "The array item schema must be of type object."
         )
     read_only = peek.read_only(schema=schema, schemas={})
-    item_conversion = functools.partial(
-        object_.convert, schema=item_schema, read_only=read_only
-    )
-    try:
-        converted_items = map(item_conversion, value)
-    except TypeError as exc:
-        raise exceptions.InvalidInstanceError("Array values must be iterable.") from exc
-    return list(converted_items)
+    item_conversion = object_.compile_(schema=item_schema, read_only=read_only)
+
+    def _convert(value: typing.Any) -> types.TOptArrayDict:
+        """Convert array value to a list of dictionaries."""
+        if value is None:
+            return None
+        try:
+            converted_items = map(item_conversion, value)
+        except TypeError as exc:
+            raise exceptions.InvalidInstanceError(
+                "Array values must be iterable."
+            ) from exc
+        return list(converted_items)
+
+    return _convert
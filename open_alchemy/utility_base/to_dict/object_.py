@@ -8,7 +8,7 @@ from ...helpers import peek
 from .. import types
 
 
-def _convert_relationship(*, value: types.TModel) -> types.TOptObjectDict:
+def _convert_relationship(value: types.TModel) -> types.TOptObjectDict:
     """
     Convert object relationship property to a dictionary.
 
@@ -51,6 +51,16 @@ def _convert_read_only(
     if value is None:
         return None
 
+    return _compile_read_only(schema=schema)(value)
+
+
+def _compile_read_only(*, schema: oa_types.Schema) -> types.TToDictObjectConverter:
+    """
+    Calculate the function that converts readOnly values to a dictionary.
+
+    Raise MalformedSchemaError if the schema does not have properties.
+    Raise MalformedSchemaError if the schema has empty properties.
+    """
     properties = schema.get(oa_types.OpenApiProperties.PROPERTIES)
     if properties is None:
         raise exceptions.MalformedSchemaError(
@@ -64,10 +74,15 @@ def _convert_read_only(
         raise exceptions.MalformedSchemaError(
             "readOnly object definitions must have at least 1 property."
         )
-    return_dict = {}
-    for key in properties.keys():
-        return_dict[key] = getattr(value, key, None)
-    return return_dict
+    keys = tuple(properties.keys())
+
+    def _convert(value: typing.Any) -> types.TOptObjectDict:
+        """Convert readOnly value to a dictionary."""
+        if value is None:
+            return None
+        return {key: getattr(value, key, None) for key in keys}
+
+    return _convert
 
 
 def convert(
@@ -89,3 +104,23 @@ def convert(
     if read_only or schema_read_only:
         return _convert_read_only(schema=schema, value=value)
     return _convert_relationship(value=value)
+
+
+def compile_(
+    *, schema: oa_types.Schema, read_only: typing.Optional[bool] = None
+) -> types.TToDictObjectConverter:
+    """
+    Calculate the function that converts object schema values to dictionaries.
+
+    Args:
+        schema: The schema for the values.
+        read_only (optional): Whether the schema is read only.
+
+    Returns:
+        The function that converts a value.
+
+    """
+    schema_read_only = peek.read_only(schema=schema, schemas={})
+    if read_only or schema_read_only:
+        return _compile_read_only(schema=schema)
+    return _convert_relationship
@@ -1,6 +1,7 @@
 """Convert simple types (not object nor array)."""
 
 import datetime
+import typing
 
 from ... import exceptions
 from ... import types as oa_types
@@ -23,77 +24,167 @@ def convert(
     Returns:
         The value converted to the expected dictionary value.
 
+    """
+    # Without native formats the converter only returns simple dictionary values
+    return typing.cast(types.TOptSimpleDict, compile_(schema=schema)(value))
+
+
+def compile_(
+    *,
+    schema: oa_types.Schema,
+    native_formats: typing.FrozenSet[str] = frozenset(),
+) -> types.TToDictConverter:
+    """
+    Calculate the function that converts values with basic types to dictionary values.
+
+    Raises TypeMissingError if the schema does not have a type.
+
+    Args:
+        schema: The schema for the values.
+        native_formats: The string formats whose values are only checked and not
+            converted to a string because the JSON encoder supports them directly.
+
+    Returns:
+        The function that converts a value.
+
     """
     type_ = peek.type_(schema=schema, schemas={})
-    if value is None:
-        return None
 
     if type_ == "integer":
-        if not isinstance(value, int):
-            raise exceptions.InvalidInstanceError(
-                "Integer type columns must have int values."
-            )
-        return value
+        return _convert_integer
     if type_ == "number":
-        if not isinstance(value, float):
-            raise exceptions.InvalidInstanceError(
-                "Number type columns must have float values."
-            )
-        return value
+        return _convert_number
     if type_ == "string":
-        return _handle_string(value, schema=schema)
+        format_ = peek.format_(schema=schema, schemas={})
+        if format_ in native_formats and format_ in _NATIVE_STRING_FORMAT_CONVERTERS:
+            return _NATIVE_STRING_FORMAT_CONVERTERS[format_]
+        return _STRING_FORMAT_CONVERTERS.get(format_, _convert_string)
     if type_ == "boolean":
-        if not isinstance(value, bool):
-            raise exceptions.InvalidInstanceError(
-                "Boolean type columns must have bool values."
-            )
-        return value
+        return _convert_boolean
 
-    raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
+    def _convert_not_implemented(value: types.TOptSimpleCol) -> types.TOptSimpleDict:
+        """Raise FeatureNotImplementedError for any value that is not None."""
+        if value is None:
+            return None
+        raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
 
+    return _convert_not_implemented
 
-def _handle_string(value: types.TSimpleCol, *, schema: oa_types.Schema) -> str:
-    """
-    Convert string type column to str.
 
-    Raises InvalidInstanceError if the value is not of the type implied by the schema.
+def _convert_integer(value: types.TOptSimpleCol) -> typing.Optional[int]:
+    """Convert integer type column to int."""
+    if value is None:
+        return None
+    if not isinstance(value, int):
+        raise exceptions.InvalidInstanceError(
+            "Integer type columns must have int values."
+        )
+    return value
 
-    Args:
-        value: The value to convert.
 
-    Returns:
-        The converted value.
+def _convert_number(value: types.TOptSimpleCol) -> typing.Optional[float]:
+    """Convert number type column to float."""
+    if value is None:
+        return None
+    if not isinstance(value, float):
+        raise exceptions.InvalidInstanceError(
+            "Number type columns must have float values."
+        )
+    return value
 
-    """
-    format_ = peek.format_(schema=schema, schemas={})
-    if format_ == "date":
-        if not isinstance(value, datetime.date):
-            raise exceptions.InvalidInstanceError(
-                "String type columns with date format must have date values."
-            )
-        return value.isoformat()
-    if format_ == "date-time":
-        if not isinstance(value, datetime.datetime):
-            raise exceptions.InvalidInstanceError(
-                "String type columns with date-time format must have datetime "
-                "values."
-            )
-        return value.isoformat()
-    if format_ == "duration":
-        if not isinstance(value, custom_python_types.duration):
-            raise exceptions.InvalidInstanceError(
-                "String type columns with duration format must have duration "
-                "values."
-            )
-        return value.isoformat()
-    if format_ == "binary":
-        if not isinstance(value, bytes):
-            raise exceptions.InvalidInstanceError(
-                "String type columns with binary format must have bytes values."
-            )
-        return value.decode()
+
+def _convert_boolean(value: types.TOptSimpleCol) -> typing.Optional[bool]:
+    """Convert boolean type column to bool."""
+    if value is None:
+        return None
+    if not isinstance(value, bool):
+        raise exceptions.InvalidInstanceError(
+            "Boolean type columns must have bool values."
+        )
+    return value
+
+
+def _convert_string(value: types.TOptSimpleCol) -> typing.Optional[str]:
+    """Convert string type column without a special format to str."""
+    if value is None:
+        return None
     if not isinstance(value, str):
         raise exceptions.InvalidInstanceError(
             "String type columns must have str values."
         )
     return value
+
+
+def _check_date(value: types.TOptSimpleCol) -> typing.Optional[datetime.date]:
+    """Check that string type column with date format has a date value."""
+    if value is None:
+        return None
+    if not isinstance(value, datetime.date):
+        raise exceptions.InvalidInstanceError(
+            "String type columns with date format must have date values."
+        )
+    return value
+
+
+def _convert_date(value: types.TOptSimpleCol) -> typing.Optional[str]:
+    """Convert string type column with date format to str."""
+    date_value = _check_date(value)
+    if date_value is None:
+        return None
+    return date_value.isoformat()
+
+
+def _check_date_time(
+    value: types.TOptSimpleCol,
+) -> typing.Optional[datetime.datetime]:
+    """Check that string type column with date-time format has a datetime value."""
+    if value is None:
+        return None
+    if not isinstance(value, datetime.datetime):
+        raise exceptions.InvalidInstanceError(
+            "String type columns with date-time format must have datetime values."
+        )
+    return value
+
+
+def _convert_date_time(value: types.TOptSimpleCol) -> typing.Optional[str]:
+    """Convert string type column with date-time format to str."""
+    date_time_value = _check_date_time(value)
+    if date_time_value is None:
+        return None
+    return date_time_value.isoformat()
+
+
+def _convert_duration(value: types.TOptSimpleCol) -> typing.Optional[str]:
+    """Convert string type column with duration format to str."""
+    if value is None:
+        return None
+    if not isinstance(value, custom_python_types.duration):
+        raise exceptions.InvalidInstanceError(
+            "String type columns with duration format must have duration values."
+        )
+    return value.isoformat()
+
+
+def _convert_binary(value: types.TOptSimpleCol) -> typing.Optional[str]:
+    """Convert string type column with binary format to str."""
+    if value is None:
+        return None
+    if not isinstance(value, bytes):
+        raise exceptions.InvalidInstanceError(
+            "String type columns with binary format must have bytes values."
+        )
+    return value.decode()
+
+
+_STRING_FORMAT_CONVERTERS: typing.Dict[typing.Optional[str], types.TToDictConverter] = {
+    "date": _convert_date,
+    "date-time": _convert_date_time,
+    "duration": _convert_duration,
+    "binary": _convert_binary,
+}
+# The converters for formats that the JSON encoder supports directly
+_NATIVE_STRING_FORMAT_CONVERTERS: typing.Dict[str, types.TToDictConverter] = {
+    "date": _check_date,
+    "date-time": _check_date_time,
+}
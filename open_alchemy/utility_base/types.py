@@ -15,6 +15,19 @@ TArrayDict = typing.List[TOptObjectDict]
 TOptArrayDict = typing.Optional[TArrayDict]
 TComplexDict = typing.Union[TOptObjectDict, TOptArrayDict]
 TAnyDict = typing.Union[TComplexDict, TOptSimpleDict]
+# Dates are left for JSON backends that encode them natively
+TNativeSimpleDict = typing.Optional[typing.Union[TSimpleDict, datetime.date]]
+# Types for the plan for converting to a dictionary
+TToDictConverter = typing.Callable[
+    [typing.Any], typing.Union[TAnyDict, TNativeSimpleDict]
+]
+TToDictObjectConverter = typing.Callable[[typing.Any], TOptObjectDict]
+TToDictArrayConverter = typing.Callable[[typing.Any], TOptArrayDict]
+TToDictPlanEntry = typing.Tuple[str, TToDictConverter, bool]
+TToDictPlan = typing.Tuple[TToDictPlanEntry, ...]
+# The path of relationships from a model, each with the attribute of the relationship
+# and whether it is a collection
+TRelationshipPath = typing.Tuple[typing.Tuple[typing.Any, bool], ...]
 # Types for converting from a dictionary
 TStringCol = typing.Union[str, bytes, datetime.date, datetime.datetime, custom_python_types.duration]
 TSimpleCol = typing.Union[int, float, TStringCol, bool]
@@ -25,6 +38,49 @@ TArrayCol = typing.Iterable[TOptObjectCol]
 TOptArrayCol = typing.Optional[TArrayCol]
 TComplexCol = typing.Union[TOptObjectCol, TOptArrayCol]
 TAnyCol = typing.Union[TComplexCol, TSimpleCol]
+# Types for the plan for converting from a dictionary
+TFromDictConverter = typing.Callable[[typing.Any], TAnyCol]
+TFromDictSimpleConverter = typing.Callable[[typing.Any], TOptSimpleCol]
+TFromDictArrayConverter = typing.Callable[[typing.Any], TOptArrayCol]
+
+
+class FromDictPlan(typing.NamedTuple):
+    """The plan for constructing a model from a dictionary."""
+
+    # Maps the name of each property that is not readOnly to its converter
+    converters: typing.Dict[str, TFromDictConverter]
+    # The names of the readOnly properties
+    read_only: typing.FrozenSet[str]
+    # The names of the required properties
+    required: typing.FrozenSet[str]
+
+
+class ToDictRelationship(typing.NamedTuple):
+    """A relationship of a model that is converted by to_dict."""
+
+    # The name of the property of the relationship
+    name: str
+    # Whether the relationship is a collection
+    collection: bool
+    # The name of the related model if to_dict is called on the related instances
+    model_name: typing.Optional[str]
+
+
+class ToColumnsColumn(typing.NamedTuple):
+    """How the values of a property are collected into a column."""
+
+    # The name of the property
+    name: str
+    # The typecode of the array.array the values are collected into, None for a list
+    typecode: typing.Optional[str]
+    # Converts a value that is not None
+    converter: TToDictConverter
+    # The NumPy dtype of the column
+    dtype: str
+
+
+TToColumnsPlan = typing.Tuple[ToColumnsColumn, ...]
+TColumn = typing.MutableSequence[typing.Any]
 
 
 class TModel(oa_types.Protocol):
@@ -0,0 +1,74 @@
+"""Tests for the generated specifications."""
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+from benchmarks import spec
+
+
+@pytest.mark.parametrize(
+    "config, expected_tables",
+    [
+        pytest.param(spec.Config(models=1), 1, id="single"),
+        pytest.param(
+            spec.Config(models=20, relationship_density=1.0, many_to_many_density=1.0),
+            39,
+            id="relationships",
+        ),
+        pytest.param(
+            spec.Config(models=20, many_to_many_density=0, all_of_depth=3),
+            20,
+            id="allOf",
+        ),
+        pytest.param(
+            spec.Config(
+                models=20,
+                inheritance_depth=3,
+                inheritance="joined",
+                many_to_many_density=0,
+            ),
+            20,
+            id="joined inheritance",
+        ),
+        pytest.param(
+            spec.Config(
+                models=20,
+                inheritance_depth=3,
+                inheritance="single",
+                many_to_many_density=0,
+            ),
+            5,
+            id="single inheritance",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_generate(config, expected_tables, engine):
+    """
+    GIVEN config
+    WHEN a specification is generated and the models are initialized
+    THEN the models can be constructed and the expected tables are created.
+    """
+    base = declarative.declarative_base()
+
+    open_alchemy.init_model_factory(base=base, spec=spec.generate(config))
+
+    base.metadata.create_all(engine)
+    assert len(base.metadata.tables) == expected_tables
+
+
+@pytest.mark.integration
+def test_write_remote(tmp_path, engine, _clean_remote_schemas_store):
+    """
+    GIVEN config with remote references
+    WHEN the specification is written and initialized
+    THEN the models are constructed.
+    """
+    config = spec.Config(models=3, remote=True)
+
+    spec_path = spec.write(config, tmp_path)
+
+    base, _ = open_alchemy.init_json(str(spec_path))
+    base.metadata.create_all(engine)
+    assert len(base.metadata.tables) == 3
@@ -117,18 +117,18 @@ def mocked_facades_models_get_model_schema(monkeypatch):
 def cleanup_models():
     """Remove any new attributes on open_alchemy.models."""
     for key in set(models.__dict__.keys()):
-        if key.startswith("__"):
+        if key.startswith("__") and key != "__getattr__":
             continue
-        if key.endswith("__"):
+        if key.endswith("__") and key != "__getattr__":
             continue
         delattr(models, key)
 
     yield
 
     for key in set(models.__dict__.keys()):
-        if key.startswith("__"):
+        if key.startswith("__") and key != "__getattr__":
             continue
-        if key.endswith("__"):
+        if key.endswith("__") and key != "__getattr__":
             continue
         delattr(models, key)
 
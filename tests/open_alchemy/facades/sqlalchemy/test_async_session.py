@@ -0,0 +1,94 @@
+"""Tests for SQLAlchemy asyncio session facade."""
+
+import asyncio
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext import declarative
+
+from open_alchemy.facades.sqlalchemy import async_session
+
+
+def _model():
+    """Construct a model with a composite primary key."""
+    base = declarative.declarative_base()
+
+    class Model(base):  # pylint: disable=too-few-public-methods
+        """Model with a composite primary key."""
+
+        __tablename__ = "model"
+        id_1 = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+        id_2 = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+        name = sqlalchemy.Column(sqlalchemy.String)
+
+    return Model
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_add_load(monkeypatch):
+    """
+    GIVEN model with a composite primary key and an AsyncSession
+    WHEN add is called with instances and load is called for the expired instances
+        and a transient instance
+    THEN the instances are flushed and the attributes of the expired instances are
+        loaded with a query for each chunk.
+    """
+    pytest.importorskip("aiosqlite")
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy.ext import asyncio as sqlalchemy_asyncio
+
+    monkeypatch.setattr(async_session, "LOAD_CHUNK_SIZE", 2)
+    model = _model()
+
+    async def run():
+        """Add and load the instances."""
+        engine = sqlalchemy_asyncio.create_async_engine("sqlite+aiosqlite://")
+        try:
+            async with engine.begin() as connection:
+                await connection.run_sync(model.metadata.create_all)
+
+            queries = []
+            sqlalchemy.event.listen(
+                engine.sync_engine,
+                "before_cursor_execute",
+                lambda *_: queries.append(None),
+            )
+            async with sqlalchemy_asyncio.AsyncSession(engine) as session:
+                instances = [
+                    model(id_1=1, id_2=idx, name=f"name {idx}") for idx in range(3)
+                ]
+                await async_session.add(session=session, instances=instances)
+                await session.commit()
+                transient = model(id_1=2, id_2=0)
+
+                queries.clear()
+                await async_session.load(
+                    session=session,
+                    model=model,
+                    instances=[*instances, transient],
+                    keys={"name"},
+                    options=[],
+                )
+
+                assert len(queries) == 2
+                assert [instance.name for instance in instances] == [
+                    "name 0",
+                    "name 1",
+                    "name 2",
+                ]
+
+                queries.clear()
+                await async_session.load(
+                    session=session,
+                    model=model,
+                    instances=instances,
+                    keys={"name"},
+                    options=[],
+                )
+
+                assert not queries
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
@@ -0,0 +1,255 @@
+"""Tests for SQLAlchemy bulk facade."""
+
+import pytest
+import sqlalchemy
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext import declarative
+
+from open_alchemy import exceptions
+from open_alchemy.facades.sqlalchemy import bulk
+
+
+def _model():
+    """Construct a model with unique constraints."""
+    base = declarative.declarative_base()
+
+    class Model(base):  # pylint: disable=too-few-public-methods
+        """Model with unique constraints."""
+
+        __tablename__ = "model"
+        __table_args__ = (
+            sqlalchemy.UniqueConstraint("first_name", "last_name"),
+            sqlalchemy.Index("ix_code", "code", unique=True),
+            sqlalchemy.Index("ix_score", "score"),
+        )
+        id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+        email = sqlalchemy.Column(sqlalchemy.String, unique=True)
+        first_name = sqlalchemy.Column(sqlalchemy.String)
+        last_name = sqlalchemy.Column(sqlalchemy.String)
+        code = sqlalchemy.Column(sqlalchemy.String)
+        score = sqlalchemy.Column(sqlalchemy.Integer)
+
+    return Model
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_unique_keys():
+    """
+    GIVEN model with a primary key, unique column, unique constraint and indexes
+    WHEN unique_keys is called with the model
+    THEN the keys of the columns of each unique constraint are returned in order.
+    """
+    returned_keys = bulk.unique_keys(model=_model())
+
+    assert returned_keys == [
+        ("id",),
+        ("email",),
+        ("first_name", "last_name"),
+        ("code",),
+    ]
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_insert_different_keys():
+    """
+    GIVEN rows with different keys
+    WHEN insert is called with the rows
+    THEN the rows are inserted in order with the default for missing columns and a
+        statement for each run of rows with the same keys.
+    """
+    model = _model()
+    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    model.metadata.create_all(engine)
+    statements = []
+    sqlalchemy.event.listen(
+        engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+
+    with engine.connect() as connection:
+        bulk.insert(
+            bind=connection,
+            model=model,
+            rows=[
+                {"id": 1, "first_name": "a"},
+                {"id": 2, "first_name": "b"},
+                {"id": 3, "score": 3},
+                {"first_name": "d", "id": 4},
+            ],
+        )
+
+        assert len(statements) == 3
+        table = model.__table__
+        assert connection.execute(
+            sqlalchemy.select(table.c.id, table.c.first_name, table.c.score).order_by(
+                table.c.id
+            )
+        ).fetchall() == [(1, "a", None), (2, "b", None), (3, None, 3), (4, "d", None)]
+
+
+@pytest.mark.parametrize(
+    "dialect, update_keys, expected_clause",
+    [
+        pytest.param(
+            sqlite.dialect(),
+            ["score"],
+            "ON CONFLICT (id) DO UPDATE SET score = excluded.score",
+            id="sqlite",
+        ),
+        pytest.param(
+            sqlite.dialect(), [], "ON CONFLICT (id) DO NOTHING", id="sqlite nothing"
+        ),
+        pytest.param(
+            postgresql.dialect(),
+            ["score"],
+            "ON CONFLICT (id) DO UPDATE SET score = excluded.score",
+            id="postgresql",
+        ),
+        pytest.param(
+            mysql.dialect(),
+            ["score"],
+            "ON DUPLICATE KEY UPDATE score = VALUES(score)",
+            id="mysql",
+        ),
+        pytest.param(
+            mysql.dialect(),
+            [],
+            "ON DUPLICATE KEY UPDATE id = VALUES(id)",
+            id="mysql nothing",
+        ),
+    ],
+)
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_upsert_statement(dialect, update_keys, expected_clause):
+    """
+    GIVEN dialect and keys to update
+    WHEN upsert_statement is called with the dialect name and keys
+    THEN a statement with the native upsert clause of the dialect is returned.
+    """
+    statement = bulk.upsert_statement(
+        dialect_name=dialect.name,
+        model=_model(),
+        conflict_keys=["id"],
+        update_keys=update_keys,
+    )
+
+    assert expected_clause in str(statement.compile(dialect=dialect))
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_upsert_statement_unsupported():
+    """
+    GIVEN dialect that does not support upserts
+    WHEN upsert_statement is called with the dialect name
+    THEN None is returned.
+    """
+    returned_statement = bulk.upsert_statement(
+        dialect_name="oracle", model=_model(), conflict_keys=["id"], update_keys=[]
+    )
+
+    assert returned_statement is None
+
+
+@pytest.mark.parametrize(
+    "conflict_keys, rows, expected_rows",
+    [
+        pytest.param(
+            ["id"],
+            [{"id": 1, "score": 10}, {"id": 3, "score": 30}, {"id": 3, "score": 31}],
+            [(1, "a", "a", 10), (2, "b", "b", 2), (3, None, None, 31)],
+            id="single column",
+        ),
+        pytest.param(
+            ["first_name", "last_name"],
+            [
+                {"first_name": "b", "last_name": "b", "score": 20},
+                {"first_name": "b", "last_name": "c", "score": 30},
+            ],
+            [(1, "a", "a", 1), (2, "b", "b", 20), (3, "b", "c", 30)],
+            id="multiple columns",
+        ),
+        pytest.param(
+            ["id"],
+            [{"id": 1, "score": 10}],
+            [(1, "a", "a", 10), (2, "b", "b", 2)],
+            id="only existing",
+        ),
+        pytest.param(
+            ["id"],
+            [{"id": 1}, {"id": 3}],
+            [(1, "a", "a", 1), (2, "b", "b", 2), (3, None, None, None)],
+            id="nothing to update",
+        ),
+        pytest.param(
+            ["id"],
+            [{"id": 1, "score": 10}, {"id": 2, "first_name": "c"}, {"id": 3}],
+            [(1, "a", "a", 10), (2, "c", "b", 2), (3, None, None, None)],
+            id="different keys",
+        ),
+    ],
+)
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_upsert_generic(monkeypatch, conflict_keys, rows, expected_rows):
+    """
+    GIVEN database without native upserts, existing rows and rows to upsert
+    WHEN upsert is called with the rows and conflict keys
+    THEN the existing rows are updated and the other rows are inserted.
+    """
+    model = _model()
+    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    model.metadata.create_all(engine)
+    monkeypatch.setattr(bulk, "_dialect_name", lambda **_: "other")
+
+    with engine.connect() as connection:
+        bulk.insert(
+            bind=connection,
+            model=model,
+            rows=[
+                {"id": 1, "first_name": "a", "last_name": "a", "score": 1},
+                {"id": 2, "first_name": "b", "last_name": "b", "score": 2},
+            ],
+        )
+        bulk.upsert(
+            bind=connection, model=model, rows=rows, conflict_keys=conflict_keys
+        )
+
+        table = model.__table__
+        assert (
+            connection.execute(
+                sqlalchemy.select(
+                    table.c.id, table.c.first_name, table.c.last_name, table.c.score
+                ).order_by(table.c.id)
+            ).fetchall()
+            == expected_rows
+        )
+
+
+@pytest.mark.facade
+@pytest.mark.sqlalchemy
+def test_upsert_conflict_keys_missing():
+    """
+    GIVEN rows where a later row does not have the conflict keys
+    WHEN upsert is called with the rows and conflict keys
+    THEN MalformedModelDictionaryError is raised and no rows are upserted.
+    """
+    model = _model()
+    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+    model.metadata.create_all(engine)
+
+    with engine.connect() as connection:
+        with pytest.raises(exceptions.MalformedModelDictionaryError):
+            bulk.upsert(
+                bind=connection,
+                model=model,
+                rows=[{"id": 1, "score": 1}, {"score": 2}],
+                conflict_keys=["id"],
+            )
+
+        table = model.__table__
+        assert connection.execute(sqlalchemy.select(table.c.id)).fetchall() == []
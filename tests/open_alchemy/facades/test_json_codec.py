@@ -0,0 +1,85 @@
+"""Tests for the JSON codec."""
+# pylint: disable=redefined-outer-name
+
+import datetime
+import sys
+
+import pytest
+
+from open_alchemy.facades import json_codec
+
+
+@pytest.fixture
+def clear_cache():
+    """Clear the cache of the codecs before and after the test."""
+    json_codec.get.cache_clear()
+    yield
+    json_codec.get.cache_clear()
+
+
+@pytest.fixture
+def no_orjson(monkeypatch, clear_cache):  # pylint: disable=unused-argument
+    """Make importing orjson fail."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        pytest.param(json_codec.JsonBackend.STDLIB, id="stdlib"),
+        pytest.param("stdlib", id="stdlib string"),
+        pytest.param(json_codec.JsonBackend.AUTO, id="auto"),
+    ],
+)
+@pytest.mark.facade
+def test_get_stdlib(no_orjson, backend):  # pylint: disable=unused-argument
+    """
+    GIVEN orjson is not installed and a backend that can use the standard library
+    WHEN get is called with the backend
+    THEN the codec of the standard library is returned.
+    """
+    codec = json_codec.get(backend=backend)
+
+    assert codec is json_codec.STDLIB
+    assert codec.backend == json_codec.JsonBackend.STDLIB
+    assert codec.dumps({"key": 1}) == '{"key": 1}'
+    assert codec.loads('{"key": 1}') == {"key": 1}
+    assert codec.native_formats == frozenset()
+
+
+@pytest.mark.facade
+def test_get_orjson_missing(no_orjson):  # pylint: disable=unused-argument
+    """
+    GIVEN orjson is not installed
+    WHEN get is called with the orjson backend
+    THEN ImportError is raised.
+    """
+    with pytest.raises(ImportError, match="orjson"):
+        json_codec.get(backend=json_codec.JsonBackend.ORJSON)
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        pytest.param(json_codec.JsonBackend.ORJSON, id="orjson"),
+        pytest.param(json_codec.JsonBackend.AUTO, id="auto"),
+    ],
+)
+@pytest.mark.facade
+def test_get_orjson(clear_cache, backend):  # pylint: disable=unused-argument
+    """
+    GIVEN orjson is installed and a backend that can use orjson
+    WHEN get is called with the backend
+    THEN the codec of orjson is returned which encodes dates natively.
+    """
+    pytest.importorskip("orjson")
+
+    codec = json_codec.get(backend=backend)
+
+    assert codec.backend == json_codec.JsonBackend.ORJSON
+    assert (
+        codec.dumps({"key": datetime.datetime(2000, 1, 1, 1, 1, 1)})
+        == '{"key":"2000-01-01T01:01:01"}'
+    )
+    assert codec.loads('{"key": 1}') == {"key": 1}
+    assert codec.native_formats == frozenset(("date", "date-time"))
@@ -77,3 +77,69 @@ def test_resolver_multiple(tmp_path):
     jsonschema.validate(instance, schema, resolver=resolver)
     assert schema1_dict == {"RefSchema1": {"type": "string"}}
     assert schema2_dict == {"RefSchema2": {"type": "integer"}}
+
+
+@pytest.mark.parametrize(
+    "schema, instance, expected_valid",
+    [
+        pytest.param({"type": "string"}, "value", True, id="valid"),
+        pytest.param({"type": "string"}, 1, False, id="invalid"),
+    ],
+)
+@pytest.mark.facade
+def test_compile_(schema, instance, expected_valid):
+    """
+    GIVEN schema and instance
+    WHEN compile_ is called with the schema and the validator is used on the instance
+    THEN the instance is validated against the schema.
+    """
+    validator = jsonschema_facade.compile_(schema)
+
+    assert validator.is_valid(instance) == expected_valid
+
+
+@pytest.mark.facade
+def test_compile_invalid_schema():
+    """
+    GIVEN schema that is not valid against the meta schema
+    WHEN compile_ is called with the schema
+    THEN SchemaError is raised.
+    """
+    with pytest.raises(jsonschema.SchemaError):
+        jsonschema_facade.compile_({"type": 1})
+
+
+@pytest.mark.facade
+def test_validate_compiled_valid():
+    """
+    GIVEN validator constructed by compile_ and a valid instance
+    WHEN validate_compiled is called with the instance and validator
+    THEN no error is raised.
+    """
+    validator = jsonschema_facade.compile_({"type": "string"})
+
+    jsonschema_facade.validate_compiled("value", validator)
+
+
+@pytest.mark.facade
+def test_validate_compiled_best_match():
+    """
+    GIVEN validator constructed by compile_ and an instance with multiple errors
+    WHEN validate_compiled is called with the instance and validator
+    THEN the same error as for validate is raised.
+    """
+    schema = {
+        "type": "object",
+        "properties": {"key1": {"type": "integer"}},
+        "required": ["key2"],
+    }
+    instance = {"key1": "value 1"}
+    validator = jsonschema_facade.compile_(schema)
+    with pytest.raises(jsonschema.ValidationError) as expected_exc:
+        jsonschema.validate(instance, schema)
+
+    with pytest.raises(jsonschema.ValidationError) as exc:
+        jsonschema_facade.validate_compiled(instance, validator)
+
+    assert exc.value.message == expected_exc.value.message
+    assert exc.value.message != next(validator.iter_errors(instance)).message
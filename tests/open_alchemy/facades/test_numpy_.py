@@ -0,0 +1,52 @@
+"""Tests for numpy facade."""
+
+import datetime
+import sys
+
+import pytest
+
+from open_alchemy.facades import numpy_
+
+
+@pytest.mark.facade
+def test_array_numpy_missing(monkeypatch):
+    """
+    GIVEN numpy is not installed
+    WHEN array is called
+    THEN ImportError is raised.
+    """
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    with pytest.raises(ImportError, match="numpy"):
+        numpy_.array(values=[1], dtype="int64")
+
+
+@pytest.mark.parametrize(
+    "values, dtype, expected_dtype, expected_values",
+    [
+        pytest.param([1, 2], "int64", "int64", [1, 2], id="int64"),
+        pytest.param([1, None], "int64", "object", [1, None], id="int64 with None"),
+        pytest.param([True, None], "bool", "object", [True, None], id="bool with None"),
+        pytest.param([1.5], "float64", "float64", [1.5], id="float64"),
+        pytest.param(
+            [datetime.date(2000, 1, 1)],
+            "datetime64[D]",
+            "datetime64[D]",
+            [datetime.date(2000, 1, 1)],
+            id="date",
+        ),
+    ],
+)
+@pytest.mark.facade
+def test_array(values, dtype, expected_dtype, expected_values):
+    """
+    GIVEN numpy is installed, values and dtype
+    WHEN array is called with the values and dtype
+    THEN an array with the expected dtype and values is returned.
+    """
+    pytest.importorskip("numpy")
+
+    returned_array = numpy_.array(values=values, dtype=dtype)
+
+    assert str(returned_array.dtype) == expected_dtype
+    assert returned_array.tolist() == expected_values
@@ -5,6 +5,7 @@ from unittest import mock
 import pytest
 
 from open_alchemy.helpers import define_all
+from open_alchemy.helpers import dependency_graph
 from open_alchemy.helpers import ref
 
 
@@ -139,3 +140,82 @@ def test_remote_ref(tmp_path, _clean_remote_schemas_store):
     model_factory = mock.MagicMock()
 
     define_all.define_all(model_factory=model_factory, schemas=schemas)
+
+
+@pytest.mark.helper
+def test_define_lazy_not_constructable():
+    """
+    GIVEN mocked model factory and schemas
+    WHEN define_lazy is called and the returned function is called with the name of a
+        schema that is not constructable
+    THEN AttributeError is raised and the model factory is not called.
+    """
+    model_factory = mock.MagicMock()
+    graph = dependency_graph.build(
+        schemas={"Table": {"x-tablename": "table"}, "Schema": {}}, artifacts={}
+    )
+    define = define_all.define_lazy(model_factory=model_factory, graph=graph)
+
+    with pytest.raises(AttributeError):
+        define("Schema")
+
+    model_factory.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "name, dependencies, expected_names",
+    [
+        pytest.param("Table1", {}, ["Table1"], id="no dependencies"),
+        pytest.param(
+            "Table1", {"Table1": {"Table2"}}, ["Table2", "Table1"], id="dependency"
+        ),
+        pytest.param(
+            "Table1",
+            {"Table1": {"Table2"}, "Table2": {"Table3"}},
+            ["Table3", "Table2", "Table1"],
+            id="dependency of dependency",
+        ),
+        pytest.param(
+            "Table1",
+            {"Table1": {"Table2"}, "Table2": {"Table1"}},
+            ["Table1", "Table2"],
+            id="circular dependency",
+        ),
+        pytest.param("Child", {}, ["Parent", "Child"], id="parent"),
+        pytest.param(
+            "Child",
+            {"Parent": {"Table1"}},
+            ["Table1", "Parent", "Child"],
+            id="dependency of parent",
+        ),
+    ],
+)
+@pytest.mark.helper
+def test_define_lazy(name, dependencies, expected_names, monkeypatch):
+    """
+    GIVEN mocked model factory, schemas and dependencies of the models
+    WHEN define_lazy is called and the returned function is called with a name
+    THEN the model factory is called for the model and its dependencies with the
+        dependencies first and the model is returned.
+    """
+    monkeypatch.setattr(
+        dependency_graph, "calculate_dependencies", lambda artifacts: dependencies
+    )
+    model_factory = mock.MagicMock()
+    schemas = {
+        "Table1": {"x-tablename": "table1"},
+        "Table2": {"x-tablename": "table2"},
+        "Table3": {"x-tablename": "table3"},
+        "Child": {
+            "allOf": [{"x-inherits": True}, {"$ref": "#/components/schemas/Parent"}]
+        },
+        "Parent": {"x-tablename": "parent"},
+    }
+    graph = dependency_graph.build(schemas=schemas, artifacts={})
+    define = define_all.define_lazy(model_factory=model_factory, graph=graph)
+
+    returned_model = define(name)
+
+    assert returned_model == model_factory.return_value
+    called_names = [call.kwargs["name"] for call in model_factory.call_args_list]
+    assert list(dict.fromkeys(called_names)) == expected_names
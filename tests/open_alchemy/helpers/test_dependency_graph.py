@@ -0,0 +1,322 @@
+"""Tests for the dependency graph helper."""
+
+import pytest
+
+from open_alchemy import schemas as schemas_module
+from open_alchemy.helpers import dependency_graph
+from open_alchemy.schemas import artifacts as schemas_artifacts
+
+
+def _ref_schema(name, **kwargs):
+    """Construct schema for a property that references another schema."""
+    return {"allOf": [{"$ref": f"#/components/schemas/{name}"}, kwargs]}
+
+
+@pytest.mark.parametrize(
+    "schemas, expected_dependencies",
+    [
+        pytest.param(
+            {
+                "Table": {
+                    "x-tablename": "table",
+                    "type": "object",
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                }
+            },
+            {"Table": set()},
+            id="no dependencies",
+        ),
+        pytest.param(
+            {
+                "RefTable": {
+                    "x-tablename": "ref_table",
+                    "type": "object",
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                },
+                "Table": {
+                    "x-tablename": "table",
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "ref_table": _ref_schema("RefTable", **{"x-backref": "tables"}),
+                    },
+                },
+            },
+            {"RefTable": {"Table"}, "Table": {"RefTable"}},
+            id="many to one with backref",
+        ),
+        pytest.param(
+            {
+                "RefTable": {
+                    "x-tablename": "ref_table",
+                    "type": "object",
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                },
+                "Table": {
+                    "x-tablename": "table",
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "ref_tables": {
+                            "type": "array",
+                            "items": _ref_schema(
+                                "RefTable", **{"x-secondary": "association"}
+                            ),
+                        },
+                    },
+                },
+            },
+            {
+                "RefTable": set(),
+                "Table": {"RefTable", "Association"},
+                "Association": {"RefTable", "Table"},
+            },
+            id="many to many",
+        ),
+        pytest.param(
+            {
+                "RefTable": {
+                    "x-tablename": "ref_table",
+                    "type": "object",
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                },
+                "Table": {
+                    "x-tablename": "table",
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "ref_table_id": {
+                            "type": "integer",
+                            "x-foreign-key": "ref_table.id",
+                        },
+                    },
+                },
+            },
+            {"RefTable": set(), "Table": {"RefTable"}},
+            id="foreign key",
+        ),
+    ],
+)
+@pytest.mark.helper
+def test_calculate_dependencies(schemas, expected_dependencies):
+    """
+    GIVEN schemas
+    WHEN calculate_dependencies is called with the artifacts of the schemas
+    THEN the expected dependencies are returned.
+    """
+    schemas_module.process(schemas=schemas)
+    artifacts = schemas_artifacts.get_from_schemas(
+        schemas=schemas, stay_within_model=True
+    )
+
+    returned_dependencies = dependency_graph.calculate_dependencies(artifacts=artifacts)
+
+    assert returned_dependencies == expected_dependencies
+
+
+def _graph(dependencies, parents=None):
+    """Construct a graph from the dependencies of each model."""
+    return dependency_graph.DependencyGraph(
+        dependencies=dependencies, parents=parents or {}
+    )
+
+
+@pytest.mark.parametrize(
+    "dependencies, parents, expected_dependencies",
+    [
+        pytest.param({"A": []}, {}, {"A": ()}, id="single"),
+        pytest.param(
+            {"A": ["C", "B"], "B": [], "C": []},
+            {},
+            {"A": ("B", "C"), "B": (), "C": ()},
+            id="order of the schemas",
+        ),
+        pytest.param(
+            {"A": ["A", "Unknown"]}, {}, {"A": ()}, id="self and unknown ignored"
+        ),
+        pytest.param(
+            {"A": [], "B": []}, {"B": "A"}, {"A": (), "B": ("A",)}, id="parent"
+        ),
+    ],
+)
+@pytest.mark.helper
+def test_dependencies(dependencies, parents, expected_dependencies):
+    """
+    GIVEN the dependencies and parents of models
+    WHEN the graph is constructed
+    THEN the graph has the expected dependencies and dependents.
+    """
+    graph = _graph(dependencies, parents)
+
+    assert graph.dependencies == expected_dependencies
+    assert graph.names == tuple(dependencies)
+    for name, name_dependencies in expected_dependencies.items():
+        for dependency in name_dependencies:
+            assert name in graph.dependents[dependency]
+    assert "Unknown" not in graph
+
+
+@pytest.mark.parametrize(
+    "dependencies, parents, expected_components, expected_order",
+    [
+        pytest.param({}, {}, [], [], id="empty"),
+        pytest.param(
+            {"A": [], "B": []}, {}, [("A",), ("B",)], ["A", "B"], id="independent"
+        ),
+        pytest.param(
+            {"A": ["B"], "B": ["C"], "C": []},
+            {},
+            [("C",), ("B",), ("A",)],
+            ["C", "B", "A"],
+            id="chain",
+        ),
+        pytest.param(
+            {"A": ["B"], "B": [], "C": ["B"]},
+            {},
+            [("B",), ("A",), ("C",)],
+            ["B", "A", "C"],
+            id="shared dependency",
+        ),
+        pytest.param(
+            {"A": ["B"], "B": ["A"], "C": ["A"]},
+            {},
+            [("A", "B"), ("C",)],
+            ["A", "B", "C"],
+            id="cycle",
+        ),
+        pytest.param(
+            {"A": ["B"], "B": ["C"], "C": ["A", "D"], "D": ["E"], "E": ["D"]},
+            {},
+            [("D", "E"), ("A", "B", "C")],
+            ["D", "E", "A", "B", "C"],
+            id="cycle depends on cycle",
+        ),
+        pytest.param(
+            {"Child": [], "Parent": ["Child"]},
+            {"Child": "Parent"},
+            [("Child", "Parent")],
+            ["Parent", "Child"],
+            id="parent in cycle",
+        ),
+        pytest.param(
+            {"Grandchild": [], "Child": [], "Parent": ["Grandchild"]},
+            {"Grandchild": "Child", "Child": "Parent"},
+            [("Grandchild", "Child", "Parent")],
+            ["Parent", "Child", "Grandchild"],
+            id="parents in cycle",
+        ),
+    ],
+)
+@pytest.mark.helper
+def test_order(dependencies, parents, expected_components, expected_order):
+    """
+    GIVEN the dependencies and parents of models
+    WHEN strongly_connected_components and topological_order are called
+    THEN the expected components and order are returned.
+    """
+    graph = _graph(dependencies, parents)
+
+    assert graph.strongly_connected_components() == expected_components
+    assert graph.strongly_connected_components() is (
+        graph.strongly_connected_components()
+    )
+    assert graph.topological_order() == expected_order
+
+
+@pytest.mark.helper
+def test_order_long_chain():
+    """
+    GIVEN a chain of models that is longer than the recursion limit
+    WHEN topological_order is called
+    THEN the models are ordered with the dependencies first.
+    """
+    names = [f"Model{idx}" for idx in range(5000)]
+    graph = _graph(dict(zip(names, [[name] for name in names[1:]] + [[]])))
+
+    assert graph.topological_order() == names[::-1]
+
+
+DEPENDENCIES = {"A": ["B"], "B": [], "C": ["A"], "D": ["D"], "E": []}
+
+
+@pytest.mark.parametrize(
+    "names, expected_closure, expected_invalidated",
+    [
+        pytest.param([], set(), set(), id="empty"),
+        pytest.param(["B"], {"B"}, {"A", "B", "C"}, id="dependency"),
+        pytest.param(["C"], {"A", "B", "C"}, {"C"}, id="dependent"),
+        pytest.param(["A", "E"], {"A", "B", "E"}, {"A", "C", "E"}, id="multiple"),
+        pytest.param(["Unknown"], set(), set(), id="unknown"),
+    ],
+)
+@pytest.mark.helper
+def test_closure_invalidated(names, expected_closure, expected_invalidated):
+    """
+    GIVEN a graph and the names of models
+    WHEN closure and invalidated are called with the names
+    THEN the expected models are returned.
+    """
+    graph = _graph(DEPENDENCIES)
+
+    assert graph.closure(names=names) == expected_closure
+    assert graph.invalidated(names=names) == expected_invalidated
+
+
+@pytest.mark.helper
+def test_build():
+    """
+    GIVEN schemas with inheritance and relationships
+    WHEN build is called with the schemas and artifacts
+    THEN the graph has the dependencies of the constructable schemas.
+    """
+    schemas = {
+        "Employee": {
+            "x-tablename": "employee",
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer", "x-primary-key": True},
+                "type": {"type": "string"},
+                "division": _ref_schema("Division", **{"x-backref": "employees"}),
+            },
+            "x-kwargs": {
+                "__mapper_args__": {
+                    "polymorphic_on": "type",
+                    "polymorphic_identity": "employee",
+                }
+            },
+        },
+        "Manager": {
+            "allOf": [
+                {
+                    "x-inherits": True,
+                    "type": "object",
+                    "properties": {"level": {"type": "integer"}},
+                    "x-kwargs": {
+                        "__mapper_args__": {"polymorphic_identity": "manager"}
+                    },
+                },
+                {"$ref": "#/components/schemas/Employee"},
+            ]
+        },
+        "Division": {
+            "x-tablename": "division",
+            "type": "object",
+            "properties": {"id": {"type": "integer", "x-primary-key": True}},
+        },
+        "Name": {"type": "string"},
+    }
+    schemas_module.process(schemas=schemas)
+    artifacts = schemas_artifacts.get_from_schemas(
+        schemas=schemas, stay_within_model=True
+    )
+
+    graph = dependency_graph.build(schemas=schemas, artifacts=artifacts)
+
+    assert graph.names == ("Employee", "Manager", "Division")
+    assert graph.parents == {"Manager": "Employee"}
+    assert graph.dependencies == {
+        "Employee": ("Division",),
+        "Manager": ("Employee",),
+        "Division": ("Employee",),
+    }
+    assert graph.topological_order() == ["Employee", "Division", "Manager"]
@@ -5,6 +5,7 @@ import pytest
 from open_alchemy import exceptions
 from open_alchemy import types
 from open_alchemy.helpers import peek
+from open_alchemy.helpers import schema_index
 
 
 @pytest.mark.parametrize(
@@ -150,6 +151,125 @@ def test_peek_key_invalid(schema, schemas):
         peek.peek_key(schema=schema, schemas=schemas, key="key")
 
 
+@pytest.mark.parametrize(
+    "key, schemas, expected_value",
+    [
+        pytest.param("key", {"Schema": {}}, None, id="missing"),
+        pytest.param("key", {"Schema": {"key": "value 1"}}, "value 1", id="plain"),
+        pytest.param(
+            "x-key",
+            {"Schema": {"x-key": "value 1", "x-open-alchemy-key": "value 2"}},
+            "value 1",
+            id="extension prefix order",
+        ),
+        pytest.param(
+            "x-key",
+            {
+                "Schema": {
+                    "x-open-alchemy-key": "value 1",
+                    "$ref": "#/components/schemas/RefSchema",
+                },
+                "RefSchema": {"x-key": "value 2"},
+            },
+            "value 1",
+            id="extension local before $ref",
+        ),
+        pytest.param(
+            "key",
+            {
+                "Schema": {"$ref": "#/components/schemas/RefSchema"},
+                "RefSchema": {"key": "value 1"},
+            },
+            "value 1",
+            id="$ref",
+        ),
+        pytest.param(
+            "key",
+            {
+                "Schema": {
+                    "$ref": "#/components/schemas/RefSchema",
+                    "allOf": [{"key": "value 2"}],
+                },
+                "RefSchema": {"other": "value 1"},
+            },
+            None,
+            id="$ref ignores allOf",
+        ),
+        pytest.param(
+            "key",
+            {"Schema": {"allOf": [{"other": "value 1"}, {"key": "value 2"}]}},
+            "value 2",
+            id="allOf",
+        ),
+        pytest.param(
+            "key",
+            {"Schema": {"allOf": [{"key": "value 1"}, {"key": "value 2"}]}},
+            "value 1",
+            id="allOf first",
+        ),
+        pytest.param(
+            "key",
+            {"Schema": {"key": "value 1", 1: "value 2", "x-open-alchemy-x-a": "v"}},
+            "value 1",
+            id="other keys",
+        ),
+        pytest.param(
+            "x-x-key",
+            {"Schema": {"x-x-key": "value 1"}},
+            "value 1",
+            id="extension key not resolvable",
+        ),
+        pytest.param(
+            "key",
+            {"Schema": {"key": "value 1", "$ref": True}},
+            "value 1",
+            id="malformed after key",
+        ),
+        pytest.param(
+            "key",
+            {"Schema": {"allOf": [{"key": "value 1"}, True]}},
+            "value 1",
+            id="allOf malformed after key",
+        ),
+    ],
+)
+@pytest.mark.helper
+def test_peek_key_index(key, schemas, expected_value):
+    """
+    GIVEN key and schemas with a schema
+    WHEN peek_key is called with the schema and schemas while the index is in use
+    THEN the expected value is returned.
+    """
+    with schema_index.build(schemas=schemas):
+        returned_value = peek.peek_key(
+            schema=schemas["Schema"], schemas=schemas, key=key
+        )
+
+    assert returned_value == expected_value
+
+
+@pytest.mark.parametrize(
+    "schemas",
+    [
+        pytest.param({"Schema": {"$ref": True}}, id="$ref not string"),
+        pytest.param({"Schema": {"allOf": [True]}}, id="allOf element not dict"),
+        pytest.param(
+            {"Schema": {"$ref": "#/components/schemas/Schema"}}, id="circular $ref"
+        ),
+    ],
+)
+@pytest.mark.helper
+def test_peek_key_index_invalid(schemas):
+    """
+    GIVEN schemas with a schema that is invalid
+    WHEN peek_key is called with the schema and schemas while the index is in use
+    THEN MalformedSchemaError is raised.
+    """
+    with schema_index.build(schemas=schemas):
+        with pytest.raises(exceptions.MalformedSchemaError):
+            peek.peek_key(schema=schemas["Schema"], schemas=schemas, key="key")
+
+
 @pytest.mark.parametrize(
     "schema, schemas, expected_value",
     [
@@ -882,3 +882,23 @@ def test_set_spec_context(_clean_remote_schemas_store):
     ref_helper.set_context(path="path1")
 
     assert ref_helper._remote_schema_store.spec_context == "path1"
+
+
+@pytest.mark.helper
+def test_set_spec_context_remote_contexts(tmp_path, _clean_remote_schemas_store):
+    """
+    GIVEN spec context with a remote file that has been retrieved
+    WHEN set_spec_context is called with another context
+    THEN the remote file is no longer in the remote contexts.
+    """
+    directory = tmp_path / "base"
+    directory.mkdir()
+    remote_schemas_file = directory / "remote.json"
+    remote_schemas_file.write_text('{"Schema1": {"key": "value"}}')
+    ref_helper.set_context(path=str(directory / "original.json"))
+    ref_helper.get_remote_ref(ref="remote.json#/Schema1")
+    assert ref_helper.get_remote_contexts() == ["remote.json"]
+
+    ref_helper.set_context(path=str(directory / "other.json"))
+
+    assert ref_helper.get_remote_contexts() == []
@@ -244,3 +244,21 @@ def test_prepare_deep(schema, schemas, expected_schema):
     returned_schema = schema_helper.prepare_deep(schema=schema, schemas=schemas)
 
     assert returned_schema == expected_schema
+
+
+@pytest.mark.helper
+def test_prepare_deep_schemas_not_modified():
+    """
+    GIVEN schema with a property that has a $ref and schemas
+    WHEN prepare_deep is called with the schema and schemas
+    THEN the schema and schemas are not modified.
+    """
+    schema = {"properties": {"key_1": {"$ref": "#/components/schemas/RefSchema"}}}
+    schemas = {"Schema": schema, "RefSchema": {"key": "value"}}
+
+    returned_schema = schema_helper.prepare_deep(schema=schema, schemas=schemas)
+
+    assert returned_schema == {"properties": {"key_1": {"key": "value"}}}
+    assert schema == {
+        "properties": {"key_1": {"$ref": "#/components/schemas/RefSchema"}}
+    }
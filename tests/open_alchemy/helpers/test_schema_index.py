@@ -0,0 +1,93 @@
+"""Tests for the schema index."""
+
+import pytest
+
+from open_alchemy.helpers import schema_index
+
+
+@pytest.mark.helper
+def test_contains():
+    """
+    GIVEN schemas
+    WHEN the index is built
+    THEN nested schemas are in the index and other dictionaries are not.
+    """
+    shared_schema = {"type": "string"}
+    schemas = {
+        "Schema": {
+            "properties": {"prop_1": {"type": "integer"}},
+            "allOf": [{"type": "object"}],
+        },
+        "OtherSchema": shared_schema,
+        "AnotherSchema": shared_schema,
+    }
+
+    index = schema_index.SchemaIndex(schemas=schemas)
+
+    assert schemas["Schema"] in index
+    assert schemas["Schema"]["properties"]["prop_1"] in index
+    assert schemas["Schema"]["allOf"][0] in index
+    assert shared_schema in index
+    assert {"type": "integer"} not in index
+
+
+@pytest.mark.helper
+def test_lookup():
+    """
+    GIVEN index
+    WHEN lookup is called multiple times for a schema in the index and one that is not
+    THEN the value is calculated once for the schema in the index and every time for
+        the schema that is not in the index.
+    """
+    schemas = {"Schema": {"type": "object"}}
+    index = schema_index.SchemaIndex(schemas=schemas)
+    calls = []
+
+    def calculate():
+        """Record the call."""
+        calls.append(None)
+        return len(calls)
+
+    assert index.lookup(schema=schemas["Schema"], key="key", calculate=calculate) == 1
+    assert index.lookup(schema=schemas["Schema"], key="key", calculate=calculate) == 1
+    assert index.lookup(schema={}, key="key", calculate=calculate) == 2
+    assert index.lookup(schema={}, key="key", calculate=calculate) == 3
+
+
+@pytest.mark.helper
+def test_lookup_exception():
+    """
+    GIVEN index
+    WHEN lookup is called with calculate that raises an exception
+    THEN the exception is raised and the value is calculated on the next lookup.
+    """
+    schemas = {"Schema": {"type": "object"}}
+    index = schema_index.SchemaIndex(schemas=schemas)
+
+    def calculate_raise():
+        """Raise exception."""
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        index.lookup(schema=schemas["Schema"], key="key", calculate=calculate_raise)
+
+    assert (
+        index.lookup(schema=schemas["Schema"], key="key", calculate=lambda: "value")
+        == "value"
+    )
+
+
+@pytest.mark.helper
+def test_build_get():
+    """
+    GIVEN schemas
+    WHEN the index is built
+    THEN get returns the index for the schemas only while it is in use.
+    """
+    schemas = {"Schema": {"type": "object"}}
+
+    assert schema_index.get(schemas=schemas) is None
+    with schema_index.build(schemas=schemas) as index:
+        assert schema_index.get(schemas=schemas) is index
+        assert schema_index.get(schemas={**schemas}) is None
+    assert schema_index.get(schemas=schemas) is None
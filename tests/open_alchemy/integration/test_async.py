@@ -0,0 +1,244 @@
+"""Integration tests for the asyncio model utilities."""
+
+import asyncio
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "employees": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Employee"},
+                    },
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {
+                        "type": "integer",
+                        "x-primary-key": True,
+                        "x-autoincrement": True,
+                    },
+                    "name": {"type": "string"},
+                    "boss": {
+                        "allOf": [
+                            {"$ref": "#/components/schemas/Boss"},
+                            {"x-backref": "staff"},
+                        ]
+                    },
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            },
+            "Boss": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "staff": {
+                        "type": "array",
+                        "readOnly": True,
+                        "items": {
+                            "type": "object",
+                            "properties": {"id": {"type": "integer"}},
+                        },
+                    },
+                },
+                "x-tablename": "boss",
+                "type": "object",
+            },
+        }
+    }
+}
+DIVISION_DICTS = [
+    {
+        "id": division_id,
+        "name": f"division {division_id}",
+        "employees": [
+            {
+                "id": division_id * 10 + idx,
+                "name": f"employee {division_id * 10 + idx}",
+                "boss": {"id": division_id * 10 + idx},
+            }
+            for idx in range(2)
+        ],
+    }
+    for division_id in range(2)
+]
+
+
+def _run(test):
+    """Run a test with an asyncio engine and the models created."""
+    pytest.importorskip("aiosqlite")
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy.ext import asyncio as sqlalchemy_asyncio
+
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=SPEC, base=base)
+    division = model_factory(name="Division")
+    employee = model_factory(name="Employee")
+
+    async def run():
+        """Create the models and run the test."""
+        engine = sqlalchemy_asyncio.create_async_engine("sqlite+aiosqlite://")
+        try:
+            async with engine.begin() as connection:
+                await connection.run_sync(base.metadata.create_all)
+            async with sqlalchemy_asyncio.AsyncSession(engine) as session:
+                session.add_all(
+                    [division.from_dict(**value) for value in DIVISION_DICTS]
+                )
+                await session.commit()
+
+            queries = []
+            sqlalchemy.event.listen(
+                engine.sync_engine,
+                "before_cursor_execute",
+                lambda *_: queries.append(None),
+            )
+            async with sqlalchemy_asyncio.AsyncSession(engine) as session:
+                await test(session, queries, division, employee)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+
+def _expected_dict(division_dict):
+    """Calculate the dictionary of a division with the backrefs of the bosses."""
+    return {
+        **division_dict,
+        "employees": [
+            {
+                **value,
+                "boss": {"id": value["boss"]["id"], "staff": [{"id": value["id"]}]},
+            }
+            for value in division_dict["employees"]
+        ],
+    }
+
+
+@pytest.mark.integration
+def test_ato_dict():
+    """
+    GIVEN models with relationships and an instance of an AsyncSession
+    WHEN ato_dict is called with the instance and session
+    THEN the relationships are loaded with a query for the collections of each level
+        without lazy loads and the instance is converted.
+    """
+
+    async def test(session, queries, division, _):
+        instance = (
+            await session.execute(sqlalchemy.select(division).where(division.id == 1))
+        ).scalar_one()
+        queries.clear()
+
+        returned_dict = await division.ato_dict(instance, session)
+
+        assert returned_dict == _expected_dict(DIVISION_DICTS[1])
+        assert len(queries) == 3
+
+    _run(test)
+
+
+@pytest.mark.integration
+def test_ato_dict_many_expired():
+    """
+    GIVEN models with relationships and expired instances of an AsyncSession
+    WHEN ato_dict_many is called with the instances, session and fields
+    THEN the attributes are loaded with a single query and the fields of the
+        instances are converted.
+    """
+
+    async def test(session, queries, division, _):
+        instances = (
+            (await session.execute(sqlalchemy.select(division).order_by(division.id)))
+            .scalars()
+            .all()
+        )
+        await session.commit()
+        queries.clear()
+
+        returned_dicts = await division.ato_dict_many(
+            instances, session, fields=["id", "name"]
+        )
+
+        assert returned_dicts == [
+            {"id": value["id"], "name": value["name"]} for value in DIVISION_DICTS
+        ]
+        assert len(queries) == 1
+
+    _run(test)
+
+
+@pytest.mark.integration
+def test_ato_dict_loaded():
+    """
+    GIVEN models and a loaded instance of an AsyncSession without relationships
+    WHEN ato_dict is called with the instance and session
+    THEN no queries are executed.
+    """
+
+    async def test(session, queries, _, employee):
+        instance = (
+            await session.execute(sqlalchemy.select(employee).where(employee.id == 1))
+        ).scalar_one()
+        queries.clear()
+
+        returned_dict = await employee.ato_dict(instance, session, fields=["name"])
+
+        assert returned_dict == {"name": "employee 1"}
+        assert not queries
+
+    _run(test)
+
+
+@pytest.mark.integration
+def test_ato_dict_invalid_fields():
+    """
+    GIVEN models and an instance of an AsyncSession
+    WHEN ato_dict is called with a field that is not a property
+    THEN ModelAttributeError is raised.
+    """
+
+    async def test(session, _, division, __):
+        instance = (await session.execute(sqlalchemy.select(division))).scalar()
+
+        with pytest.raises(open_alchemy.exceptions.ModelAttributeError):
+            await division.ato_dict(instance, session, fields=["other"])
+
+    _run(test)
+
+
+@pytest.mark.integration
+def test_afrom_dict_many():
+    """
+    GIVEN models and dictionaries
+    WHEN afrom_dict_many is called with the dictionaries and an AsyncSession
+    THEN the instances are constructed, added to the session and flushed.
+    """
+
+    async def test(session, _, __, employee):
+        instances = await employee.afrom_dict_many(
+            [{"name": "employee a"}, {"name": "employee b"}], session
+        )
+
+        assert [instance.id for instance in instances] == [12, 13]
+        assert await employee.ato_dict_many(instances, session) == [
+            {"id": 12, "name": "employee a"},
+            {"id": 13, "name": "employee b"},
+        ]
+
+        with pytest.raises(open_alchemy.exceptions.MalformedModelDictionaryError):
+            await employee.afrom_dict_many([{"name": 1}], session)
+
+    _run(test)
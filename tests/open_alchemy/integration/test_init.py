@@ -1,14 +1,19 @@
 """Integration tests for initialization."""
 
+import copy
 import json
 import sys
 from unittest import mock
 
 import pytest
 import yaml
+from sqlalchemy.ext import declarative
 
 import open_alchemy
 from open_alchemy import cache
+from open_alchemy import exceptions
+from open_alchemy import profile
+from open_alchemy.facades import json_codec
 from open_alchemy.facades.sqlalchemy import types as sqlalchemy_types
 
 
@@ -31,6 +36,11 @@ def test_init_optional_base_none_call(
         spec=spec,
         models_filename=None,
         spec_path=None,
+        validation=open_alchemy.ValidationMode.STRICT,
+        lazy=False,
+        json_backend=open_alchemy.JsonBackend.STDLIB,
+        jobs=1,
+        model_names=None,
     )
 
 
@@ -65,7 +75,15 @@ def test_init_optional_base_def_call(mocked_init_model_factory: mock.MagicMock):
     open_alchemy._init_optional_base(base=base, spec=spec)
 
     mocked_init_model_factory.assert_called_once_with(
-        base=base, spec=spec, models_filename=None, spec_path=None
+        base=base,
+        spec=spec,
+        models_filename=None,
+        spec_path=None,
+        validation=open_alchemy.ValidationMode.STRICT,
+        lazy=False,
+        json_backend=open_alchemy.JsonBackend.STDLIB,
+        jobs=1,
+        model_names=None,
     )
 
 
@@ -194,6 +212,80 @@ def test_schema():
     assert isinstance(model.column.type, sqlalchemy_types.Integer)
 
 
+@pytest.mark.integration
+def test_init_model_factory_lazy(engine, sessionmaker):
+    """
+    GIVEN specification with a many to one relationship and an unrelated schema
+    WHEN init_model_factory is called with lazy and a model is accessed on the models
+    THEN only the model and the models it depends on are defined and they can be used.
+    """
+    base = declarative.declarative_base()
+    open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "RefTable": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True}
+                        },
+                        "x-tablename": "ref_table",
+                        "type": "object",
+                    },
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "ref_table": {"$ref": "#/components/schemas/RefTable"},
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    },
+                    "Unrelated": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True}
+                        },
+                        "x-tablename": "unrelated",
+                        "type": "object",
+                    },
+                }
+            }
+        },
+        lazy=True,
+    )
+    assert "Table" not in vars(open_alchemy.models)
+
+    model = open_alchemy.models.Table  # pylint: disable=no-member
+
+    assert "RefTable" in vars(open_alchemy.models)
+    assert "Unrelated" not in vars(open_alchemy.models)
+    assert not hasattr(open_alchemy.models, "Missing")
+    base.metadata.create_all(engine)
+    model_dict = {"id": 11, "ref_table": {"id": 12}}
+    session = sessionmaker()
+    session.add(model.from_dict(**model_dict))
+    session.flush()
+    assert session.query(model).first().to_dict() == model_dict
+
+
+@pytest.mark.integration
+def test_init_model_factory_not_lazy_after_lazy():
+    """
+    GIVEN models that have been initialized with lazy
+    WHEN init_model_factory is called without lazy
+    THEN the models are no longer defined on access.
+    """
+    open_alchemy.init_model_factory(
+        base=declarative.declarative_base(), spec=copy.deepcopy(BASIC_SPEC), lazy=True
+    )
+    spec = copy.deepcopy(BASIC_SPEC)
+    spec["components"]["schemas"]["Other"] = spec["components"]["schemas"].pop("Table")
+
+    open_alchemy.init_model_factory(base=declarative.declarative_base(), spec=spec)
+
+    assert "Other" in vars(open_alchemy.models)
+    assert not hasattr(open_alchemy.models, "Table")
+
+
 BASIC_SPEC = {
     "components": {
         "schemas": {
@@ -239,6 +331,74 @@ def test_init_json(engine, sessionmaker, tmp_path):
 
     # Checking for cache
     assert cache.schemas_valid(str(spec_file)) is True
+    assert cache.load_artifacts(str(spec_file)) is not None
+
+
+@pytest.mark.integration
+def test_init_json_artifacts_cache(engine, sessionmaker, tmp_path):
+    """
+    GIVEN specification stored in a JSON file that has been initialized before
+    WHEN init_json is called with the file
+    THEN the schemas are not processed again and a valid model factory is returned.
+    """
+    # Generate spec file
+    directory = tmp_path / "specs"
+    directory.mkdir()
+    spec_file = directory / "spec.json"
+    spec_file.write_text(json.dumps(BASIC_SPEC))
+    open_alchemy.init_json(str(spec_file))
+
+    # Creating model factory
+    with mock.patch.object(
+        open_alchemy._schemas_module,  # pylint: disable=protected-access
+        "process",
+    ) as mocked_process:
+        base, model_factory = open_alchemy.init_json(str(spec_file))
+    mocked_process.assert_not_called()
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+    # Creating model instance
+    value = 0
+    model_instance = model.from_dict(column=value)
+    session = sessionmaker()
+    session.add(model_instance)
+    session.flush()
+
+    # Querying session
+    queried_model = session.query(model).first()
+    assert queried_model.to_dict() == {"column": value}
+
+
+@pytest.mark.integration
+def test_init_json_profile(tmp_path):
+    """
+    GIVEN specification stored in a JSON file
+    WHEN init_json is called with the file while a profile is collected
+    THEN the phases of the initialization are recorded.
+    """
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps(BASIC_SPEC))
+    models_file = tmp_path / "models.py"
+
+    with profile.collect() as report:
+        open_alchemy.init_json(str(spec_file), models_filename=str(models_file))
+
+    assert list(report.phases) == [
+        "spec_load",
+        "artifacts_cache",
+        "validation",
+        "properties",
+        "backref",
+        "foreign_key",
+        "association",
+        "artifacts",
+        "models_file",
+        "model_factory",
+        "model_factory.Table",
+    ]
+    assert all(phase.calls == 1 for phase in report.phases.values())
 
 
 @pytest.mark.integration
@@ -371,6 +531,103 @@ def test_init_yaml_remote(engine, sessionmaker, tmp_path, _clean_remote_schemas_
     assert queried_model.column == value
 
 
+MODELS_SPEC = {
+    "components": {
+        "schemas": {
+            "SubsetCustomer": {
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                "x-tablename": "subset_customer",
+                "type": "object",
+            },
+            "SubsetOrder": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "customer": {
+                        "allOf": [
+                            {"$ref": "#/components/schemas/SubsetCustomer"},
+                            {"x-backref": "orders"},
+                        ]
+                    },
+                },
+                "x-tablename": "subset_order",
+                "type": "object",
+            },
+            "SubsetUnused": {
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                "x-tablename": "subset_unused",
+                "type": "object",
+            },
+            "SubsetInvalid": {
+                "properties": {"id": {"type": "unsupported"}},
+                "x-tablename": "subset_invalid",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+@pytest.mark.integration
+def test_init_yaml_models(engine, sessionmaker, tmp_path):
+    """
+    GIVEN specification stored in a YAML file with an invalid model
+    WHEN init_yaml is called with the file, a models file and the name of a model that
+        does not depend on the invalid model
+    THEN the model and the models it depends on are constructed and written to the
+        models file and the cache is not written.
+    """
+    # Generate spec file
+    directory = tmp_path / "specs"
+    directory.mkdir()
+    spec_file = directory / "spec.yaml"
+    spec_file.write_text(yaml.dump(MODELS_SPEC))
+    models_file = directory / "models.py"
+
+    # Creating model factory
+    base, _ = open_alchemy.init_yaml(
+        str(spec_file), models_filename=str(models_file), model_names=["SubsetCustomer"]
+    )
+
+    # Checking the constructed models
+    assert set(base.metadata.tables) == {"subset_customer", "subset_order"}
+    assert not hasattr(open_alchemy.models, "SubsetUnused")
+    models_file_contents = models_file.read_text()
+    assert "SubsetOrder: typing.Type[TSubsetOrder]" in models_file_contents
+    assert "SubsetUnused" not in models_file_contents
+
+    # Creating model instance
+    base.metadata.create_all(engine)
+    customer = open_alchemy.models.SubsetCustomer(id=1)
+    order = open_alchemy.models.SubsetOrder(id=2, customer=customer)
+    session = sessionmaker()
+    session.add(order)
+    session.flush()
+
+    # Querying session
+    queried_customer = session.query(open_alchemy.models.SubsetCustomer).first()
+    assert [queried.id for queried in queried_customer.orders] == [2]
+
+    # Checking for cache
+    assert cache.schemas_valid(str(spec_file)) is False
+
+
+@pytest.mark.integration
+def test_init_yaml_models_not_found(tmp_path):
+    """
+    GIVEN specification stored in a YAML file
+    WHEN init_yaml is called with the file and the name of a schema that is not a model
+    THEN SchemaNotFoundError is raised.
+    """
+    # Generate spec file
+    directory = tmp_path / "specs"
+    directory.mkdir()
+    spec_file = directory / "spec.yaml"
+    spec_file.write_text(yaml.dump(MODELS_SPEC))
+
+    with pytest.raises(exceptions.SchemaNotFoundError):
+        open_alchemy.init_yaml(str(spec_file), model_names=["Missing"])
+
+
 @pytest.mark.integration
 def test_init_yaml_import_error():
     """
@@ -801,3 +1058,22 @@ def test_build_yaml_import_error():
     with mock.patch.dict("sys.modules", {"yaml": None}):
         with pytest.raises(ImportError):
             open_alchemy.build_yaml("some file", "some package", "some path")
+
+
+@pytest.mark.integration
+def test_init_model_factory_json_backend_missing(monkeypatch):
+    """
+    GIVEN orjson is not installed
+    WHEN init_model_factory is called with the orjson JSON backend
+    THEN ImportError is raised.
+    """
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    json_codec.get.cache_clear()
+
+    with pytest.raises(ImportError, match="orjson"):
+        open_alchemy.init_model_factory(
+            base=mock.MagicMock,
+            spec={"components": {"schemas": {}}},
+            json_backend=open_alchemy.JsonBackend.ORJSON,
+        )
+    json_codec.get.cache_clear()
@@ -1,9 +1,15 @@
 """Integration tests for from_dict and to_dict."""
 
+import array
+import datetime
+import json
+
 import pytest
+import sqlalchemy
 from sqlalchemy.ext import declarative
 
 import open_alchemy
+from open_alchemy.facades import numpy_
 
 
 @pytest.mark.parametrize(
@@ -107,6 +113,119 @@ def test_to_from_dict_many_to_one(engine, sessionmaker):
     assert queried_instance.to_dict() == model_dict
 
 
+@pytest.mark.parametrize(
+    "validation",
+    [
+        open_alchemy.ValidationMode.STRICT,
+        open_alchemy.ValidationMode.STRUCTURAL,
+        open_alchemy.ValidationMode.TRUSTED,
+    ],
+    ids=["strict", "structural", "trusted"],
+)
+@pytest.mark.integration
+def test_to_from_dict_many_to_one_validation(engine, sessionmaker, validation):
+    """
+    GIVEN specification that has a schema with a many to one relationship and
+        validation mode
+    WHEN models are defined with the validation mode and constructed using from_dict
+    THEN the models have the validation mode and when to_dict is called the
+        construction dictionary is returned.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "RefTable": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True}
+                        },
+                        "x-tablename": "ref_table",
+                        "type": "object",
+                    },
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "ref_table": {"$ref": "#/components/schemas/RefTable"},
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    },
+                }
+            }
+        },
+        validation=validation,
+    )
+    ref_model = model_factory(name="RefTable")
+    model = model_factory(name="Table")
+    assert ref_model._validation == validation  # pylint: disable=protected-access
+    assert model._validation == validation  # pylint: disable=protected-access
+    # Creating models
+    base.metadata.create_all(engine)
+
+    # Constructing and turning back to dictionary
+    model_dict = {"id": 11, "ref_table": {"id": 12}}
+    instance = model.from_dict(**model_dict)
+    session = sessionmaker()
+    session.add(instance)
+    session.flush()
+    queried_instance = session.query(model).first()
+    assert queried_instance.to_dict() == model_dict
+
+
+@pytest.mark.parametrize(
+    "json_backend",
+    [
+        pytest.param(open_alchemy.JsonBackend.STDLIB, id="stdlib"),
+        pytest.param(open_alchemy.JsonBackend.AUTO, id="auto"),
+    ],
+)
+@pytest.mark.integration
+def test_to_from_str_json_backend(engine, sessionmaker, json_backend):
+    """
+    GIVEN specification that has a schema with a date-time property and JSON backend
+    WHEN models are defined with the JSON backend and constructed using from_str
+    THEN when to_str is called the equivalent JSON is returned.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "created": {"type": "string", "format": "date-time"},
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    },
+                }
+            }
+        },
+        json_backend=json_backend,
+    )
+    model = model_factory(name="Table")
+    # Creating models
+    base.metadata.create_all(engine)
+
+    # Constructing and turning back to JSON
+    model_str = '{"id": 11, "created": "2000-01-01T01:01:01"}'
+    instance = model.from_str(model_str)
+    session = sessionmaker()
+    session.add(instance)
+    session.flush()
+    queried_instance = session.query(model).first()
+    assert json.loads(queried_instance.to_str()) == json.loads(model_str)
+    assert json.loads("".join(model.iter_json([queried_instance]))) == [
+        json.loads(model_str)
+    ]
+
+
 @pytest.mark.integration
 def test_to_from_dict_many_to_one_read_only(engine, sessionmaker):
     """
@@ -587,3 +706,1019 @@ def test_inheritance(engine, sessionmaker):
     assert queried_employee.to_dict() == employee_dict
     queried_manager = session.query(manager).first()
     assert queried_manager.to_dict() == manager_dict
+
+
+@pytest.mark.parametrize(
+    "depth, expected_queries",
+    [
+        pytest.param(None, 3, id="all levels"),
+        pytest.param(3, 3, id="depth 3"),
+        pytest.param(2, 2 + 4, id="depth 2 staff for each boss"),
+        pytest.param(1, 2 + 4 + 4, id="depth 1 boss and staff for each employee"),
+        pytest.param(0, 1 + 2 + 4 + 4, id="depth 0 employees for each division"),
+    ],
+)
+@pytest.mark.integration
+def test_to_dict_load_options(engine, sessionmaker, depth, expected_queries):
+    """
+    GIVEN specification with a one to many relationship to a model with a many to one
+        relationship and a readOnly backref
+    WHEN to_dict is called for the instances returned by a query with the options
+        returned by to_dict_load_options with the depth
+    THEN the expected number of queries are executed.
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "Division": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "employees": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/Employee"},
+                        },
+                    },
+                    "x-tablename": "division",
+                    "type": "object",
+                },
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "boss": {
+                            "allOf": [
+                                {"$ref": "#/components/schemas/Boss"},
+                                {"x-backref": "staff"},
+                            ]
+                        },
+                    },
+                    "x-tablename": "employee",
+                    "type": "object",
+                },
+                "Boss": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "staff": {
+                            "type": "array",
+                            "readOnly": True,
+                            "items": {
+                                "type": "object",
+                                "properties": {"id": {"type": "integer"}},
+                            },
+                        },
+                    },
+                    "x-tablename": "boss",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    division = model_factory(name="Division")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    # Creating instances of models
+    division_dicts = [
+        {
+            "id": division_id,
+            "employees": [
+                {"id": division_id * 10 + idx, "boss": {"id": division_id * 10 + idx}}
+                for idx in range(2)
+            ],
+        }
+        for division_id in range(2)
+    ]
+    session = sessionmaker()
+    session.add_all([division.from_dict(**value) for value in division_dicts])
+    session.commit()
+    session.close()
+
+    # Querying the instances and converting them to dictionaries
+    queries = []
+    sqlalchemy.event.listen(
+        engine, "before_cursor_execute", lambda *_: queries.append(None)
+    )
+    session = sessionmaker()
+    options = division.to_dict_load_options(depth=depth)
+    queried_dicts = division.to_dict_many(session.query(division).options(*options))
+
+    assert len(queries) == expected_queries
+    for queried_dict, division_dict in zip(queried_dicts, division_dicts):
+        assert queried_dict["id"] == division_dict["id"]
+        for queried_employee, employee in zip(
+            queried_dict["employees"], division_dict["employees"]
+        ):
+            assert queried_employee["boss"]["id"] == employee["boss"]["id"]
+            assert queried_employee["boss"]["staff"] == [{"id": employee["id"]}]
+
+
+@pytest.mark.integration
+def test_to_dict_fields_load_only_options(engine, sessionmaker):
+    """
+    GIVEN specification with a schema with columns and a relationship
+    WHEN a query with the options of load_only_options for some fields is executed and
+        to_dict is called with the same fields
+    THEN only the columns of the fields and the primary key are selected and only the
+        fields are returned.
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "RefTable": {
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                    "x-tablename": "ref_table",
+                    "type": "object",
+                },
+                "Table": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "name": {"type": "string"},
+                        "description": {"type": "string"},
+                        "ref_table": {"$ref": "#/components/schemas/RefTable"},
+                    },
+                    "x-tablename": "item",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    # Creating instance of model
+    session = sessionmaker()
+    session.add(
+        model.from_dict(
+            id=1, name="name 1", description="description 1", ref_table={"id": 2}
+        )
+    )
+    session.commit()
+    session.close()
+
+    # Querying the instance
+    statements = []
+    sqlalchemy.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    fields = ["name", "ref_table"]
+    session = sessionmaker()
+    queried_instance = (
+        session.query(model).options(*model.load_only_options(fields)).first()
+    )
+
+    (select_statement,) = statements
+    assert "item.name" in select_statement
+    assert "item.id" in select_statement
+    assert "item.description" not in select_statement
+    assert "item.ref_table_id" not in select_statement
+    assert queried_instance.to_dict(fields=fields) == {
+        "name": "name 1",
+        "ref_table": {"id": 2},
+    }
+
+
+BULK_SPEC = {
+    "components": {
+        "schemas": {
+            "RefTable": {
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                "x-tablename": "ref_table",
+                "type": "object",
+            },
+            "Table": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string", "maxLength": 10},
+                    "created": {"type": "string", "format": "date", "nullable": True},
+                    "ref_table_id": {
+                        "type": "integer",
+                        "x-foreign-key": "ref_table.id",
+                    },
+                    "ref_table": {"$ref": "#/components/schemas/RefTable"},
+                },
+                "required": ["name"],
+                "x-tablename": "bulk_table",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+@pytest.mark.parametrize(
+    "chunk_size, expected_statements",
+    [
+        pytest.param(1, 5, id="chunk size 1"),
+        pytest.param(2, 3, id="chunk size 2"),
+        pytest.param(5, 1, id="chunk size equal to rows"),
+        pytest.param(1000, 1, id="chunk size larger than rows"),
+    ],
+)
+@pytest.mark.integration
+def test_bulk_insert_dicts(engine, sessionmaker, chunk_size, expected_statements):
+    """
+    GIVEN specification with a schema and dictionaries
+    WHEN bulk_insert_dicts is called with the dictionaries and chunk size
+    THEN the dictionaries are converted and inserted with the expected number of
+        statements.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=BULK_SPEC, base=base)
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    # Inserting dictionaries
+    rows = [
+        {"id": idx, "name": f"name {idx}", "created": f"2000-01-0{idx + 1}"}
+        for idx in range(5)
+    ]
+    statements = []
+    sqlalchemy.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    session = sessionmaker()
+    inserted = model.bulk_insert_dicts(session, iter(rows), chunk_size=chunk_size)
+
+    assert inserted == len(rows)
+    assert len(statements) == expected_statements
+    queried_dicts = [
+        instance.to_dict(fields=["id", "name", "created"])
+        for instance in session.query(model).order_by(model.id)
+    ]
+    assert queried_dicts == rows
+
+
+@pytest.mark.integration
+def test_bulk_insert_dicts_connection(engine):
+    """
+    GIVEN specification with a schema with a foreign key property and a connection
+    WHEN bulk_insert_dicts is called with the connection
+    THEN the dictionaries are inserted.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=BULK_SPEC, base=base)
+    ref_model = model_factory(name="RefTable")
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    with engine.connect() as connection:
+        ref_model.bulk_insert_dicts(connection, [{"id": 2}])
+        inserted = model.bulk_insert_dicts(
+            connection, [{"id": 1, "name": "name 1", "ref_table_id": 2}]
+        )
+
+        assert inserted == 1
+        assert connection.execute(
+            sqlalchemy.select(model.__table__.c.name, model.__table__.c.ref_table_id)
+        ).fetchall() == [("name 1", 2)]
+
+
+@pytest.mark.integration
+def test_bulk_insert_dicts_different_properties(engine, sessionmaker):
+    """
+    GIVEN specification with a schema and dictionaries with different properties
+    WHEN bulk_insert_dicts is called with the dictionaries
+    THEN the dictionaries are inserted.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=BULK_SPEC, base=base)
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    rows = [
+        {"id": 1, "name": "name 1", "created": "2000-01-01"},
+        {"id": 2, "name": "name 2"},
+        {"id": 3, "name": "name 3", "created": "2000-01-03"},
+    ]
+    session = sessionmaker()
+    inserted = model.bulk_insert_dicts(session, rows)
+
+    assert inserted == len(rows)
+    queried_dicts = [
+        instance.to_dict(fields=["id", "name", "created"])
+        for instance in session.query(model).order_by(model.id)
+    ]
+    assert queried_dicts == [
+        {"id": 1, "name": "name 1", "created": "2000-01-01"},
+        {"id": 2, "name": "name 2", "created": None},
+        {"id": 3, "name": "name 3", "created": "2000-01-03"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "validation, row",
+    [
+        pytest.param(None, {"id": 1}, id="strict missing required"),
+        pytest.param(None, {"id": 1, "name": "a" * 11}, id="strict too long"),
+        pytest.param(
+            open_alchemy.ValidationMode.STRUCTURAL,
+            {"id": 1},
+            id="structural missing required",
+        ),
+        pytest.param(
+            open_alchemy.ValidationMode.TRUSTED,
+            {"id": 1, "name": "name 1", "other": "value"},
+            id="trusted not a property",
+        ),
+        pytest.param(
+            None,
+            {"id": 1, "name": "name 1", "ref_table": {"id": 2}},
+            id="relationship",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_bulk_insert_dicts_invalid(engine, sessionmaker, validation, row):
+    """
+    GIVEN specification with a schema and an invalid dictionary for the validation
+    WHEN bulk_insert_dicts is called with the dictionary and validation
+    THEN MalformedModelDictionaryError is raised and no rows are inserted.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=BULK_SPEC, base=base)
+    model_factory(name="RefTable")
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    session = sessionmaker()
+    with pytest.raises(open_alchemy.exceptions.MalformedModelDictionaryError):
+        model.bulk_insert_dicts(
+            session, [{"id": 0, "name": "name 0"}, row], validation=validation
+        )
+    assert session.query(model).count() == 0
+
+
+@pytest.mark.integration
+def test_bulk_insert_dicts_polymorphic(engine, sessionmaker):
+    """
+    GIVEN specification with a schema that has a polymorphic identity and a schema
+        that inherits from it
+    WHEN bulk_insert_dicts is called on the models
+    THEN the polymorphic identity is inserted for the parent and
+        FeatureNotImplementedError is raised for the model that inherits.
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "type": {"type": "string"},
+                    },
+                    "x-tablename": "employee",
+                    "type": "object",
+                    "x-kwargs": {
+                        "__mapper_args__": {
+                            "polymorphic_on": "type",
+                            "polymorphic_identity": "employee",
+                        }
+                    },
+                },
+                "Manager": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Employee"},
+                        {
+                            "x-inherits": True,
+                            "type": "object",
+                            "properties": {"manager_data": {"type": "string"}},
+                            "x-kwargs": {
+                                "__mapper_args__": {"polymorphic_identity": "manager"}
+                            },
+                        },
+                    ]
+                },
+            }
+        }
+    }
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    employee = model_factory(name="Employee")
+    manager = model_factory(name="Manager")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    session = sessionmaker()
+    employee.bulk_insert_dicts(session, [{"id": 1}])
+    assert session.query(employee).one().to_dict() == {"id": 1, "type": "employee"}
+    with pytest.raises(open_alchemy.exceptions.FeatureNotImplementedError):
+        manager.bulk_insert_dicts(session, [{"id": 2}])
+
+
+UPSERT_SPEC = {
+    "components": {
+        "schemas": {
+            "Table": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "email": {"type": "string", "x-unique": True},
+                    "first_name": {"type": "string"},
+                    "last_name": {"type": "string"},
+                    "score": {"type": "integer"},
+                },
+                "x-composite-unique": ["first_name", "last_name"],
+                "x-tablename": "upsert_table",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+@pytest.mark.parametrize(
+    "conflict_on, rows, expected_rows",
+    [
+        pytest.param(
+            None,
+            [{"id": 1, "score": 10}, {"id": 3, "score": 30}],
+            [
+                (1, "a@x.com", "a", "a", 10),
+                (2, "b@x.com", "b", "b", 2),
+                (3, None, None, None, 30),
+            ],
+            id="primary key",
+        ),
+        pytest.param(
+            None,
+            [{"email": "b@x.com", "score": 20}, {"email": "c@x.com", "score": 30}],
+            [
+                (1, "a@x.com", "a", "a", 1),
+                (2, "b@x.com", "b", "b", 20),
+                (3, "c@x.com", None, None, 30),
+            ],
+            id="unique property",
+        ),
+        pytest.param(
+            None,
+            [{"first_name": "a", "last_name": "a", "score": 10}],
+            [(1, "a@x.com", "a", "a", 10), (2, "b@x.com", "b", "b", 2)],
+            id="composite unique",
+        ),
+        pytest.param(
+            ["email"],
+            [{"id": 2, "email": "b@x.com", "score": 20}],
+            [(1, "a@x.com", "a", "a", 1), (2, "b@x.com", "b", "b", 20)],
+            id="conflict on",
+        ),
+        pytest.param(
+            None,
+            [{"id": 2}, {"id": 3}],
+            [
+                (1, "a@x.com", "a", "a", 1),
+                (2, "b@x.com", "b", "b", 2),
+                (3, None, None, None, None),
+            ],
+            id="nothing to update",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_bulk_upsert_dicts(engine, sessionmaker, conflict_on, rows, expected_rows):
+    """
+    GIVEN specification with a schema with unique constraints and existing rows
+    WHEN bulk_upsert_dicts is called with dictionaries and conflict_on
+    THEN the existing rows are updated and the other rows are inserted with a single
+        statement.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=UPSERT_SPEC, base=base)
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    session = sessionmaker()
+    model.bulk_insert_dicts(
+        session,
+        [
+            {
+                "id": 1,
+                "email": "a@x.com",
+                "first_name": "a",
+                "last_name": "a",
+                "score": 1,
+            },
+            {
+                "id": 2,
+                "email": "b@x.com",
+                "first_name": "b",
+                "last_name": "b",
+                "score": 2,
+            },
+        ],
+    )
+
+    # Upserting dictionaries
+    statements = []
+    sqlalchemy.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    upserted = model.bulk_upsert_dicts(session, rows, conflict_on=conflict_on)
+
+    assert upserted == len(rows)
+    assert len(statements) == 1
+    assert "ON CONFLICT" in statements[0]
+    table = model.__table__
+    assert (
+        session.execute(
+            sqlalchemy.select(
+                table.c.id,
+                table.c.email,
+                table.c.first_name,
+                table.c.last_name,
+                table.c.score,
+            ).order_by(table.c.id)
+        ).fetchall()
+        == expected_rows
+    )
+
+
+@pytest.mark.parametrize(
+    "conflict_on, rows, expected_exception",
+    [
+        pytest.param(
+            None,
+            [{"score": 1}],
+            open_alchemy.exceptions.MissingArgumentError,
+            id="no unique constraint in dictionaries",
+        ),
+        pytest.param(
+            None,
+            [{"first_name": "a", "score": 1}],
+            open_alchemy.exceptions.MissingArgumentError,
+            id="part of composite unique in dictionaries",
+        ),
+        pytest.param(
+            ["other"],
+            [{"id": 1}],
+            open_alchemy.exceptions.ModelAttributeError,
+            id="conflict on not a column",
+        ),
+        pytest.param(
+            None,
+            [{"id": 1, "score": 1}, {"email": "c@x.com", "score": 2}],
+            open_alchemy.exceptions.MalformedModelDictionaryError,
+            id="dictionary without conflict target",
+        ),
+        pytest.param(
+            ["email"],
+            [{"email": "c@x.com", "score": 1}, {"id": 3, "score": 2}],
+            open_alchemy.exceptions.MalformedModelDictionaryError,
+            id="dictionary without conflict on",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_bulk_upsert_dicts_conflict_on_invalid(
+    engine, sessionmaker, conflict_on, rows, expected_exception
+):
+    """
+    GIVEN specification with a schema with unique constraints
+    WHEN bulk_upsert_dicts is called with dictionaries and a conflict_on that does not
+        identify a unique constraint
+    THEN the expected exception is raised and no rows are inserted.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=UPSERT_SPEC, base=base)
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    session = sessionmaker()
+    with pytest.raises(expected_exception):
+        model.bulk_upsert_dicts(session, rows, conflict_on=conflict_on)
+    assert session.query(model).count() == 0
+
+
+@pytest.mark.integration
+def test_bulk_upsert_dicts_different_properties(engine, sessionmaker):
+    """
+    GIVEN specification with a schema, existing rows and dictionaries with different
+        properties
+    WHEN bulk_upsert_dicts is called with the dictionaries
+    THEN the properties in each dictionary are updated or inserted with a statement
+        for each run of dictionaries with the same properties.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=UPSERT_SPEC, base=base)
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    session = sessionmaker()
+    model.bulk_insert_dicts(
+        session,
+        [
+            {"id": 1, "email": "a@x.com", "first_name": "a", "score": 1},
+            {"id": 2, "email": "b@x.com", "first_name": "b", "score": 2},
+        ],
+    )
+
+    # Upserting dictionaries
+    statements = []
+    sqlalchemy.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    rows = [
+        {"id": 1, "score": 10},
+        {"id": 2, "first_name": "c"},
+        {"id": 3, "first_name": "d"},
+        {"id": 4, "score": 40},
+    ]
+    upserted = model.bulk_upsert_dicts(session, rows)
+
+    assert upserted == len(rows)
+    assert len(statements) == 3
+    table = model.__table__
+    assert session.execute(
+        sqlalchemy.select(
+            table.c.id, table.c.email, table.c.first_name, table.c.score
+        ).order_by(table.c.id)
+    ).fetchall() == [
+        (1, "a@x.com", "a", 10),
+        (2, "b@x.com", "c", 2),
+        (3, None, "d", None),
+        (4, None, None, 40),
+    ]
+
+
+@pytest.mark.integration
+def test_bulk_upsert_dicts_chunks(engine):
+    """
+    GIVEN specification with a schema and a connection
+    WHEN bulk_upsert_dicts is called twice with overlapping dictionaries and a chunk
+        size
+    THEN a statement is executed for each chunk and the rows are upserted.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=UPSERT_SPEC, base=base)
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    statements = []
+    sqlalchemy.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    with engine.connect() as connection:
+        model.bulk_upsert_dicts(
+            connection, ({"id": idx, "score": idx} for idx in range(3)), chunk_size=2
+        )
+        upserted = model.bulk_upsert_dicts(
+            connection,
+            ({"id": idx, "score": 10 * idx} for idx in range(1, 5)),
+            chunk_size=2,
+        )
+
+        assert upserted == 4
+        assert len(statements) == 4
+        table = model.__table__
+        assert connection.execute(
+            sqlalchemy.select(table.c.id, table.c.score).order_by(table.c.id)
+        ).fetchall() == [(0, 0), (1, 10), (2, 20), (3, 30), (4, 40)]
+
+
+@pytest.mark.integration
+def test_select_dicts(engine, sessionmaker):
+    """
+    GIVEN specification with a schema with a relationship and instances of the model
+    WHEN select_dicts is called with a session
+    THEN the rows are converted like to_dict without the relationship and no instances
+        are added to the session.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=BULK_SPEC, base=base)
+    ref_model = model_factory(name="RefTable")
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    # Creating instances
+    session = sessionmaker()
+    session.add(ref_model.from_dict(id=2))
+    session.add(model.from_dict(id=1, name="name 1", created="2000-01-01"))
+    session.add(model.from_dict(id=2, name="name 2", ref_table_id=2))
+    session.commit()
+    session.expunge_all()
+
+    returned_dicts = model.select_dicts(session)
+
+    assert returned_dicts == [
+        {"id": 1, "name": "name 1", "created": "2000-01-01"},
+        {"id": 2, "name": "name 2", "created": None, "ref_table_id": 2},
+    ]
+    assert len(session.identity_map) == 0
+    assert returned_dicts == [
+        {key: value for key, value in instance.to_dict().items() if key != "ref_table"}
+        for instance in session.query(model).order_by(model.id)
+    ]
+
+
+@pytest.mark.integration
+def test_select_dicts_statement(engine):
+    """
+    GIVEN specification with a schema and rows of the model
+    WHEN select_dicts is called with a connection and a refined select_statement
+        for some fields
+    THEN the rows selected by the statement are converted with only the fields.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=BULK_SPEC, base=base)
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    with engine.connect() as connection:
+        model.bulk_insert_dicts(
+            connection, [{"id": idx, "name": f"name {idx}"} for idx in range(5)]
+        )
+        statement = (
+            model.select_statement(fields=["name"])
+            .where(model.id > 1)
+            .order_by(model.id.desc())
+            .limit(2)
+        )
+
+        returned_dicts = model.select_dicts(connection, statement)
+
+    assert returned_dicts == [{"name": "name 4"}, {"name": "name 3"}]
+
+
+@pytest.mark.parametrize(
+    "manager_schema",
+    [
+        pytest.param({}, id="single"),
+        pytest.param(
+            {
+                "x-tablename": "manager",
+                "properties": {
+                    "id": {
+                        "type": "integer",
+                        "x-primary-key": True,
+                        "x-foreign-key": "employee.id",
+                    },
+                    "manager_data": {"type": "string"},
+                },
+            },
+            id="joined",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_select_dicts_inheritance(engine, sessionmaker, manager_schema):
+    """
+    GIVEN specification with a schema with a schema that inherits from it and rows
+        of both models
+    WHEN select_dicts is called on both models
+    THEN the rows of the parent include all rows and the rows of the model that
+        inherits only include its rows with the columns of the parent.
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "Employee": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "type": {"type": "string"},
+                    },
+                    "x-tablename": "employee",
+                    "type": "object",
+                    "x-kwargs": {
+                        "__mapper_args__": {
+                            "polymorphic_on": "type",
+                            "polymorphic_identity": "employee",
+                        }
+                    },
+                },
+                "Manager": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Employee"},
+                        {
+                            "x-inherits": True,
+                            "type": "object",
+                            "properties": {"manager_data": {"type": "string"}},
+                            "x-kwargs": {
+                                "__mapper_args__": {"polymorphic_identity": "manager"}
+                            },
+                            **manager_schema,
+                        },
+                    ]
+                },
+            }
+        }
+    }
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=spec, base=base)
+    employee = model_factory(name="Employee")
+    manager = model_factory(name="Manager")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    session = sessionmaker()
+    session.add(employee.from_dict(id=1))
+    session.add(manager.from_dict(id=2, manager_data="data 2"))
+    session.commit()
+
+    assert employee.select_dicts(
+        session, employee.select_statement().order_by(employee.id)
+    ) == [{"id": 1, "type": "employee"}, {"id": 2, "type": "manager"}]
+    assert manager.select_dicts(session) == [
+        {"id": 2, "type": "manager", "manager_data": "data 2"}
+    ]
+    assert manager.to_columns(session.query(manager)) == {
+        "id": array.array("q", [2]),
+        "type": ["manager"],
+        "manager_data": ["data 2"],
+    }
+
+
+@pytest.mark.integration
+def test_select_dicts_invalid(engine, sessionmaker):
+    """
+    GIVEN specification with a schema with a relationship
+    WHEN select_statement and select_dicts are called with fields or columns that are
+        not column properties or for a value that is not valid
+    THEN ModelAttributeError or InvalidInstanceError is raised.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=BULK_SPEC, base=base)
+    model_factory(name="RefTable")
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    session = sessionmaker()
+    with pytest.raises(open_alchemy.exceptions.ModelAttributeError):
+        model.select_statement(fields=["other"])
+    with pytest.raises(open_alchemy.exceptions.ModelAttributeError):
+        model.select_statement(fields=["id", "ref_table"])
+    with pytest.raises(open_alchemy.exceptions.ModelAttributeError):
+        model.select_dicts(
+            session, sqlalchemy.select(model.__table__.c.id.label("key"))
+        )
+
+    session.execute(
+        sqlalchemy.text(
+            "INSERT INTO bulk_table (id, name, ref_table_id) VALUES (1, 'name', 'a')"
+        )
+    )
+    with pytest.raises(open_alchemy.exceptions.InvalidInstanceError) as exc:
+        model.select_dicts(session)
+    assert exc.value.property_name == "ref_table_id"
+
+
+@pytest.mark.integration
+def test_to_columns(engine, sessionmaker):
+    """
+    GIVEN specification with a schema with a relationship and rows of the model
+    WHEN to_columns is called with a query, with the rows of a select_statement and
+        with fields
+    THEN the values of the columns are collected for each property.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=BULK_SPEC, base=base)
+    model_factory(name="RefTable")
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    session = sessionmaker()
+    model.bulk_insert_dicts(
+        session, [{"id": idx, "name": f"name {idx}"} for idx in range(3)]
+    )
+    model.bulk_insert_dicts(
+        session, [{"id": 3, "name": "name 3", "created": "2000-01-01"}]
+    )
+
+    returned_columns = model.to_columns(session.query(model).order_by(model.id))
+
+    assert returned_columns == {
+        "id": array.array("q", [0, 1, 2, 3]),
+        "name": ["name 0", "name 1", "name 2", "name 3"],
+        "created": [None, None, None, datetime.date(2000, 1, 1)],
+        "ref_table_id": [None, None, None, None],
+    }
+    assert model.to_columns(
+        session.execute(model.select_statement(fields=["id", "name"]).limit(2))
+    ) == {"id": array.array("q", [0, 1]), "name": ["name 0", "name 1"]}
+    assert model.to_columns(session.query(model), fields=["id"]) == {
+        "id": array.array("q", [0, 1, 2, 3])
+    }
+    with pytest.raises(open_alchemy.exceptions.ModelAttributeError):
+        model.to_columns(session.query(model), fields=["ref_table"])
+
+
+@pytest.mark.integration
+def test_to_columns_numpy_dtype(engine, sessionmaker, monkeypatch):
+    """
+    GIVEN specification with a schema and rows of the model
+    WHEN to_columns is called with numpy
+    THEN each column is converted to an array with the dtype for the schema.
+    """
+    monkeypatch.setattr(
+        numpy_,
+        "array",
+        lambda *, values, dtype: (dtype, list(values)),
+    )
+
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=BULK_SPEC, base=base)
+    model_factory(name="RefTable")
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    session = sessionmaker()
+    model.bulk_insert_dicts(session, [{"id": 1, "name": "name 1"}])
+
+    returned_columns = model.to_columns(session.query(model), numpy=True)
+
+    assert returned_columns == {
+        "id": ("int64", [1]),
+        "name": ("object", ["name 1"]),
+        "created": ("datetime64[D]", [None]),
+        "ref_table_id": ("int64", [None]),
+    }
+
+
+@pytest.mark.integration
+def test_to_columns_numpy(engine, sessionmaker):
+    """
+    GIVEN numpy is installed and specification with a schema and rows of the model
+    WHEN to_columns is called with numpy
+    THEN the columns are NumPy arrays with the dtype for the schema.
+    """
+    pytest.importorskip("numpy")
+
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(spec=BULK_SPEC, base=base)
+    model_factory(name="RefTable")
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+
+    session = sessionmaker()
+    model.bulk_insert_dicts(
+        session, [{"id": 1, "name": "name 1", "created": "2000-01-01"}]
+    )
+
+    returned_columns = model.to_columns(session.query(model), numpy=True)
+
+    assert {name: str(column.dtype) for name, column in returned_columns.items()} == {
+        "id": "int64",
+        "name": "object",
+        "created": "datetime64[D]",
+        "ref_table_id": "object",
+    }
@@ -813,3 +813,49 @@ def test_backrefs_items(schema, schemas, expected_backrefs):
     returned_backrefs = iterate.backrefs_items(schema=schema, schemas=schemas)
 
     assert list(returned_backrefs) == expected_backrefs
+
+
+@pytest.mark.parametrize(
+    "value, expected_names",
+    [
+        pytest.param(None, [], id="not dict"),
+        pytest.param({}, [], id="empty"),
+        pytest.param({"$ref": "#/components/schemas/Schema1"}, ["Schema1"], id="$ref"),
+        pytest.param({"$ref": "remote.yaml#/Schema1"}, [], id="$ref remote"),
+        pytest.param({"$ref": True}, [], id="$ref not string"),
+        pytest.param(
+            {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Schema1"},
+                    {"x-backref": "schema"},
+                ]
+            },
+            ["Schema1"],
+            id="allOf",
+        ),
+        pytest.param(
+            {
+                "properties": {
+                    "prop_1": {"$ref": "#/components/schemas/Schema1"},
+                    "prop_2": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Schema2"},
+                    },
+                }
+            },
+            ["Schema1", "Schema2"],
+            id="nested",
+        ),
+    ],
+)
+@pytest.mark.schemas
+@pytest.mark.helper
+def test_local_refs(value, expected_names):
+    """
+    GIVEN value and expected names
+    WHEN local_refs is called with the value
+    THEN the expected names are returned.
+    """
+    returned_names = iterate.local_refs(value)
+
+    assert list(returned_names) == expected_names
@@ -0,0 +1,187 @@
+"""Tests for the pipeline helper."""
+
+import pytest
+
+from open_alchemy import types
+from open_alchemy.helpers import property_
+from open_alchemy.schemas.helpers import pipeline
+
+SCHEMAS = {
+    "Schema1": {
+        "x-tablename": "schema_1",
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "x-primary-key": True},
+            "json_prop": {"type": "object", "x-json": True},
+            "many_to_one": {"$ref": "#/components/schemas/Schema2"},
+            "many_to_many": {
+                "type": "array",
+                "items": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Schema2"},
+                        {"x-secondary": "schema_1_schema_2"},
+                    ]
+                },
+            },
+        },
+    },
+    "Schema2": {
+        "x-tablename": "schema_2",
+        "type": "object",
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+    },
+    "NotConstructable": {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}},
+    },
+}
+
+RUN_TESTS = [
+    pytest.param(
+        None,
+        [
+            ("Schema1", "id", types.PropertyType.SIMPLE, None),
+            ("Schema1", "json_prop", types.PropertyType.JSON, None),
+            (
+                "Schema1",
+                "many_to_one",
+                types.PropertyType.RELATIONSHIP,
+                types.RelationshipType.MANY_TO_ONE,
+            ),
+            (
+                "Schema1",
+                "many_to_many",
+                types.PropertyType.RELATIONSHIP,
+                types.RelationshipType.MANY_TO_MANY,
+            ),
+            ("Schema2", "id", types.PropertyType.SIMPLE, None),
+        ],
+        id="all",
+    ),
+    pytest.param(
+        [types.PropertyType.JSON],
+        [("Schema1", "json_prop", types.PropertyType.JSON, None)],
+        id="property type",
+    ),
+    pytest.param(
+        [types.PropertyType.RELATIONSHIP],
+        [
+            (
+                "Schema1",
+                "many_to_one",
+                types.PropertyType.RELATIONSHIP,
+                types.RelationshipType.MANY_TO_ONE,
+            ),
+            (
+                "Schema1",
+                "many_to_many",
+                types.PropertyType.RELATIONSHIP,
+                types.RelationshipType.MANY_TO_MANY,
+            ),
+        ],
+        id="relationship property type",
+    ),
+    pytest.param(
+        [types.RelationshipType.MANY_TO_MANY],
+        [
+            (
+                "Schema1",
+                "many_to_many",
+                types.PropertyType.RELATIONSHIP,
+                types.RelationshipType.MANY_TO_MANY,
+            )
+        ],
+        id="relationship type",
+    ),
+    pytest.param(
+        [types.PropertyType.SIMPLE, types.RelationshipType.MANY_TO_ONE],
+        [
+            ("Schema1", "id", types.PropertyType.SIMPLE, None),
+            (
+                "Schema1",
+                "many_to_one",
+                types.PropertyType.RELATIONSHIP,
+                types.RelationshipType.MANY_TO_ONE,
+            ),
+            ("Schema2", "id", types.PropertyType.SIMPLE, None),
+        ],
+        id="multiple",
+    ),
+    pytest.param(
+        [],
+        [],
+        id="none",
+    ),
+]
+
+
+@pytest.mark.parametrize("kinds, expected_properties", RUN_TESTS)
+@pytest.mark.schemas
+def test_run(kinds, expected_properties):
+    """
+    GIVEN schemas and a pipeline with a handler registered for some kinds
+    WHEN run is called with the schemas
+    THEN the handler is called with the properties of those kinds.
+    """
+    handled = []
+
+    def handler(schemas, property_):
+        """Record the property."""
+        assert schemas is SCHEMAS
+        assert property_.parent_schema is schemas[property_.parent_name]
+        handled.append(
+            (
+                property_.parent_name,
+                property_.name,
+                property_.type,
+                property_.relationship_type,
+            )
+        )
+
+    test_pipeline = pipeline.Pipeline()
+    test_pipeline.register(handler=handler, kinds=kinds)
+
+    test_pipeline.run(schemas=SCHEMAS)
+
+    assert handled == expected_properties
+
+
+@pytest.mark.schemas
+def test_run_multiple_handlers(monkeypatch):
+    """
+    GIVEN schemas and a pipeline with multiple handlers
+    WHEN run is called with the schemas
+    THEN the handlers are called in the order they are registered and the type of each
+        property is calculated once.
+    """
+    calculated = []
+    original_calculate_type = property_.calculate_type
+
+    def calculate_type(*, schemas, schema):
+        """Record the schema and calculate the type."""
+        calculated.append(schema)
+        return original_calculate_type(schemas=schemas, schema=schema)
+
+    monkeypatch.setattr(pipeline.property_helper, "calculate_type", calculate_type)
+    handled = []
+    test_pipeline = pipeline.Pipeline()
+    test_pipeline.register(
+        handler=lambda _, property_: handled.append(("first", property_.name))
+    )
+    test_pipeline.register(
+        handler=lambda _, property_: handled.append(("second", property_.name)),
+        kinds=[types.PropertyType.RELATIONSHIP],
+    )
+
+    test_pipeline.run(schemas=SCHEMAS)
+
+    assert handled == [
+        ("first", "id"),
+        ("first", "json_prop"),
+        ("first", "many_to_one"),
+        ("second", "many_to_one"),
+        ("first", "many_to_many"),
+        ("second", "many_to_many"),
+        ("first", "id"),
+    ]
+    assert len(calculated) == 5
@@ -0,0 +1,298 @@
+"""Tests for subset."""
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy.schemas import subset
+
+
+def _model(**properties):
+    """Construct the schema of a model with an id and some properties."""
+    return {
+        "x-tablename": properties.pop("tablename", "table"),
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "x-primary-key": True},
+            **properties,
+        },
+    }
+
+
+def _ref(name):
+    """Construct a local $ref to a schema."""
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+CALCULATE_TESTS = [
+    pytest.param(
+        {"Schema1": _model(), "Schema2": _model()},
+        ["Schema1"],
+        ["Schema1"],
+        id="single",
+    ),
+    pytest.param(
+        {"Schema1": _model(), "Schema2": _model()},
+        ["Schema2", "Schema1"],
+        ["Schema1", "Schema2"],
+        id="multiple order of schemas",
+    ),
+    pytest.param(
+        {
+            "Id": {"type": "integer", "x-primary-key": True},
+            "Schema1": {
+                "x-tablename": "schema_1",
+                "type": "object",
+                "properties": {"id": _ref("Id")},
+            },
+            "Schema2": _model(),
+        },
+        ["Schema1"],
+        ["Id", "Schema1"],
+        id="referenced schema",
+    ),
+    pytest.param(
+        {
+            "Parent": _model(tablename="parent"),
+            "Child": {
+                "allOf": [
+                    {
+                        "x-inherits": True,
+                        "type": "object",
+                        "properties": {"name": {"type": "string"}},
+                    },
+                    _ref("Parent"),
+                ]
+            },
+        },
+        ["Child"],
+        ["Parent", "Child"],
+        id="parent",
+    ),
+    pytest.param(
+        {
+            "Schema1": _model(ref=_ref("Schema2")),
+            "Schema2": _model(ref=_ref("Schema3")),
+            "Schema3": _model(),
+            "Schema4": _model(),
+        },
+        ["Schema1"],
+        ["Schema1", "Schema2", "Schema3"],
+        id="relationship targets recursive",
+    ),
+    pytest.param(
+        {
+            "Schema1": _model(ref=_ref("Schema2")),
+            "Schema2": _model(),
+        },
+        ["Schema2"],
+        ["Schema2"],
+        id="relationship no back reference",
+    ),
+    pytest.param(
+        {
+            "Schema1": _model(
+                ref={"allOf": [_ref("Schema2"), {"x-backref": "schemas_1"}]}
+            ),
+            "Schema2": _model(),
+            "Schema3": _model(ref=_ref("Schema1")),
+        },
+        ["Schema2"],
+        ["Schema1", "Schema2"],
+        id="back reference owner",
+    ),
+    pytest.param(
+        {
+            "Schema1": _model(
+                refs={
+                    "type": "array",
+                    "items": {"allOf": [_ref("Schema2"), {"x-backref": "schema_1"}]},
+                }
+            ),
+            "Schema2": _model(),
+        },
+        ["Schema2"],
+        ["Schema1", "Schema2"],
+        id="back reference owner array",
+    ),
+    pytest.param(
+        {
+            "Schema1": _model(refs={"type": "array", "items": _ref("Schema2")}),
+            "Schema2": _model(),
+            "Schema3": _model(ref=_ref("Schema1")),
+        },
+        ["Schema2"],
+        ["Schema1", "Schema2"],
+        id="one to many owner",
+    ),
+    pytest.param(
+        {
+            "Schema1": _model(
+                tablename="schema_1",
+                refs={
+                    "type": "array",
+                    "items": {"allOf": [_ref("Schema2"), {"x-secondary": "assoc"}]},
+                },
+            ),
+            "Schema2": _model(tablename="schema_2"),
+            "Association": _model(tablename="assoc"),
+        },
+        ["Schema2"],
+        ["Schema2"],
+        id="many to many no back reference",
+    ),
+    pytest.param(
+        {
+            "Schema1": _model(ref=_ref("Schema2")),
+            "Schema2": {**_model(), "x-backref": "schemas_1"},
+        },
+        ["Schema2"],
+        ["Schema1", "Schema2"],
+        id="back reference owner on referenced schema",
+    ),
+    pytest.param(
+        {
+            "Schema1": _model(ref={"allOf": [_ref("Schema2"), {"x-backref": True}]}),
+            "Schema2": _model(),
+        },
+        ["Schema2"],
+        ["Schema1", "Schema2"],
+        id="back reference owner invalid",
+    ),
+    pytest.param(
+        {
+            "Schema1": _model(
+                tablename="schema_1",
+                refs={
+                    "type": "array",
+                    "items": {"allOf": [_ref("Schema2"), {"x-secondary": "assoc"}]},
+                },
+            ),
+            "Schema2": _model(tablename="schema_2"),
+            "Association": _model(tablename="assoc"),
+            "Schema3": _model(tablename="schema_3"),
+        },
+        ["Schema1"],
+        ["Schema1", "Schema2", "Association"],
+        id="association table",
+    ),
+    pytest.param(
+        {
+            "Schema1": _model(
+                tablename="schema_1",
+                schema_2_id={"type": "integer", "x-foreign-key": "schema_2.id"},
+            ),
+            "Schema2": _model(tablename="schema_2"),
+            "Schema3": _model(tablename="schema_3"),
+        },
+        ["Schema1"],
+        ["Schema1", "Schema2"],
+        id="foreign key",
+    ),
+    pytest.param(
+        {
+            "Schema1": _model(
+                tablename="schema_1",
+                refs={
+                    "type": "array",
+                    "items": {
+                        "allOf": [
+                            _ref("Schema2"),
+                            {"x-open-alchemy-secondary": "assoc"},
+                        ]
+                    },
+                },
+            ),
+            "Schema2": _model(tablename="schema_2"),
+            "Association": _model(tablename="assoc"),
+            "Schema3": _model(tablename="schema_3"),
+        },
+        ["Schema1"],
+        ["Schema1", "Schema2", "Association"],
+        id="association table prefixed",
+    ),
+    pytest.param(
+        {
+            "Schema1": _model(
+                tablename="schema_1",
+                schema_2_id={
+                    "type": "integer",
+                    "x-open-alchemy-foreign-key": "schema_2.id",
+                },
+            ),
+            "Schema2": _model(tablename="schema_2"),
+            "Schema3": _model(tablename="schema_3"),
+        },
+        ["Schema1"],
+        ["Schema1", "Schema2"],
+        id="foreign key prefixed",
+    ),
+    pytest.param(
+        {
+            "Schema1": _model(ref=_ref("Schema2")),
+            "Schema2": _model(ref=_ref("Schema1")),
+        },
+        ["Schema1"],
+        ["Schema1", "Schema2"],
+        id="cycle",
+    ),
+    pytest.param(
+        {"Schema1": _model(ref=_ref("Missing"))},
+        ["Schema1"],
+        ["Schema1"],
+        id="reference missing",
+    ),
+    pytest.param(
+        {
+            "Schema1": {**_model(), "x-tablename": True},
+            "Schema2": _model(
+                prop={
+                    "type": "integer",
+                    "x-backref": "schemas_2",
+                    "x-secondary": True,
+                    "x-foreign-key": 1,
+                }
+            ),
+        },
+        ["Schema2"],
+        ["Schema2"],
+        id="malformed",
+    ),
+]
+
+
+@pytest.mark.parametrize("schemas, names, expected_names", CALCULATE_TESTS)
+@pytest.mark.schemas
+def test_calculate(schemas, names, expected_names):
+    """
+    GIVEN schemas, the names of models and the expected names of the schemas
+    WHEN calculate is called with the schemas and names
+    THEN the schemas with the expected names are returned.
+    """
+    returned_schemas = subset.calculate(schemas=schemas, names=names)
+
+    assert list(returned_schemas) == expected_names
+    assert all(
+        returned_schemas[name] is schemas[name] for name in returned_schemas.keys()
+    )
+
+
+@pytest.mark.parametrize(
+    "schemas, name",
+    [
+        pytest.param({"Schema1": _model()}, "Missing", id="missing"),
+        pytest.param(
+            {"Schema1": _model(), "Schema2": {"type": "integer"}},
+            "Schema2",
+            id="not constructable",
+        ),
+    ],
+)
+@pytest.mark.schemas
+def test_calculate_not_model(schemas, name):
+    """
+    GIVEN schemas and the name of a schema that is not a model
+    WHEN calculate is called with the schemas and name
+    THEN SchemaNotFoundError is raised.
+    """
+    with pytest.raises(exceptions.SchemaNotFoundError):
+        subset.calculate(schemas=schemas, names=[name])
@@ -0,0 +1,136 @@
+"""Tests for the hashes of models."""
+
+import datetime
+
+import pytest
+
+from open_alchemy.schemas.validation import model_hash
+
+
+def _ref(name):
+    """Construct a local $ref to a schema."""
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+SCHEMAS = {
+    "Model1": {
+        "type": "object",
+        "x-tablename": "model_1",
+        "properties": {"id": _ref("Id"), "model_2": _ref("Model2")},
+    },
+    "Model2": {
+        "type": "object",
+        "x-tablename": "model_2",
+        "properties": {"id": _ref("Id"), "name": {"allOf": [_ref("Name")]}},
+    },
+    "Model3": {
+        "type": "object",
+        "x-tablename": "model_3",
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+    },
+    "Id": {"type": "integer", "x-primary-key": True},
+    "Name": {"type": "string"},
+}
+
+
+def _changed(name, value):
+    """Copy the schemas with a schema replaced."""
+    return {**SCHEMAS, name: value}
+
+
+@pytest.mark.parametrize(
+    "schemas, expected_changed",
+    [
+        pytest.param(dict(SCHEMAS), set(), id="same"),
+        pytest.param(
+            _changed("Model3", {**SCHEMAS["Model3"], "x-tablename": "model_4"}),
+            {"Model3"},
+            id="model changed",
+        ),
+        pytest.param(
+            _changed("Id", {"type": "integer"}),
+            {"Model1", "Model2"},
+            id="direct reference changed",
+        ),
+        pytest.param(
+            _changed("Name", {"type": "string", "maxLength": 1}),
+            {"Model1", "Model2"},
+            id="transitive reference changed",
+        ),
+        pytest.param(
+            {
+                **SCHEMAS,
+                "Model3": {
+                    **SCHEMAS["Model3"],
+                    "properties": {"id": _ref("Missing")},
+                },
+            },
+            {"Model3"},
+            id="missing reference",
+        ),
+        pytest.param(
+            _changed("Unused", {"type": "string"}), set(), id="unreferenced schema"
+        ),
+    ],
+)
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_calculate(schemas, expected_changed):
+    """
+    GIVEN schemas
+    WHEN calculate is called with the schemas
+    THEN the hashes of the models that depend on a changed schema change.
+    """
+    names = ["Model1", "Model2", "Model3"]
+    original_hashes = model_hash.calculate(schemas=SCHEMAS, names=names)
+
+    returned_hashes = model_hash.calculate(schemas=schemas, names=names)
+
+    assert set(returned_hashes) == set(names)
+    changed = {name for name in names if returned_hashes[name] != original_hashes[name]}
+    assert changed == expected_changed
+
+
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_calculate_missing_reference_added():
+    """
+    GIVEN schemas with a reference to a schema that is not defined
+    WHEN calculate is called before and after the schema is defined
+    THEN the hash of the model changes.
+    """
+    schemas = _changed(
+        "Model3", {**SCHEMAS["Model3"], "properties": {"id": _ref("Missing")}}
+    )
+    before = model_hash.calculate(schemas=schemas, names=["Model3"])
+
+    after = model_hash.calculate(
+        schemas={**schemas, "Missing": {"type": "integer"}}, names=["Model3"]
+    )
+
+    assert before != after
+
+
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_calculate_not_json():
+    """
+    GIVEN schemas with values that are not JSON serializable
+    WHEN calculate is called with the schemas
+    THEN the hash changes with the values.
+    """
+    schemas = _changed(
+        "Id",
+        {"type": "string", "format": "date", "default": datetime.date(2021, 1, 1)},
+    )
+    before = model_hash.calculate(schemas=schemas, names=["Model1"])
+
+    after = model_hash.calculate(
+        schemas={
+            **schemas,
+            "Id": {**schemas["Id"], "default": datetime.date(2021, 1, 2)},
+        },
+        names=["Model1"],
+    )
+
+    assert before != after
@@ -1,10 +1,12 @@
 """Tests for validation rules."""
 
+import multiprocessing
 import pathlib
 
 import pytest
 
 from open_alchemy import exceptions
+from open_alchemy.helpers import ref
 from open_alchemy.schemas import validation
 
 PROCESS_TESTS = [
@@ -261,6 +263,170 @@ def test_process(schemas, raises):
         validation.process(schemas=schemas)
 
 
+def _process_error(schemas, jobs):
+    """Validate the schemas and return the message of any error."""
+    try:
+        validation.process(schemas=schemas, jobs=jobs)
+    except exceptions.MalformedSchemaError as exc:
+        return str(exc)
+    return None
+
+
+@pytest.mark.parametrize("schemas, raises", PROCESS_TESTS)
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_process_jobs(schemas, raises):
+    """
+    GIVEN schemas and whether an exception is expected
+    WHEN process is called with the schemas using several processes
+    THEN the same error is raised as for a single process.
+    """
+    assert _process_error(schemas, jobs=2) == _process_error(schemas, jobs=1)
+    assert (_process_error(schemas, jobs=2) is not None) == raises
+
+
+def _jobs_model(tablename, properties):
+    """Construct the schema of a model for the jobs tests."""
+    return {
+        "type": "object",
+        "x-tablename": tablename,
+        "properties": {
+            "id": {"type": "integer", "x-primary-key": True},
+            **properties,
+        },
+    }
+
+
+PROCESS_JOBS_TESTS = [
+    pytest.param(
+        {f"Schema{idx}": _jobs_model(f"schema_{idx}", {}) for idx in range(8)},
+        None,
+        id="valid",
+    ),
+    pytest.param(
+        {
+            **{f"Schema{idx}": _jobs_model(f"schema_{idx}", {}) for idx in range(4)},
+            "Schema4": _jobs_model("schema_4", {"prop_1": {"type": True}}),
+            "Schema5": {"type": "object", "x-tablename": True, "properties": {}},
+            "Schema6": _jobs_model("schema_6", {"prop_1": {"type": True}}),
+            "Schema7": {"type": "object", "x-tablename": True, "properties": {}},
+        },
+        "Schema5 :: ",
+        id="invalid model after invalid properties",
+    ),
+    pytest.param(
+        {
+            **{f"Schema{idx}": _jobs_model(f"schema_{idx}", {}) for idx in range(4)},
+            "Schema4": _jobs_model("schema_4", {"prop_1": {"type": True}}),
+            "Schema5": _jobs_model("schema_5", {"prop_1": {"type": True}}),
+        },
+        "Schema4 :: prop_1 :: ",
+        id="invalid properties",
+    ),
+    pytest.param(
+        {
+            **{f"Schema{idx}": _jobs_model(f"schema_{idx}", {}) for idx in range(4)},
+            "Schema4": _jobs_model("schema_4", {"prop_1": {"$ref": "#/Missing"}}),
+            "Schema5": _jobs_model("schema_5", {"prop_1": {"type": True}}),
+        },
+        "Schema4 :: prop_1 :: ",
+        id="invalid reference",
+    ),
+]
+
+
+@pytest.mark.parametrize("schemas, expected_prefix", PROCESS_JOBS_TESTS)
+@pytest.mark.parametrize("jobs", [2, 0])
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_process_jobs_several_models(schemas, expected_prefix, jobs):
+    """
+    GIVEN schemas with several models and the number of processes
+    WHEN process is called with the schemas using the processes
+    THEN the same error is raised as for a single process.
+    """
+    error = _process_error(schemas, jobs=jobs)
+
+    assert error == _process_error(schemas, jobs=1)
+    if expected_prefix is None:
+        assert error is None
+    else:
+        assert error.startswith(expected_prefix)
+
+
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_process_jobs_remote(tmp_path, _clean_remote_schemas_store):
+    """
+    GIVEN schemas with remote references and the path to the specification
+    WHEN process is called with the schemas using several processes
+    THEN the remote references are resolved by the processes.
+    """
+    (tmp_path / "remote.json").write_text(
+        '{"Id": {"type": "integer", "x-primary-key": true}, "Name": {"type": true}}'
+    )
+    ref.set_context(path=str(tmp_path / "spec.json"))
+    schemas = {
+        f"Schema{idx}": {
+            "type": "object",
+            "x-tablename": f"schema_{idx}",
+            "properties": {"id": {"$ref": "remote.json#/Id"}},
+        }
+        for idx in range(4)
+    }
+
+    validation.process(schemas=schemas, jobs=2)
+
+    schemas["Schema2"]["properties"]["name"] = {"$ref": "remote.json#/Name"}
+    error = _process_error(schemas, jobs=2)
+    assert error == _process_error(schemas, jobs=1)
+    assert error.startswith("Schema2 :: name :: ")
+
+
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_process_jobs_properties_raises(_clean_remote_schemas_store):
+    """
+    GIVEN schemas with a remote reference without the path to the specification
+    WHEN process is called with the schemas using several processes
+    THEN the same exception is raised as for a single process.
+    """
+    schemas = {
+        f"Schema{idx}": _jobs_model(f"schema_{idx}", {"prop_1": {"$ref": "o.json#/P"}})
+        for idx in range(4)
+    }
+
+    with pytest.raises(exceptions.MissingArgumentError):
+        validation.process(schemas=schemas, jobs=2)
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="the processes only see the patched check when they are forked",
+)
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_process_jobs_model_raises(monkeypatch):
+    """
+    GIVEN schemas with several models and a model check that raises for one of them
+    WHEN process is called with the schemas using several processes
+    THEN the exception is raised.
+    """
+    check = validation.model.check
+
+    def raising_check(schemas, schema):
+        """Raise for the schema of the third model."""
+        if schema["x-tablename"] == "schema_2":
+            raise exceptions.MalformedSchemaError("check raised")
+        return check(schemas, schema)
+
+    monkeypatch.setattr(validation.model, "check", raising_check)
+    schemas = {f"Schema{idx}": _jobs_model(f"schema_{idx}", {}) for idx in range(4)}
+
+    with pytest.raises(exceptions.MalformedSchemaError, match="check raised"):
+        validation.process(schemas=schemas, jobs=2)
+
+
 def test_process_cache(tmpdir):
     """
     GIVEN spec filename
@@ -282,6 +448,115 @@ def test_process_cache(tmpdir):
     validation.process(schemas={}, spec_filename=str(spec_file))
 
 
+def _incremental_schemas():
+    """Construct the schemas for the incremental validation tests."""
+    return {
+        **{f"Schema{idx}": _jobs_model(f"schema_{idx}", {}) for idx in range(3)},
+        "Schema3": _jobs_model(
+            "schema_3", {"name": {"$ref": "#/components/schemas/Name"}}
+        ),
+        "Name": {"type": "string"},
+    }
+
+
+@pytest.fixture
+def checked_names(monkeypatch):
+    """Record the names of the models whose schema is checked."""
+    names = []
+    check = validation.model.check
+
+    def recording_check(schemas, schema):
+        """Record the name of the model."""
+        names.append(next(name for name, value in schemas.items() if value is schema))
+        return check(schemas, schema)
+
+    monkeypatch.setattr(validation.model, "check", recording_check)
+    return names
+
+
+@pytest.mark.parametrize(
+    "change, expected_names",
+    [
+        pytest.param(lambda schemas: None, [], id="no model changed"),
+        pytest.param(
+            lambda schemas: schemas["Schema1"].update({"description": "changed"}),
+            ["Schema1"],
+            id="model changed",
+        ),
+        pytest.param(
+            lambda schemas: schemas["Name"].update({"maxLength": 1}),
+            ["Schema3"],
+            id="reference changed",
+        ),
+        pytest.param(
+            lambda schemas: schemas.update(Schema4=_jobs_model("schema_4", {})),
+            ["Schema4"],
+            id="model added",
+        ),
+    ],
+)
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_process_cache_incremental(tmpdir, checked_names, change, expected_names):
+    """
+    GIVEN schemas that have been validated with the spec filename and a change
+    WHEN the spec file is changed and process is called with the changed schemas
+    THEN only the models that changed are checked.
+    """
+    spec_file = pathlib.Path(tmpdir) / "spec.json"
+    spec_file.write_text("spec 1", encoding="utf-8")
+    schemas = _incremental_schemas()
+    validation.process(schemas=schemas, spec_filename=str(spec_file))
+    checked_names.clear()
+    spec_file.write_text("spec 2", encoding="utf-8")
+    change(schemas)
+
+    validation.process(schemas=schemas, spec_filename=str(spec_file))
+
+    assert checked_names == expected_names
+
+
+@pytest.mark.parametrize(
+    "change, expected_message",
+    [
+        pytest.param(
+            lambda schemas: schemas["Schema1"].update({"x-tablename": True}),
+            "Schema1 :: ",
+            id="model invalid",
+        ),
+        pytest.param(
+            lambda schemas: schemas["Name"].update({"type": True}),
+            "Schema3 :: name :: ",
+            id="reference invalid",
+        ),
+        pytest.param(
+            lambda schemas: schemas["Schema1"].update({"x-tablename": "schema_2"}),
+            "schema_2 defined on the schema",
+            id="spec-wide check",
+        ),
+    ],
+)
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_process_cache_incremental_invalid(tmpdir, change, expected_message):
+    """
+    GIVEN schemas that have been validated with the spec filename and a change
+    WHEN the spec file is changed and process is called with the changed schemas
+    THEN MalformedSchemaError is raised and it is raised again on the next call.
+    """
+    spec_file = pathlib.Path(tmpdir) / "spec.json"
+    spec_file.write_text("spec 1", encoding="utf-8")
+    schemas = _incremental_schemas()
+    validation.process(schemas=schemas, spec_filename=str(spec_file))
+    spec_file.write_text("spec 2", encoding="utf-8")
+    change(schemas)
+
+    for _ in range(2):
+        with pytest.raises(exceptions.MalformedSchemaError) as exc:
+            validation.process(schemas=schemas, spec_filename=str(spec_file))
+        assert expected_message in str(exc.value)
+
+
 CHECK_TESTS = [
     pytest.param(
         True,
@@ -20,6 +20,7 @@ from open_alchemy.table_args import factory
         ({"name": "name 1", "expressions": ["column 1"]}, "Index"),
         ({"name": "name 1", "expressions": ["column 1"], "unique": True}, "Index"),
         ([{"name": "name 1", "expressions": ["column 1"]}], "IndexList"),
+        ("module.Mixin", "Mixin"),
     ],
     ids=[
         "ColumnList",
@@ -31,6 +32,7 @@ from open_alchemy.table_args import factory
         "Index no unique",
         "Index",
         "IndexList",
+        "schema not in shape dispatch table",
     ],
 )
 @pytest.mark.table_args
@@ -54,6 +56,11 @@ def test_spec_to_schema_name(spec, expected_name):
         (["ColumnListList", "Unique"], ["column 1"], True),
         (["ColumnList", "Unique"], ["column 1"], False),
         (["Unique", "ColumnList"], ["column 1"], False),
+        (None, [], True),
+        (None, 1, True),
+        (None, [1], True),
+        (None, {"name": "name 1"}, True),
+        (None, ["column 1", ["column 2"]], True),
     ],
     ids=[
         "empty schemas,    -,             raises",
@@ -62,6 +69,11 @@ def test_spec_to_schema_name(spec, expected_name):
         "multiple schemas, spec not in,   raises",
         "multiple schemas, spec in,       not raises",
         "multiple schemas, other spec in, not raises",
+        "all schemas,      empty list,    raises",
+        "all schemas,      integer,       raises",
+        "all schemas,      integer list,  raises",
+        "all schemas,      object,        raises",
+        "all schemas,      mixed list,    raises",
     ],
 )
 @pytest.mark.table_args
@@ -1,5 +1,6 @@
 """Tests for the cache."""
 
+import dataclasses
 import json
 import pathlib
 
@@ -7,6 +8,7 @@ import pytest
 
 from open_alchemy import cache
 from open_alchemy import exceptions
+from open_alchemy import types
 
 
 @pytest.mark.parametrize(
@@ -357,3 +359,464 @@ def test_schemas_are_valid_cache_exists(tmpdir, cache_contents):
     cache.schemas_are_valid(str(spec_file))
 
     assert cache.schemas_valid(str(spec_file)) is True
+
+
+@pytest.mark.cache
+def test_valid_model_hashes_cache_missing(tmpdir):
+    """
+    GIVEN spec file without a cache
+    WHEN valid_model_hashes is called with the filename
+    THEN an empty dictionary is returned.
+    """
+    spec_file = pathlib.Path(tmpdir) / "spec.json"
+    spec_file.write_text("spec 1", encoding="utf-8")
+
+    returned_hashes = cache.valid_model_hashes(str(spec_file))
+
+    assert returned_hashes == {}
+
+
+@pytest.mark.parametrize(
+    "cache_contents, expected_hashes",
+    [
+        pytest.param("invalid JSON", {}, id="not json"),
+        pytest.param("true", {}, id="not dictionary"),
+        pytest.param(json.dumps({"data": True}), {}, id="data not dictionary"),
+        pytest.param(
+            json.dumps({"data": {"schemas": True}}), {}, id="data schemas not dict"
+        ),
+        pytest.param(
+            json.dumps({"data": {"schemas": {"valid": True}}}),
+            {},
+            id="data schemas models missing",
+        ),
+        pytest.param(
+            json.dumps({"data": {"schemas": {"models": True}}}),
+            {},
+            id="data schemas models not dict",
+        ),
+        pytest.param(
+            json.dumps(
+                {"data": {"schemas": {"models": {"Model1": "hash 1", "Model2": 2}}}}
+            ),
+            {"Model1": "hash 1"},
+            id="data schemas models hash not string",
+        ),
+        pytest.param(
+            json.dumps(
+                {
+                    "hash": "other",
+                    "data": {"schemas": {"models": {"Model1": "hash 1"}}},
+                }
+            ),
+            {"Model1": "hash 1"},
+            id="different spec hash",
+        ),
+    ],
+)
+@pytest.mark.cache
+def test_valid_model_hashes(tmpdir, cache_contents, expected_hashes):
+    """
+    GIVEN spec file with contents and cache with contents
+    WHEN valid_model_hashes is called with the filename
+    THEN the expected hashes are returned.
+    """
+    path_tmpdir = pathlib.Path(tmpdir)
+    spec_filename = "spec.json"
+    spec_file = path_tmpdir / spec_filename
+    spec_file.write_text("spec 1", encoding="utf-8")
+    cache_file = (
+        path_tmpdir / f"__open_alchemy_{cache.calculate_hash(spec_filename)}_cache__"
+    )
+    cache_file.write_text(cache_contents, encoding="utf-8")
+
+    returned_hashes = cache.valid_model_hashes(str(spec_file))
+
+    assert returned_hashes == expected_hashes
+
+
+@pytest.mark.cache
+def test_schemas_are_valid_model_hashes(tmpdir):
+    """
+    GIVEN spec in a file
+    WHEN schemas_are_valid is called with model hashes and then without
+    THEN valid_model_hashes returns the hashes also after the spec file changed.
+    """
+    spec_file = pathlib.Path(tmpdir) / "spec.json"
+    spec_file.write_text("spec 1", encoding="utf-8")
+
+    cache.schemas_are_valid(str(spec_file), model_hashes={"Model1": "hash 1"})
+    spec_file.write_text("spec 2", encoding="utf-8")
+    cache.schemas_are_valid(str(spec_file))
+
+    assert cache.schemas_valid(str(spec_file)) is True
+    assert cache.valid_model_hashes(str(spec_file)) == {"Model1": "hash 1"}
+
+
+@pytest.mark.cache
+def test_calculate_artifacts_cache_path():
+    """
+    GIVEN spec path
+    WHEN calculate_artifacts_cache_path is called with the spec path
+    THEN the expected path is returned.
+    """
+    returned_path = cache.calculate_artifacts_cache_path(
+        pathlib.Path("parent/some.file")
+    )
+
+    assert str(returned_path) == str(
+        pathlib.Path(
+            "parent/__open_alchemy_"
+            f"{cache.calculate_hash('some.file')}_artifacts_cache__"
+        )
+    )
+
+
+@pytest.mark.cache
+def test_load_artifacts_spec_file_not_exists(tmpdir):
+    """
+    GIVEN spec file that does not exist and artifacts cache with contents
+    WHEN load_artifacts is called with the filename
+    THEN None is returned.
+    """
+    path_tmpdir = pathlib.Path(tmpdir)
+    spec_file = path_tmpdir / "spec.json"
+    cache.calculate_artifacts_cache_path(spec_file).write_text(
+        json.dumps({"version": 2}), encoding="utf-8"
+    )
+
+    returned_result = cache.load_artifacts(str(spec_file))
+
+    assert returned_result is None
+
+
+@pytest.mark.cache
+def test_load_artifacts_cache_file_missing(tmpdir):
+    """
+    GIVEN spec file and artifacts cache that does not exist
+    WHEN load_artifacts is called with the filename
+    THEN None is returned.
+    """
+    path_tmpdir = pathlib.Path(tmpdir)
+    spec_file = path_tmpdir / "spec.json"
+    spec_file.write_text("spec 1", encoding="utf-8")
+
+    returned_result = cache.load_artifacts(str(spec_file))
+
+    assert returned_result is None
+
+
+@dataclasses.dataclass
+class _NotArtifacts:
+    """Dataclass that is not an artifacts class."""
+
+
+def _artifacts_cache(**values):
+    """Construct the contents of a valid artifacts cache for spec 1 with some values."""
+    # pylint: disable=protected-access
+    return json.dumps(
+        {
+            "version": 2,
+            "package_version": cache._package_version(),
+            "hash": cache.calculate_hash("spec 1"),
+            "remote": {},
+            "schemas": {},
+            "artifacts": {},
+            **values,
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "cache_contents",
+    [
+        pytest.param("", id="empty"),
+        pytest.param("not JSON", id="invalid JSON"),
+        pytest.param(json.dumps(True), id="not dict"),
+        pytest.param(json.dumps({}), id="empty dict"),
+        pytest.param(_artifacts_cache(version=1), id="version different"),
+        pytest.param(
+            _artifacts_cache(package_version="0.0.0"), id="package version different"
+        ),
+        pytest.param(
+            _artifacts_cache(hash=cache.calculate_hash("spec 2")), id="hash different"
+        ),
+        pytest.param(_artifacts_cache(remote=None), id="remote not dict"),
+        pytest.param(
+            _artifacts_cache(remote={"remote.json": cache.calculate_hash("remote 1")}),
+            id="remote file missing",
+        ),
+        pytest.param(_artifacts_cache(schemas=None), id="schemas not dict"),
+        pytest.param(_artifacts_cache(artifacts=None), id="artifacts not dict"),
+        pytest.param(
+            _artifacts_cache(
+                artifacts={"Schema": {"__open_alchemy_type__": "Missing", "value": {}}}
+            ),
+            id="type not artifacts class",
+        ),
+        pytest.param(
+            _artifacts_cache(
+                artifacts={"Schema": {"__open_alchemy_type__": "Protocol", "value": []}}
+            ),
+            id="type imported into types",
+        ),
+        pytest.param(
+            _artifacts_cache(
+                artifacts={
+                    "Schema": {
+                        "__open_alchemy_type__": "ModelArtifacts",
+                        "value": {"key": "value"},
+                    }
+                }
+            ),
+            id="dataclass fields invalid",
+        ),
+        pytest.param(
+            _artifacts_cache(
+                artifacts={
+                    "Schema": {"__open_alchemy_type__": "PropertyType", "value": "X"}
+                }
+            ),
+            id="enum value invalid",
+        ),
+    ],
+)
+@pytest.mark.cache
+def test_load_artifacts_invalid(tmpdir, cache_contents):
+    """
+    GIVEN spec file and artifacts cache that is not valid for the spec
+    WHEN load_artifacts is called with the filename
+    THEN None is returned.
+    """
+    path_tmpdir = pathlib.Path(tmpdir)
+    spec_file = path_tmpdir / "spec.json"
+    spec_file.write_text("spec 1", encoding="utf-8")
+    cache.calculate_artifacts_cache_path(spec_file).write_text(
+        cache_contents, encoding="utf-8"
+    )
+
+    returned_result = cache.load_artifacts(str(spec_file))
+
+    assert returned_result is None
+
+
+@pytest.mark.cache
+def test_store_artifacts_spec_missing(tmpdir):
+    """
+    GIVEN spec is missing
+    WHEN store_artifacts is called with the spec filename
+    THEN CacheError is raised.
+    """
+    spec_file = pathlib.Path(tmpdir) / "spec.json"
+
+    with pytest.raises(exceptions.CacheError):
+        cache.store_artifacts(str(spec_file), schemas={}, artifacts={})
+
+
+@pytest.mark.cache
+def test_store_artifacts_spec_not_file(tmpdir):
+    """
+    GIVEN spec is actually a folder
+    WHEN store_artifacts is called with the spec filename
+    THEN CacheError is raised.
+    """
+    spec_file = pathlib.Path(tmpdir) / "spec.json"
+    spec_file.mkdir()
+
+    with pytest.raises(exceptions.CacheError):
+        cache.store_artifacts(str(spec_file), schemas={}, artifacts={})
+
+
+@pytest.mark.parametrize("cache_is_folder", [False, True], ids=["file", "folder"])
+@pytest.mark.cache
+def test_store_artifacts(tmpdir, cache_is_folder):
+    """
+    GIVEN spec in a file
+    WHEN store_artifacts is called with the spec filename, schemas and artifacts
+    THEN load_artifacts returns the schemas and artifacts until the spec changes.
+    """
+    path_tmpdir = pathlib.Path(tmpdir)
+    spec_file = path_tmpdir / "spec.json"
+    spec_file.write_text("spec 1", encoding="utf-8")
+    if cache_is_folder:
+        cache.calculate_artifacts_cache_path(spec_file).mkdir()
+    schemas = {
+        "Schema": {"type": "object", "x-kwargs": {"__open_alchemy_type__": "dict"}}
+    }
+    artifacts = {
+        "Schema": types.ModelArtifacts(
+            tablename="schema",
+            inherits=None,
+            parent=None,
+            description=None,
+            mixins=None,
+            kwargs=None,
+            composite_index=None,
+            composite_unique=None,
+            backrefs=[
+                (
+                    "schemas",
+                    types.ModelBackrefArtifacts(
+                        type=types.BackrefSubType.ARRAY, child="Child"
+                    ),
+                )
+            ],
+            properties=[
+                (
+                    "id",
+                    types.SimplePropertyArtifacts(
+                        type=types.PropertyType.SIMPLE,
+                        open_api=types.OpenApiSimplePropertyArtifacts(
+                            type="integer",
+                            format=None,
+                            max_length=None,
+                            nullable=None,
+                            default=None,
+                            read_only=None,
+                            write_only=None,
+                        ),
+                        extension=types.ExtensionSimplePropertyArtifacts(
+                            primary_key=True,
+                            autoincrement=None,
+                            index=None,
+                            unique=None,
+                            server_default=None,
+                            foreign_key=None,
+                            kwargs=None,
+                            foreign_key_kwargs=None,
+                            dict_ignore=None,
+                        ),
+                        schema={"type": "integer"},
+                        required=True,
+                        description=None,
+                    ),
+                )
+            ],
+        )
+    }
+
+    cache.store_artifacts(str(spec_file), schemas=schemas, artifacts=artifacts)
+
+    assert cache.load_artifacts(str(spec_file)) == (schemas, artifacts)
+    assert set(path_tmpdir.iterdir()) == {
+        spec_file,
+        cache.calculate_artifacts_cache_path(spec_file),
+    }
+    spec_file.write_text("spec 2", encoding="utf-8")
+    assert cache.load_artifacts(str(spec_file)) is None
+
+
+@pytest.mark.cache
+def test_package_version_not_installed(monkeypatch):
+    """
+    GIVEN OpenAlchemy is not installed
+    WHEN _package_version is called
+    THEN an empty string is returned.
+    """
+
+    def raise_package_not_found(_):
+        raise cache.importlib_metadata.PackageNotFoundError
+
+    monkeypatch.setattr(cache.importlib_metadata, "version", raise_package_not_found)
+
+    # pylint: disable=protected-access
+    assert cache._package_version() == ""
+
+
+@pytest.mark.cache
+def test_store_artifacts_remote(tmpdir):
+    """
+    GIVEN spec in a file that references a remote file
+    WHEN store_artifacts is called with the spec filename and the remote file
+    THEN load_artifacts returns the schemas and artifacts until the remote file changes.
+    """
+    path_tmpdir = pathlib.Path(tmpdir)
+    spec_file = path_tmpdir / "spec.json"
+    spec_file.write_text("spec 1", encoding="utf-8")
+    remote_file = path_tmpdir / "remote.json"
+    remote_file.write_text("remote 1", encoding="utf-8")
+
+    cache.store_artifacts(
+        str(spec_file), schemas={}, artifacts={}, remote_contexts=["remote.json"]
+    )
+
+    assert cache.load_artifacts(str(spec_file)) == ({}, {})
+    remote_file.write_text("remote 2", encoding="utf-8")
+    assert cache.load_artifacts(str(spec_file)) is None
+
+
+@pytest.mark.parametrize(
+    "schemas, remote_contexts",
+    [
+        pytest.param({}, ["remote.json"], id="remote file missing"),
+        pytest.param({}, ["http://host.com/remote.json"], id="remote file URL"),
+        pytest.param({"Schema": {"default": object()}}, [], id="value not JSON"),
+        pytest.param({"Schema": {1: "value"}}, [], id="key not string"),
+        pytest.param(
+            {"Schema": {"default": _NotArtifacts()}}, [], id="dataclass not artifacts"
+        ),
+        pytest.param(
+            {"Schema": {"default": cache.CachedArtifacts(schemas={}, artifacts={})}},
+            [],
+            id="named tuple not artifacts",
+        ),
+    ],
+)
+@pytest.mark.cache
+def test_store_artifacts_not_cacheable(tmpdir, schemas, remote_contexts):
+    """
+    GIVEN spec in a file and schemas or remote files that can't be cached
+    WHEN store_artifacts is called with the spec filename, schemas and remote files
+    THEN the cache is not written.
+    """
+    path_tmpdir = pathlib.Path(tmpdir)
+    spec_file = path_tmpdir / "spec.json"
+    spec_file.write_text("spec 1", encoding="utf-8")
+
+    cache.store_artifacts(
+        str(spec_file), schemas=schemas, artifacts={}, remote_contexts=remote_contexts
+    )
+
+    assert list(path_tmpdir.iterdir()) == [spec_file]
+
+
+@pytest.mark.cache
+def test_store_artifacts_not_writable(tmpdir, monkeypatch):
+    """
+    GIVEN spec in a file in a folder where the cache cannot be written
+    WHEN store_artifacts is called with the spec filename
+    THEN the cache is not written.
+    """
+    path_tmpdir = pathlib.Path(tmpdir)
+    spec_file = path_tmpdir / "spec.json"
+    spec_file.write_text("spec 1", encoding="utf-8")
+
+    def raise_os_error(*_, **__):
+        raise OSError
+
+    monkeypatch.setattr(cache.tempfile, "NamedTemporaryFile", raise_os_error)
+
+    cache.store_artifacts(str(spec_file), schemas={}, artifacts={})
+
+    assert list(path_tmpdir.iterdir()) == [spec_file]
+
+
+@pytest.mark.cache
+def test_store_artifacts_replace_fails(tmpdir, monkeypatch):
+    """
+    GIVEN spec in a file where the cache cannot be replaced
+    WHEN store_artifacts is called with the spec filename
+    THEN no files are left behind.
+    """
+    path_tmpdir = pathlib.Path(tmpdir)
+    spec_file = path_tmpdir / "spec.json"
+    spec_file.write_text("spec 1", encoding="utf-8")
+
+    def raise_os_error(*_, **__):
+        raise OSError
+
+    monkeypatch.setattr(cache.os, "replace", raise_os_error)
+
+    cache.store_artifacts(str(spec_file), schemas={}, artifacts={})
+
+    assert list(path_tmpdir.iterdir()) == [spec_file]
@@ -0,0 +1,114 @@
+"""Tests for the profile."""
+
+import logging
+import tracemalloc
+
+import pytest
+
+from open_alchemy import profile
+
+
+@pytest.mark.profile
+def test_record_not_collecting():
+    """
+    GIVEN no report is being collected
+    WHEN a phase is recorded
+    THEN nothing is recorded.
+    """
+    with profile.record("phase 1"):
+        pass
+
+    with profile.collect() as report:
+        pass
+
+    assert report.phases == {}
+
+
+@pytest.mark.profile
+def test_collect():
+    """
+    GIVEN report is being collected
+    WHEN phases are recorded, including a nested phase and a phase that is repeated
+    THEN the report contains the calls, time and peak memory of the phases in the
+        order they were first executed.
+    """
+    with profile.collect() as report:
+        with profile.record("phase 1"):
+            with profile.record("phase 1.nested"):
+                value = [0] * 100000
+            del value
+        with profile.record("phase 2"):
+            pass
+        with profile.record("phase 2"):
+            pass
+
+    assert list(report.phases) == ["phase 1", "phase 1.nested", "phase 2"]
+    assert report.phases["phase 1"].calls == 1
+    assert report.phases["phase 2"].calls == 2
+    assert report.phases["phase 1.nested"].peak_memory >= 100000 * 8
+    assert (
+        report.phases["phase 1"].peak_memory
+        >= report.phases["phase 1.nested"].peak_memory
+    )
+    assert report.phases["phase 1"].seconds >= report.phases["phase 1.nested"].seconds
+    assert report.seconds == pytest.approx(
+        report.phases["phase 1"].seconds + report.phases["phase 2"].seconds
+    )
+
+
+@pytest.mark.profile
+def test_collect_exception():
+    """
+    GIVEN report is being collected
+    WHEN a phase raises an exception
+    THEN the phase is recorded and no more phases are recorded after the collection.
+    """
+    with pytest.raises(ValueError):
+        with profile.collect() as report:
+            with profile.record("phase 1"):
+                raise ValueError
+
+    with profile.record("phase 2"):
+        pass
+
+    assert list(report.phases) == ["phase 1"]
+    assert report.phases["phase 1"].calls == 1
+
+
+@pytest.mark.profile
+def test_collect_log(caplog):
+    """
+    GIVEN report is being collected
+    WHEN the collection finishes
+    THEN the report is logged.
+    """
+    caplog.set_level(logging.INFO, logger="open_alchemy.profile")
+
+    with profile.collect() as report:
+        with profile.record("phase 1"):
+            pass
+
+    assert str(report) in caplog.text
+    assert "phase 1" in str(report)
+
+
+@pytest.mark.profile
+def test_collect_tracing(monkeypatch):
+    """
+    GIVEN memory allocations are already traced and the peak cannot be reset
+    WHEN a report is collected
+    THEN the phases are recorded and the allocations are still traced afterwards.
+    """
+    monkeypatch.delattr(tracemalloc, "reset_peak", raising=False)
+    tracemalloc.start()
+    try:
+        with profile.collect() as report:
+            with profile.record("phase 1"):
+                pass
+
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+    assert report.phases["phase 1"].calls == 1
+    assert report.phases["phase 1"].peak_memory > 0
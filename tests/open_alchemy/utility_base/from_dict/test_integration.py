@@ -1,6 +1,7 @@
 """Integration tests for dictionary to model conversion."""
 
 import copy
+import datetime
 from unittest import mock
 
 import pytest
@@ -96,3 +97,44 @@ def test_convert_array(mocked_facades_models_get_model):
         mocked_facades_models_get_model.return_value.from_dict.return_value
     ]
     assert returned_value == expected_value
+
+
+@pytest.mark.utility_base
+def test_calculate_plan():
+    """
+    GIVEN schema with properties including a readOnly property
+    WHEN calculate_plan is called with the schema
+    THEN a plan with converters for the properties that are not readOnly and the names
+        of the readOnly and required properties is returned.
+    """
+    schema = {
+        "properties": {
+            "prop_1": {"type": "integer"},
+            "prop_2": {"type": "string", "format": "date"},
+            "prop_3": {"type": "integer", "readOnly": True},
+        },
+        "required": ["prop_1"],
+    }
+
+    plan = from_dict.calculate_plan(schema=schema)
+
+    assert plan.read_only == {"prop_3"}
+    assert plan.required == {"prop_1"}
+    assert plan.converters.keys() == {"prop_1", "prop_2"}
+    assert plan.converters["prop_1"](1) == 1
+    assert plan.converters["prop_2"]("2000-01-01") == datetime.date(2000, 1, 1)
+
+
+@pytest.mark.utility_base
+def test_calculate_plan_invalid_property():
+    """
+    GIVEN schema with a property with a type that is not supported
+    WHEN calculate_plan is called with the schema and the converter is called
+    THEN FeatureNotImplementedError is raised when the converter is called.
+    """
+    schema = {"properties": {"prop_1": {"type": "type 1"}}}
+
+    plan = from_dict.calculate_plan(schema=schema)
+
+    with pytest.raises(exceptions.FeatureNotImplementedError):
+        plan.converters["prop_1"](1)
@@ -59,3 +59,38 @@ def test_convert_valid(mocked_facades_models_get_model):
     )
     expected_value = mocked_facades_models_get_model.return_value.from_dict.return_value
     assert returned_value == expected_value
+
+
+@pytest.mark.utility_base
+def test_compile_model_bound(mocked_facades_models_get_model):
+    """
+    GIVEN mocked models facade and schema
+    WHEN compile_ is called and the converter is called multiple times
+    THEN the referenced model is only retrieved once.
+    """
+    schema = {"x-de-$ref": "RefModel"}
+
+    converter = object_.compile_(schema=schema)
+    converter({"key": "value 1"})
+    converter({"key": "value 2"})
+
+    mocked_facades_models_get_model.assert_called_once_with(name="RefModel")
+    assert mocked_facades_models_get_model.return_value.from_dict.call_count == 2
+
+
+@pytest.mark.utility_base
+def test_compile_model_not_available(mocked_facades_models_get_model):
+    """
+    GIVEN mocked models facade that only returns the model after compile_ is called
+    WHEN compile_ is called and the converter is called
+    THEN the referenced model is retrieved when the value is converted.
+    """
+    ref_model = mocked_facades_models_get_model.return_value
+    mocked_facades_models_get_model.return_value = None
+    schema = {"x-de-$ref": "RefModel"}
+
+    converter = object_.compile_(schema=schema)
+    mocked_facades_models_get_model.return_value = ref_model
+    returned_value = converter({"key": "value"})
+
+    assert returned_value == ref_model.from_dict.return_value
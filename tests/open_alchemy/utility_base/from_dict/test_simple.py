@@ -173,3 +173,26 @@ def test_convert(schema, value, expected_value):
     returned_value = simple.convert(schema=schema, value=value)
 
     assert returned_value == expected_value
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        pytest.param({"type": "type 1"}, id="unsupported type"),
+        pytest.param({"type": "integer"}, id="integer"),
+        pytest.param({"type": "number"}, id="number"),
+        pytest.param({"type": "string"}, id="string"),
+        pytest.param({"type": "string", "format": "date"}, id="string date"),
+        pytest.param({"type": "boolean"}, id="boolean"),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_none(schema):
+    """
+    GIVEN schema
+    WHEN compile_ is called with the schema and the converter is called with None
+    THEN None is returned.
+    """
+    converter = simple.compile_(schema=schema)
+
+    assert converter(None) is None
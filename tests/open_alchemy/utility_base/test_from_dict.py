@@ -4,6 +4,7 @@ import datetime
 
 import pytest
 
+import open_alchemy
 from open_alchemy import exceptions
 from open_alchemy import utility_base
 
@@ -175,6 +176,288 @@ def test_from_dict_backref(__init__):
         model.from_dict(**{"key_1": 1, "key_2": {"obj_key": "obj value"}})
 
 
+@pytest.mark.utility_base
+def test_from_dict_schema_validator_cached(__init__):
+    """
+    GIVEN model
+    WHEN from_dict is called multiple times
+    THEN the schema validator is only constructed once.
+    """
+    # pylint: disable=protected-access
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+
+    model.from_dict(**{"key": 1})
+    validator = model._get_schema_validator()
+    model.from_dict(**{"key": 2})
+
+    assert model._get_schema_validator() is validator
+
+
+@pytest.mark.utility_base
+def test_from_dict_schema_validator_schema_changed(__init__):
+    """
+    GIVEN model that has been used with from_dict
+    WHEN the schema is replaced and from_dict is called
+    THEN the dictionary is validated against the new schema.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+    model.from_dict(**{"key": 1})
+
+    model._schema = {  # pylint: disable=protected-access
+        "properties": {"key": {"type": "integer"}},
+        "required": ["key"],
+    }
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        model.from_dict(**{})
+
+
+@pytest.mark.utility_base
+def test_from_dict_schema_validator_not_inherited(__init__):
+    """
+    GIVEN model that has been used with from_dict and a model that derives from it
+        with a different schema
+    WHEN from_dict is called on the derived model
+    THEN the dictionary is validated against the schema of the derived model.
+    """
+    parent = type(
+        "parent",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+    parent.from_dict(**{"key": 1})
+    child = type(
+        "child",
+        (parent,),
+        {"_schema": {"properties": {"key": {"type": "string"}}}},
+    )
+
+    instance = child.from_dict(**{"key": "value"})
+
+    assert instance.key == "value"  # pylint: disable=no-member
+
+
+@pytest.mark.utility_base
+def test_from_dict_read_only(__init__):
+    """
+    GIVEN schema with readOnly property
+    WHEN from_dict is called with a value for the readOnly property
+    THEN MalformedModelDictionaryError is raised with information about the property.
+    """
+    schema = {"properties": {"key": {"type": "integer", "readOnly": True}}}
+    model = type(
+        "model", (utility_base.UtilityBase,), {"_schema": schema, "__init__": __init__}
+    )
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError) as exc_info:
+        model.from_dict(**{"key": 1})
+
+    assert exc_info.value.property_name == "key"  # pylint: disable=no-member
+
+
+@pytest.mark.utility_base
+def test_from_dict_plan_cached(__init__):
+    """
+    GIVEN model
+    WHEN from_dict is called multiple times
+    THEN the plan is only calculated once.
+    """
+    # pylint: disable=protected-access
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+
+    model.from_dict(**{"key": 1})
+    plan = model._get_from_dict_plan()
+    model.from_dict(**{"key": 2})
+
+    assert model._get_from_dict_plan() is plan
+
+
+@pytest.mark.parametrize(
+    "validation, dictionary, expected_exception",
+    [
+        pytest.param(
+            open_alchemy.ValidationMode.STRICT,
+            {"key_1": "a"},
+            exceptions.MalformedModelDictionaryError,
+            id="strict schema violated",
+        ),
+        pytest.param(
+            open_alchemy.ValidationMode.STRUCTURAL,
+            {"key_2": 1},
+            exceptions.MalformedModelDictionaryError,
+            id="structural required missing",
+        ),
+        pytest.param(
+            open_alchemy.ValidationMode.STRUCTURAL,
+            {"key_1": "a", "key_2": "1"},
+            exceptions.InvalidInstanceError,
+            id="structural type wrong",
+        ),
+        pytest.param(
+            open_alchemy.ValidationMode.STRUCTURAL,
+            {"key_1": "a", "key_3": 1},
+            exceptions.MalformedModelDictionaryError,
+            id="structural not in properties",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_from_dict_validation_invalid(
+    validation, dictionary, expected_exception, __init__
+):
+    """
+    GIVEN model with a validation mode and dictionary that is not valid for the mode
+    WHEN from_dict is called with the dictionary
+    THEN the expected exception is raised.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {
+                    "key_1": {"type": "string", "minLength": 2},
+                    "key_2": {"type": "integer"},
+                },
+                "required": ["key_1"],
+            },
+            "_validation": validation,
+            "__init__": __init__,
+        },
+    )
+
+    with pytest.raises(expected_exception):
+        model.from_dict(**dictionary)
+
+
+@pytest.mark.parametrize(
+    "validation, dictionary",
+    [
+        pytest.param(
+            open_alchemy.ValidationMode.STRUCTURAL,
+            {"key_1": "a"},
+            id="structural schema violated",
+        ),
+        pytest.param(
+            open_alchemy.ValidationMode.TRUSTED, {"key_2": 1}, id="trusted missing"
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_from_dict_validation(validation, dictionary, __init__):
+    """
+    GIVEN model with a validation mode and dictionary that is valid for the mode
+    WHEN from_dict is called with the dictionary
+    THEN the instance has the properties from the dictionary.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {
+                    "key_1": {"type": "string", "minLength": 2},
+                    "key_2": {"type": "integer"},
+                },
+                "required": ["key_1"],
+            },
+            "_validation": validation,
+            "__init__": __init__,
+        },
+    )
+
+    instance = model.from_dict(**dictionary)
+
+    for key, value in dictionary.items():
+        assert getattr(instance, key) == value
+
+
+@pytest.mark.parametrize(
+    "validation",
+    [open_alchemy.ValidationMode.TRUSTED, "trusted"],
+    ids=["enum", "string"],
+)
+@pytest.mark.utility_base
+def test_from_dict_with(validation, __init__):
+    """
+    GIVEN model that validates strictly and dictionary that violates the schema
+    WHEN from_dict_with is called with the dictionary and trusted validation
+    THEN the instance has the properties from the dictionary and later from_dict calls
+        validate strictly.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {"key": {"type": "string", "minLength": 2}},
+            },
+            "__init__": __init__,
+        },
+    )
+
+    instance = model.from_dict_with({"key": "a"}, validation=validation)
+
+    assert instance.key == "a"  # pylint: disable=no-member
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        model.from_dict(**{"key": "a"})
+
+
+@pytest.mark.utility_base
+def test_from_dict_with_related(mocked_facades_models_get_model, __init__):
+    """
+    GIVEN model with a relationship to a model that has been mocked
+    WHEN from_dict_with is called with trusted validation
+    THEN the validation mode applies while the related model is constructed.
+    """
+    validations = []
+    mocked_facades_models_get_model.return_value.from_dict.side_effect = (
+        lambda **_: validations.append(
+            utility_base._VALIDATION.get()  # pylint: disable=protected-access
+        )
+    )
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {"key": {"type": "object", "x-de-$ref": "RefModel"}}
+            },
+            "__init__": __init__,
+        },
+    )
+
+    model.from_dict_with(
+        {"key": {"ref_key": "value"}}, validation=open_alchemy.ValidationMode.TRUSTED
+    )
+
+    assert validations == [open_alchemy.ValidationMode.TRUSTED]
+
+
 @pytest.mark.utility_base
 def test_from_dict_inheritance_inherits_bool(__init__):
     """
@@ -274,6 +557,117 @@ def test_from_dict_inheritance_return(mocked_facades_models_get_model, __init__)
     assert instance.parent_key == "parent value"  # pylint: disable=no-member
 
 
+@pytest.mark.utility_base
+def test_from_dict_many(__init__):
+    """
+    GIVEN model and dictionaries
+    WHEN from_dict_many is called with the dictionaries
+    THEN instances with the properties from the dictionaries are returned in order.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {"key": {"type": "string", "format": "date"}},
+            },
+            "__init__": __init__,
+        },
+    )
+
+    instances = model.from_dict_many(
+        iter([{"key": "2000-01-01"}, {"key": "2000-01-02"}])
+    )
+
+    assert [instance.key for instance in instances] == [
+        datetime.date(2000, 1, 1),
+        datetime.date(2000, 1, 2),
+    ]
+
+
+@pytest.mark.parametrize(
+    "validation, raises",
+    [
+        pytest.param(None, True, id="model validation"),
+        pytest.param(open_alchemy.ValidationMode.TRUSTED, False, id="trusted"),
+    ],
+)
+@pytest.mark.utility_base
+def test_from_dict_many_validation(validation, raises, __init__):
+    """
+    GIVEN model that validates strictly and dictionaries where one violates the schema
+    WHEN from_dict_many is called with the dictionaries and validation
+    THEN MalformedModelDictionaryError is raised if the dictionaries are validated
+        strictly and later from_dict calls validate strictly.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {"key": {"type": "string", "minLength": 2}},
+            },
+            "__init__": __init__,
+        },
+    )
+    values = [{"key": "ab"}, {"key": "a"}]
+
+    if raises:
+        with pytest.raises(exceptions.MalformedModelDictionaryError):
+            model.from_dict_many(values, validation=validation)
+    else:
+        instances = model.from_dict_many(values, validation=validation)
+        assert [instance.key for instance in instances] == ["ab", "a"]
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        model.from_dict(**{"key": "a"})
+
+
+@pytest.mark.utility_base
+def test_from_dict_many_inheritance(mocked_facades_models_get_model, __init__):
+    """
+    GIVEN model with a parent model and dictionaries
+    WHEN from_dict_many is called with the dictionaries
+    THEN the parent is retrieved once and the instances have the properties of the
+        parent and the child.
+    """
+    parent = type(
+        "parent",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"parent_key": {"type": "string"}}},
+            "__init__": __init__,
+        },
+    )
+    mocked_facades_models_get_model.return_value = parent
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {"key": {"type": "string"}},
+                "x-inherits": "Parent",
+            },
+            "__init__": __init__,
+        },
+    )
+
+    instances = model.from_dict_many(
+        [
+            {"key": "value 1", "parent_key": "parent value 1"},
+            {"key": "value 2", "parent_key": "parent value 2"},
+        ]
+    )
+
+    mocked_facades_models_get_model.assert_called_once_with(name="Parent")
+    assert [(instance.key, instance.parent_key) for instance in instances] == [
+        ("value 1", "parent value 1"),
+        ("value 2", "parent value 2"),
+    ]
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        model.from_dict_many([{"key": "value", "other_key": "value"}])
+
+
 @pytest.mark.parametrize(
     "value",
     [1, "hi", '"hi"', '{"key_2": 2}'],
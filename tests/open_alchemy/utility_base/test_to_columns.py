@@ -0,0 +1,186 @@
+"""Tests for to_columns."""
+
+import array
+import datetime
+import math
+import types
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy.utility_base import to_columns
+
+
+@pytest.mark.parametrize(
+    "property_schema, expected_typecode, expected_dtype",
+    [
+        pytest.param({"type": "integer"}, "q", "int64", id="integer"),
+        pytest.param({"type": "number"}, "d", "float64", id="number"),
+        pytest.param({"type": "boolean"}, "b", "bool", id="boolean"),
+        pytest.param({"type": "string"}, None, "object", id="string"),
+        pytest.param(
+            {"type": "string", "format": "date"}, None, "datetime64[D]", id="date"
+        ),
+        pytest.param(
+            {"type": "string", "format": "date-time"},
+            None,
+            "datetime64[us]",
+            id="date-time",
+        ),
+        pytest.param(
+            {"type": "string", "format": "binary"}, None, "object", id="binary"
+        ),
+        pytest.param(
+            {"type": "integer", "x-json": True}, None, "object", id="JSON simple"
+        ),
+        pytest.param(
+            {"type": "object", "x-json": True}, None, "object", id="JSON object"
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_calculate_plan(property_schema, expected_typecode, expected_dtype):
+    """
+    GIVEN schema with a property
+    WHEN calculate_plan is called with the schema
+    THEN the plan has a column for the property with the expected typecode and dtype.
+    """
+    schema = {"properties": {"prop_1": property_schema}}
+
+    returned_plan = to_columns.calculate_plan(schema=schema)
+
+    assert len(returned_plan) == 1
+    column = returned_plan[0]
+    assert column.name == "prop_1"
+    assert column.typecode == expected_typecode
+    assert column.dtype == expected_dtype
+
+
+@pytest.mark.parametrize(
+    "property_schema",
+    [
+        pytest.param({"type": "object", "x-de-$ref": "RefSchema"}, id="object"),
+        pytest.param(
+            {"type": "array", "items": {"type": "object", "x-de-$ref": "RefSchema"}},
+            id="array",
+        ),
+        pytest.param({"type": "integer", "writeOnly": True}, id="writeOnly"),
+    ],
+)
+@pytest.mark.utility_base
+def test_calculate_plan_skip(property_schema):
+    """
+    GIVEN schema with a property that is not collected
+    WHEN calculate_plan is called with the schema
+    THEN the plan is empty.
+    """
+    schema = {"properties": {"prop_1": property_schema}}
+
+    returned_plan = to_columns.calculate_plan(schema=schema)
+
+    assert returned_plan == ()
+
+
+SCHEMA = {
+    "properties": {
+        "integer": {"type": "integer"},
+        "number": {"type": "number"},
+        "boolean": {"type": "boolean"},
+        "date": {"type": "string", "format": "date"},
+        "binary": {"type": "string", "format": "binary"},
+    }
+}
+
+
+@pytest.mark.utility_base
+def test_collect():
+    """
+    GIVEN plan and instances with values and None values
+    WHEN collect is called with the plan and instances
+    THEN the values are collected into arrays or lists for each property.
+    """
+    plan = to_columns.calculate_plan(schema=SCHEMA)
+    values = [
+        types.SimpleNamespace(
+            integer=1,
+            number=1.5,
+            boolean=True,
+            date=datetime.date(2000, 1, 1),
+            binary=b"some binary",
+        ),
+        types.SimpleNamespace(
+            integer=2,
+            number=None,
+            boolean=None,
+            date=None,
+            binary=None,
+        ),
+        types.SimpleNamespace(integer=None),
+    ]
+
+    returned_columns = to_columns.collect(plan=plan, values=values, schema=SCHEMA)
+
+    assert returned_columns["number"][0] == 1.5
+    assert math.isnan(returned_columns["number"][1])
+    returned_columns["number"] = returned_columns["number"][:1]
+    assert returned_columns == {
+        "integer": [1, 2, None],
+        "number": array.array("d", [1.5]),
+        "boolean": [True, None, None],
+        "date": [datetime.date(2000, 1, 1), None, None],
+        "binary": ["some binary", None, None],
+    }
+
+
+@pytest.mark.utility_base
+def test_collect_arrays():
+    """
+    GIVEN plan and instances without None values
+    WHEN collect is called with the plan and instances
+    THEN integer, number and boolean values are collected into arrays.
+    """
+    plan = to_columns.calculate_plan(schema=SCHEMA)[:3]
+    values = (
+        types.SimpleNamespace(integer=idx, number=idx / 2, boolean=idx % 2 == 0)
+        for idx in range(3)
+    )
+
+    returned_columns = to_columns.collect(plan=plan, values=values, schema=SCHEMA)
+
+    assert returned_columns == {
+        "integer": array.array("q", [0, 1, 2]),
+        "number": array.array("d", [0.0, 0.5, 1.0]),
+        "boolean": array.array("b", [1, 0, 1]),
+    }
+
+
+@pytest.mark.utility_base
+def test_collect_empty():
+    """
+    GIVEN plan and no instances
+    WHEN collect is called with the plan
+    THEN empty columns are returned.
+    """
+    plan = to_columns.calculate_plan(schema=SCHEMA)[:2]
+
+    returned_columns = to_columns.collect(plan=plan, values=[], schema=SCHEMA)
+
+    assert returned_columns == {"integer": array.array("q"), "number": array.array("d")}
+
+
+@pytest.mark.utility_base
+def test_collect_invalid():
+    """
+    GIVEN plan and instance with a value that is not valid
+    WHEN collect is called with the plan and instance
+    THEN InvalidInstanceError is raised with the property.
+    """
+    plan = to_columns.calculate_plan(schema=SCHEMA)[:1]
+
+    with pytest.raises(exceptions.InvalidInstanceError) as exc:
+        to_columns.collect(
+            plan=plan, values=[types.SimpleNamespace(integer="1")], schema=SCHEMA
+        )
+
+    assert exc.value.property_name == "integer"
+    assert exc.value.property_value == "1"
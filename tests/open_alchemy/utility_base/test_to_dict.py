@@ -1,11 +1,16 @@
 """Tests for UtilityBase."""
 
+import datetime
+import json
 from unittest import mock
 
 import pytest
 
 from open_alchemy import exceptions
 from open_alchemy import utility_base
+from open_alchemy.facades import json_codec
+from open_alchemy.utility_base import query
+from open_alchemy.utility_base import to_dict
 
 
 @pytest.mark.utility_base
@@ -142,6 +147,29 @@ def test_to_dict_error(__init__):
         raise AssertionError("Should have raised.")
 
 
+@pytest.mark.utility_base
+def test_to_dict_plan_cached(__init__):
+    """
+    GIVEN class that derives from UtilityBase with a schema
+    WHEN to_dict is called multiple times
+    THEN the plan is only calculated once.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+
+    assert model(key=1).to_dict() == {"key": 1}
+    plan = to_dict.get_plan(model=model)
+    assert model(key=2).to_dict() == {"key": 2}
+
+    assert to_dict.get_plan(model=model) is plan
+
+
 @pytest.mark.utility_base
 def test_to_dict_inheritance_call(mocked_facades_models_get_model, __init__):
     """
@@ -170,6 +198,51 @@ def test_to_dict_inheritance_call(mocked_facades_models_get_model, __init__):
     check_func.assert_called_once_with(instance)
 
 
+@pytest.mark.utility_base
+def test_to_dict_many(mocked_facades_models_get_model, __init__):
+    """
+    GIVEN instances of a model and of a model that inherits from it
+    WHEN to_dict_many is called with the instances
+    THEN the dictionaries of the instances are returned in order and the parent is
+        only retrieved once.
+    """
+    parent = type(
+        "parent",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"parent_key": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+    mocked_facades_models_get_model.return_value = parent
+    child = type(
+        "child",
+        (parent,),
+        {
+            "_schema": {
+                "properties": {"key": {"type": "integer"}},
+                "x-inherits": "Parent",
+            },
+        },
+    )
+    instances = [
+        child(key=1, parent_key=2),
+        parent(parent_key=3),
+        child(key=4, parent_key=5),
+    ]
+
+    returned_dicts = parent.to_dict_many(iter(instances))
+
+    assert returned_dicts == [
+        {"key": 1, "parent_key": 2},
+        {"parent_key": 3},
+        {"key": 4, "parent_key": 5},
+    ]
+    assert returned_dicts == [instance.to_dict() for instance in instances]
+    mocked_facades_models_get_model.assert_called_with(name="Parent")
+    assert mocked_facades_models_get_model.call_count == 1 + 2
+
+
 @pytest.mark.utility_base
 def test_to_str(__init__):
     """
@@ -192,3 +265,327 @@ def test_to_str(__init__):
     assert returned_str == '{"key_1": 1}'
     assert str(instance) == '{"key_1": 1}'
     assert repr(instance) == "open_alchemy.models.Model(key_1=1)"
+
+
+@pytest.mark.parametrize(
+    "values, expected_str",
+    [
+        pytest.param([], "[]", id="empty"),
+        pytest.param([1], '[{"key_1": 1}]', id="single"),
+        pytest.param([1, None, 3], '[{"key_1": 1}, {}, {"key_1": 3}]', id="multiple"),
+    ],
+)
+@pytest.mark.utility_base
+def test_iter_json(__init__, values, expected_str):
+    """
+    GIVEN class that derives from UtilityBase and instances of it
+    WHEN iter_json is called with the instances
+    THEN the joined chunks are the JSON array of the dictionaries of the instances.
+    """
+    model = type(
+        "Model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key_1": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+    instances = [model(key_1=value) for value in values]
+
+    returned_str = "".join(model.iter_json(instances))
+
+    assert returned_str == expected_str
+    assert json.loads(returned_str) == model.to_dict_many(instances)
+
+
+@pytest.mark.utility_base
+def test_iter_json_lazy(__init__):
+    """
+    GIVEN class that derives from UtilityBase and a generator of instances
+    WHEN the chunks of iter_json are consumed one at a time
+    THEN each instance is only retrieved when its chunk is consumed.
+    """
+    model = type(
+        "Model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key_1": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+    retrieved = []
+
+    def instances():
+        """Generate instances recording which have been retrieved."""
+        for value in (1, 2):
+            retrieved.append(value)
+            yield model(key_1=value)
+
+    chunks = model.iter_json(instances())
+
+    assert next(chunks) == "["
+    assert retrieved == []
+    assert next(chunks) == '{"key_1": 1}'
+    assert retrieved == [1]
+    assert next(chunks) == ', {"key_1": 2}'
+    assert retrieved == [1, 2]
+    assert list(chunks) == ["]"]
+
+
+@pytest.mark.utility_base
+def test_to_str_json_codec(__init__):
+    """
+    GIVEN class that derives from UtilityBase with a JSON codec that encodes dates
+        natively
+    WHEN to_str, iter_json and to_dict are called
+    THEN the dates are passed to the codec without conversion for to_str and iter_json
+        and are converted for to_dict.
+    """
+    encoded = []
+
+    def dumps(value):
+        """Record the value and encode it."""
+        encoded.append(value)
+        return json.dumps(value, default=lambda date: date.isoformat())
+
+    model = type(
+        "Model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key_1": {"type": "string", "format": "date"}}},
+            "_json_codec": json_codec.Codec(
+                backend=json_codec.JsonBackend.STDLIB,
+                dumps=dumps,
+                loads=json.loads,
+                native_formats=frozenset(("date",)),
+            ),
+            "__init__": __init__,
+        },
+    )
+    instance = model(key_1=datetime.date(2000, 1, 1))
+
+    assert instance.to_str() == '{"key_1": "2000-01-01"}'
+    assert encoded == [{"key_1": datetime.date(2000, 1, 1)}]
+    assert "".join(model.iter_json([instance])) == '[{"key_1": "2000-01-01"}]'
+    assert instance.to_dict() == {"key_1": "2000-01-01"}
+
+
+@pytest.mark.parametrize(
+    "depth, expected_paths",
+    [
+        pytest.param(
+            None,
+            [
+                ((("Child", "parent_ref"), False), (("Ref", "back"), False)),
+                (
+                    (("Child", "refs"), True),
+                    (("Parent", "parent_ref"), False),
+                    (("Ref", "back"), False),
+                ),
+            ],
+            id="all levels cycle ends",
+        ),
+        pytest.param(
+            1,
+            [((("Child", "parent_ref"), False),), ((("Child", "refs"), True),)],
+            id="depth 1",
+        ),
+        pytest.param(0, [], id="depth 0"),
+    ],
+)
+@pytest.mark.utility_base
+def test_to_dict_load_options(
+    mocked_facades_models_get_model, monkeypatch, depth, expected_paths
+):
+    """
+    GIVEN model that inherits a relationship from its parent to a model with a
+        relationship back to the model and a relationship to the parent and depth
+    WHEN to_dict_load_options is called with the depth
+    THEN the options for the expected paths are returned.
+    """
+    monkeypatch.setattr(query.load_options, "construct", lambda *, path: tuple(path))
+    parent = type(
+        "Parent",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {
+                    "parent_ref": {"type": "object", "x-de-$ref": "Ref"},
+                }
+            },
+            "parent_ref": ("Parent", "parent_ref"),
+        },
+    )
+    child = type(
+        "Child",
+        (parent,),
+        {
+            "_schema": {
+                "properties": {
+                    "refs": {
+                        "type": "array",
+                        "items": {"type": "object", "x-de-$ref": "Parent"},
+                    },
+                },
+                "x-inherits": "Parent",
+            },
+            "parent_ref": ("Child", "parent_ref"),
+            "refs": ("Child", "refs"),
+        },
+    )
+    ref = type(
+        "Ref",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {"back": {"type": "object", "x-de-$ref": "Child"}}
+            },
+            "back": ("Ref", "back"),
+        },
+    )
+    models = {"Parent": parent, "Child": child, "Ref": ref}
+    mocked_facades_models_get_model.side_effect = lambda name: models[name]
+
+    options = child.to_dict_load_options(depth=depth)
+
+    assert options == expected_paths
+
+
+@pytest.mark.parametrize(
+    "fields, expected_dict",
+    [
+        pytest.param([], {}, id="empty"),
+        pytest.param(["key_1"], {"key_1": 1}, id="single"),
+        pytest.param(("key_1", "key_3"), {"key_1": 1, "key_3": 3}, id="multiple"),
+        pytest.param(["key_4"], {}, id="writeOnly"),
+        pytest.param(
+            ["parent_key", "key_2"], {"parent_key": 0, "key_2": 2}, id="parent"
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_to_dict_fields(
+    mocked_facades_models_get_model, __init__, fields, expected_dict
+):
+    """
+    GIVEN class that derives from a parent model and fields
+    WHEN to_dict and to_dict_many are called with the fields
+    THEN only the properties in the fields are returned.
+    """
+    parent = type(
+        "parent",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"parent_key": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+    mocked_facades_models_get_model.return_value = parent
+    model = type(
+        "model",
+        (parent,),
+        {
+            "_schema": {
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_2": {"type": "integer"},
+                    "key_3": {"type": "integer"},
+                    "key_4": {"type": "integer", "writeOnly": True},
+                },
+                "x-inherits": "Parent",
+            },
+        },
+    )
+    instance = model(parent_key=0, key_1=1, key_2=2, key_3=3, key_4=4)
+
+    assert instance.to_dict(fields=fields) == expected_dict
+    assert model.to_dict_many([instance], fields=fields) == [expected_dict]
+
+
+@pytest.mark.utility_base
+def test_to_dict_fields_projection_cached(__init__):
+    """
+    GIVEN class that derives from UtilityBase
+    WHEN the projection for fields is retrieved twice
+    THEN the projection is calculated once.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_2": {"type": "integer"},
+                }
+            },
+            "__init__": __init__,
+        },
+    )
+
+    projection = to_dict.get_projection(
+        model=model, fields=frozenset(["key_1"]), json_=False
+    )
+
+    assert [name for name, _, _ in projection] == ["key_1"]
+    assert (
+        to_dict.get_projection(model=model, fields=frozenset(["key_1"]), json_=False)
+        is projection
+    )
+
+
+@pytest.mark.utility_base
+def test_to_dict_fields_projection_cache_bounded(__init__, monkeypatch):
+    """
+    GIVEN class that derives from UtilityBase with a projection cache of size 1
+    WHEN the projections for fields, other fields and the first fields are retrieved
+    THEN the projection for the first fields is calculated again.
+    """
+    monkeypatch.setattr(to_dict, "_PROJECTIONS_MAXSIZE", 1)
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_2": {"type": "integer"},
+                }
+            },
+            "__init__": __init__,
+        },
+    )
+
+    projection = to_dict.get_projection(
+        model=model, fields=frozenset(["key_1"]), json_=False
+    )
+    to_dict.get_projection(model=model, fields=frozenset(["key_2"]), json_=False)
+
+    returned_projection = to_dict.get_projection(
+        model=model, fields=frozenset(["key_1"]), json_=False
+    )
+    assert returned_projection == projection
+    assert returned_projection is not projection
+
+
+@pytest.mark.utility_base
+def test_to_dict_fields_unknown(__init__):
+    """
+    GIVEN class that derives from UtilityBase
+    WHEN to_dict or load_only_options are called with a field that is not a property
+    THEN ModelAttributeError is raised.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key_1": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+    instance = model(key_1=1)
+
+    with pytest.raises(exceptions.ModelAttributeError):
+        instance.to_dict(fields=["key_1", "key_2"])
+    with pytest.raises(exceptions.ModelAttributeError):
+        model.load_only_options(["key_2"])
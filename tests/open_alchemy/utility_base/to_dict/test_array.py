@@ -83,3 +83,46 @@ def test_convert_valid(value, schema, expected_value):
     returned_value = array.convert(schema=schema, value=value)
 
     assert returned_value == expected_value
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        pytest.param({"items": {"type": "object"}}, id="relationship"),
+        pytest.param(
+            {
+                "items": {"type": "object", "properties": {"key": "type 1"}},
+                "readOnly": True,
+            },
+            id="readOnly",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_none(schema):
+    """
+    GIVEN schema
+    WHEN compile_ is called with the schema and the converter is called with None
+    THEN None is returned.
+    """
+    converter = array.compile_(schema=schema)
+
+    assert converter(None) is None
+
+
+@pytest.mark.utility_base
+def test_compile_read_only_item_none():
+    """
+    GIVEN readOnly schema
+    WHEN compile_ is called with the schema and the converter is called with a None
+        item
+    THEN None is returned for the item.
+    """
+    converter = array.compile_(
+        schema={
+            "items": {"type": "object", "properties": {"key": "type 1"}},
+            "readOnly": True,
+        }
+    )
+
+    assert converter([None]) == [None]
@@ -6,6 +6,7 @@ from unittest import mock
 import pytest
 
 from open_alchemy import exceptions
+from open_alchemy.helpers import custom_python_types
 from open_alchemy.utility_base.to_dict import simple
 
 
@@ -168,3 +169,116 @@ def test_convert(schema, value, expected_value):
     returned_value = simple.convert(schema=schema, value=value)
 
     assert returned_value == expected_value
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        pytest.param({"type": "type 1"}, id="unsupported type"),
+        pytest.param({"type": "integer"}, id="integer"),
+        pytest.param({"type": "number"}, id="number"),
+        pytest.param({"type": "string"}, id="string"),
+        pytest.param({"type": "string", "format": "duration"}, id="string duration"),
+        pytest.param({"type": "boolean"}, id="boolean"),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_none(schema):
+    """
+    GIVEN schema
+    WHEN compile_ is called with the schema and the converter is called with None
+    THEN None is returned.
+    """
+    converter = simple.compile_(schema=schema)
+
+    assert converter(None) is None
+
+
+@pytest.mark.utility_base
+def test_compile_duration():
+    """
+    GIVEN schema with duration format
+    WHEN compile_ is called with the schema and the converter is called
+    THEN duration values are converted and other values raise InvalidInstanceError.
+    """
+    converter = simple.compile_(schema={"type": "string", "format": "duration"})
+
+    assert converter(custom_python_types.duration(seconds=1)) == "PT1S"
+    with pytest.raises(exceptions.InvalidInstanceError):
+        converter("value")
+
+
+@pytest.mark.parametrize(
+    "schema, native_formats, value, expected_value",
+    [
+        pytest.param(
+            {"type": "string", "format": "date"},
+            frozenset(("date",)),
+            datetime.date(2000, 1, 1),
+            datetime.date(2000, 1, 1),
+            id="date native",
+        ),
+        pytest.param(
+            {"type": "string", "format": "date-time"},
+            frozenset(("date", "date-time")),
+            datetime.datetime(2000, 1, 1, 1, 1, 1),
+            datetime.datetime(2000, 1, 1, 1, 1, 1),
+            id="date-time native",
+        ),
+        pytest.param(
+            {"type": "string", "format": "date-time"},
+            frozenset(("date",)),
+            datetime.datetime(2000, 1, 1, 1, 1, 1),
+            "2000-01-01T01:01:01",
+            id="date-time not native",
+        ),
+        pytest.param(
+            {"type": "string", "format": "duration"},
+            frozenset(("duration",)),
+            custom_python_types.duration(seconds=1),
+            "PT1S",
+            id="duration not supported as native",
+        ),
+        pytest.param(
+            {"type": "string", "format": "date"},
+            frozenset(("date",)),
+            None,
+            None,
+            id="date native None",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_native_formats(schema, native_formats, value, expected_value):
+    """
+    GIVEN schema, native formats, value and expected value
+    WHEN compile_ is called with the schema and native formats and the converter is
+        called with the value
+    THEN the expected value is returned.
+    """
+    converter = simple.compile_(schema=schema, native_formats=native_formats)
+
+    assert converter(value) == expected_value
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        pytest.param({"type": "string", "format": "date"}, id="date"),
+        pytest.param({"type": "string", "format": "date-time"}, id="date-time"),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_native_formats_invalid(schema):
+    """
+    GIVEN schema with a format that is native
+    WHEN compile_ is called with the schema and the converter is called with a value of
+        a different type
+    THEN InvalidInstanceError is raised.
+    """
+    converter = simple.compile_(
+        schema=schema, native_formats=frozenset(("date", "date-time"))
+    )
+
+    with pytest.raises(exceptions.InvalidInstanceError):
+        converter("value")
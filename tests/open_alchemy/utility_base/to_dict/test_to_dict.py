@@ -2,7 +2,9 @@
 
 import pytest
 
+from open_alchemy import exceptions
 from open_alchemy.utility_base import to_dict
+from open_alchemy.utility_base import types
 
 
 @pytest.mark.parametrize(
@@ -72,3 +74,89 @@ def test_return_none(schema, expected_result):
     result = to_dict.return_none(schema=schema, property_name="prop_1")
 
     assert result == expected_result
+
+
+@pytest.mark.utility_base
+def test_calculate_plan():
+    """
+    GIVEN schema with properties
+    WHEN calculate_plan is called with the schema
+    THEN a plan with writeOnly properties excluded and whether None values are included
+        is returned.
+    """
+    schema = {
+        "properties": {
+            "prop_1": {"type": "integer"},
+            "prop_2": {"type": "integer", "nullable": True},
+            "prop_3": {"type": "integer"},
+            "prop_4": {"type": "integer", "writeOnly": True},
+        },
+        "required": ["prop_3"],
+    }
+
+    plan = to_dict.calculate_plan(schema=schema)
+
+    assert [(name, include_none) for name, _, include_none in plan] == [
+        ("prop_1", False),
+        ("prop_2", True),
+        ("prop_3", True),
+    ]
+    assert [converter(1) for _, converter, _ in plan] == [1, 1, 1]
+
+
+@pytest.mark.utility_base
+def test_calculate_plan_invalid_property():
+    """
+    GIVEN schema with a property with a type that is not supported
+    WHEN calculate_plan is called with the schema and the converter is called
+    THEN FeatureNotImplementedError is raised when the converter is called.
+    """
+    schema = {"properties": {"prop_1": {"type": "type 1"}}}
+
+    ((_, converter, _),) = to_dict.calculate_plan(schema=schema)
+
+    with pytest.raises(exceptions.FeatureNotImplementedError):
+        converter(1)
+
+
+@pytest.mark.utility_base
+def test_calculate_relationships():
+    """
+    GIVEN schema with simple, JSON, writeOnly, readOnly, relationship and array without
+        items properties
+    WHEN calculate_relationships is called with the schema
+    THEN the relationships converted by to_dict are returned with the name of the
+        related model unless they are readOnly.
+    """
+    schema = {
+        "properties": {
+            "prop_1": {"type": "integer"},
+            "prop_2": {"type": "object", "x-de-$ref": "Model2"},
+            "prop_3": {
+                "type": "array",
+                "items": {"type": "object", "x-de-$ref": "Model3"},
+            },
+            "prop_4": {"type": "object", "x-de-$ref": "Model4", "writeOnly": True},
+            "prop_5": {"type": "object", "x-json": True},
+            "prop_6": {
+                "type": "object",
+                "readOnly": True,
+                "properties": {"id": {"type": "integer"}},
+            },
+            "prop_7": {
+                "type": "array",
+                "readOnly": True,
+                "items": {"type": "object", "properties": {"id": {"type": "integer"}}},
+            },
+            "prop_8": {"type": "array"},
+        }
+    }
+
+    relationships = to_dict.calculate_relationships(schema=schema)
+
+    assert relationships == (
+        types.ToDictRelationship(name="prop_2", collection=False, model_name="Model2"),
+        types.ToDictRelationship(name="prop_3", collection=True, model_name="Model3"),
+        types.ToDictRelationship(name="prop_6", collection=False, model_name=None),
+        types.ToDictRelationship(name="prop_7", collection=True, model_name=None),
+    )
@@ -1,6 +1,7 @@
 """Tests for the CLI."""
 
 import argparse
+import logging
 import os
 import pathlib
 import sys
@@ -70,9 +71,29 @@ def test_validate_specfile_does_not_exist(tmp_path):
         ),
         pytest.param(
             ["openalchemy", "generate", "specfile.yaml", "models.py"],
-            ["specfile='specfile.yaml'", "output='models.py'"],
+            ["specfile='specfile.yaml'", "output='models.py'", "profile=False"],
             id="cli generate command",
         ),
+        pytest.param(
+            ["openalchemy", "--profile", "generate", "specfile.yaml", "models.py"],
+            ["specfile='specfile.yaml'", "output='models.py'", "profile=True"],
+            id="cli generate command profile",
+        ),
+        pytest.param(
+            ["openalchemy", "generate", "specfile.yaml", "models.py"],
+            ["jobs=1"],
+            id="cli generate command jobs default",
+        ),
+        pytest.param(
+            ["openalchemy", "generate", "--jobs", "4", "specfile.yaml", "models.py"],
+            ["jobs=4"],
+            id="cli generate command jobs",
+        ),
+        pytest.param(
+            ["openalchemy", "build", "-j", "0", "specfile.yaml", "pkg", "out"],
+            ["jobs=0"],
+            id="cli build command jobs",
+        ),
     ],
 )
 @pytest.mark.cli
@@ -120,6 +141,7 @@ def test_generate(tmp_path):
     args = argparse.Namespace(
         specfile=f"{pathlib.Path.cwd() / 'examples' / 'simple' / 'example-spec.yml'}",
         output=str(model_file),
+        jobs=1,
     )
 
     cli.generate(args)
@@ -153,6 +175,25 @@ def test_main(tmp_path, _remember_current_directory, command, expected_file):
     assert pathlib.Path(expected_file).exists()
 
 
+@pytest.mark.cli
+def test_main_profile(tmp_path, caplog):
+    """
+    GIVEN CLI options with --profile are set
+    WHEN the CLI is called
+    THEN the program runs and the profile is logged.
+    """
+    caplog.set_level(logging.INFO, logger="open_alchemy.profile")
+    model_file = tmp_path / "models.py"
+    spec_file = pathlib.Path.cwd() / "examples" / "simple" / "example-spec.yml"
+    sys.argv = ["openalchemy", "--profile", "generate", str(spec_file), str(model_file)]
+
+    cli.main()
+
+    assert "Autogenerated SQLAlchemy models" in model_file.read_text()
+    assert "spec_load" in caplog.text
+    assert "models_file" in caplog.text
+
+
 @pytest.mark.cli
 def test_invalid_main(tmp_path, _remember_current_directory):
     """